@@ -0,0 +1,115 @@
+from typing import Any
+
+from clean_base.either import Either, right
+from clean_base.entities import FetchManyResponse, FetchResponse
+from clean_base.exceptions import FetchingError
+
+from gcon.adapters.pickledb.repositories.connection_registration import (
+    CONNECTION_KEY_PREFIX,
+)
+from gcon.adapters.pickledb.repositories.connector import PickleDbConnector
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.score import ConnectionScores
+from gcon.core.domain.entities.connection_fetching import ConnectionFetching
+from gcon.settings import LOGGER
+
+
+class ConnectionFetchingPickleDbRepository(ConnectionFetching):
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    __conn: PickleDbConnector
+
+    # ? ------------------------------------------------------------------------
+    # ? LIFE CYCLE HOOK METHODS
+    # ? ------------------------------------------------------------------------
+
+    def __init__(self, db: PickleDbConnector) -> None:
+        self.__conn = db
+
+    def __init_subclass__(cls) -> None:
+        return super().__init_subclass__()
+
+    # ? ------------------------------------------------------------------------
+    # ? ABSTRACT CLASS METHODS IMPLEMENTATIONS
+    # ? ------------------------------------------------------------------------
+
+    def get(
+        self,
+        **kwargs: Any,
+    ) -> Either[FetchingError, FetchResponse[Connection]]:
+        """Get a cached connection given the row id and the row nodes.
+
+        A cached connection is only returned if it was built from nodes with
+        the same signatures of the given ones. Otherwise the connection should
+        be assembled again.
+
+        Args:
+            id (UUID): The source row id.
+            nodes (list[Node]): The nodes of the source row.
+
+        Returns:
+            Either[FetchingError, FetchResponse[Connection]]: The cached
+                connection, including its scores and metadata keys coverage,
+                or a not fetched response.
+
+        """
+
+        try:
+            if (id := kwargs.get("id")) is None:
+                return FetchingError(
+                    "`id` is required.",
+                    logger=LOGGER,
+                )()
+
+            if (nodes := kwargs.get("nodes")) is None:
+                return FetchingError(
+                    "`nodes` is required.",
+                    logger=LOGGER,
+                )()
+
+            response = self.__conn.db.get(f"{CONNECTION_KEY_PREFIX}{id}")
+
+            if not response or response is False:
+                return right(FetchResponse(False, None))
+
+            if sorted(
+                node.signature.__str__() for node in nodes
+            ) != response.get("node_signatures"):
+                return right(FetchResponse(False, None))
+
+            connection = Connection(
+                identifiers=set(response.get("identifiers")),
+                nodes=nodes,
+            ).with_id(id)
+
+            if (scores := response.get("scores")) is not None:
+                connection.with_scores(
+                    ConnectionScores(
+                        observed_completeness_score=scores.get(
+                            "observed_completeness_score"
+                        ),
+                        reachable_completeness_score=scores.get(
+                            "reachable_completeness_score"
+                        ),
+                    )
+                )
+
+            if (coverage := response.get("coverage")) is not None:
+                connection.with_coverage(coverage=coverage)
+
+            return right(FetchResponse(True, connection))
+
+        except Exception as e:
+            return FetchingError(e, logger=LOGGER)()
+
+    # ? ------------------------------------------------------------------------
+    # ! NOT IMPLEMENTED ABSTRACT METHODS
+    # ? ------------------------------------------------------------------------
+
+    def show(
+        self,
+        **kwargs: Any,
+    ) -> Either[FetchingError, FetchManyResponse[Connection]]:
+        return super().show(**kwargs)
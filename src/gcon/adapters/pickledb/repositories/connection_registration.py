@@ -0,0 +1,108 @@
+from typing import Any
+
+from clean_base.either import Either, right
+from clean_base.entities import (
+    CreateManyResponse,
+    CreateResponse,
+    GetOrCreateResponse,
+)
+from clean_base.exceptions import CreationError
+
+from gcon.adapters.pickledb.repositories.connector import PickleDbConnector
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.entities.connection_registration import (
+    ConnectionRegistration,
+)
+from gcon.settings import LOGGER
+
+# Connections share the database with nodes, which are indexed by accession.
+# The prefix avoids collisions between both record types.
+CONNECTION_KEY_PREFIX = "connection:"
+
+
+class ConnectionRegistrationPickleDbRepository(ConnectionRegistration):
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    __conn: PickleDbConnector
+
+    # ? ------------------------------------------------------------------------
+    # ? LIFE CYCLE HOOK METHODS
+    # ? ------------------------------------------------------------------------
+
+    def __init__(self, db: PickleDbConnector) -> None:
+        self.__conn = db
+
+    def __init_subclass__(cls) -> None:
+        return super().__init_subclass__()
+
+    # ? ------------------------------------------------------------------------
+    # ? ABSTRACT CLASS METHODS IMPLEMENTATIONS
+    # ? ------------------------------------------------------------------------
+
+    def create_many(
+        self,
+        **kwargs: Any,  # type: ignore
+    ) -> Either[CreationError, CreateManyResponse[Connection]]:
+        try:
+            if (connections := kwargs.get("connections")) is None:
+                return CreationError(
+                    "Connection is required.",
+                    logger=LOGGER,
+                )()
+
+            if not isinstance(connections, list):
+                return CreationError(
+                    "Connection must be an list.",
+                    logger=LOGGER,
+                )()
+
+            for connection in connections:
+                if not isinstance(connection, Connection):
+                    return CreationError(
+                        "Connection must be an instance of Connection.",
+                        logger=LOGGER,
+                    )()
+
+            for connection in connections:
+                self.__conn.db.set(
+                    f"{CONNECTION_KEY_PREFIX}{connection.id}",
+                    {
+                        "signature": connection.signature.__str__(),
+                        "identifiers": sorted(connection.identifiers),
+                        "node_signatures": sorted(
+                            node.signature.__str__()
+                            for node in connection.nodes
+                        ),
+                        "scores": (
+                            connection.scores.to_dict()
+                            if connection.scores
+                            else None
+                        ),
+                        "coverage": connection.coverage,
+                    },
+                )
+
+            self.__conn.db.dump()
+
+            return right(CreateManyResponse(True, connections))
+
+        except Exception as e:
+            return CreationError(e, logger=LOGGER)()
+
+    # ? ------------------------------------------------------------------------
+    # ! NOT IMPLEMENTED ABSTRACT METHODS
+    # ? ------------------------------------------------------------------------
+
+    def create(
+        self,
+        **kwargs: Any,
+    ) -> Either[CreationError, CreateResponse[Connection]]:
+        return super().create(**kwargs)
+
+    def get_or_create(
+        self,
+        **kwargs: Any,
+    ) -> Either[CreationError, GetOrCreateResponse[Connection]]:
+        return super().get_or_create(**kwargs)
@@ -56,7 +56,9 @@ class NodeFetchingPickleDbRepository(NodeFetching):
             if not response or response is False:
                 return right(FetchResponse(False, None))
 
-            node_either: Either = Node.from_dict(response)
+            # The node is parsed from a copy, since parsing pops the keys of
+            # the cached record, which would be persisted by the next dump
+            node_either: Either = Node.from_dict(dict(response))
 
             if node_either.is_left:
                 return node_either
@@ -13,8 +13,18 @@ class Connection:
     """Connection class.
 
     Attributes:
+        signature (UUID): The connection signature. It is computed on demand
+            and cached until the identifiers or the nodes signatures change.
         identifiers (set[str]): The identifiers of the connection.
         nodes (set[Node]): The nodes of the connection.
+        scores (ConnectionScores | None): The connection scores.
+        coverage (dict[str, int] | None): The number of nodes sharing the most
+            frequent value of each metadata key. Scores depend only on the
+            coverage and on the scoring profile, thus it is persisted to allow
+            rescoring connections without reprocessing nodes metadata.
+        profile_scores (dict[str, ConnectionScores]): The connection scores
+            calculated with additional scoring profiles, indexed by the profile
+            name.
 
     """
 
@@ -23,10 +33,19 @@ class Connection:
     # ? ------------------------------------------------------------------------
 
     id: UUID = field(init=False)
-    signature: UUID = field(init=False)
     identifiers: set[str] = field()
     nodes: set[Node] = field()
     scores: ConnectionScores | None = field(default=None)
+    coverage: dict[str, int] | None = field(default=None)
+    profile_scores: dict[str, ConnectionScores] = field(factory=dict)
+
+    # The cached signature and the connection state used to compute it
+    _signature: UUID | None = field(init=False, default=None, repr=False)
+    _signature_state: tuple[Any, ...] | None = field(
+        init=False,
+        default=None,
+        repr=False,
+    )
 
     # ? ------------------------------------------------------------------------
     # ? VALIDATORS
@@ -36,6 +55,14 @@ class Connection:
     def _set_default_id(self) -> UUID:
         return uuid4()
 
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC PROPERTIES
+    # ? ------------------------------------------------------------------------
+
+    @property
+    def signature(self) -> UUID:
+        return self.__update_signature()._signature  # type: ignore
+
     # ? ------------------------------------------------------------------------
     # ? PUBLIC INSTANCE METHODS
     # ? ------------------------------------------------------------------------
@@ -62,36 +89,60 @@ class Connection:
                 node.to_dict(update_signature=False) for node in me.nodes
             ],
             "scores": me.scores.to_dict() if me.scores else None,
+            "coverage": me.coverage,
+            "profile_scores": {
+                name: scores.to_dict()
+                for name, scores in me.profile_scores.items()
+            },
         }
 
     def with_scores(self, scores: ConnectionScores) -> None:
         self.scores = scores
 
+    def with_coverage(self, coverage: dict[str, int]) -> None:
+        self.coverage = coverage
+
+    def with_profile_scores(
+        self,
+        profile_scores: dict[str, ConnectionScores],
+    ) -> None:
+        self.profile_scores = profile_scores
+
     # ? ------------------------------------------------------------------------
-    # ? PUBLIC INSTANCE METHODS
+    # ? PRIVATE INSTANCE METHODS
     # ? ------------------------------------------------------------------------
 
     def __update_signature(self) -> Self:
         """Update the connection signature.
 
         This is an internal method called before to convert the connection to a
-        dictionary.
+        dictionary. Nodes signatures are cached by the nodes themselves, thus
+        the connection signature is only recomputed if the identifiers or any
+        node signature changed since the last computation.
+
+        Identifiers are sorted before hashing to make the signature independent
+        of the set iteration order, which varies between processes.
 
         """
 
-        nodes_signature = "".join(
-            [
-                node.signature.__str__()
-                for node in sorted(
-                    [i.update_signature() for i in self.nodes],
-                    key=lambda x: x.signature,
-                )
-            ]
+        state = (
+            tuple(sorted(self.identifiers)),
+            tuple(sorted(node.signature for node in self.nodes)),
         )
 
-        self.signature = uuid3(
-            namespace=GCON_NAMESPACE_HASH,
-            name=("".join(self.identifiers) + nodes_signature),
-        )
+        if self._signature is None or self._signature_state != state:
+            identifiers, nodes_signatures = state
+
+            self._signature = uuid3(
+                namespace=GCON_NAMESPACE_HASH,
+                name=(
+                    "".join(identifiers)
+                    + "".join(
+                        signature.__str__() for signature in nodes_signatures
+                    )
+                ),
+            )
+
+            self._signature_state = state
 
         return self
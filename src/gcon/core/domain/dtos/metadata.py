@@ -1,13 +1,13 @@
 from __future__ import annotations
 
+from collections import Counter
 from enum import Enum
-from hashlib import md5
-from typing import Self
+from hashlib import md5, sha256
+from types import MappingProxyType
+from typing import Any, Mapping, Self
 
 from attrs import define, field, frozen
 
-from gcon.settings import LOGGER
-
 
 @frozen(kw_only=True)
 class MetadataGroupUnit:
@@ -28,6 +28,9 @@ class MetadataKeyGroup(Enum):
     Methods:
         set_key_group: Set the key group given the attribute key.
         default: Default key group.
+        configure_key_groups: Replace the key to group lookup table.
+        pop_unclassified_keys: Get and reset the unclassified keys counts.
+        build_key_groups_digest: Build the digest of the key classification.
 
     """
 
@@ -187,16 +190,79 @@ class MetadataKeyGroup(Enum):
 
         key = key.lower()
 
-        for group in cls:
-            if key in [i.lower() for i in group.value.keys]:
-                return group
+        if (group := _KEY_GROUP_LOOKUP.get(key)) is not None:
+            return group  # type: ignore
 
-        LOGGER.warning(
-            f"Key `{key}` not already classified. Default value (`OTHER`) used"
-        )
+        # Unclassified keys are counted instead of logged to avoid a warning
+        # per parsed record. See `pop_unclassified_keys`.
+        _UNCLASSIFIED_KEYS[key] += 1
 
         return cls.default()
 
+    @classmethod
+    def configure_key_groups(
+        cls,
+        key_groups: Mapping[str, MetadataKeyGroup] | None = None,
+    ) -> None:
+        """Replace the key to group lookup table used by `set_key_group`.
+
+        The lookup table is compiled once into a read-only mapping of
+        lowercase keys. It should be configured at startup, before any
+        metadata is parsed.
+
+        Args:
+            key_groups (Mapping[str, MetadataKeyGroup] | None): The group of
+                each key, e.g. the `key_groups` of a scoring profile. The
+                default classification, defined by the enum members, is
+                restored if not informed.
+
+        """
+
+        global _KEY_GROUP_LOOKUP
+
+        if key_groups is None:
+            key_groups = {
+                key: group for group in cls for key in group.value.keys
+            }
+
+        _KEY_GROUP_LOOKUP = MappingProxyType(
+            {key.lower(): group for key, group in key_groups.items()}
+        )
+
+    @classmethod
+    def pop_unclassified_keys(cls) -> Counter[str]:
+        """Get and reset the counts of keys classified as default.
+
+        Returns:
+            Counter[str]: The number of times each unclassified key was found
+                since the last call.
+
+        """
+
+        unclassified_keys = Counter(_UNCLASSIFIED_KEYS)
+        _UNCLASSIFIED_KEYS.clear()
+
+        return unclassified_keys
+
+    @classmethod
+    def build_key_groups_digest(cls) -> str:
+        """Build the digest of the active key to group classification.
+
+        Metadata keys are classified when parsed, thus persisted metadata is
+        only valid while the classification used to parse it is active.
+
+        Returns:
+            str: The hex digest.
+
+        """
+
+        return sha256(
+            "\n".join(
+                f"{key}\t{group.name}"
+                for key, group in sorted(_KEY_GROUP_LOOKUP.items())
+            ).encode("utf-8")
+        ).hexdigest()
+
     @classmethod
     def self_validate(self) -> None:
         """Self validate the enum class.
@@ -251,14 +317,43 @@ class MetadataKeyGroup(Enum):
                 global_unique_keys.append(key)
 
 
+# ? ----------------------------------------------------------------------------
+# ? Key to group lookup table
+#
+# Built at import time from the `MetadataKeyGroup` definitions and replaced
+# through `MetadataKeyGroup.configure_key_groups`. Keys not found in the table
+# are counted in `_UNCLASSIFIED_KEYS`.
+#
+# ? ----------------------------------------------------------------------------
+
+
+_KEY_GROUP_LOOKUP: MappingProxyType[str, MetadataKeyGroup] = MappingProxyType(
+    {
+        key.lower(): group
+        for group in MetadataKeyGroup
+        for key in group.value.keys
+    }
+)
+
+_UNCLASSIFIED_KEYS: Counter[str] = Counter()
+
+
 @frozen(kw_only=True)
 class MetadataKey:
     """Metadata key class.
 
+    Instances should be created through the `intern` class method, which
+    returns a single shared instance for each (group, key) pair. Direct
+    instantiation is still supported and produces instances equal to the
+    interned ones.
+
     Attributes:
         group (MetadataKeyGroup): The group of the key.
         key (str | int): The key.
 
+    Methods:
+        intern: Get the shared instance of a (group, key) pair.
+
     """
 
     # ? ------------------------------------------------------------------------
@@ -268,35 +363,88 @@ class MetadataKey:
     group: MetadataKeyGroup = field()
     key: str | int = field()
 
+    # The hash is computed once since instances are immutable and heavily used
+    # as dictionary keys
+    _hash: int = field(init=False, eq=False, repr=False)
+
+    # ? ------------------------------------------------------------------------
+    # ? VALIDATORS AND DEFAULTS
+    # ? ------------------------------------------------------------------------
+
+    @_hash.default
+    def _set_default_hash(self) -> int:
+        return hash((self.group.name, str(self.key)))
+
     # ? ------------------------------------------------------------------------
     # ? LIFE CYCLE HOOK METHODS
     # ? ------------------------------------------------------------------------
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         return (
             isinstance(other, MetadataKey)
-            and self.__hash__() == other.__hash__()
+            and self._hash == other._hash
+            and self.group is other.group
+            and str(self.key) == str(other.key)
         )
 
     def __hash__(self) -> int:
-        return int(
-            md5((self.group.name + str(self.key)).encode()).hexdigest(),
-            16,
-        )
+        return self._hash
 
     def __str__(self) -> str:
         return f"{self.group.name}: {self.key}"
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Unpickled keys are the shared instances, as parsed ones
+        return (MetadataKey.intern, (self.group, self.key))
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC CLASS METHODS
+    # ? ------------------------------------------------------------------------
+
+    @classmethod
+    def intern(cls, group: MetadataKeyGroup, key: str | int) -> MetadataKey:
+        """Get the shared instance of a (group, key) pair.
+
+        Args:
+            group (MetadataKeyGroup): The group of the key.
+            key (str | int): The key.
+
+        Returns:
+            MetadataKey: The shared metadata key instance.
+
+        """
+
+        registry_key = (group, str(key))
+
+        if (metadata_key := _METADATA_KEY_REGISTRY.get(registry_key)) is None:
+            metadata_key = cls(group=group, key=key)
+            _METADATA_KEY_REGISTRY[registry_key] = metadata_key
+
+        return metadata_key
+
+
+# Shared `MetadataKey` instances indexed by (group, stringified key)
+_METADATA_KEY_REGISTRY: dict[tuple[MetadataKeyGroup, str], MetadataKey] = dict()
+
 
 @define(kw_only=True)
 class Metadata:
     """Metadata class.
 
     Attributes:
-        qualifiers (dict[MetadataKey, str | int]): The metadata qualifiers.
+        qualifiers (Mapping[MetadataKey, tuple[str | int, ...]]): A read-only
+            view of the metadata qualifiers. Lists of values are stored as
+            tuples, thus neither the view nor its values could be changed.
+            Qualifiers are changed through `add_feature` or `set_qualifier`.
+        revision (int): A counter incremented on each change of the
+            qualifiers. It is used to invalidate cached signatures.
 
     Methods:
         add_feature: Add a new feature to the metadata.
+        set_qualifier: Set the values of a metadata key.
 
     """
 
@@ -304,15 +452,11 @@ class Metadata:
     # ? CLASS ATTRIBUTES
     # ? ------------------------------------------------------------------------
 
-    qualifiers: dict[MetadataKey, list[str | int]] = field(init=False)
-
-    # ? ------------------------------------------------------------------------
-    # ? VALIDATORS AND DEFAULTS
-    # ? ------------------------------------------------------------------------
-
-    @qualifiers.default
-    def _set_default_qualifier(self) -> dict[MetadataKey, str]:
-        return dict()
+    _qualifiers: dict[MetadataKey, tuple[str | int, ...]] = field(
+        init=False,
+        factory=dict,
+    )
+    revision: int = field(init=False, default=0)
 
     # ? ------------------------------------------------------------------------
     # ? LIFE CYCLE HOOK METHODS
@@ -324,11 +468,19 @@ class Metadata:
         )
 
     def __hash__(self) -> int:
-        return int(md5(str(self.qualifiers).encode()).hexdigest(), 16)
+        return int(md5(str(self._qualifiers).encode()).hexdigest(), 16)
 
     """ def __str__(self) -> str:
         return str(self.to_dict()) """
 
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC PROPERTIES
+    # ? ------------------------------------------------------------------------
+
+    @property
+    def qualifiers(self) -> Mapping[MetadataKey, tuple[str | int, ...]]:
+        return MappingProxyType(self._qualifiers)
+
     # ? ------------------------------------------------------------------------
     # ? PUBLIC INSTANCE METHODS
     # ? ------------------------------------------------------------------------
@@ -342,8 +494,10 @@ class Metadata:
         """
 
         return {
-            f"{metadata_key.group.name}.{metadata_key.key}": value
-            for metadata_key, value in self.qualifiers.items()
+            f"{metadata_key.group.name}.{metadata_key.key}": (
+                list(value) if isinstance(value, tuple) else value
+            )
+            for metadata_key, value in self._qualifiers.items()
         }
 
     def add_feature(self, key: str, value: list[str | int]) -> Self:
@@ -360,13 +514,38 @@ class Metadata:
 
         key = key.lower()
 
-        self.qualifiers.update(
-            {
-                MetadataKey(
-                    group=MetadataKeyGroup.set_key_group(key),
-                    key=key,
-                ): value
-            }
+        return self.set_qualifier(
+            key=MetadataKey.intern(
+                group=MetadataKeyGroup.set_key_group(key),
+                key=key,
+            ),
+            value=value,
+        )
+
+    def set_qualifier(
+        self,
+        key: MetadataKey,
+        value: list[str | int] | tuple[str | int, ...],
+    ) -> Self:
+        """Set the values of a metadata key.
+
+        Lists of values are stored as tuples, thus later changes of the
+        informed list, or of the values read through `qualifiers`, could not
+        change the metadata without updating its revision.
+
+        Args:
+            key (MetadataKey): The metadata key.
+            value (list[str | int] | tuple[str | int, ...]): The values of the
+                key.
+
+        Returns:
+            Self: The metadata with the updated qualifier.
+
+        """
+
+        self._qualifiers[key] = (
+            tuple(value) if isinstance(value, list) else value
         )
+        self.revision += 1
 
         return self
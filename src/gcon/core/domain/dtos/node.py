@@ -1,4 +1,4 @@
-from typing import Self
+from typing import Any, Iterable, Self
 from uuid import UUID, uuid3
 
 import clean_base.exceptions as exc
@@ -7,7 +7,6 @@ from clean_base.either import Either, right
 
 from gcon.core.domain.dtos.metadata import (
     Metadata,
-    MetadataKey,
     MetadataKeyGroup,
 )
 from gcon.settings import GCON_NAMESPACE_HASH, LOGGER
@@ -18,11 +17,14 @@ class Node:
     """Node class.
 
     Attributes:
+        signature (UUID): The node signature. It is computed on demand and
+            cached until the accession, the marker or the metadata changes.
         accession (str): The accession of the node.
         metadata (Metadata): The metadata of the node.
 
     Methods:
         to_dict: Convert the node to a dictionary.
+        update_signatures: Compute the signatures of many nodes.
 
     """
 
@@ -30,11 +32,18 @@ class Node:
     # ? CLASS ATTRIBUTES
     # ? ------------------------------------------------------------------------
 
-    signature: UUID = field(init=False)
     accession: str = field()
     marker: str = field()
     metadata: Metadata = field()
 
+    # The cached signature and the node state used to compute it
+    _signature: UUID | None = field(init=False, default=None, repr=False)
+    _signature_state: tuple[Any, ...] | None = field(
+        init=False,
+        default=None,
+        repr=False,
+    )
+
     # ? ------------------------------------------------------------------------
     # ? LIFE CYCLE HOOK METHODS
     # ? ------------------------------------------------------------------------
@@ -47,6 +56,14 @@ class Node:
             (self.accession, self.marker, self.metadata.qualifiers.keys())
         )
 
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC PROPERTIES
+    # ? ------------------------------------------------------------------------
+
+    @property
+    def signature(self) -> UUID:
+        return self.update_signature()._signature  # type: ignore
+
     # ? ------------------------------------------------------------------------
     # ? PUBLIC INSTANCE METHODS
     # ? ------------------------------------------------------------------------
@@ -54,22 +71,22 @@ class Node:
     def update_signature(self) -> Self:
         """Update the node signature.
 
-        This is an public method called before to convert the node to a
-        dictionary.
+        The signature is only recomputed if the accession, the marker, the
+        metadata instance or the metadata revision changed since the last
+        computation.
 
         """
 
-        dict_metadata = self.metadata.to_dict()
+        state = self.__signature_state()
 
-        self.signature = uuid3(
-            namespace=GCON_NAMESPACE_HASH,
-            name=(
-                self.accession
-                + self.marker
-                + "".join(sorted(dict_metadata.keys()))
-                + "".join(["".join(i) for i in sorted(dict_metadata.values())])
-            ),
-        )
+        if self._signature is None or self._signature_state != state:
+            self._signature = self.build_signature(
+                accession=self.accession,
+                marker=self.marker,
+                dict_metadata=self.metadata.to_dict(),
+            )
+
+            self._signature_state = state
 
         return self
 
@@ -89,10 +106,75 @@ class Node:
             "metadata": me.metadata.to_dict(),
         }
 
+    # ? ------------------------------------------------------------------------
+    # ? PRIVATE INSTANCE METHODS
+    # ? ------------------------------------------------------------------------
+
+    def __signature_state(self) -> tuple[Any, ...]:
+        return (
+            self.accession,
+            self.marker,
+            self.metadata,
+            self.metadata.revision,
+        )
+
     # ? ------------------------------------------------------------------------
     # ? PUBLIC CLASS METHODS
     # ? ------------------------------------------------------------------------
 
+    @staticmethod
+    def build_signature(
+        accession: str,
+        marker: str,
+        dict_metadata: dict[str, list[str | int]],
+    ) -> UUID:
+        """Build a node signature from its content.
+
+        Args:
+            accession (str): The accession of the node.
+            marker (str): The marker of the node.
+            dict_metadata (dict[str, list[str | int]]): The node metadata as
+                returned by `Metadata.to_dict`.
+
+        Returns:
+            UUID: The node signature.
+
+        """
+
+        return uuid3(
+            namespace=GCON_NAMESPACE_HASH,
+            name=(
+                accession
+                + marker
+                + "".join(sorted(dict_metadata.keys()))
+                + "".join(
+                    # Values are stringified before sorting since integer and
+                    # string values are not comparable
+                    "".join(values)
+                    for values in sorted(
+                        [str(value) for value in values]
+                        for values in dict_metadata.values()
+                    )
+                )
+            ),
+        )
+
+    @staticmethod
+    def update_signatures(nodes: Iterable["Node"]) -> list[UUID]:
+        """Compute the signatures of many nodes in a single pass.
+
+        Only nodes without a valid cached signature are computed.
+
+        Args:
+            nodes (Iterable[Node]): The nodes to be signed.
+
+        Returns:
+            list[UUID]: The signatures in the same order of the input nodes.
+
+        """
+
+        return [node.update_signature()._signature for node in nodes]  # type: ignore
+
     @classmethod
     def from_dict(
         cls,
@@ -157,33 +239,17 @@ class Node:
 
             group, key = tuple(splitted_key)
 
-            try:
-                group_enum = MetadataKeyGroup[group]
-            except KeyError:
+            if group not in MetadataKeyGroup.__members__:
                 return exc.DadaTransferObjectError(
                     f"Unable to load JSON. Invalid metadata key group: `{group}`.",
                     logger=LOGGER,
                 )()
 
-            if key not in group_enum.value.keys:
-                return exc.DadaTransferObjectError(
-                    f"Unable to load JSON. Invalid metadata key: `{key}`.",
-                    logger=LOGGER,
-                )()
-
-            expected_metadata_key = MetadataKey(
-                group=group_enum,
-                key=key,
-            )
-
+            # The stored group reflects the classification active when the
+            # node was persisted. Keys are classified again with the active
+            # classification, which may be configured differently.
             metadata_instance.add_feature(key=key, value=value)
 
-            if expected_metadata_key not in metadata_instance.qualifiers:
-                return exc.DadaTransferObjectError(
-                    f"Unable to load JSON. Invalid metadata key: `{key}`.",
-                    logger=LOGGER,
-                )()
-
         return right(
             cls(
                 accession=accession,
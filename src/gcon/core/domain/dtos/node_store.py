@@ -0,0 +1,517 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterator, Mapping
+from uuid import UUID
+
+from attrs import define, field, frozen
+
+from gcon.core.domain.dtos.metadata import Metadata, MetadataKey
+from gcon.core.domain.dtos.node import Node
+
+
+@define(kw_only=True)
+class NodeStore:
+    """Compact array-backed storage of nodes.
+
+    Nodes are stored as integer references instead of Python objects. Metadata
+    keys are mapped to integer ids, accessions, markers and qualifier values
+    are interned into a single values table, and the qualifiers of each node
+    are delimited by offset arrays:
+
+        node i entries:   qualifier_keys[node_offsets[i]:node_offsets[i + 1]]
+        entry j values:   value_refs[value_offsets[j]:value_offsets[j + 1]]
+
+    Stored nodes are read through `NodeView` instances, which expose the same
+    read API of `Node` used by the identifiers collection, the scores
+    calculation and the output table building steps.
+
+    Methods:
+        add: Add a node to the store.
+        update_signatures: Compute the signatures of all stored nodes.
+        from_nodes: Build a store from a list of nodes.
+
+    """
+
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    # Metadata keys indexed by key id and the reverse mapping
+    _keys: list[MetadataKey] = field(init=False, factory=list)
+    _key_ids: dict[MetadataKey, int] = field(init=False, factory=dict)
+
+    # Interned values indexed by value id and the reverse mapping. Values keep
+    # their original type, thus `1` and `"1"` are interned apart
+    _values: list[str | int] = field(init=False, factory=list)
+    _value_ids: dict[str | int, int] = field(init=False, factory=dict)
+
+    # Value ids of the accession and marker of each node
+    _accessions: array[int] = field(init=False, factory=lambda: array("I"))
+    _markers: array[int] = field(init=False, factory=lambda: array("I"))
+
+    # Qualifier entries offsets, keys and values
+    _node_offsets: array[int] = field(
+        init=False,
+        factory=lambda: array("I", [0]),
+    )
+    _qualifier_keys: array[int] = field(init=False, factory=lambda: array("I"))
+    _value_offsets: array[int] = field(
+        init=False,
+        factory=lambda: array("I", [0]),
+    )
+    _value_refs: array[int] = field(init=False, factory=lambda: array("I"))
+
+    # Signatures are computed on demand. Stored nodes are immutable, thus a
+    # computed signature is never invalidated
+    _signatures: list[UUID | None] = field(init=False, factory=list)
+
+    # ? ------------------------------------------------------------------------
+    # ? LIFE CYCLE HOOK METHODS
+    # ? ------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._accessions)
+
+    def __getitem__(self, index: int) -> NodeView:
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("Node store index out of range")
+
+        return NodeView(store=self, index=index)
+
+    def __iter__(self) -> Iterator[NodeView]:
+        for index in range(len(self)):
+            yield NodeView(store=self, index=index)
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC INSTANCE METHODS
+    # ? ------------------------------------------------------------------------
+
+    def add(self, node: Node | NodeView) -> NodeView:
+        """Add a node to the store.
+
+        Args:
+            node (Node | NodeView): The node to be stored.
+
+        Returns:
+            NodeView: A view of the stored node.
+
+        """
+
+        self._accessions.append(self.__intern_value(node.accession))
+        self._markers.append(self.__intern_value(node.marker))
+
+        for key, values in node.metadata.qualifiers.items():
+            if (key_id := self._key_ids.get(key)) is None:
+                key_id = len(self._keys)
+                self._keys.append(key)
+                self._key_ids[key] = key_id
+
+            self._qualifier_keys.append(key_id)
+
+            # A single string is stored as a one-item list
+            if isinstance(values, (str, int)):
+                values = [values]
+
+            self._value_refs.extend(
+                self.__intern_value(value) for value in values
+            )
+
+            self._value_offsets.append(len(self._value_refs))
+
+        self._node_offsets.append(len(self._qualifier_keys))
+        self._signatures.append(None)
+
+        return NodeView(store=self, index=len(self._accessions) - 1)
+
+    def get_value(self, value_id: int) -> str | int:
+        """Get an interned value given its id.
+
+        Args:
+            value_id (int): The value id.
+
+        Returns:
+            str | int: The interned value.
+
+        """
+
+        return self._values[value_id]
+
+    def get_key(self, key_id: int) -> MetadataKey:
+        """Get a metadata key given its id.
+
+        Args:
+            key_id (int): The key id.
+
+        Returns:
+            MetadataKey: The metadata key.
+
+        """
+
+        return self._keys[key_id]
+
+    def get_key_id(self, key: object) -> int | None:
+        """Get the id of a metadata key.
+
+        Args:
+            key (object): The metadata key.
+
+        Returns:
+            int | None: The key id or None if the key was never stored.
+
+        """
+
+        if not isinstance(key, MetadataKey):
+            return None
+
+        return self._key_ids.get(key)
+
+    def node_entries(self, index: int) -> range:
+        """Get the range of qualifier entries of a node.
+
+        Args:
+            index (int): The node index.
+
+        Returns:
+            range: The qualifier entries indices.
+
+        """
+
+        return range(self._node_offsets[index], self._node_offsets[index + 1])
+
+    def find_entry(self, index: int, key: object) -> int | None:
+        """Find the qualifier entry of a node given its metadata key.
+
+        Args:
+            index (int): The node index.
+            key (object): The metadata key.
+
+        Returns:
+            int | None: The entry index or None if the node does not include
+                the key.
+
+        """
+
+        if not isinstance(key, MetadataKey):
+            return None
+
+        if (key_id := self._key_ids.get(key)) is None:
+            return None
+
+        qualifier_keys = self._qualifier_keys
+
+        for entry in range(
+            self._node_offsets[index],
+            self._node_offsets[index + 1],
+        ):
+            if qualifier_keys[entry] == key_id:
+                return entry
+
+        return None
+
+    def entry_key_id(self, entry: int) -> int:
+        return self._qualifier_keys[entry]
+
+    def entry_values(self, entry: int) -> list[str | int]:
+        """Decode the values of a qualifier entry.
+
+        Args:
+            entry (int): The qualifier entry index.
+
+        Returns:
+            list[str | int]: The qualifier values.
+
+        """
+
+        values = self._values
+        return [
+            values[value_id]
+            for value_id in self._value_refs[
+                self._value_offsets[entry] : self._value_offsets[entry + 1]
+            ]
+        ]
+
+    def accession_of(self, index: int) -> str:
+        return str(self._values[self._accessions[index]])
+
+    def marker_of(self, index: int) -> str:
+        return str(self._values[self._markers[index]])
+
+    def signature_of(self, index: int) -> UUID:
+        """Get the signature of a stored node.
+
+        Args:
+            index (int): The node index.
+
+        Returns:
+            UUID: The node signature.
+
+        """
+
+        if (signature := self._signatures[index]) is None:
+            signature = self.__build_signature(index)
+            self._signatures[index] = signature
+
+        return signature
+
+    def update_signatures(self) -> list[UUID]:
+        """Compute the signatures of all stored nodes in a single pass.
+
+        Returns:
+            list[UUID]: The signatures indexed by node index.
+
+        """
+
+        signatures = self._signatures
+        build_signature = self.__build_signature
+
+        for index, signature in enumerate(signatures):
+            if signature is None:
+                signatures[index] = build_signature(index)
+
+        return signatures  # type: ignore
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC CLASS METHODS
+    # ? ------------------------------------------------------------------------
+
+    @classmethod
+    def from_nodes(cls, nodes: list[Node]) -> NodeStore:
+        """Build a store from a list of nodes.
+
+        Args:
+            nodes (list[Node]): The nodes to be stored.
+
+        Returns:
+            NodeStore: The populated store.
+
+        """
+
+        store = cls()
+
+        for node in nodes:
+            store.add(node)
+
+        return store
+
+    # ? ------------------------------------------------------------------------
+    # ? PRIVATE INSTANCE METHODS
+    # ? ------------------------------------------------------------------------
+
+    def __build_signature(self, index: int) -> UUID:
+        keys = self._keys
+        dict_metadata: dict[str, list[str | int]] = dict()
+
+        for entry in self.node_entries(index):
+            key = keys[self._qualifier_keys[entry]]
+            dict_metadata[f"{key.group.name}.{key.key}"] = self.entry_values(
+                entry
+            )
+
+        return Node.build_signature(
+            accession=self.accession_of(index),
+            marker=self.marker_of(index),
+            dict_metadata=dict_metadata,
+        )
+
+    def __intern_value(self, value: str | int) -> int:
+        if (value_id := self._value_ids.get(value)) is None:
+            value_id = len(self._values)
+            self._values.append(value)
+            self._value_ids[value] = value_id
+
+        return value_id
+
+
+@frozen(kw_only=True, eq=False)
+class NodeQualifiersView(Mapping[MetadataKey, list[str | int]]):
+    """Read-only mapping over the qualifiers of a stored node."""
+
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    store: NodeStore = field()
+    index: int = field()
+
+    # ? ------------------------------------------------------------------------
+    # ? LIFE CYCLE HOOK METHODS
+    # ? ------------------------------------------------------------------------
+
+    def __getitem__(self, key: MetadataKey) -> list[str | int]:
+        if (entry := self.store.find_entry(self.index, key)) is None:
+            raise KeyError(key)
+
+        return self.store.entry_values(entry)
+
+    def __iter__(self) -> Iterator[MetadataKey]:
+        for entry in self.store.node_entries(self.index):
+            yield self.store.get_key(self.store.entry_key_id(entry))
+
+    def __len__(self) -> int:
+        return len(self.store.node_entries(self.index))
+
+    def __contains__(self, key: object) -> bool:
+        return self.store.find_entry(self.index, key) is not None
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC INSTANCE METHODS
+    # ? ------------------------------------------------------------------------
+
+    def get(  # type: ignore[override]
+        self,
+        key: MetadataKey,
+        default: list[str | int] | None = None,
+    ) -> list[str | int] | None:
+        if (entry := self.store.find_entry(self.index, key)) is None:
+            return default
+
+        return self.store.entry_values(entry)
+
+
+@frozen(kw_only=True, eq=False)
+class NodeMetadataView:
+    """Read-only view of the metadata of a stored node.
+
+    Attributes:
+        qualifiers (NodeQualifiersView): The node qualifiers.
+
+    Methods:
+        to_dict: Convert the metadata to a dictionary.
+
+    """
+
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    qualifiers: NodeQualifiersView = field()
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC INSTANCE METHODS
+    # ? ------------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, list[str | int]]:
+        """Convert the metadata to a dictionary.
+
+        Returns:
+            dict[str, list[str | int]]: The metadata as a dictionary.
+
+        """
+
+        return {
+            f"{metadata_key.group.name}.{metadata_key.key}": list(value)
+            for metadata_key, value in self.qualifiers.items()
+        }
+
+
+@frozen(kw_only=True, eq=False)
+class NodeView:
+    """Read-only view of a node kept in a `NodeStore`.
+
+    Attributes:
+        accession (str): The accession of the node.
+        marker (str): The marker of the node.
+        metadata (NodeMetadataView): The metadata of the node.
+        signature (UUID): The node signature.
+
+    Methods:
+        to_dict: Convert the node to a dictionary.
+        to_node: Materialize the view as a `Node` instance.
+
+    """
+
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    store: NodeStore = field()
+    index: int = field()
+    metadata: NodeMetadataView = field(init=False)
+
+    # ? ------------------------------------------------------------------------
+    # ? VALIDATORS AND DEFAULTS
+    # ? ------------------------------------------------------------------------
+
+    @metadata.default
+    def _set_default_metadata(self) -> NodeMetadataView:
+        return NodeMetadataView(
+            qualifiers=NodeQualifiersView(store=self.store, index=self.index)
+        )
+
+    # ? ------------------------------------------------------------------------
+    # ? LIFE CYCLE HOOK METHODS
+    # ? ------------------------------------------------------------------------
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, NodeView)
+            and self.store is other.store
+            and self.index == other.index
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.store), self.index))
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC PROPERTIES
+    # ? ------------------------------------------------------------------------
+
+    @property
+    def accession(self) -> str:
+        return self.store.accession_of(self.index)
+
+    @property
+    def marker(self) -> str:
+        return self.store.marker_of(self.index)
+
+    @property
+    def signature(self) -> UUID:
+        return self.store.signature_of(self.index)
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC INSTANCE METHODS
+    # ? ------------------------------------------------------------------------
+
+    def update_signature(self) -> NodeView:
+        """Keep compatibility with `Node.update_signature`.
+
+        Signatures of stored nodes are computed from the stored content, thus
+        nothing should be updated.
+
+        """
+
+        return self
+
+    def to_dict(
+        self,
+        update_signature: bool = True,
+    ) -> dict[str, str | dict[str, list[str | int]]]:
+        return {
+            "signature": self.signature.__str__(),
+            "accession": self.accession,
+            "marker": self.marker,
+            "metadata": self.metadata.to_dict(),
+        }
+
+    def to_node(self) -> Node:
+        """Materialize the view as a `Node` instance.
+
+        Returns:
+            Node: A new node with the stored content.
+
+        """
+
+        metadata = Metadata()
+
+        for key, values in self.metadata.qualifiers.items():
+            metadata.set_qualifier(key=key, value=values)
+
+        return Node(
+            accession=self.accession,
+            marker=self.marker,
+            metadata=metadata,
+        ).update_signature()
@@ -1,6 +1,8 @@
-from json import load
+import gzip
+from contextlib import nullcontext
+from json import JSONDecodeError, load, loads
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, Iterable, Iterator, Literal, Self, TextIO
 
 import clean_base.exceptions as exc
 from attrs import field, frozen
@@ -12,19 +14,35 @@ from pandera.errors import SchemaError
 from gcon.core.domain.dtos.connection import Connection
 from gcon.core.domain.dtos.metadata import (
     Metadata,
-    MetadataKey,
     MetadataKeyGroup,
 )
 from gcon.core.domain.dtos.node import Node
 from gcon.core.domain.dtos.score import ConnectionScores
 from gcon.settings import LOGGER
 
+from .accessions import build_accessions_table
+from .checkpoint import dump_checkpoint, load_checkpoint
 from .schemas import (
     GeneColumnSchema,
     OptionalColumnsSchema,
     StandardFieldsSchema,
 )
 
+# ? ----------------------------------------------------------------------------
+# ? JSON Lines format
+#
+# The first line contains the format header and the optional and gene fields.
+# Each following line contains a connection, as produced by
+# `Connection.to_dict`, and its source table row in the `data` key.
+#
+# ? ----------------------------------------------------------------------------
+
+
+JSONL_FORMAT_NAME = "gcon-connections"
+
+
+JSONL_FORMAT_VERSION = 1
+
 
 @frozen(kw_only=True)
 class ReferenceData:
@@ -35,10 +53,15 @@ class ReferenceData:
         optional_fields (list[str]): A list of optional fields present in data.
         gene_fields (list[str]): A list of gene fields present in data.
         connections (list[Connection]): A list of connections present in data.
+        accessions (DataFrame): The long-form view of the gene fields, built
+            from data. See `build_accessions_table`.
 
     Methods:
         with_connections: Add a list of connections to the reference data.
         to_dict: Convert the reference data to a dictionary.
+        to_checkpoint: Write the reference data to a binary checkpoint.
+        from_checkpoint: Load the reference data from a binary checkpoint.
+        from_records: Create the reference data from source table rows.
 
     """
 
@@ -58,6 +81,9 @@ class ReferenceData:
     # A list of connections present in data
     connections: list[Connection] = field(init=False)
 
+    # The long-form view of the gene fields, sharing the accessions of data
+    accessions: DataFrame = field(init=False, repr=False)
+
     # ? ------------------------------------------------------------------------
     # ? VALIDATORS AND DEFAULTS
     # ? ------------------------------------------------------------------------
@@ -66,6 +92,13 @@ class ReferenceData:
     def _set_default_connections(self) -> list[Connection]:
         return list()
 
+    @accessions.default
+    def _set_default_accessions(self) -> DataFrame:
+        return build_accessions_table(
+            data=self.data,
+            gene_fields=self.gene_fields,
+        )
+
     # ? ------------------------------------------------------------------------
     # ? PUBLIC INSTANCE METHODS
     # ? ------------------------------------------------------------------------
@@ -111,18 +144,105 @@ class ReferenceData:
             ],
         }
 
+    def to_checkpoint(
+        self,
+        checkpoint_path: Path,
+    ) -> Either[exc.MappedErrors, Literal[True]]:
+        """Write the reference data to a binary checkpoint.
+
+        Unlike the JSON output, the data table and the connections are
+        persisted as objects, thus they are loaded by `from_checkpoint`
+        without being parsed and validated again. See the `checkpoint` module
+        for the file format.
+
+        Args:
+            checkpoint_path (Path): The checkpoint file path.
+
+        Returns:
+            Either[exc.MappedErrors, Literal[True]]: A positive response if the
+                checkpoint was written or a negative response with the errors.
+
+        """
+
+        return dump_checkpoint(
+            content={
+                "key_groups_digest": MetadataKeyGroup.build_key_groups_digest(),
+                "data": self.data,
+                "optional_fields": self.optional_fields,
+                "gene_fields": self.gene_fields,
+                "connections": self.connections,
+            },
+            checkpoint_path=checkpoint_path,
+        )
+
     # ? ------------------------------------------------------------------------
     # ? PUBLIC CLASS METHODS
     # ? ------------------------------------------------------------------------
 
+    @classmethod
+    def from_checkpoint(
+        cls,
+        checkpoint_path: Path,
+    ) -> Either[exc.MappedErrors, Self]:
+        """Load the reference data from a binary checkpoint.
+
+        Metadata keys are classified when parsed, thus checkpoints written
+        while another key classification was active are rejected.
+
+        Args:
+            checkpoint_path (Path): The checkpoint file path.
+
+        Returns:
+            Either[exc.MappedErrors, Self]: The reference data or a list of
+                errors.
+
+        """
+
+        try:
+            if (content_either := load_checkpoint(checkpoint_path)).is_left:
+                return content_either
+
+            content: dict[str, Any] = content_either.value
+
+            if (
+                content.get("key_groups_digest")
+                != MetadataKeyGroup.build_key_groups_digest()
+            ):
+                return exc.DadaTransferObjectError(
+                    (
+                        "Unable to load checkpoint. Metadata keys were "
+                        + "classified by another scoring profile."
+                    ),
+                    logger=LOGGER,
+                )()
+
+            reference_data = cls(
+                data=content["data"],
+                optional_fields=content["optional_fields"],
+                gene_fields=content["gene_fields"],
+            )
+
+            reference_data.with_connections(
+                connections=content["connections"],
+            )
+
+            return right(reference_data)
+
+        except Exception as e:
+            return exc.UseCaseError(e, logger=LOGGER)()
+
     @staticmethod
     def build_genes_schema_from_list(
         genes: list[str],
+        check_accessions: bool = True,
     ) -> DataFrameSchema:
         """Build a genes schema from a list of genes.
 
         Args:
             genes (list[str]): The list of genes.
+            check_accessions (bool): Include the accessions format check. It
+                could be disabled when accessions were already validated, e.g.
+                with `find_invalid_accessions`.
 
         Returns:
             dict[str, Column]: The genes schema.
@@ -131,6 +251,9 @@ class ReferenceData:
 
         col, pattern, attrs = GeneColumnSchema
 
+        if check_accessions is False:
+            attrs = {**attrs, "checks": []}
+
         return DataFrameSchema(
             {pattern: col(**attrs, name=gene) for gene in genes},  # type: ignore
             unique_column_names=True,
@@ -194,18 +317,6 @@ class ReferenceData:
             connections_content = content.pop("connections")
             parsed_connections: list[Connection] = list()
 
-            required_connection_keys = [
-                "identifiers",
-                "nodes",
-                "scores",
-            ]
-
-            required_node_keys = [
-                "accession",
-                "marker",
-                "metadata",
-            ]
-
             if not isinstance(connections_content, list):
                 return exc.DadaTransferObjectError(
                     "Unable to load JSON. Connections must be a list.",
@@ -213,178 +324,12 @@ class ReferenceData:
                 )()
 
             for connection in connections_content:
-                for grouped_key in required_connection_keys:
-                    if grouped_key not in connection:
-                        return exc.DadaTransferObjectError(
-                            f"Unable to load JSON. Missing key: `{grouped_key}`",
-                            logger=LOGGER,
-                        )()
-
-                id = connection.pop("id")
-                identifiers = connection.pop("identifiers")
-                nodes = connection.pop("nodes")
-
-                if not isinstance(identifiers, list):
-                    return exc.DadaTransferObjectError(
-                        "Unable to load JSON. Identifiers must be a list.",
-                        logger=LOGGER,
-                    )()
-
-                if not isinstance(nodes, list):
-                    return exc.DadaTransferObjectError(
-                        "Unable to load JSON. Nodes must be a list.",
-                        logger=LOGGER,
-                    )()
-
-                parsed_identifiers: list[str] = list()
-
-                for identifier in identifiers:
-                    if not isinstance(identifier, str):
-                        return exc.DadaTransferObjectError(
-                            "Unable to load JSON. Identifier must be a string.",
-                            logger=LOGGER,
-                        )()
-
-                    parsed_identifiers.append(identifier)
-
-                parsed_nodes: list[Node] = list()
-
-                for node in nodes:
-                    for grouped_key in required_node_keys:
-                        if grouped_key not in node:
-                            return exc.DadaTransferObjectError(
-                                f"Unable to load JSON. Missing key: `{grouped_key}`",
-                                logger=LOGGER,
-                            )()
-
-                    accession = node.pop("accession")
-                    marker = node.pop("marker")
-                    metadata = node.pop("metadata")
-
-                    if not isinstance(accession, str):
-                        return exc.DadaTransferObjectError(
-                            "Unable to load JSON. Accession must be a string.",
-                            logger=LOGGER,
-                        )()
-
-                    if not isinstance(marker, str):
-                        return exc.DadaTransferObjectError(
-                            "Unable to load JSON. Marker must be a string.",
-                            logger=LOGGER,
-                        )()
-
-                    if not isinstance(metadata, dict):
-                        return exc.DadaTransferObjectError(
-                            "Unable to load JSON. Metadata must be a dictionary.",
-                            logger=LOGGER,
-                        )()
-
-                    metadata_instance = Metadata()
-
-                    for grouped_key, value in metadata.items():
-                        if not isinstance(grouped_key, str):
-                            return exc.DadaTransferObjectError(
-                                "Unable to load JSON. Metadata key must be a string.",
-                                logger=LOGGER,
-                            )()
-
-                        if not isinstance(value, list):
-                            return exc.DadaTransferObjectError(
-                                "Unable to load JSON. Metadata value must be a string.",
-                                logger=LOGGER,
-                            )()
-
-                        splitted_key = grouped_key.split(".")
-
-                        if len(splitted_key) != 2:
-                            return exc.DadaTransferObjectError(
-                                (
-                                    "Unable to load JSON. Metadata key must be in"
-                                    + " the format `namespace.key`."
-                                ),
-                                logger=LOGGER,
-                            )()
-
-                        group, key = tuple(splitted_key)
-
-                        try:
-                            group_enum = MetadataKeyGroup[group]
-                        except KeyError:
-                            return exc.DadaTransferObjectError(
-                                (
-                                    "Unable to load JSON. Invalid metadata key "
-                                    + f"group: `{group}`."
-                                ),
-                                logger=LOGGER,
-                            )()
-
-                        expected_metadata_key = MetadataKey(
-                            group=group_enum,
-                            key=key,
-                        )
-
-                        metadata_instance.add_feature(key=key, value=value)
-
-                        if (
-                            expected_metadata_key
-                            not in metadata_instance.qualifiers
-                        ):
-                            return exc.DadaTransferObjectError(
-                                f"Unable to load JSON. Invalid metadata key: `{key}`.",
-                                logger=LOGGER,
-                            )()
-
-                    parsed_nodes.append(
-                        Node(
-                            accession=accession,
-                            marker=marker,
-                            metadata=metadata_instance,
-                        )
-                    )
-
-                scores: ConnectionScores | None = None
-                if (parsed_scores := connection.get("scores")) is not None:
-                    if not isinstance(parsed_scores, dict):
-                        return exc.DadaTransferObjectError(
-                            "Unable to load JSON. Scores must be a dictionary.",
-                            logger=LOGGER,
-                        )()
-
-                    for key, value in parsed_scores.items():
-                        if not isinstance(key, str):
-                            return exc.DadaTransferObjectError(
-                                "Unable to load JSON. Score key must be a string.",
-                                logger=LOGGER,
-                            )()
-
-                        if not isinstance(value, (int, float)):
-                            return exc.DadaTransferObjectError(
-                                "Unable to load JSON. Score value must be a number.",
-                                logger=LOGGER,
-                            )()
+                if (
+                    connection_either := cls.__connection_from_dict(connection)
+                ).is_left:
+                    return connection_either
 
-                    observed_completeness_score = parsed_scores.get(
-                        "observed_completeness_score"
-                    )
-
-                    reachable_completeness_score = parsed_scores.get(
-                        "reachable_completeness_score"
-                    )
-
-                    scores = ConnectionScores(
-                        observed_completeness_score=observed_completeness_score,
-                        reachable_completeness_score=reachable_completeness_score,
-                    )
-
-                connection = Connection(
-                    identifiers=parsed_identifiers,
-                    nodes=parsed_nodes,
-                ).with_id(id)
-
-                if scores is not None:
-                    connection.with_scores(scores=scores)
-
-                parsed_connections.append(connection)
+                parsed_connections.append(connection_either.value)
 
             # ? ----------------------------------------------------------------
             # ? Load optional fields
@@ -422,7 +367,49 @@ class ReferenceData:
                     logger=LOGGER,
                 )()
 
-            data_as_df = DataFrame.from_records(data_content)
+            # ? ----------------------------------------------------------------
+            # ? Return a positive response
+            # ? ----------------------------------------------------------------
+
+            return cls.from_records(
+                data=data_content,
+                optional_fields=optional_fields_content,
+                gene_fields=gene_fields_content,
+                connections=parsed_connections,
+            )
+
+        except Exception as e:
+            return exc.UseCaseError(e, logger=LOGGER)()
+
+    @classmethod
+    def from_records(
+        cls,
+        data: list[dict[str, Any]],
+        optional_fields: list[str],
+        gene_fields: list[str],
+        connections: list[Connection] | None = None,
+    ) -> Either[exc.MappedErrors, Self]:
+        """Create a reference data from the records of the source table rows.
+
+        Rows are validated against the required, optional and gene fields
+        schemas, as rows loaded from the source table are.
+
+        Args:
+            data (list[dict[str, Any]]): The source table rows, as produced by
+                `DataFrame.to_dict(orient="records")`.
+            optional_fields (list[str]): The optional fields present in data.
+            gene_fields (list[str]): The gene fields present in data.
+            connections (list[Connection] | None): The connections of the
+                rows, if already resolved.
+
+        Returns:
+            Either[exc.MappedErrors, Self]: The reference data or a list of
+                errors.
+
+        """
+
+        try:
+            data_as_df = DataFrame.from_records(data)
 
             try:
                 # Validate required data schema
@@ -433,28 +420,483 @@ class ReferenceData:
 
                 # Validate gene data schema
                 cls.build_genes_schema_from_list(
-                    genes=gene_fields_content,
+                    genes=gene_fields,
                 ).validate(data_as_df)
 
             except SchemaError as e:
                 return exc.ExecutionError(
-                    f"Invalid JSON content for data: {e}",
+                    f"Invalid content for data: {e}",
                     logger=LOGGER,
                 )()
 
-            # ? ----------------------------------------------------------------
-            # ? Return a positive response
-            # ? ----------------------------------------------------------------
-
             reference_data = cls(
-                optional_fields=optional_fields_content,
-                gene_fields=gene_fields_content,
+                optional_fields=optional_fields,
+                gene_fields=gene_fields,
                 data=data_as_df,
             )
 
-            reference_data.with_connections(connections=parsed_connections)
+            reference_data.with_connections(connections=connections or [])
 
             return right(reference_data)
 
         except Exception as e:
             return exc.UseCaseError(e, logger=LOGGER)()
+
+    @classmethod
+    def read_jsonl_header(
+        cls,
+        jsonl_path: Path,
+    ) -> Either[exc.MappedErrors, tuple[list[str], list[str]]]:
+        """Read the fields of a JSON Lines file without reading connections.
+
+        Args:
+            jsonl_path (Path): The path to the JSON Lines file. Files ending
+                with `.gz` are read as gzip compressed.
+
+        Returns:
+            Either[exc.MappedErrors, tuple[list[str], list[str]]]: The
+                optional and gene fields or a list of errors.
+
+        """
+
+        try:
+            if jsonl_path.is_file() is False:
+                return exc.DadaTransferObjectError(
+                    f"Invalid file path: `{jsonl_path}`",
+                    logger=LOGGER,
+                )()
+
+            with cls.__open_jsonl(jsonl_path) as f:
+                return cls.parse_jsonl_header(f.readline())
+
+        except Exception as e:
+            return exc.UseCaseError(e, logger=LOGGER)()
+
+    @staticmethod
+    def parse_jsonl_header(
+        line: str,
+    ) -> Either[exc.MappedErrors, tuple[list[str], list[str]]]:
+        """Parse the header line of a JSON Lines file.
+
+        Args:
+            line (str): The first line of the JSON Lines file.
+
+        Returns:
+            Either[exc.MappedErrors, tuple[list[str], list[str]]]: The
+                optional and gene fields or a list of errors.
+
+        """
+
+        try:
+            header = loads(line)
+        except JSONDecodeError as e:
+            return exc.DadaTransferObjectError(
+                f"Unable to load JSON Lines. Invalid header: {e}",
+                logger=LOGGER,
+            )()
+
+        if (
+            not isinstance(header, dict)
+            or header.get("format") != JSONL_FORMAT_NAME
+        ):
+            return exc.DadaTransferObjectError(
+                "Unable to load JSON Lines. Unknown file format.",
+                logger=LOGGER,
+            )()
+
+        if (version := header.get("version")) != JSONL_FORMAT_VERSION:
+            return exc.DadaTransferObjectError(
+                f"Unable to load JSON Lines. Unsupported version: {version}",
+                logger=LOGGER,
+            )()
+
+        fields: list[list[str]] = []
+
+        for key in ["optional_fields", "gene_fields"]:
+            if not isinstance(value := header.get(key), list) or not all(
+                isinstance(item, str) for item in value
+            ):
+                return exc.DadaTransferObjectError(
+                    f"Unable to load JSON Lines. `{key}` must be a list.",
+                    logger=LOGGER,
+                )()
+
+            fields.append(value)
+
+        return right((fields[0], fields[1]))
+
+    @classmethod
+    def iter_jsonl_records(
+        cls,
+        jsonl_path: Path | Iterable[str],
+    ) -> Iterator[Either[exc.MappedErrors, dict[str, Any]]]:
+        """Iterate over the raw connection records of a JSON Lines file.
+
+        Unlike `iter_jsonl`, records are yielded as parsed, without building
+        connections, thus consumers reading only a few keys of each record
+        (e.g. signatures) skip the cost of rebuilding nodes metadata. The
+        iteration stops after the first error.
+
+        Args:
+            jsonl_path (Path | Iterable[str]): The path to the JSON Lines
+                file, or its lines, e.g. an open text stream read from the
+                current position, such as the standard input. Files ending
+                with `.gz` are read as gzip compressed.
+
+        Yields:
+            Either[exc.MappedErrors, dict[str, Any]]: The connection record of
+                each line, as produced by `Connection.to_dict`, with its
+                source table row in the `data` key, or an error.
+
+        """
+
+        try:
+            if isinstance(jsonl_path, Path) and jsonl_path.is_file() is False:
+                yield exc.DadaTransferObjectError(
+                    f"Invalid file path: `{jsonl_path}`",
+                    logger=LOGGER,
+                )()
+
+                return
+
+            with (
+                cls.__open_jsonl(jsonl_path)
+                if isinstance(jsonl_path, Path)
+                else nullcontext(jsonl_path)
+            ) as f:
+                lines = iter(f)
+
+                if (
+                    header_either := cls.parse_jsonl_header(next(lines, ""))
+                ).is_left:
+                    yield header_either
+                    return
+
+                for line_number, line in enumerate(lines, start=2):
+                    if not line.strip():
+                        continue
+
+                    try:
+                        content = loads(line)
+                    except JSONDecodeError as e:
+                        yield exc.DadaTransferObjectError(
+                            (
+                                "Unable to load JSON Lines. Invalid line "
+                                + f"{line_number}: {e}"
+                            ),
+                            logger=LOGGER,
+                        )()
+
+                        return
+
+                    if not isinstance(content, dict):
+                        yield exc.DadaTransferObjectError(
+                            (
+                                "Unable to load JSON Lines. Line "
+                                + f"{line_number} must be an object."
+                            ),
+                            logger=LOGGER,
+                        )()
+
+                        return
+
+                    yield right(content)
+
+        except Exception as e:
+            yield exc.UseCaseError(e, logger=LOGGER)()
+
+    @classmethod
+    def iter_jsonl(
+        cls,
+        jsonl_path: Path | Iterable[str],
+    ) -> Iterator[
+        Either[exc.MappedErrors, tuple[dict[str, Any] | None, Connection]]
+    ]:
+        """Iterate over the connections of a JSON Lines file.
+
+        Lines are parsed one at a time, thus files of any size could be
+        processed incrementally. The iteration stops after the first error.
+
+        Args:
+            jsonl_path (Path | Iterable[str]): The path to the JSON Lines
+                file, or its lines, e.g. an open text stream read from the
+                current position, such as the standard input. Files ending
+                with `.gz` are read as gzip compressed.
+
+        Yields:
+            Either[exc.MappedErrors, tuple[dict[str, Any] | None, Connection]]:
+                The source table row and the connection of each line, or an
+                error.
+
+        """
+
+        try:
+            for record_either in cls.iter_jsonl_records(jsonl_path):
+                if record_either.is_left:
+                    yield record_either
+                    return
+
+                content = record_either.value
+                row = content.pop("data", None)
+
+                if (
+                    connection_either := cls.__connection_from_dict(content)
+                ).is_left:
+                    yield connection_either
+                    return
+
+                yield right((row, connection_either.value))
+
+        except Exception as e:
+            yield exc.UseCaseError(e, logger=LOGGER)()
+
+    # ? ------------------------------------------------------------------------
+    # ? PRIVATE STATIC METHODS
+    # ? ------------------------------------------------------------------------
+
+    @staticmethod
+    def __connection_from_dict(
+        content: dict[str, Any],
+    ) -> Either[exc.MappedErrors, Connection]:
+        """Create a connection from its dictionary representation.
+
+        Args:
+            content (dict[str, Any]): The connection content, as produced
+                by `Connection.to_dict`. The dictionary is consumed.
+
+        Returns:
+            Either[exc.MappedErrors, Connection]: The connection or an error.
+
+        """
+
+        required_connection_keys = [
+            "identifiers",
+            "nodes",
+            "scores",
+        ]
+
+        required_node_keys = [
+            "accession",
+            "marker",
+            "metadata",
+        ]
+
+        for grouped_key in required_connection_keys:
+            if grouped_key not in content:
+                return exc.DadaTransferObjectError(
+                    f"Unable to load JSON. Missing key: `{grouped_key}`",
+                    logger=LOGGER,
+                )()
+
+        id = content.pop("id")
+        identifiers = content.pop("identifiers")
+        nodes = content.pop("nodes")
+
+        if not isinstance(identifiers, list):
+            return exc.DadaTransferObjectError(
+                "Unable to load JSON. Identifiers must be a list.",
+                logger=LOGGER,
+            )()
+
+        if not isinstance(nodes, list):
+            return exc.DadaTransferObjectError(
+                "Unable to load JSON. Nodes must be a list.",
+                logger=LOGGER,
+            )()
+
+        parsed_identifiers: list[str] = list()
+
+        for identifier in identifiers:
+            if not isinstance(identifier, str):
+                return exc.DadaTransferObjectError(
+                    "Unable to load JSON. Identifier must be a string.",
+                    logger=LOGGER,
+                )()
+
+            parsed_identifiers.append(identifier)
+
+        parsed_nodes: list[Node] = list()
+
+        for node in nodes:
+            for grouped_key in required_node_keys:
+                if grouped_key not in node:
+                    return exc.DadaTransferObjectError(
+                        f"Unable to load JSON. Missing key: `{grouped_key}`",
+                        logger=LOGGER,
+                    )()
+
+            accession = node.pop("accession")
+            marker = node.pop("marker")
+            metadata = node.pop("metadata")
+
+            if not isinstance(accession, str):
+                return exc.DadaTransferObjectError(
+                    "Unable to load JSON. Accession must be a string.",
+                    logger=LOGGER,
+                )()
+
+            if not isinstance(marker, str):
+                return exc.DadaTransferObjectError(
+                    "Unable to load JSON. Marker must be a string.",
+                    logger=LOGGER,
+                )()
+
+            if not isinstance(metadata, dict):
+                return exc.DadaTransferObjectError(
+                    "Unable to load JSON. Metadata must be a dictionary.",
+                    logger=LOGGER,
+                )()
+
+            metadata_instance = Metadata()
+
+            for grouped_key, value in metadata.items():
+                if not isinstance(grouped_key, str):
+                    return exc.DadaTransferObjectError(
+                        "Unable to load JSON. Metadata key must be a string.",
+                        logger=LOGGER,
+                    )()
+
+                if not isinstance(value, list):
+                    return exc.DadaTransferObjectError(
+                        "Unable to load JSON. Metadata value must be a string.",
+                        logger=LOGGER,
+                    )()
+
+                splitted_key = grouped_key.split(".")
+
+                if len(splitted_key) != 2:
+                    return exc.DadaTransferObjectError(
+                        (
+                            "Unable to load JSON. Metadata key must be in"
+                            + " the format `namespace.key`."
+                        ),
+                        logger=LOGGER,
+                    )()
+
+                group, key = tuple(splitted_key)
+
+                if group not in MetadataKeyGroup.__members__:
+                    return exc.DadaTransferObjectError(
+                        (
+                            "Unable to load JSON. Invalid metadata key "
+                            + f"group: `{group}`."
+                        ),
+                        logger=LOGGER,
+                    )()
+
+                # Keys are classified with the active classification
+                metadata_instance.add_feature(key=key, value=value)
+
+            parsed_nodes.append(
+                Node(
+                    accession=accession,
+                    marker=marker,
+                    metadata=metadata_instance,
+                )
+            )
+
+        scores: ConnectionScores | None = None
+        if (parsed_scores := content.get("scores")) is not None:
+            if not isinstance(parsed_scores, dict):
+                return exc.DadaTransferObjectError(
+                    "Unable to load JSON. Scores must be a dictionary.",
+                    logger=LOGGER,
+                )()
+
+            for key, value in parsed_scores.items():
+                if not isinstance(key, str):
+                    return exc.DadaTransferObjectError(
+                        "Unable to load JSON. Score key must be a string.",
+                        logger=LOGGER,
+                    )()
+
+                if not isinstance(value, (int, float)):
+                    return exc.DadaTransferObjectError(
+                        "Unable to load JSON. Score value must be a number.",
+                        logger=LOGGER,
+                    )()
+
+            observed_completeness_score = parsed_scores.get(
+                "observed_completeness_score"
+            )
+
+            reachable_completeness_score = parsed_scores.get(
+                "reachable_completeness_score"
+            )
+
+            scores = ConnectionScores(
+                observed_completeness_score=observed_completeness_score,
+                reachable_completeness_score=reachable_completeness_score,
+            )
+
+        coverage: dict[str, int] | None = None
+        if (parsed_coverage := content.get("coverage")) is not None:
+            if not isinstance(parsed_coverage, dict) or not all(
+                isinstance(key, str) and isinstance(value, int)
+                for key, value in parsed_coverage.items()
+            ):
+                return exc.DadaTransferObjectError(
+                    (
+                        "Unable to load JSON. Coverage must be a "
+                        + "dictionary of integers."
+                    ),
+                    logger=LOGGER,
+                )()
+
+            coverage = parsed_coverage
+
+        profile_scores: dict[str, ConnectionScores] = dict()
+        if (parsed_profile_scores := content.get("profile_scores")) is not None:
+            if not isinstance(parsed_profile_scores, dict):
+                return exc.DadaTransferObjectError(
+                    (
+                        "Unable to load JSON. Profile scores must be a "
+                        + "dictionary."
+                    ),
+                    logger=LOGGER,
+                )()
+
+            for name, profile_score in parsed_profile_scores.items():
+                if not isinstance(profile_score, dict) or not all(
+                    isinstance(value, (int, float))
+                    for value in profile_score.values()
+                ):
+                    return exc.DadaTransferObjectError(
+                        (
+                            "Unable to load JSON. Scores of profile "
+                            + f"`{name}` must be a dictionary of "
+                            + "numbers."
+                        ),
+                        logger=LOGGER,
+                    )()
+
+                profile_scores[name] = ConnectionScores(
+                    observed_completeness_score=profile_score.get(
+                        "observed_completeness_score"
+                    ),
+                    reachable_completeness_score=profile_score.get(
+                        "reachable_completeness_score"
+                    ),
+                )
+
+        connection = Connection(
+            identifiers=parsed_identifiers,
+            nodes=parsed_nodes,
+        ).with_id(id)
+
+        if scores is not None:
+            connection.with_scores(scores=scores)
+
+        if coverage is not None:
+            connection.with_coverage(coverage=coverage)
+
+        connection.with_profile_scores(profile_scores=profile_scores)
+
+        return right(connection)
+
+    @staticmethod
+    def __open_jsonl(jsonl_path: Path) -> TextIO:
+        if jsonl_path.suffix.lower() == ".gz":
+            return gzip.open(jsonl_path, "rt")
+
+        return jsonl_path.open("r")
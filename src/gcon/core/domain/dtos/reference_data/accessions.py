@@ -0,0 +1,367 @@
+import re
+from itertools import groupby
+from operator import itemgetter
+
+from attrs import field, frozen
+from numpy import arange, concatenate, full, int16, int32, object_, select
+from numpy.typing import NDArray
+from pandas import Categorical, CategoricalDtype, DataFrame, Series, concat
+
+# ? ----------------------------------------------------------------------------
+# ? Accession patterns
+#
+# Patterns are compiled once and matched against whole accessions. Only
+# nucleotide accessions are accepted. Remaining patterns are used to explain
+# why an accession was rejected.
+#
+# ? ----------------------------------------------------------------------------
+
+
+NUCLEOTIDE_PATTERN = re.compile(r"[A-Z]{1,2}_?[0-9]{5,8}")
+PROTEIN_PATTERN = re.compile(r"[A-Z]{3}[0-9]{5,7}")
+WGS_PATTERN = re.compile(r"[A-Z]{4,6}[0-9]{2}[0-9]{6,7}")
+MGA_PATTERN = re.compile(r"[A-Z]{5}[0-9]{7}")
+
+
+@frozen(kw_only=True)
+class AccessionIssue:
+    """Invalid accession found in a gene column.
+
+    Attributes:
+        row (int): The index of the content row containing the accession.
+        column (str): The gene column containing the accession.
+        accession (str): The invalid accession.
+        reason (str): Why the accession was rejected.
+
+    """
+
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    row: int = field()
+    column: str = field()
+    accession: str = field()
+    reason: str = field()
+
+
+def explode_accessions(data: DataFrame, gene_fields: list[str]) -> Series:
+    """Explode the gene columns into a single series of accessions.
+
+    Cells may contain comma separated accessions or lists of accessions.
+    Empty cells are dropped.
+
+    Args:
+        data (DataFrame): The source table data.
+        gene_fields (list[str]): The gene columns.
+
+    Returns:
+        Series: The stripped accessions indexed by (row, column).
+
+    """
+
+    accessions = data[gene_fields].stack().explode().dropna().astype(str)
+
+    # Only cells containing multiple accessions are split. Most cells contain
+    # a single accession and splitting would only allocate single item lists.
+    if (multiple := accessions.str.contains(",", regex=False)).any():
+        accessions = concat(
+            [
+                accessions[~multiple],
+                accessions[multiple].str.split(",").explode(),
+            ]
+        )
+
+    return accessions[accessions != ""].str.strip()
+
+
+def find_invalid_accessions(
+    data: DataFrame,
+    gene_fields: list[str],
+) -> list[AccessionIssue]:
+    """Find all invalid accessions of the gene columns.
+
+    All gene columns are exploded once and each accession is matched against
+    the precompiled patterns, thus all invalid accessions are reported at once
+    instead of failing at the first one.
+
+    Args:
+        data (DataFrame): The source table data.
+        gene_fields (list[str]): The gene columns.
+
+    Returns:
+        list[AccessionIssue]: The invalid accessions, ordered by row and
+            column position.
+
+    """
+
+    if len(gene_fields) == 0 or data.shape[0] == 0:
+        return []
+
+    accessions = explode_accessions(data, gene_fields)
+
+    invalid = accessions[
+        ~accessions.str.fullmatch(NUCLEOTIDE_PATTERN).astype(bool)
+    ]
+
+    if invalid.empty:
+        return []
+
+    reasons = select(
+        [
+            invalid.str.fullmatch(PROTEIN_PATTERN).astype(bool),
+            invalid.str.fullmatch(WGS_PATTERN).astype(bool),
+            invalid.str.fullmatch(MGA_PATTERN).astype(bool),
+        ],
+        [
+            f"Accession is a protein ({PROTEIN_PATTERN.pattern})",
+            f"Accession is a wgs ({WGS_PATTERN.pattern})",
+            f"Accession is a mga ({MGA_PATTERN.pattern})",
+        ],
+        default=(
+            "Invalid nucleotide format of accession "
+            + f"({NUCLEOTIDE_PATTERN.pattern})"
+        ),
+    )
+
+    column_positions = {column: index for index, column in enumerate(data)}
+
+    return sorted(
+        (
+            AccessionIssue(
+                row=row,
+                column=column,
+                accession=accession,
+                reason=reason,
+            )
+            for (row, column), accession, reason in zip(
+                invalid.index, invalid.tolist(), reasons
+            )
+        ),
+        key=lambda issue: (issue.row, column_positions[issue.column]),
+    )
+
+
+# ? ----------------------------------------------------------------------------
+# ? Duplicated accessions
+# ? ----------------------------------------------------------------------------
+
+
+@frozen(kw_only=True)
+class DuplicatedAccession:
+    """Accession found more than once in gene columns.
+
+    Attributes:
+        accession (str): The duplicated accession.
+        occurrences (tuple[tuple[int, str], ...]): The (row, column) pairs
+            containing the accession, ordered by row and column position.
+
+    """
+
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    accession: str = field()
+    occurrences: tuple[tuple[int, str], ...] = field()
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC PROPERTIES
+    # ? ------------------------------------------------------------------------
+
+    @property
+    def columns(self) -> list[str]:
+        return list(dict.fromkeys(column for _, column in self.occurrences))
+
+    @property
+    def rows(self) -> list[int]:
+        return list(dict.fromkeys(row for row, _ in self.occurrences))
+
+
+@frozen(kw_only=True)
+class DuplicatedAccessionsReport:
+    """Duplicated accessions of the gene columns.
+
+    Attributes:
+        within_genes (tuple[DuplicatedAccession, ...]): Accessions found more
+            than once in the same gene column. Occurrences include only the
+            column where the accession is duplicated.
+        between_genes (tuple[DuplicatedAccession, ...]): Accessions found in
+            more than one gene column.
+
+    """
+
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    within_genes: tuple[DuplicatedAccession, ...] = field(default=())
+    between_genes: tuple[DuplicatedAccession, ...] = field(default=())
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC PROPERTIES
+    # ? ------------------------------------------------------------------------
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.within_genes) == 0 and len(self.between_genes) == 0
+
+
+def find_duplicated_accessions(
+    data: DataFrame,
+    gene_fields: list[str],
+) -> DuplicatedAccessionsReport:
+    """Find accessions duplicated within and between gene columns.
+
+    Individual accessions of comma separated cells are considered. All gene
+    columns are exploded once into an accession to (row, column) index and
+    duplicates are found by hashing, thus the detection is linear in the
+    number of accessions.
+
+    Args:
+        data (DataFrame): The source table data.
+        gene_fields (list[str]): The gene columns.
+
+    Returns:
+        DuplicatedAccessionsReport: The duplicated accessions.
+
+    """
+
+    if len(gene_fields) == 0 or data.shape[0] == 0:
+        return DuplicatedAccessionsReport()
+
+    accessions = explode_accessions(data, gene_fields)
+
+    index = DataFrame(
+        {
+            "row": accessions.index.get_level_values(0),
+            "column": accessions.index.get_level_values(1),
+            "accession": accessions.to_numpy(),
+        }
+    )
+
+    column_positions = {
+        column: position for position, column in enumerate(data)
+    }
+    index["position"] = index["column"].map(column_positions)
+
+    def build_duplicates(
+        duplicated: DataFrame,
+        keys: list[str],
+    ) -> tuple[DuplicatedAccession, ...]:
+        # Grouping is done over sorted plain lists, since building a pandas
+        # group for each duplicated accession is slow for large tables.
+        duplicated = duplicated.sort_values([*keys, "row", "position"])
+
+        return tuple(
+            DuplicatedAccession(
+                accession=group[0][0],
+                occurrences=tuple((row, column) for _, _, row, column in group),
+            )
+            for group in (
+                list(group)
+                for _, group in groupby(
+                    zip(
+                        duplicated["accession"].tolist(),
+                        duplicated[keys].itertuples(index=False, name=None),
+                        duplicated["row"].tolist(),
+                        duplicated["column"].tolist(),
+                    ),
+                    key=itemgetter(1),
+                )
+            )
+        )
+
+    # ? ------------------------------------------------------------------------
+    # ? Accessions repeated in the same gene column
+    # ? ------------------------------------------------------------------------
+
+    within_genes = build_duplicates(
+        index[index.duplicated(["column", "accession"], keep=False)],
+        keys=["position", "accession"],
+    )
+
+    # ? ------------------------------------------------------------------------
+    # ? Accessions shared by multiple gene columns
+    # ? ------------------------------------------------------------------------
+
+    by_column = index.drop_duplicates(["column", "accession"])
+
+    between_genes = build_duplicates(
+        index[
+            index["accession"].isin(
+                by_column.loc[
+                    by_column.duplicated("accession", keep=False), "accession"
+                ]
+            )
+        ],
+        keys=["accession"],
+    )
+
+    return DuplicatedAccessionsReport(
+        within_genes=within_genes,
+        between_genes=between_genes,
+    )
+
+
+# ? ----------------------------------------------------------------------------
+# ? Long-form accessions
+# ? ----------------------------------------------------------------------------
+
+
+def build_accessions_table(
+    data: DataFrame, gene_fields: list[str]
+) -> DataFrame:
+    """Build the long-form view of the gene columns.
+
+    The accession objects of the wide view are referenced instead of copied,
+    thus the long-form view costs only the row positions, the gene codes, and
+    one reference by accession.
+
+    Args:
+        data (DataFrame): The data table content. Gene cells should contain
+            lists of accessions, single accessions, or null values.
+        gene_fields (list[str]): The gene columns.
+
+    Returns:
+        DataFrame: A table with one row by accession, containing the `row`
+            position in data (int32), the `gene` (categorical, ordered as the
+            gene fields), and the `accession`. Rows are ordered by gene and
+            by their position in data.
+
+    """
+
+    genes_dtype = CategoricalDtype(categories=gene_fields)
+
+    if len(gene_fields) == 0 or data.shape[0] == 0:
+        return DataFrame(
+            {
+                "row": Series(dtype=int32),
+                "gene": Series(dtype=genes_dtype),
+                "accession": Series(dtype=object),
+            }
+        )
+
+    rows: list[NDArray[int32]] = []
+    codes: list[NDArray[int16]] = []
+    accessions: list[NDArray[object_]] = []
+
+    positions = Series(arange(data.shape[0], dtype=int32), index=data.index)
+
+    for code, gene in enumerate(gene_fields):
+        exploded = data[gene].explode().dropna()
+
+        rows.append(positions.loc[exploded.index].to_numpy())
+        codes.append(full(exploded.shape[0], code, dtype=int16))
+        accessions.append(exploded.to_numpy(dtype=object))
+
+    return DataFrame(
+        {
+            "row": concatenate(rows),
+            "gene": Categorical.from_codes(
+                concatenate(codes),
+                dtype=genes_dtype,
+            ),
+            "accession": concatenate(accessions),
+        }
+    )
@@ -0,0 +1,195 @@
+import pickle
+from hashlib import sha256
+from pathlib import Path
+from struct import Struct
+from typing import Any, BinaryIO, Literal
+from uuid import uuid4
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.settings import LOGGER
+
+# ? ----------------------------------------------------------------------------
+# ? Checkpoint format
+#
+# A fixed size header followed by a pickle payload. The header contains the
+# magic bytes, the format version, the SHA-256 digest and the size of the
+# payload. The digest is verified before the payload is unpickled, thus
+# truncated or corrupted files are rejected instead of partially loaded.
+#
+# Checkpoints are intermediary files written and read by the same tool. They
+# are not an exchange format, and should never be loaded from untrusted
+# sources, as unpickling could execute arbitrary code.
+#
+# The version should be increased whenever the pickled classes change, thus
+# checkpoints written by previous versions are ignored.
+#
+# ? ----------------------------------------------------------------------------
+
+
+CHECKPOINT_MAGIC = b"GCONCKPT"
+
+
+CHECKPOINT_VERSION = 3
+
+
+CHECKPOINT_FILE_NAME = "reference_data.ckpt"
+
+
+CHECKPOINT_PICKLE_PROTOCOL = 5
+
+
+# Magic, version, payload digest, and payload size
+CHECKPOINT_HEADER = Struct(">8sH32sQ")
+
+
+def dump_checkpoint(
+    content: Any,
+    checkpoint_path: Path,
+) -> Either[exc.MappedErrors, Literal[True]]:
+    """Write a checkpoint file.
+
+    The payload is hashed while it is pickled, thus it is never held in memory
+    as a whole. The file is written to a temporary path and moved into place,
+    thus an interrupted writing never replaces a valid checkpoint.
+
+    Args:
+        content (Any): The picklable checkpoint content.
+        checkpoint_path (Path): The checkpoint file path.
+
+    Returns:
+        Either[exc.MappedErrors, Literal[True]]: A positive response if the
+            checkpoint was written or a negative response with the errors.
+
+    """
+
+    temporary_path = checkpoint_path.with_name(
+        f".{checkpoint_path.name}.{uuid4()}"
+    )
+
+    try:
+        with temporary_path.open("wb") as f:
+            f.write(bytes(CHECKPOINT_HEADER.size))
+
+            writer = _HashingWriter(f)
+
+            pickle.dump(
+                content,
+                writer,
+                protocol=CHECKPOINT_PICKLE_PROTOCOL,
+            )
+
+            f.seek(0)
+            f.write(
+                CHECKPOINT_HEADER.pack(
+                    CHECKPOINT_MAGIC,
+                    CHECKPOINT_VERSION,
+                    writer.digest.digest(),
+                    writer.size,
+                )
+            )
+
+        temporary_path.replace(checkpoint_path)
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
+
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
+def load_checkpoint(checkpoint_path: Path) -> Either[exc.MappedErrors, Any]:
+    """Read a checkpoint file.
+
+    Args:
+        checkpoint_path (Path): The checkpoint file path.
+
+    Returns:
+        Either[exc.MappedErrors, Any]: The checkpoint content or an error if
+            the file is missing, was written by another format version, or
+            does not match its digest.
+
+    """
+
+    try:
+        if checkpoint_path.is_file() is False:
+            return exc.DadaTransferObjectError(
+                f"Invalid file path: `{checkpoint_path}`",
+                logger=LOGGER,
+            )()
+
+        with checkpoint_path.open("rb") as f:
+            # ? ----------------------------------------------------------------
+            # ? Validate header
+            # ? ----------------------------------------------------------------
+
+            raw_header = f.read(CHECKPOINT_HEADER.size)
+
+            if len(raw_header) != CHECKPOINT_HEADER.size:
+                return exc.DadaTransferObjectError(
+                    "Unable to load checkpoint. Truncated header.",
+                    logger=LOGGER,
+                )()
+
+            magic, version, digest, size = CHECKPOINT_HEADER.unpack(raw_header)
+
+            if magic != CHECKPOINT_MAGIC:
+                return exc.DadaTransferObjectError(
+                    "Unable to load checkpoint. Unknown file format.",
+                    logger=LOGGER,
+                )()
+
+            if version != CHECKPOINT_VERSION:
+                return exc.DadaTransferObjectError(
+                    (
+                        "Unable to load checkpoint. Unsupported version: "
+                        + f"{version}"
+                    ),
+                    logger=LOGGER,
+                )()
+
+            # ? ----------------------------------------------------------------
+            # ? Validate payload
+            # ? ----------------------------------------------------------------
+
+            payload_digest = sha256()
+            payload_size = 0
+
+            while block := f.read(1 << 20):
+                payload_digest.update(block)
+                payload_size += len(block)
+
+            if payload_size != size or payload_digest.digest() != digest:
+                return exc.DadaTransferObjectError(
+                    "Unable to load checkpoint. Checksum mismatch.",
+                    logger=LOGGER,
+                )()
+
+            # ? ----------------------------------------------------------------
+            # ? Load payload
+            # ? ----------------------------------------------------------------
+
+            f.seek(CHECKPOINT_HEADER.size)
+
+            return right(pickle.load(f))
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
+
+
+class _HashingWriter:
+    """A write-only file wrapper that hashes and counts the written bytes."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self.__f = f
+        self.digest = sha256()
+        self.size = 0
+
+    def write(self, block: bytes) -> int:
+        self.digest.update(block)
+        self.size += len(block)
+
+        return self.__f.write(block)
@@ -0,0 +1,197 @@
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from json import dump, load
+from os import cpu_count
+from pathlib import Path
+
+from bibtexparser import __version__ as bibtexparser_version
+from bibtexparser import loads as bib_loads
+from pandas import Series
+
+from gcon.settings import LITERATURE_PROCESSES_THRESHOLD, LOGGER
+
+# ? ----------------------------------------------------------------------------
+# ? Validation results memo
+#
+# Results are indexed by the SHA-256 digest of the BibTeX entry, being None the
+# valid entries and the rejection reason the invalid ones. Results are shared by
+# all validations of the process, thus the same entry is parsed only once. The
+# version is stored with persisted results and results of other versions are
+# discarded on loading.
+#
+# ? ----------------------------------------------------------------------------
+
+
+BIB_VALIDATION_VERSION = f"1:bibtexparser-{bibtexparser_version}"
+
+
+BIB_VALIDATION_FILE_NAME = "literature-validation.json"
+
+
+_BIB_VALIDATION_RESULTS: dict[str, str | None] = dict()
+
+
+def build_bib_digest(bib: str) -> str:
+    """Build the digest indexing the validation result of a BibTeX entry.
+
+    Args:
+        bib (str): A BibTeX entry.
+
+    Returns:
+        str: The SHA-256 hex digest of the entry.
+
+    """
+
+    return sha256(bib.encode("utf-8")).hexdigest()
+
+
+def check_bib(bib: str) -> str | None:
+    """Parse and check a BibTeX entry.
+
+    Args:
+        bib (str): A BibTeX entry.
+
+    Returns:
+        str | None: None if the entry is valid or the rejection reason
+            otherwise.
+
+    """
+
+    try:
+        libs = bib_loads(bib)
+    except Exception as e:
+        return f"Unable to parse bib: {e}"
+
+    if not libs.entries:
+        return "Bib is empty"
+
+    for entry in libs.entries:
+        if any(
+            [
+                entry.get("ID") is None,
+                entry.get("ENTRYTYPE") is None,
+                entry.get("author") is None,
+                entry.get("title") is None,
+                entry.get("year") is None,
+            ]
+        ):
+            return "Bib is missing ENTRYTYPE/author/title/year"
+
+    return None
+
+
+def validate_bibs(
+    bibs: Series,
+    processes_threshold: int = LITERATURE_PROCESSES_THRESHOLD,
+) -> Series:
+    """Validate BibTeX entries of a literature column.
+
+    Cells are deduplicated before validation and only entries without a
+    memoized result are parsed. Parsing is spread over a process pool when the
+    number of entries to parse reaches the threshold.
+
+    Args:
+        bibs (Series): The literature cells. Null cells are ignored.
+        processes_threshold (int): The minimum number of entries to parse to
+            use a process pool.
+
+    Returns:
+        Series: The rejection reason of each cell, being None the valid cells.
+
+    """
+
+    unique_bibs = bibs.dropna().astype(str).unique().tolist()
+    digests = [build_bib_digest(bib) for bib in unique_bibs]
+
+    pending = {
+        digest: bib
+        for digest, bib in zip(digests, unique_bibs)
+        if digest not in _BIB_VALIDATION_RESULTS
+    }
+
+    if len(pending) >= max(processes_threshold, 2):
+        workers = min(cpu_count() or 1, len(pending))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reasons = list(
+                executor.map(
+                    check_bib,
+                    pending.values(),
+                    chunksize=max(1, len(pending) // (workers * 4)),
+                )
+            )
+    else:
+        reasons = [check_bib(bib) for bib in pending.values()]
+
+    _BIB_VALIDATION_RESULTS.update(zip(pending, reasons))
+
+    reasons_by_bib = {
+        bib: _BIB_VALIDATION_RESULTS[digest]
+        for digest, bib in zip(digests, unique_bibs)
+    }
+
+    return bibs.map(lambda bib: reasons_by_bib[str(bib)], na_action="ignore")
+
+
+def load_bib_validation_results(path: Path) -> int:
+    """Load persisted validation results into the memo.
+
+    Missing files and results of other validation versions are ignored.
+
+    Args:
+        path (Path): The JSON file containing the results.
+
+    Returns:
+        int: The number of loaded results.
+
+    """
+
+    if not path.is_file():
+        return 0
+
+    try:
+        with path.open("r") as f:
+            content = load(f)
+    except ValueError:
+        LOGGER.warning(f"Ignoring invalid literature validation cache: {path}")
+        return 0
+
+    if (
+        not isinstance(content, dict)
+        or content.get("version") != BIB_VALIDATION_VERSION
+        or not isinstance(results := content.get("results"), dict)
+    ):
+        return 0
+
+    _BIB_VALIDATION_RESULTS.update(
+        {
+            digest: reason
+            for digest, reason in results.items()
+            if reason is None or isinstance(reason, str)
+        }
+    )
+
+    return len(results)
+
+
+def dump_bib_validation_results(path: Path) -> None:
+    """Persist the memoized validation results.
+
+    Args:
+        path (Path): The JSON file to write.
+
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f".{path.name}.tmp")
+
+    with temporary_path.open("w") as f:
+        dump(
+            {
+                "version": BIB_VALIDATION_VERSION,
+                "results": _BIB_VALIDATION_RESULTS,
+            },
+            f,
+        )
+
+    temporary_path.replace(path)
@@ -11,6 +11,8 @@ class ConnectionScores:
 
     Methods:
         to_dict: Convert the connection scores to a dictionary.
+        build_profile_field_name: Build the name of a score field calculated
+            with an additional scoring profile.
 
     """
 
@@ -37,3 +39,23 @@ class ConnectionScores:
             "observed_completeness_score": self.observed_completeness_score,
             "reachable_completeness_score": self.reachable_completeness_score,
         }
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC STATIC METHODS
+    # ? ------------------------------------------------------------------------
+
+    @staticmethod
+    def build_profile_field_name(profile_name: str, field_name: str) -> str:
+        """Build the name of a score field of an additional scoring profile.
+
+        Args:
+            profile_name (str): The scoring profile name.
+            field_name (str): The score field name, e.g.
+                `observed_completeness_score`.
+
+        Returns:
+            str: The field name prefixed by the profile name.
+
+        """
+
+        return f"{profile_name}.{field_name}"
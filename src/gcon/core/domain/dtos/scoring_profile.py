@@ -0,0 +1,289 @@
+from json import load
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Self
+
+import clean_base.exceptions as exc
+from attrs import evolve, field, frozen
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.metadata import MetadataGroupUnit, MetadataKeyGroup
+from gcon.settings import LOGGER
+
+
+def _normalize_groups(
+    groups: Mapping[MetadataKeyGroup, MetadataGroupUnit],
+) -> Mapping[MetadataKeyGroup, MetadataGroupUnit]:
+    """Copy the groups into a read-only mapping with lowercase keys.
+
+    Qualifier keys are lowercased when parsed, thus profiles built from the
+    enum definitions and from JSON files should match keys the same way.
+
+    """
+
+    return MappingProxyType(
+        {
+            group: evolve(unit, keys=[key.lower() for key in unit.keys])
+            for group, unit in groups.items()
+        }
+    )
+
+
+@frozen(kw_only=True)
+class ScoringProfile:
+    """Scoring profile class.
+
+    A scoring profile defines the weight of each metadata key group and the
+    qualifier keys that belong to each group. The default profile mirrors the
+    `MetadataKeyGroup` definitions.
+
+    Attributes:
+        name (str): The profile name.
+        groups (Mapping[MetadataKeyGroup, MetadataGroupUnit]): The weight and
+            lowercase keys of each group.
+        key_groups (Mapping[str, MetadataKeyGroup]): A lookup table from the
+            lowercase qualifier key to its group.
+
+    Methods:
+        default: Build the default scoring profile.
+        from_dict: Build a scoring profile from a dictionary.
+        from_json: Load a scoring profile from a JSON file.
+
+    """
+
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    name: str = field()
+    groups: Mapping[MetadataKeyGroup, MetadataGroupUnit] = field(
+        converter=_normalize_groups,
+    )
+    key_groups: Mapping[str, MetadataKeyGroup] = field(init=False)
+
+    # ? ------------------------------------------------------------------------
+    # ? VALIDATORS AND DEFAULTS
+    # ? ------------------------------------------------------------------------
+
+    @key_groups.default
+    def _set_default_key_groups(self) -> Mapping[str, MetadataKeyGroup]:
+        return MappingProxyType(
+            {
+                key: group
+                for group, unit in self.groups.items()
+                for key in unit.keys
+            }
+        )
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC INSTANCE METHODS
+    # ? ------------------------------------------------------------------------
+
+    def get_weight(self, group: MetadataKeyGroup) -> int:
+        """Get the weight of a group.
+
+        Args:
+            group (MetadataKeyGroup): The group.
+
+        Returns:
+            int: The group weight. Groups not included in the profile weight
+                zero.
+
+        """
+
+        if (unit := self.groups.get(group)) is None:
+            return 0
+
+        return unit.score
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the scoring profile to a dictionary.
+
+        Returns:
+            dict[str, Any]: The scoring profile as a dictionary.
+
+        """
+
+        return {
+            "name": self.name,
+            "groups": {
+                group.name: {
+                    "description": unit.description,
+                    "score": unit.score,
+                    "keys": list(unit.keys),
+                }
+                for group, unit in self.groups.items()
+            },
+        }
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC CLASS METHODS
+    # ? ------------------------------------------------------------------------
+
+    @classmethod
+    def default(cls) -> Self:
+        """Build the default scoring profile.
+
+        Returns:
+            Self: A profile with the `MetadataKeyGroup` weights and keys.
+
+        """
+
+        return cls(
+            name="default",
+            groups={group: group.value for group in MetadataKeyGroup},
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        content: dict[str, Any],
+    ) -> Either[exc.MappedErrors, Self]:
+        """Build a scoring profile from a dictionary.
+
+        Groups not included in the dictionary, or group attributes not
+        informed, fall back to the `MetadataKeyGroup` definitions.
+
+        Example:
+            {
+                "name": "host-centric",
+                "groups": {
+                    "HOST_SUBSTRATE": {"score": 8},
+                    "SPECIMEN": {"score": 3, "keys": ["strain", "isolate"]}
+                }
+            }
+
+        Args:
+            content (dict[str, Any]): The profile content.
+
+        Returns:
+            Either[exc.MappedErrors, Self]: The scoring profile or an error.
+
+        """
+
+        if not isinstance(content, dict):
+            return exc.DadaTransferObjectError(
+                "Unable to load scoring profile. Content must be a dictionary.",
+                logger=LOGGER,
+            )()
+
+        if not isinstance(name := content.get("name"), str):
+            return exc.DadaTransferObjectError(
+                "Unable to load scoring profile. Name must be a string.",
+                logger=LOGGER,
+            )()
+
+        if not isinstance(groups_content := content.get("groups", {}), dict):
+            return exc.DadaTransferObjectError(
+                "Unable to load scoring profile. Groups must be a dictionary.",
+                logger=LOGGER,
+            )()
+
+        groups: dict[MetadataKeyGroup, MetadataGroupUnit] = {
+            group: group.value for group in MetadataKeyGroup
+        }
+
+        for group_name, group_content in groups_content.items():
+            try:
+                group = MetadataKeyGroup[group_name]
+            except KeyError:
+                return exc.DadaTransferObjectError(
+                    (
+                        "Unable to load scoring profile. Invalid metadata key "
+                        + f"group: `{group_name}`."
+                    ),
+                    logger=LOGGER,
+                )()
+
+            if not isinstance(group_content, dict):
+                return exc.DadaTransferObjectError(
+                    (
+                        "Unable to load scoring profile. Group "
+                        + f"`{group_name}` must be a dictionary."
+                    ),
+                    logger=LOGGER,
+                )()
+
+            score = group_content.get("score", group.value.score)
+            keys = group_content.get("keys", group.value.keys)
+
+            if not isinstance(score, int) or isinstance(score, bool):
+                return exc.DadaTransferObjectError(
+                    (
+                        "Unable to load scoring profile. Score of group "
+                        + f"`{group_name}` must be an integer."
+                    ),
+                    logger=LOGGER,
+                )()
+
+            if not isinstance(keys, list) or not all(
+                isinstance(key, str) for key in keys
+            ):
+                return exc.DadaTransferObjectError(
+                    (
+                        "Unable to load scoring profile. Keys of group "
+                        + f"`{group_name}` must be a list of strings."
+                    ),
+                    logger=LOGGER,
+                )()
+
+            groups[group] = MetadataGroupUnit(
+                description=group_content.get(
+                    "description",
+                    group.value.description,
+                ),
+                score=score,
+                keys=keys,
+            )
+
+        # ? --------------------------------------------------------------------
+        # ? Keys should belong to a single group
+        # ? --------------------------------------------------------------------
+
+        key_owners: dict[str, MetadataKeyGroup] = dict()
+
+        for group, unit in groups.items():
+            for key in unit.keys:
+                if (owner := key_owners.get(key.lower())) is not None:
+                    return exc.DadaTransferObjectError(
+                        (
+                            f"Unable to load scoring profile. Key `{key}` "
+                            + f"belongs to groups `{owner.name}` and "
+                            + f"`{group.name}`."
+                        ),
+                        logger=LOGGER,
+                    )()
+
+                key_owners[key.lower()] = group
+
+        return right(cls(name=name, groups=groups))
+
+    @classmethod
+    def from_json(
+        cls,
+        json_path: Path,
+    ) -> Either[exc.MappedErrors, Self]:
+        """Load a scoring profile from a JSON file.
+
+        Args:
+            json_path (Path): The path to the JSON file.
+
+        Returns:
+            Either[exc.MappedErrors, Self]: The scoring profile or an error.
+
+        """
+
+        try:
+            if json_path.is_file() is False:
+                return exc.DadaTransferObjectError(
+                    f"Invalid file path: `{json_path}`",
+                    logger=LOGGER,
+                )()
+
+            with json_path.open("r") as f:
+                content = load(f)
+
+            return cls.from_dict(content)
+
+        except Exception as e:
+            return exc.DadaTransferObjectError(e, logger=LOGGER)()
@@ -0,0 +1,122 @@
+from unittest import TestCase
+
+from numpy import nan
+from pandas import DataFrame
+
+from gcon.core.domain.dtos.reference_data.accessions import (
+    build_accessions_table,
+    find_duplicated_accessions,
+    find_invalid_accessions,
+)
+
+
+class FindInvalidAccessionsTest(TestCase):
+    def test_valid_accessions(self) -> None:
+        data = DataFrame(
+            {
+                "nuc-its": ["KX452442", "NR_12345", nan],
+                "mit-gapdh": ["KX452408, KX452409", [], ["AB123456"]],
+            }
+        )
+
+        self.assertEqual(
+            find_invalid_accessions(data, ["nuc-its", "mit-gapdh"]),
+            [],
+        )
+
+    def test_all_invalid_accessions_are_reported(self) -> None:
+        data = DataFrame(
+            {
+                "nuc-its": ["ABC12345", "KX452442"],
+                "mit-gapdh": ["KX452408, invalid", "ABCDE1234567"],
+            }
+        )
+
+        issues = find_invalid_accessions(data, ["nuc-its", "mit-gapdh"])
+
+        self.assertEqual(
+            [(i.row, i.column, i.accession) for i in issues],
+            [
+                (0, "nuc-its", "ABC12345"),
+                (0, "mit-gapdh", "invalid"),
+                (1, "mit-gapdh", "ABCDE1234567"),
+            ],
+        )
+
+        self.assertIn("protein", issues[0].reason)
+        self.assertIn("nucleotide", issues[1].reason)
+        self.assertIn("mga", issues[2].reason)
+
+
+class FindDuplicatedAccessionsTest(TestCase):
+    def test_no_duplicated_accessions(self) -> None:
+        data = DataFrame(
+            {
+                "nuc-its": ["KX452442", "KX452443", nan],
+                "mit-gapdh": ["KX452408, KX452409", [], ["AB123456"]],
+            }
+        )
+
+        self.assertTrue(
+            find_duplicated_accessions(data, ["nuc-its", "mit-gapdh"]).is_empty
+        )
+
+    def test_duplicated_accessions_are_reported(self) -> None:
+        data = DataFrame(
+            {
+                "nuc-its": ["KX452442", "KX452443, KX452442", "AB123456"],
+                "mit-gapdh": ["KX452408", "KX452409", "KX452408, AB123456"],
+            }
+        )
+
+        report = find_duplicated_accessions(data, ["nuc-its", "mit-gapdh"])
+
+        self.assertEqual(
+            [(i.accession, i.occurrences) for i in report.within_genes],
+            [
+                ("KX452442", ((0, "nuc-its"), (1, "nuc-its"))),
+                ("KX452408", ((0, "mit-gapdh"), (2, "mit-gapdh"))),
+            ],
+        )
+
+        self.assertEqual(
+            [(i.accession, i.columns, i.rows) for i in report.between_genes],
+            [("AB123456", ["nuc-its", "mit-gapdh"], [2])],
+        )
+
+
+class BuildAccessionsTableTest(TestCase):
+    def test_long_form_view_of_gene_fields(self) -> None:
+        data = DataFrame(
+            {
+                "nuc-its": [["KX452442"], [], ["NR_12345"]],
+                "mit-gapdh": [["KX452408", "KX452409"], nan, ["AB123456"]],
+            },
+            index=[10, 11, 12],
+        )
+
+        accessions = build_accessions_table(data, ["nuc-its", "mit-gapdh"])
+
+        self.assertEqual(
+            list(accessions.itertuples(index=False, name=None)),
+            [
+                (0, "nuc-its", "KX452442"),
+                (2, "nuc-its", "NR_12345"),
+                (0, "mit-gapdh", "KX452408"),
+                (0, "mit-gapdh", "KX452409"),
+                (2, "mit-gapdh", "AB123456"),
+            ],
+        )
+
+        self.assertEqual(
+            accessions["gene"].cat.categories.tolist(),
+            ["nuc-its", "mit-gapdh"],
+        )
+
+        # Accessions are shared with the wide view
+        self.assertIs(accessions["accession"].iat[0], data["nuc-its"].iat[0][0])
+
+    def test_empty_gene_fields(self) -> None:
+        accessions = build_accessions_table(DataFrame({"id": [1]}), [])
+
+        self.assertEqual(accessions.shape, (0, 3))
@@ -0,0 +1,141 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pandas import DataFrame
+
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.metadata import Metadata, MetadataKeyGroup
+from gcon.core.domain.dtos.node import Node
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.domain.dtos.reference_data.checkpoint import CHECKPOINT_HEADER
+from gcon.core.domain.dtos.score import ConnectionScores
+
+
+class ReferenceDataCheckpointTest(TestCase):
+    def setUp(self) -> None:
+        self.__reference_data = ReferenceData(
+            data=DataFrame(
+                {
+                    "identifier": ["CBS 101"],
+                    "scientificName": ["Bipolaris maydis"],
+                    "nuc-its": [["MN000001"]],
+                }
+            ),
+            gene_fields=["nuc-its"],
+        )
+
+        connection = Connection(
+            identifiers=["CBS 101"],
+            nodes=[
+                Node(
+                    accession="MN000001",
+                    marker="nuc-its",
+                    metadata=Metadata()
+                    .add_feature(key="strain", value=["CBS 101"])
+                    .add_feature(key="host", value=["Zea mays"]),
+                )
+            ],
+        )
+
+        connection.with_scores(
+            ConnectionScores(
+                observed_completeness_score=0.5,
+                reachable_completeness_score=0.75,
+            )
+        )
+
+        self.__reference_data.with_connections([connection])
+
+        self.__temporary_dir = TemporaryDirectory()
+        self.__checkpoint_path = Path(self.__temporary_dir.name).joinpath(
+            "reference_data.ckpt"
+        )
+
+    def tearDown(self) -> None:
+        self.__temporary_dir.cleanup()
+        MetadataKeyGroup.configure_key_groups()
+
+    def test_checkpoint_round_trip(self) -> None:
+        self.assertTrue(
+            self.__reference_data.to_checkpoint(
+                checkpoint_path=self.__checkpoint_path,
+            ).is_right
+        )
+
+        response = ReferenceData.from_checkpoint(
+            checkpoint_path=self.__checkpoint_path,
+        )
+
+        self.assertTrue(response.is_right)
+
+        loaded: ReferenceData = response.value
+        connection = self.__reference_data.connections[0]
+        loaded_connection = loaded.connections[0]
+
+        self.assertTrue(loaded.data.equals(self.__reference_data.data))
+        self.assertEqual(loaded.gene_fields, ["nuc-its"])
+        self.assertEqual(loaded_connection.id, connection.id)
+        self.assertEqual(loaded_connection.signature, connection.signature)
+        self.assertEqual(loaded_connection.scores, connection.scores)
+        self.assertTrue(
+            loaded.accessions.equals(self.__reference_data.accessions)
+        )
+
+        # ? Metadata keys are the shared instances
+        for key, loaded_key in zip(
+            connection.nodes[0].metadata.qualifiers,
+            loaded_connection.nodes[0].metadata.qualifiers,
+        ):
+            self.assertIs(key, loaded_key)
+
+    def test_checkpoint_with_corrupted_payload(self) -> None:
+        self.__reference_data.to_checkpoint(
+            checkpoint_path=self.__checkpoint_path,
+        )
+
+        content = bytearray(self.__checkpoint_path.read_bytes())
+        content[CHECKPOINT_HEADER.size + 10] ^= 0xFF
+        self.__checkpoint_path.write_bytes(bytes(content))
+
+        response = ReferenceData.from_checkpoint(
+            checkpoint_path=self.__checkpoint_path,
+        )
+
+        self.assertTrue(response.is_left)
+        self.assertIn("Checksum mismatch", str(response.value.msg))
+
+    def test_checkpoint_with_truncated_file(self) -> None:
+        self.__reference_data.to_checkpoint(
+            checkpoint_path=self.__checkpoint_path,
+        )
+
+        content = self.__checkpoint_path.read_bytes()
+        self.__checkpoint_path.write_bytes(content[:-10])
+
+        self.assertTrue(
+            ReferenceData.from_checkpoint(
+                checkpoint_path=self.__checkpoint_path,
+            ).is_left
+        )
+
+    def test_checkpoint_with_another_key_classification(self) -> None:
+        self.__reference_data.to_checkpoint(
+            checkpoint_path=self.__checkpoint_path,
+        )
+
+        MetadataKeyGroup.configure_key_groups(
+            {"strain": MetadataKeyGroup.TAXONOMY}
+        )
+
+        self.assertTrue(
+            ReferenceData.from_checkpoint(
+                checkpoint_path=self.__checkpoint_path,
+            ).is_left
+        )
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
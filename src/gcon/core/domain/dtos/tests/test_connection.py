@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.metadata import (
+    Metadata,
+    MetadataKey,
+    MetadataKeyGroup,
+)
+from gcon.core.domain.dtos.node import Node
+
+
+class ConnectionSignatureTest(TestCase):
+    def setUp(self) -> None:
+        self.__nodes = [
+            Node(
+                accession="KX452442",
+                marker="nuc-its",
+                metadata=Metadata().add_feature("strain", ["BRIP 12490"]),
+            ),
+            Node(
+                accession="KX452408",
+                marker="mit-gapdh",
+                metadata=Metadata().add_feature("strain", ["BRIP 12490"]),
+            ),
+        ]
+
+    def test_signature_does_not_depend_on_order(self) -> None:
+        first = Connection(
+            identifiers={"BRIP 12490", "BRIP 12490T"},
+            nodes=self.__nodes,
+        )
+
+        second = Connection(
+            identifiers={"BRIP 12490T", "BRIP 12490"},
+            nodes=list(reversed(self.__nodes)),
+        )
+
+        self.assertEqual(first.signature, second.signature)
+
+    def test_signature_changes_with_nodes_metadata(self) -> None:
+        connection = Connection(
+            identifiers={"BRIP 12490"},
+            nodes=self.__nodes,
+        )
+
+        signature = connection.signature
+        self.assertIs(connection.signature, signature)
+
+        self.__nodes[0].metadata.add_feature("host", ["Austrostipa"])
+        self.assertNotEqual(connection.signature, signature)
+
+    def test_signature_changes_with_identifiers(self) -> None:
+        connection = Connection(
+            identifiers={"BRIP 12490"},
+            nodes=self.__nodes,
+        )
+
+        signature = connection.signature
+        connection.identifiers.add("BRIP 12490T")
+
+        self.assertNotEqual(connection.signature, signature)
+
+    def test_signature_changes_with_set_qualifier(self) -> None:
+        connection = Connection(
+            identifiers={"BRIP 12490"},
+            nodes=self.__nodes,
+        )
+
+        signature = connection.signature
+
+        self.__nodes[1].metadata.set_qualifier(
+            key=MetadataKey.intern(
+                group=MetadataKeyGroup.SPECIMEN,
+                key="strain",
+            ),
+            value=["CBS 101"],
+        )
+
+        self.assertNotEqual(connection.signature, signature)
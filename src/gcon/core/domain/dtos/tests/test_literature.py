@@ -0,0 +1,83 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from numpy import nan
+from pandas import Series
+
+from gcon.core.domain.dtos.reference_data import literature
+from gcon.core.domain.dtos.reference_data.literature import (
+    dump_bib_validation_results,
+    load_bib_validation_results,
+    validate_bibs,
+)
+
+VALID_BIB = """@article{tan2016eight,
+  title={Eight novel Bipolaris species},
+  author={Tan, Yu Pei},
+  year={2016}
+}"""
+
+INCOMPLETE_BIB = """@article{tan2016eight,
+  title={Eight novel Bipolaris species},
+  year={2016}
+}"""
+
+
+class ValidateBibsTest(TestCase):
+    def setUp(self) -> None:
+        literature._BIB_VALIDATION_RESULTS.clear()
+
+    def tearDown(self) -> None:
+        literature._BIB_VALIDATION_RESULTS.clear()
+
+    def test_validate_bibs(self) -> None:
+        reasons = validate_bibs(
+            Series([VALID_BIB, INCOMPLETE_BIB, nan, "not a bib", VALID_BIB])
+        )
+
+        self.assertEqual(
+            reasons.isna().tolist(),
+            [True, False, True, False, True],
+        )
+
+        self.assertIn("missing", reasons[1])
+
+    def test_unique_bibs_are_parsed_once(self) -> None:
+        with patch.object(
+            literature,
+            "check_bib",
+            wraps=literature.check_bib,
+        ) as check_bib:
+            validate_bibs(Series([VALID_BIB] * 100 + [INCOMPLETE_BIB] * 100))
+            validate_bibs(Series([VALID_BIB, INCOMPLETE_BIB]))
+
+        self.assertEqual(check_bib.call_count, 2)
+
+    def test_validate_bibs_with_process_pool(self) -> None:
+        bibs = Series(
+            [VALID_BIB.replace("2016", str(year)) for year in range(1990, 2000)]
+            + [INCOMPLETE_BIB]
+        )
+
+        reasons = validate_bibs(bibs, processes_threshold=2)
+
+        self.assertEqual(reasons.isna().tolist(), [True] * 10 + [False])
+
+    def test_persisted_results_skip_parsing(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache_file = Path(directory).joinpath("literature.json")
+
+            validate_bibs(Series([VALID_BIB, INCOMPLETE_BIB]))
+            dump_bib_validation_results(cache_file)
+
+            literature._BIB_VALIDATION_RESULTS.clear()
+
+            self.assertEqual(load_bib_validation_results(cache_file), 2)
+
+            with patch.object(literature, "bib_loads") as bib_loads:
+                reasons = validate_bibs(Series([VALID_BIB, INCOMPLETE_BIB]))
+
+            bib_loads.assert_not_called()
+            self.assertEqual(reasons.isna().tolist(), [True, False])
@@ -24,6 +24,35 @@ class MetadataKeyGroupsTest(TestCase):
         MetadataKeyGroup.self_validate()
 
 
+class MetadataKeyTest(TestCase):
+    def test_intern_returns_shared_instance(self) -> None:
+        first = MetadataKey.intern(
+            group=MetadataKeyGroup.SPECIMEN,
+            key="strain",
+        )
+        second = MetadataKey.intern(
+            group=MetadataKeyGroup.SPECIMEN,
+            key="strain",
+        )
+
+        self.assertIs(first, second)
+
+    def test_interned_key_equals_direct_instance(self) -> None:
+        interned = MetadataKey.intern(group=MetadataKeyGroup.OTHER, key="note")
+        direct = MetadataKey(group=MetadataKeyGroup.OTHER, key="note")
+
+        self.assertEqual(interned, direct)
+        self.assertEqual(hash(interned), hash(direct))
+
+    def test_keys_with_distinct_groups_are_not_equal(self) -> None:
+        self.assertNotEqual(
+            MetadataKey.intern(group=MetadataKeyGroup.OTHER, key="host"),
+            MetadataKey.intern(
+                group=MetadataKeyGroup.HOST_SUBSTRATE, key="host"
+            ),
+        )
+
+
 class MetadataTest(TestCase):
     def test_add_feature_method(self) -> None:
         metadata = Metadata()
@@ -52,3 +81,42 @@ class MetadataTest(TestCase):
                 ): "value"
             },
         )
+
+
+class MetadataKeyGroupsConfigurationTest(TestCase):
+    def tearDown(self) -> None:
+        MetadataKeyGroup.configure_key_groups()
+        MetadataKeyGroup.pop_unclassified_keys()
+
+    def test_configure_key_groups(self) -> None:
+        MetadataKeyGroup.configure_key_groups(
+            {"Strain": MetadataKeyGroup.TAXONOMY}
+        )
+
+        self.assertEqual(
+            MetadataKeyGroup.set_key_group("strain"),
+            MetadataKeyGroup.TAXONOMY,
+        )
+
+        self.assertEqual(
+            MetadataKeyGroup.set_key_group("isolate"),
+            MetadataKeyGroup.OTHER,
+        )
+
+        MetadataKeyGroup.configure_key_groups()
+
+        self.assertEqual(
+            MetadataKeyGroup.set_key_group("strain"),
+            MetadataKeyGroup.SPECIMEN,
+        )
+
+    def test_unclassified_keys_are_counted(self) -> None:
+        MetadataKeyGroup.pop_unclassified_keys()
+
+        for _ in range(3):
+            Metadata().add_feature(key="unknown_key", value=["value"])
+
+        unclassified_keys = MetadataKeyGroup.pop_unclassified_keys()
+
+        self.assertEqual(unclassified_keys["unknown_key"], 3)
+        self.assertFalse(MetadataKeyGroup.pop_unclassified_keys())
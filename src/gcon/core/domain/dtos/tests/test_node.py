@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+from gcon.core.domain.dtos.metadata import (
+    Metadata,
+    MetadataKey,
+    MetadataKeyGroup,
+)
+from gcon.core.domain.dtos.node import Node
+
+
+class NodeSignatureTest(TestCase):
+    def setUp(self) -> None:
+        self.__node = Node(
+            accession="KX452442",
+            marker="nuc-its",
+            metadata=Metadata().add_feature("strain", ["BRIP 12490"]),
+        )
+
+    def test_signature_is_cached(self) -> None:
+        self.assertIs(self.__node.signature, self.__node.signature)
+
+    def test_signature_changes_with_metadata(self) -> None:
+        signature = self.__node.signature
+        self.__node.metadata.add_feature("host", ["Austrostipa"])
+
+        self.assertNotEqual(self.__node.signature, signature)
+
+    def test_signature_changes_with_set_qualifier(self) -> None:
+        signature = self.__node.signature
+        self.__node.metadata.set_qualifier(
+            key=MetadataKey.intern(
+                group=MetadataKeyGroup.SPECIMEN,
+                key="strain",
+            ),
+            value=["CBS 101"],
+        )
+
+        self.assertNotEqual(self.__node.signature, signature)
+
+    def test_qualifiers_are_read_only(self) -> None:
+        values = ["CBS 101"]
+        key = MetadataKey.intern(group=MetadataKeyGroup.OTHER, key="note")
+
+        with self.assertRaises(TypeError):
+            self.__node.metadata.qualifiers[key] = values  # type: ignore
+
+        self.__node.metadata.set_qualifier(key=key, value=values)
+        signature = self.__node.signature
+        values.append("CBS 102")
+
+        # Stored values could not be changed in place either
+        with self.assertRaises(AttributeError):
+            self.__node.metadata.qualifiers[key].append(  # type: ignore
+                "CBS 103"
+            )
+
+        self.assertEqual(self.__node.metadata.qualifiers[key], ("CBS 101",))
+        self.assertEqual(
+            self.__node.metadata.to_dict()["OTHER.note"], ["CBS 101"]
+        )
+        self.assertEqual(self.__node.signature, signature)
+
+    def test_signature_changes_with_accession(self) -> None:
+        signature = self.__node.signature
+        self.__node.accession = "KX452408"
+
+        self.assertNotEqual(self.__node.signature, signature)
+
+    def test_signature_matches_content(self) -> None:
+        self.assertEqual(
+            self.__node.signature,
+            Node.build_signature(
+                accession=self.__node.accession,
+                marker=self.__node.marker,
+                dict_metadata=self.__node.metadata.to_dict(),
+            ),
+        )
+
+    def test_update_signatures(self) -> None:
+        other = Node(
+            accession="KX452408",
+            marker="mit-gapdh",
+            metadata=Metadata(),
+        )
+
+        self.assertEqual(
+            Node.update_signatures([self.__node, other]),
+            [self.__node.signature, other.signature],
+        )
@@ -0,0 +1,106 @@
+from unittest import TestCase
+
+from gcon.core.domain.dtos.metadata import (
+    Metadata,
+    MetadataKey,
+    MetadataKeyGroup,
+)
+from gcon.core.domain.dtos.node import Node
+from gcon.core.domain.dtos.node_store import NodeStore
+
+
+class NodeStoreTest(TestCase):
+    def setUp(self) -> None:
+        self.__nodes = [
+            Node(
+                accession="KX452442",
+                marker="nuc-its",
+                metadata=Metadata()
+                .add_feature("strain", ["BRIP 12490"])
+                .add_feature("organism", ["Bipolaris austrostipae"])
+                .add_feature("mol_type", ["genomic DNA"]),
+            ),
+            Node(
+                accession="KX452408",
+                marker="mit-gapdh",
+                metadata=Metadata()
+                .add_feature("strain", ["BRIP 12490"])
+                .add_feature("country", ["Australia", "Queensland"]),
+            ),
+        ]
+
+        self.__store = NodeStore.from_nodes(self.__nodes)
+
+    def test_views_expose_node_content(self) -> None:
+        self.assertEqual(len(self.__store), len(self.__nodes))
+
+        for node, view in zip(self.__nodes, self.__store):
+            self.assertEqual(view.accession, node.accession)
+            self.assertEqual(view.marker, node.marker)
+            self.assertEqual(view.metadata.to_dict(), node.metadata.to_dict())
+            self.assertEqual(
+                view.signature,
+                node.update_signature().signature,
+            )
+
+    def test_qualifiers_lookup(self) -> None:
+        qualifiers = self.__store[1].metadata.qualifiers
+        strain = MetadataKey.intern(
+            group=MetadataKeyGroup.SPECIMEN,
+            key="strain",
+        )
+        organism = MetadataKey.intern(
+            group=MetadataKeyGroup.TAXONOMY,
+            key="organism",
+        )
+
+        self.assertIn(strain, qualifiers)
+        self.assertNotIn(organism, qualifiers)
+        self.assertEqual(qualifiers.get(strain), ["BRIP 12490"])
+        self.assertIsNone(qualifiers.get(organism))
+        self.assertEqual(len(qualifiers), 2)
+
+    def test_values_are_interned(self) -> None:
+        strain = MetadataKey.intern(
+            group=MetadataKeyGroup.SPECIMEN,
+            key="strain",
+        )
+
+        self.assertIs(
+            self.__store[0].metadata.qualifiers[strain][0],
+            self.__store[1].metadata.qualifiers[strain][0],
+        )
+
+    def test_to_node_round_trip(self) -> None:
+        node = self.__store[0].to_node()
+
+        self.assertIsInstance(node, Node)
+        self.assertEqual(node.to_dict(), self.__nodes[0].to_dict())
+
+    def test_to_node_round_trip_keeps_integer_values(self) -> None:
+        node = Node(
+            accession="KX452409",
+            marker="tef1",
+            metadata=Metadata()
+            .add_feature("strain", ["BRIP 12490"])
+            .add_feature("transl_table", [1, "1"]),
+        )
+
+        store = NodeStore.from_nodes([node])
+        round_tripped = store[0].to_node()
+
+        self.assertEqual(
+            round_tripped.metadata.to_dict(),
+            node.metadata.to_dict(),
+        )
+        self.assertEqual(
+            [
+                type(value)
+                for value in round_tripped.metadata.to_dict()[
+                    "OTHER.transl_table"
+                ]
+            ],
+            [int, str],
+        )
+        self.assertEqual(store[0].signature, node.signature)
+        self.assertEqual(round_tripped.signature, node.signature)
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+from attrs import evolve
+
+from gcon.core.domain.dtos.metadata import MetadataKeyGroup
+from gcon.core.domain.dtos.scoring_profile import ScoringProfile
+
+
+class ScoringProfileTest(TestCase):
+    def test_default_profile_mirrors_key_groups(self) -> None:
+        profile = ScoringProfile.default()
+
+        for group in MetadataKeyGroup:
+            self.assertEqual(profile.get_weight(group), group.value.score)
+
+            for key in group.value.keys:
+                self.assertEqual(profile.key_groups[key], group)
+
+    def test_from_dict_overrides_informed_groups_only(self) -> None:
+        response = ScoringProfile.from_dict(
+            {
+                "name": "host-centric",
+                "groups": {
+                    "HOST_SUBSTRATE": {"score": 10},
+                    "SPECIMEN": {"keys": ["Strain"]},
+                },
+            }
+        )
+
+        self.assertTrue(response.is_right)
+
+        profile = response.value
+
+        self.assertEqual(
+            profile.get_weight(MetadataKeyGroup.HOST_SUBSTRATE), 10
+        )
+        self.assertEqual(profile.get_weight(MetadataKeyGroup.SPECIMEN), 8)
+        self.assertEqual(
+            profile.key_groups["strain"], MetadataKeyGroup.SPECIMEN
+        )
+        self.assertNotIn("isolate", profile.key_groups)
+        self.assertEqual(
+            profile.get_weight(MetadataKeyGroup.TAXONOMY),
+            MetadataKeyGroup.TAXONOMY.value.score,
+        )
+
+    def test_from_dict_rejects_invalid_groups(self) -> None:
+        response = ScoringProfile.from_dict(
+            {"name": "invalid", "groups": {"UNKNOWN": {"score": 1}}}
+        )
+
+        self.assertTrue(response.is_left)
+
+    def test_from_dict_rejects_keys_of_multiple_groups(self) -> None:
+        response = ScoringProfile.from_dict(
+            {"name": "invalid", "groups": {"TAXONOMY": {"keys": ["strain"]}}}
+        )
+
+        self.assertTrue(response.is_left)
+
+    def test_keys_are_normalized_as_json_profiles(self) -> None:
+        specimen = MetadataKeyGroup.SPECIMEN.value
+
+        built = ScoringProfile(
+            name="mixed-case",
+            groups={
+                **ScoringProfile.default().groups,
+                MetadataKeyGroup.SPECIMEN: evolve(
+                    specimen,
+                    keys=[key.upper() for key in specimen.keys],
+                ),
+            },
+        )
+
+        response = ScoringProfile.from_dict(
+            {
+                "name": "mixed-case",
+                "groups": {
+                    "SPECIMEN": {"keys": [key.upper() for key in specimen.keys]}
+                },
+            }
+        )
+
+        self.assertTrue(response.is_right)
+        self.assertEqual(built.to_dict(), response.value.to_dict())
+        self.assertEqual(built.key_groups, response.value.key_groups)
+        self.assertEqual(
+            built.groups[MetadataKeyGroup.SPECIMEN].keys,
+            specimen.keys,
+        )
@@ -0,0 +1,34 @@
+from typing import Any
+
+from clean_base.either import Either
+from clean_base.entities import Fetching, FetchManyResponse, FetchResponse
+from clean_base.exceptions import FetchingError
+
+from gcon.core.domain.dtos.connection import Connection
+
+
+class ConnectionFetching(Fetching):
+    """A ConnectionFetching entity."""
+
+    # ? ------------------------------------------------------------------------
+    # ? LIFE CYCLE HOOK METHODS
+    # ? ------------------------------------------------------------------------
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+
+    # ? ------------------------------------------------------------------------
+    # ? ABSTRACT METHODS DEFINITIONS
+    # ? ------------------------------------------------------------------------
+
+    def show(
+        self,
+        **kwargs: Any,
+    ) -> Either[FetchingError, FetchManyResponse[Connection]]:
+        raise NotImplementedError
+
+    def get(
+        self,
+        **kwargs: Any,
+    ) -> Either[FetchingError, FetchResponse[Connection]]:
+        raise NotImplementedError
@@ -1,20 +1,34 @@
-from json import dumps
 from pathlib import Path
-from typing import Any, Literal
+from typing import Literal
 
 import clean_base.exceptions as exc
 from clean_base.either import Either, right
-from pandas import DataFrame
 
-from gcon.core.domain.dtos.metadata import MetadataKey
-from gcon.core.domain.dtos.reference_data import ReferenceData
-from gcon.core.domain.dtos.reference_data.schemas import StandardFieldsSchema
+from gcon.core.domain.dtos.reference_data.literature import (
+    BIB_VALIDATION_FILE_NAME,
+)
+from gcon.core.domain.dtos.scoring_profile import ScoringProfile
+from gcon.core.domain.entities.connection_fetching import ConnectionFetching
+from gcon.core.domain.entities.connection_registration import (
+    ConnectionRegistration,
+)
 from gcon.core.domain.entities.node_fetching import NodeFetching
 from gcon.core.domain.entities.node_registration import NodeRegistration
 from gcon.core.use_cases.build_metadata_match_scores import (
     build_metadata_match_scores,
 )
 from gcon.core.use_cases.collect_metadata import collect_metadata
+from gcon.core.use_cases.collect_metadata._warn_unclassified_keys import (
+    warn_unclassified_keys,
+)
+from gcon.core.use_cases.export_reference_data import (
+    ColumnarFormat,
+    OutputFormat,
+    TableLayout,
+    export_reference_data,
+    export_reference_data_shards,
+    validate_export_options,
+)
 from gcon.core.use_cases.load_and_validate_source_table import (
     load_and_validate_source_table,
 )
@@ -28,6 +42,16 @@ def run_gcon_pipeline(
     local_node_fetching_repo: NodeFetching,
     local_node_registration_repo: NodeRegistration,
     ignore_duplicates: bool = False,
+    local_connection_fetching_repo: ConnectionFetching | None = None,
+    local_connection_registration_repo: ConnectionRegistration | None = None,
+    scoring_profiles: list[ScoringProfile] | None = None,
+    validation_report_file: Path | None = None,
+    output_format: OutputFormat = OutputFormat.JSON,
+    columnar_format: ColumnarFormat | None = None,
+    table_layout: TableLayout = TableLayout.WIDE,
+    shard_count: int | None = None,
+    shard_by: str | None = None,
+    results_database: bool = False,
 ) -> Either[exc.UseCaseError, Literal[True]]:
     def section_log(msg: str) -> None:
         LOGGER.info("")
@@ -46,6 +70,15 @@ def run_gcon_pipeline(
                 logger=LOGGER,
             )()
 
+        if (
+            options_either := validate_export_options(
+                columnar_format=columnar_format,
+                shard_count=shard_count,
+                shard_by=shard_by,
+            )
+        ).is_left:
+            return options_either
+
         # ? --------------------------------------------------------------------
         # ? Load source data
         # ? --------------------------------------------------------------------
@@ -57,6 +90,11 @@ def run_gcon_pipeline(
         loading_response_either = load_and_validate_source_table(
             source_table_path=source_table_path,
             ignore_duplicates=ignore_duplicates,
+            literature_cache_file=output_dir_path.joinpath(
+                BIB_VALIDATION_FILE_NAME
+            ),
+            validation_cache_dir=output_dir_path,
+            report_file=validation_report_file,
         )
 
         if loading_response_either.is_left:
@@ -73,6 +111,7 @@ def run_gcon_pipeline(
             output_dir_path=output_dir_path,
             local_node_fetching_repo=local_node_fetching_repo,
             local_node_registration_repo=local_node_registration_repo,
+            local_connection_fetching_repo=local_connection_fetching_repo,
         )
 
         if metadata_collection_response_either.is_left:
@@ -86,6 +125,8 @@ def run_gcon_pipeline(
 
         calculation_response_either = build_metadata_match_scores(
             reference_data=metadata_collection_response_either.value,
+            profiles=scoring_profiles,
+            reuse_coverage=local_connection_fetching_repo is not None,
         )
 
         if calculation_response_either.is_left:
@@ -94,176 +135,57 @@ def run_gcon_pipeline(
         LOGGER.info("Metadata match scores calculated successfully")
 
         # ? --------------------------------------------------------------------
-        # ? Persist results to temporary directory
+        # ? Cache scored connections
         # ? --------------------------------------------------------------------
 
-        section_log("PERSISTING RESULTS LOCALLY")
-
-        LOGGER.info(f"Persisting JSON results to file: {output_file}.json")
-
-        with output_file.with_suffix(".json").open("w") as f:
-            f.write(
-                dumps(
-                    calculation_response_either.value.to_dict(),
-                    indent=4,
-                    sort_keys=True,
-                    default=str,
+        if local_connection_registration_repo is not None:
+            if (
+                registration_response_either := (
+                    local_connection_registration_repo.create_many(
+                        connections=calculation_response_either.value.connections,
+                    )
                 )
-            )
-
-        LOGGER.info(f"Persisting TSV results to file: {output_file}.tsv")
-
-        __build_metadata_table(
-            reference_data=metadata_collection_response_either.value,
-            output_file=output_file.with_suffix(".tsv"),
-        )
-
-        LOGGER.info("")
+            ).is_left:
+                return registration_response_either
 
         # ? --------------------------------------------------------------------
-        # ? Return success
-        # ? --------------------------------------------------------------------
-
-        return right(True)
-
-    except Exception as e:
-        return exc.UseCaseError(e, logger=LOGGER)()
-
-
-def __build_metadata_table(
-    reference_data: ReferenceData,
-    output_file: Path,
-) -> Either[exc.UseCaseError, Literal[True]]:
-    JOIN_SEPARATOR = " / "
-
-    def build_metadata_string_key(key: MetadataKey) -> str:
-        return f"{key.group.name}.{key.key}"
-
-    try:
-        # ? --------------------------------------------------------------------
-        # ? Collect all unique keys
+        # ? Persist results to temporary directory
         # ? --------------------------------------------------------------------
 
-        unique_marker_keys: set[str] = set()
-        unique_metadata_keys: set[str] = set()
+        section_log("PERSISTING RESULTS LOCALLY")
 
-        for connection in reference_data.connections:
-            for node in connection.nodes:
-                unique_marker_keys.add(node.marker)
+        export_options = dict(
+            reference_data=calculation_response_either.value,
+            output_file=output_file,
+            output_format=output_format,
+            columnar_format=columnar_format,
+            table_layout=table_layout,
+            results_database=results_database,
+            profile_names=[
+                profile.name for profile in (scoring_profiles or [])[1:]
+            ],
+        )
 
-                unique_metadata_keys = unique_metadata_keys.union(
-                    {
-                        build_metadata_string_key(key=qualifier_key)
-                        for qualifier_key in node.metadata.qualifiers.keys()
-                    }
+        if (
+            export_response_either := (
+                export_reference_data(**export_options)
+                if shard_count is None
+                else export_reference_data_shards(
+                    **export_options,
+                    shard_count=shard_count,
+                    shard_by=shard_by,
                 )
+            )
+        ).is_left:
+            return export_response_either
 
         # ? --------------------------------------------------------------------
-        # ? Build dataframe
+        # ? Summarize unclassified metadata keys
         # ? --------------------------------------------------------------------
 
-        data_source: list[dict[str, Any]] = []
-
-        for connection in reference_data.connections:
-            connection_record: dict[str, Any] = {}
-
-            connection_record.update(
-                {
-                    "id": connection.id,
-                    "signature": connection.signature,
-                    StandardFieldsSchema.identifier: f"{JOIN_SEPARATOR}".join(
-                        set(connection.identifiers)
-                    ),
-                    "observed_completeness_score": connection.scores.observed_completeness_score,
-                    "reachable_completeness_score": connection.scores.reachable_completeness_score,
-                }
-            )
+        warn_unclassified_keys()
 
-            for node in connection.nodes:
-                accession = node.accession
-                if node.marker in connection_record:
-                    accession = f"{JOIN_SEPARATOR}".join(
-                        [accession, node.accession]
-                    )
-
-                connection_record.update({node.marker: accession})
-                connection_record.update(
-                    {f"signature-{node.marker}": node.signature}
-                )
-
-                for key, value in node.metadata.qualifiers.items():
-                    composed_key = build_metadata_string_key(key=key)
-                    stringified_value = (
-                        value
-                        if isinstance(value, str)
-                        else f"{JOIN_SEPARATOR}".join(value)
-                    )
-
-                    if composed_key in connection_record:
-                        stringified_value = f"{JOIN_SEPARATOR}".join(
-                            [
-                                *connection_record[composed_key],
-                                stringified_value,
-                            ]
-                        )
-
-                    connection_record.update(
-                        {
-                            build_metadata_string_key(
-                                key=key
-                            ): stringified_value
-                            if isinstance(value, str)
-                            else ",".join(value)
-                        }
-                    )
-
-            data_source.append(connection_record)
-
-        output_df = DataFrame.from_records(data_source)
-
-        output_df["information_gain"] = 100 - (
-            output_df["observed_completeness_score"]
-            * 100
-            / output_df["reachable_completeness_score"]
-        )
-
-        output_df.merge(
-            right=reference_data.data[
-                [
-                    c
-                    for c in reference_data.data.columns
-                    if c
-                    in [
-                        "uuid",
-                        StandardFieldsSchema.sci_name,
-                        *reference_data.optional_fields,
-                    ]
-                ]
-            ],
-            how="left",
-            left_on="id",
-            right_on="uuid",
-        ).reindex(
-            [
-                "signature",
-                StandardFieldsSchema.identifier,
-                StandardFieldsSchema.sci_name,
-                *reference_data.optional_fields,
-                "observed_completeness_score",
-                "reachable_completeness_score",
-                "information_gain",
-                *sorted(unique_marker_keys),
-                *sorted(
-                    i for i in output_df.columns if i.startswith("signature-")
-                ),
-                *sorted(unique_metadata_keys),
-            ],
-            axis=1,
-        ).to_csv(
-            path_or_buf=output_file.with_suffix(".tsv"),
-            sep="\t",
-            index=False,
-        )
+        LOGGER.info("")
 
         # ? --------------------------------------------------------------------
         # ? Return success
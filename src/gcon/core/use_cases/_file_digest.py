@@ -0,0 +1,25 @@
+from hashlib import sha256
+from pathlib import Path
+
+
+def build_file_digest(path: Path) -> str:
+    """Build the SHA-256 digest of a file content.
+
+    The file is read in blocks, thus it is never loaded as a whole. Shared by
+    the source table validation cache and the shards manifest.
+
+    Args:
+        path (Path): The file path.
+
+    Returns:
+        str: The hex digest.
+
+    """
+
+    digest = sha256()
+
+    with path.open("rb") as f:
+        while block := f.read(1 << 20):
+            digest.update(block)
+
+    return digest.hexdigest()
@@ -2,19 +2,31 @@ import clean_base.exceptions as exc
 from clean_base.either import Either, right
 
 from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.domain.dtos.scoring_profile import ScoringProfile
 from gcon.settings import LOGGER
 
 from ._calculate_connection_match_score import calculate_connection_match_score
+from ._calculate_key_coverage import calculate_key_coverage
+from ._calculate_scores_from_coverage import calculate_scores_from_coverage
 
 
 def build_metadata_match_scores(
     reference_data: ReferenceData,
+    profiles: list[ScoringProfile] | None = None,
+    reuse_coverage: bool = False,
 ) -> Either[exc.MappedErrors, ReferenceData]:
     """Calculate the match score of the metadata of a reference data.
 
     Args:
         reference_data (ReferenceData): The reference data to calculate the
             match scores.
+        profiles (list[ScoringProfile] | None): The scoring profiles. The
+            first profile sets the main connection scores and the remaining
+            ones set additional scores indexed by the profile name. The
+            default profile is used if not informed.
+        reuse_coverage (bool): Score connections with a known metadata keys
+            coverage, e.g. connections reused from the connections cache,
+            without calculating the coverage again.
 
     Returns:
         Either[exc.MappedErrors, ReferenceData]: A positive response with the
@@ -43,6 +55,15 @@ def build_metadata_match_scores(
                 logger=LOGGER,
             )()
 
+        if not profiles:
+            profiles = [ScoringProfile.default()]
+
+        if len({profile.name for profile in profiles}) != len(profiles):
+            return exc.UseCaseError(
+                "Scoring profiles names should be unique",
+                logger=LOGGER,
+            )()
+
         # ? --------------------------------------------------------------------
         # ? Calculate match scores by row
         # ? --------------------------------------------------------------------
@@ -50,6 +71,8 @@ def build_metadata_match_scores(
         for index, connection in enumerate(reference_data.connections):
             calculation_response_either = calculate_connection_match_score(
                 connection=connection,
+                profiles=profiles,
+                reuse_coverage=reuse_coverage,
             )
 
             if calculation_response_either.is_left:
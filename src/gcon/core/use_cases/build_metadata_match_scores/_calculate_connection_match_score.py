@@ -2,22 +2,27 @@ import clean_base.exceptions as exc
 from clean_base.either import Either, right
 
 from gcon.core.domain.dtos.connection import Connection
-from gcon.core.domain.dtos.metadata import MetadataKeyGroup
-from gcon.core.domain.dtos.score import ConnectionScores
+from gcon.core.domain.dtos.scoring_profile import ScoringProfile
 from gcon.settings import LOGGER
 
-from ._calculate_connection_observed_score import (
-    calculate_connection_observed_score,
-)
+from ._calculate_key_coverage import calculate_key_coverage
+from ._calculate_scores_from_coverage import calculate_scores_from_coverage
 
 
 def calculate_connection_match_score(
     connection: Connection,
+    profiles: list[ScoringProfile],
+    reuse_coverage: bool = False,
 ) -> Either[exc.UseCaseError, Connection]:
     """Calculate the match score of a connection.
 
     Args:
         connection (Connection): The connection to calculate the match score.
+        profiles (list[ScoringProfile]): The scoring profiles. The first
+            profile sets the connection scores. Remaining profiles set the
+            connection scores by profile name.
+        reuse_coverage (bool): Use the connection coverage, if available,
+            instead of calculating it again from the nodes metadata.
 
     Returns:
         Either[exc.UseCaseError, Connection]: The connection with the match
@@ -37,71 +42,53 @@ def calculate_connection_match_score(
             )()
 
         # ? --------------------------------------------------------------------
-        # ? Calculate observed scores by group
+        # ? Calculate metadata keys coverage
         # ? --------------------------------------------------------------------
 
-        non_zero_groups = [i for i in MetadataKeyGroup if i.value.score > 0]
-
-        used_groups: dict[MetadataKeyGroup, bool]
-        observed_score: int
-
-        (
-            used_groups,
-            observed_score,
-        ) = calculate_connection_observed_score(
-            connection=connection,
-            non_zero_groups=non_zero_groups,
-        )
-
-        # ? --------------------------------------------------------------------
-        # ? Calculate expected score
-        # ? --------------------------------------------------------------------
-
-        expected_score = sum(
-            [i.value.score * len(connection.nodes) for i in non_zero_groups]
-        )
-
-        # ? --------------------------------------------------------------------
-        # ? Calculate non-zero groups score
-        # ? --------------------------------------------------------------------
-
-        non_zero_group_score = sum(
-            [
-                group.value.score * len(connection.nodes)
-                for group, was_used in used_groups.items()
-                if was_used is True
-            ]
-        )
-
-        # ? --------------------------------------------------------------------
-        # ? Calculate observed completeness score
-        # ? --------------------------------------------------------------------
-
-        observed_completeness_score = round(
-            observed_score / expected_score,
-            ndigits=2,
-        )
-
-        # ? --------------------------------------------------------------------
-        # ? Calculate reachable completeness score
-        # ? --------------------------------------------------------------------
-
-        reachable_completeness_score = round(
-            non_zero_group_score / expected_score,
-            ndigits=2,
-        )
+        if reuse_coverage is False or connection.coverage is None:
+            connection.with_coverage(
+                coverage=calculate_key_coverage(
+                    (
+                        node.accession,
+                        (
+                            (metadata_key.key, values)
+                            for metadata_key, values in (
+                                node.metadata.qualifiers.items()
+                            )
+                        ),
+                    )
+                    for node in connection.nodes
+                )
+            )
 
         # ? --------------------------------------------------------------------
         # ? Update input connection with scores
+        #
+        # The coverage is calculated once and shared by all profiles.
+        #
         # ? --------------------------------------------------------------------
 
+        main_profile, *additional_profiles = profiles
+
         connection.with_scores(
-            scores=ConnectionScores(
-                observed_completeness_score=observed_completeness_score,
-                reachable_completeness_score=reachable_completeness_score,
+            scores=calculate_scores_from_coverage(
+                coverage=connection.coverage,  # type: ignore
+                nodes_count=len(connection.nodes),
+                profile=main_profile,
             )
         )
 
+        connection.with_profile_scores(
+            profile_scores={
+                profile.name: calculate_scores_from_coverage(
+                    coverage=connection.coverage,  # type: ignore
+                    nodes_count=len(connection.nodes),
+                    profile=profile,
+                )
+                for profile in additional_profiles
+            }
+        )
+
         # ? --------------------------------------------------------------------
         # ? Return a positive response
         # ? --------------------------------------------------------------------
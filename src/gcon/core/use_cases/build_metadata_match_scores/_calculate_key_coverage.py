@@ -0,0 +1,49 @@
+import re
+from typing import Iterable
+
+# Matches all non alphanumeric characters, which are ignored when values are
+# compared
+NON_WORD_PATTERN = re.compile(r"\W+")
+
+
+def calculate_key_coverage(
+    nodes: Iterable[tuple[str, Iterable[tuple[str, Iterable[str | int]]]]],
+) -> dict[str, int]:
+    """Calculate the coverage of each metadata key of a connection.
+
+    The coverage of a key is the number of distinct accessions sharing its
+    most frequent value. Values are compared after the removal of non
+    alphanumeric characters and case folding. The coverage is calculated for
+    all keys, regardless of the group which they belong to, thus a single
+    coverage serves any scoring profile.
+
+    Args:
+        nodes (Iterable[tuple[str, Iterable[tuple[str, Iterable[str | int]]]]]):
+            The connection nodes as (accession, qualifiers) pairs, being the
+            qualifiers a sequence of (key, values) pairs.
+
+    Returns:
+        dict[str, int]: The coverage indexed by the metadata key.
+
+    """
+
+    values_shared_by_nodes: dict[str, dict[str, set[str]]] = dict()
+
+    for accession, qualifiers in nodes:
+        for key, values in qualifiers:
+            if (key_values := values_shared_by_nodes.get(key)) is None:
+                key_values = values_shared_by_nodes[key] = dict()
+
+            for value in values:
+                value = NON_WORD_PATTERN.sub("", str(value)).lower()
+
+                if (accessions := key_values.get(value)) is None:
+                    accessions = key_values[value] = set()
+
+                accessions.add(accession)
+
+    return {
+        key: max(len(accessions) for accessions in key_values.values())
+        for key, key_values in values_shared_by_nodes.items()
+        if key_values
+    }
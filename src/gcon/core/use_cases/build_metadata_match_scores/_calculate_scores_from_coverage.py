@@ -0,0 +1,60 @@
+from gcon.core.domain.dtos.score import ConnectionScores
+from gcon.core.domain.dtos.scoring_profile import ScoringProfile
+
+
+def calculate_scores_from_coverage(
+    coverage: dict[str, int],
+    nodes_count: int,
+    profile: ScoringProfile,
+) -> ConnectionScores:
+    """Calculate the connection scores given the metadata keys coverage.
+
+    Each group with non-zero weight contributes with its weight multiplied by
+    the highest coverage of its keys to the observed score. Groups with any
+    covered key contribute with its weight multiplied by the number of nodes
+    to the reachable score. Both scores are normalized by the expected score,
+    which considers all non-zero groups fully covered.
+
+    Args:
+        coverage (dict[str, int]): The coverage indexed by the metadata key.
+        nodes_count (int): The number of nodes of the connection.
+        profile (ScoringProfile): The scoring profile.
+
+    Returns:
+        ConnectionScores: The connection scores.
+
+    Raises:
+        ZeroDivisionError: If the connection has no nodes or the profile has
+            no groups with non-zero weight.
+
+    """
+
+    observed_score = 0
+    expected_score = 0
+    non_zero_group_score = 0
+
+    for unit in profile.groups.values():
+        if unit.score <= 0:
+            continue
+
+        expected_score += unit.score * nodes_count
+
+        higher_coverage = max(
+            (coverage.get(key, 0) for key in unit.keys),
+            default=0,
+        )
+
+        if higher_coverage > 0:
+            observed_score += higher_coverage * unit.score
+            non_zero_group_score += unit.score * nodes_count
+
+    return ConnectionScores(
+        observed_completeness_score=round(
+            observed_score / expected_score,
+            ndigits=2,
+        ),
+        reachable_completeness_score=round(
+            non_zero_group_score / expected_score,
+            ndigits=2,
+        ),
+    )
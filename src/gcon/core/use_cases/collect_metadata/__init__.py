@@ -1,24 +1,28 @@
-from functools import reduce
-from json import dump
-from operator import iconcat
+from uuid import UUID
 from pathlib import Path
 
 import clean_base.exceptions as exc
-from Bio import Entrez
 from clean_base.either import Either, right
 from clean_base.lock import has_named_lock, lock_named
 from clean_base.validations import slugify_string
 
 from gcon.core.domain.dtos.connection import Connection
-from gcon.core.domain.dtos.node import Node
+from gcon.core.domain.dtos.node_store import NodeStore
 from gcon.core.domain.dtos.reference_data import ReferenceData
-from gcon.core.domain.dtos.reference_data.schemas import StandardFieldsSchema
+from gcon.core.domain.dtos.reference_data.checkpoint import (
+    CHECKPOINT_FILE_NAME,
+)
+from gcon.core.domain.entities.connection_fetching import ConnectionFetching
 from gcon.core.domain.entities.node_fetching import NodeFetching
 from gcon.core.domain.entities.node_registration import NodeRegistration
-from gcon.settings import CURRENT_USER_EMAIL, LOGGER
+from gcon.settings import LOGGER
 
-from ._collect_single_gene_metadata import collect_single_gene_metadata
-from ._collect_unique_identifiers import collect_unique_identifiers
+from ._assemble_row_connection import (
+    build_row_connection,
+    collect_row_nodes,
+    index_markers_nodes,
+)
+from ._collect_markers_nodes import collect_markers_nodes
 
 
 def collect_metadata(
@@ -26,6 +30,7 @@ def collect_metadata(
     output_dir_path: Path,
     local_node_fetching_repo: NodeFetching,
     local_node_registration_repo: NodeRegistration,
+    local_connection_fetching_repo: ConnectionFetching | None = None,
 ) -> Either[exc.MappedErrors, ReferenceData]:
     """Collect metadata from a list of accessions.
 
@@ -35,6 +40,11 @@ def collect_metadata(
         local_node_fetching_repo (NodeFetching): Local node fetching repository.
         local_node_registration_repo (NodeRegistration): Local node registration
             repository.
+        local_connection_fetching_repo (ConnectionFetching | None): Local
+            connection fetching repository. If provided, connections of rows
+            already resolved in previous executions, and whose nodes did not
+            change, are reused with their scores instead of being assembled
+            again.
 
     Returns:
         Either[exc.UseCaseError, ReferenceData]: Either a UseCaseError or a
@@ -67,7 +77,7 @@ def collect_metadata(
         # ? Collect accessions from marker columns values
         # ? --------------------------------------------------------------------
 
-        marker_output_file = output_dir_path.joinpath("reference_data.json")
+        checkpoint_file = output_dir_path.joinpath(CHECKPOINT_FILE_NAME)
 
         lock_config = dict(
             base_dir=output_dir_path,
@@ -76,114 +86,91 @@ def collect_metadata(
 
         if has_named_lock(**lock_config):
             if (
-                reference_data_either := ReferenceData.from_json(
-                    json_path=marker_output_file,
+                reference_data_either := ReferenceData.from_checkpoint(
+                    checkpoint_path=checkpoint_file,
                 )
-            ).is_left:
-                return reference_data_either
-
-            return right(reference_data_either.value)
+            ).is_right:
+                return right(reference_data_either.value)
+
+            # Metadata of nodes is cached by the local repositories, thus
+            # collecting it again does not repeat the remote requests
+            LOGGER.warning(
+                "Unable to resume from checkpoint. Metadata will be collected "
+                + f"again: {reference_data_either.value.msg}"
+            )
 
         # ? --------------------------------------------------------------------
         # ? Collect accessions from marker columns values
         # ? --------------------------------------------------------------------
 
-        if CURRENT_USER_EMAIL is None:
-            return exc.UseCaseError(
-                "`CURRENT_USER_EMAIL` not configured correctly. Please "
-                "configure before execute GCON pipeline.",
-                logger=LOGGER,
-            )()
-
-        Entrez.email = CURRENT_USER_EMAIL
-
-        by_marker_nodes: dict[str, list[Node]] = dict()
-
-        LOGGER.debug(f"Fetching sequence from user `{CURRENT_USER_EMAIL}`")
-        LOGGER.debug("")
-
-        for marker in reference_data.gene_fields:
-            LOGGER.debug(f"Recovering sequences from `{marker}` marker")
-
-            marker_nodes = collect_single_gene_metadata(
-                entrez_handle=Entrez,
-                marker=marker,
-                accessions=reduce(
-                    iconcat,
-                    reference_data.data[marker].dropna().values,
-                    [],
-                ),
+        # Nodes are kept in a compact store instead of as `Node` objects to
+        # reduce the memory footprint of large tables
+        if (
+            by_marker_nodes_either := collect_markers_nodes(
+                reference_data=reference_data,
+                node_store=NodeStore(),
                 local_node_fetching_repo=local_node_fetching_repo,
                 local_node_registration_repo=local_node_registration_repo,
             )
+        ).is_left:
+            return by_marker_nodes_either
 
-            if marker_nodes.is_left:
-                return marker_nodes
-
-            by_marker_nodes.update({marker: marker_nodes.value})
-
-            LOGGER.debug(
-                f"`{marker}`: {len(marker_nodes.value)} sequences found"
-            )
-
-            LOGGER.debug("")
-
-        LOGGER.info("Fetching sequence done")
+        by_marker_nodes = by_marker_nodes_either.value
 
         # ? --------------------------------------------------------------------
         # ? Build output Connections
         # ? --------------------------------------------------------------------
 
+        # Index the position of each node given its accession to avoid
+        # scanning all marker nodes for every row
+        by_marker_positions = index_markers_nodes(by_marker_nodes)
+
+        cached_connections = 0
         connections: list[Connection] = list()
         for _, row in reference_data.data.iterrows():
-            row_nodes: list[Node] = list()
-
-            for gene in reference_data.gene_fields:
-                if (gene_value := row.get(gene)) is None:
-                    continue
-
-                if (gene_nodes := by_marker_nodes.get(gene)) is None:
-                    return exc.UseCaseError(
-                        f"Unable to find metadata for gene `{gene}`",
-                        logger=LOGGER,
+            if (
+                row_nodes_either := collect_row_nodes(
+                    row=row,
+                    gene_fields=reference_data.gene_fields,
+                    by_marker_nodes=by_marker_nodes,
+                    by_marker_positions=by_marker_positions,
+                )
+            ).is_left:
+                return row_nodes_either
+
+            if local_connection_fetching_repo is not None:
+                # Row ids are stored as strings in the reference data
+                if (
+                    cached_either := local_connection_fetching_repo.get(
+                        id=(
+                            None
+                            if (uuid := row.get("uuid")) is None
+                            else UUID(str(uuid))
+                        ),
+                        nodes=row_nodes_either.value,
                     )
+                ).is_left:
+                    return cached_either
 
-                try:
-                    acc_metadata = [
-                        i for i in gene_nodes if i.accession in gene_value
-                    ]
-                except StopIteration:
+                if cached_either.value.fetched is True:
+                    connections.append(cached_either.value.instance)
+                    cached_connections += 1
                     continue
 
-                row_nodes.extend(acc_metadata)
-
-            identifiers = collect_unique_identifiers(
-                nodes=row_nodes,
-            )
-
-            if identifiers.is_left:
-                return identifiers
-
             if (
-                row_identifier := row.get(StandardFieldsSchema.identifier)
-            ) is None:
-                return exc.UseCaseError(
-                    f"Unable to find identifier for row `{row}`",
-                    logger=LOGGER,
-                )()
-
-            unique_identifiers = set(
-                [
-                    *list(identifiers.value),
-                    row_identifier,
-                ]
-            )
+                connection_either := build_row_connection(
+                    row=row,
+                    row_nodes=row_nodes_either.value,
+                )
+            ).is_left:
+                return connection_either
+
+            connections.append(connection_either.value)
 
-            connections.append(
-                Connection(
-                    identifiers=unique_identifiers,
-                    nodes=row_nodes,
-                ).with_id(row.get("uuid"))
+        if local_connection_fetching_repo is not None:
+            LOGGER.info(
+                f"{cached_connections} of {len(connections)} connections "
+                + "reused from cache"
             )
 
         reference_data.with_connections(connections)
@@ -192,18 +179,14 @@ def collect_metadata(
         # ? Persist connections to file
         # ? --------------------------------------------------------------------
 
-        LOGGER.debug(
-            f"Persisting metadata to temporary file: {marker_output_file}"
-        )
+        LOGGER.debug(f"Persisting metadata to checkpoint: {checkpoint_file}")
 
-        with marker_output_file.open("w") as marker_out:
-            dump(
-                reference_data.to_dict(),
-                marker_out,
-                indent=4,
-                sort_keys=True,
-                default=str,
+        if (
+            checkpoint_either := reference_data.to_checkpoint(
+                checkpoint_path=checkpoint_file,
             )
+        ).is_left:
+            return checkpoint_either
 
         # ? --------------------------------------------------------------------
         # ? Lock the step execution
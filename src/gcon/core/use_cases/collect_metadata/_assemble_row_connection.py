@@ -0,0 +1,140 @@
+from typing import Any, Mapping
+from uuid import UUID
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.node_store import NodeView
+from gcon.core.domain.dtos.reference_data.schemas import StandardFieldsSchema
+from gcon.settings import LOGGER
+
+from ._collect_unique_identifiers import collect_unique_identifiers
+
+
+def index_markers_nodes(
+    by_marker_nodes: dict[str, list[NodeView]],
+) -> dict[str, dict[str, list[int]]]:
+    """Index the positions of the nodes of each marker by accession.
+
+    Args:
+        by_marker_nodes (dict[str, list[NodeView]]): The nodes of each marker.
+
+    Returns:
+        dict[str, dict[str, list[int]]]: The positions of the nodes of each
+            accession, by marker.
+
+    """
+
+    by_marker_positions: dict[str, dict[str, list[int]]] = dict()
+
+    for marker, marker_nodes_views in by_marker_nodes.items():
+        positions = by_marker_positions.setdefault(marker, dict())
+
+        for position, node in enumerate(marker_nodes_views):
+            positions.setdefault(node.accession, list()).append(position)
+
+    return by_marker_positions
+
+
+def collect_row_nodes(
+    row: Mapping[str, Any],
+    gene_fields: list[str],
+    by_marker_nodes: dict[str, list[NodeView]],
+    by_marker_positions: dict[str, dict[str, list[int]]],
+) -> Either[exc.UseCaseError, list[NodeView]]:
+    """Collect the nodes of the accessions of a source table row.
+
+    Args:
+        row (Mapping[str, Any]): The source table row.
+        gene_fields (list[str]): The gene fields of the source table.
+        by_marker_nodes (dict[str, list[NodeView]]): The nodes of each marker.
+        by_marker_positions (dict[str, dict[str, list[int]]]): The positions
+            of the nodes of each marker, as built by `index_markers_nodes`.
+
+    Returns:
+        Either[exc.UseCaseError, list[NodeView]]: The row nodes, in the
+            fetching order of each marker, or a negative response with the
+            errors.
+
+    """
+
+    row_nodes: list[NodeView] = list()
+
+    for gene in gene_fields:
+        if (gene_value := row.get(gene)) is None:
+            continue
+
+        if (gene_nodes := by_marker_nodes.get(gene)) is None:
+            return exc.UseCaseError(
+                f"Unable to find metadata for gene `{gene}`",
+                logger=LOGGER,
+            )()
+
+        if isinstance(gene_value, str):
+            gene_value = [i.strip() for i in gene_value.split(",")]
+
+        if not isinstance(gene_value, list):
+            continue
+
+        gene_positions = by_marker_positions[gene]
+
+        # Nodes are kept in the fetching order
+        row_nodes.extend(
+            gene_nodes[position]
+            for position in sorted(
+                position
+                for accession in set(gene_value)
+                for position in gene_positions.get(accession, [])
+            )
+        )
+
+    return right(row_nodes)
+
+
+def build_row_connection(
+    row: Mapping[str, Any],
+    row_nodes: list[NodeView],
+) -> Either[exc.UseCaseError, Connection]:
+    """Build the connection of a source table row.
+
+    Args:
+        row (Mapping[str, Any]): The source table row.
+        row_nodes (list[NodeView]): The row nodes, as collected by
+            `collect_row_nodes`.
+
+    Returns:
+        Either[exc.UseCaseError, Connection]: The connection, with the row id,
+            or a negative response with the errors.
+
+    """
+
+    # Row ids are stored as strings in the reference data
+    row_id = None if (uuid := row.get("uuid")) is None else UUID(str(uuid))
+
+    identifiers = collect_unique_identifiers(
+        nodes=row_nodes,
+    )
+
+    if identifiers.is_left:
+        return identifiers
+
+    if (row_identifier := row.get(StandardFieldsSchema.identifier)) is None:
+        return exc.UseCaseError(
+            f"Unable to find identifier for row `{row}`",
+            logger=LOGGER,
+        )()
+
+    unique_identifiers = set(
+        [
+            *list(identifiers.value),
+            row_identifier,
+        ]
+    )
+
+    return right(
+        Connection(
+            identifiers=unique_identifiers,
+            nodes=row_nodes,
+        ).with_id(row_id)
+    )
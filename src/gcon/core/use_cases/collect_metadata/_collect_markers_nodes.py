@@ -0,0 +1,85 @@
+import clean_base.exceptions as exc
+from Bio import Entrez
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.node_store import NodeStore, NodeView
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.domain.entities.node_fetching import NodeFetching
+from gcon.core.domain.entities.node_registration import NodeRegistration
+from gcon.settings import CURRENT_USER_EMAIL, LOGGER
+
+from ._collect_single_gene_metadata import collect_single_gene_metadata
+
+
+def collect_markers_nodes(
+    reference_data: ReferenceData,
+    node_store: NodeStore,
+    local_node_fetching_repo: NodeFetching,
+    local_node_registration_repo: NodeRegistration,
+) -> Either[exc.MappedErrors, dict[str, list[NodeView]]]:
+    """Collect the nodes of the accessions of each gene field.
+
+    Nodes are read from the local repositories, or fetched from GenBank and
+    registered into the local repositories otherwise.
+
+    Args:
+        reference_data (ReferenceData): Reference data.
+        node_store (NodeStore): The store the collected nodes are added to.
+        local_node_fetching_repo (NodeFetching): Local node fetching repository.
+        local_node_registration_repo (NodeRegistration): Local node registration
+            repository.
+
+    Returns:
+        Either[exc.MappedErrors, dict[str, list[NodeView]]]: The stored nodes
+            of each gene field, in the fetching order, or a negative response
+            with the errors.
+
+    """
+
+    if CURRENT_USER_EMAIL is None:
+        return exc.UseCaseError(
+            "`CURRENT_USER_EMAIL` not configured correctly. Please "
+            "configure before execute GCON pipeline.",
+            logger=LOGGER,
+        )()
+
+    Entrez.email = CURRENT_USER_EMAIL
+
+    by_marker_nodes: dict[str, list[NodeView]] = dict()
+
+    LOGGER.debug(f"Fetching sequence from user `{CURRENT_USER_EMAIL}`")
+    LOGGER.debug("")
+
+    # Accessions are taken from the long-form view, in the rows order
+    by_marker_accessions: dict[str, list[str]] = {
+        str(marker): accessions.tolist()
+        for marker, accessions in reference_data.accessions.groupby(
+            "gene", observed=True, sort=False
+        )["accession"]
+    }
+
+    for marker in reference_data.gene_fields:
+        LOGGER.debug(f"Recovering sequences from `{marker}` marker")
+
+        marker_nodes = collect_single_gene_metadata(
+            entrez_handle=Entrez,
+            marker=marker,
+            accessions=by_marker_accessions.get(marker, []),
+            local_node_fetching_repo=local_node_fetching_repo,
+            local_node_registration_repo=local_node_registration_repo,
+        )
+
+        if marker_nodes.is_left:
+            return marker_nodes
+
+        by_marker_nodes.update(
+            {marker: [node_store.add(node) for node in marker_nodes.value]}
+        )
+
+        LOGGER.debug(f"`{marker}`: {len(marker_nodes.value)} sequences found")
+
+        LOGGER.debug("")
+
+    LOGGER.info("Fetching sequence done")
+
+    return right(by_marker_nodes)
@@ -3,15 +3,16 @@ from clean_base.either import Either, right
 
 from gcon.core.domain.dtos.metadata import MetadataKeyGroup
 from gcon.core.domain.dtos.node import Node
+from gcon.core.domain.dtos.node_store import NodeView
 
 
 def collect_unique_identifiers(
-    nodes: list[Node],
+    nodes: list[Node | NodeView],
 ) -> Either[exc.UseCaseError, set[str]]:
     """Collect unique identifiers from a list of nodes.
 
     Args:
-        nodes (list[Node]): List of nodes.
+        nodes (list[Node | NodeView]): List of nodes.
 
     Returns:
         Either[exc.UseCaseError, set[str]]: Either a UseCaseError or a set of
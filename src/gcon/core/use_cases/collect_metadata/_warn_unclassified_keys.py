@@ -0,0 +1,22 @@
+from gcon.core.domain.dtos.metadata import MetadataKeyGroup
+from gcon.settings import LOGGER
+
+
+def warn_unclassified_keys() -> None:
+    """Summarize the metadata keys classified as the default group.
+
+    Counts are reset, thus each key is reported once by execution.
+
+    """
+
+    if unclassified_keys := MetadataKeyGroup.pop_unclassified_keys():
+        LOGGER.warning(
+            f"{len(unclassified_keys)} metadata keys not already "
+            + "classified. Default group "
+            + f"(`{MetadataKeyGroup.default().name}`) used. Occurrences "
+            + "by key: "
+            + ", ".join(
+                f"{key} ({count})"
+                for key, count in unclassified_keys.most_common()
+            )
+        )
@@ -0,0 +1,252 @@
+from collections import Counter
+from csv import QUOTE_MINIMAL, writer
+from heapq import merge
+from itertools import groupby
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Iterator, TextIO
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.use_cases.export_reference_data import (
+    find_output_data_file,
+    iter_output_records,
+)
+from gcon.settings import LOGGER, OUTPUT_BATCH_SIZE
+
+from ._dtos import ChangeCounts, ResultsDiff
+
+# The columns of the diff report, in the output order. Connections are keyed
+# by id and nodes by `marker:accession`. Unchanged records are not reported.
+DIFF_REPORT_COLUMNS = [
+    "change",
+    "kind",
+    "key",
+    "previous_signature",
+    "current_signature",
+]
+
+
+# ? ----------------------------------------------------------------------------
+# ? Sorted runs format
+#
+# The connections and nodes of each run are split into runs of up to
+# `run_size` records, sorted by kind and key and spilled to temporary files.
+# Each line of a run contains the record kind, the record key, and the record
+# signature, separated by tabs. Ids, node keys, and signatures never contain
+# tabs, thus the runs of both executions are merged without parsing records.
+#
+# ? ----------------------------------------------------------------------------
+
+
+def diff_results(
+    previous_output_file: Path,
+    current_output_file: Path,
+    report: TextIO,
+    run_size: int = OUTPUT_BATCH_SIZE,
+    temporary_dir: Path | None = None,
+) -> Either[exc.UseCaseError, ResultsDiff]:
+    """Compare the connections and nodes of two runs by signature.
+
+    Connections are matched by id and nodes by marker and accession. A matched
+    record changed if its signature differs, e.g. if the GenBank metadata of a
+    node was updated between runs, which also changes the signature of its
+    connections. Connection ids are derived from the source table row
+    contents, thus a row edited between runs results in a removed and an added
+    connection, never in a changed one.
+
+    The keys and signatures of each run are spilled to sorted runs (see
+    above), which are then merged by key, as done by `merge_results`, thus at
+    most `run_size` records are held in memory, whatever the runs size. Note
+    that JSON outputs are loaded as a whole to be spilled, while JSON Lines
+    outputs are read one line at a time (see `iter_output_records`). Records
+    found many times in a run, e.g. nodes shared by connections, are compared
+    once, by their first occurrence.
+
+    Args:
+        previous_output_file (Path): The system path of the outputs of the
+            previous run, without file extension.
+        current_output_file (Path): The system path of the outputs of the
+            current run, without file extension.
+        report (TextIO): The text stream the differences are written to, as
+            TSV rows with the `DIFF_REPORT_COLUMNS` columns. Connections are
+            written before nodes, each of them sorted by key.
+        run_size (int): The maximum number of records of each sorted run.
+        temporary_dir (Path | None): The directory the sorted runs are
+            spilled to. The system temporary directory is used if not
+            informed, thus the outputs directories are never written to.
+
+    Returns:
+        Either[exc.UseCaseError, ResultsDiff]: The number of records by kind
+            of change or a negative response with the errors.
+
+    """
+
+    def build_node_key(node: dict[str, Any]) -> str:
+        return f"{node.get('marker')}:{node.get('accession')}"
+
+    def iter_run(
+        run_file: Path,
+        name: str,
+    ) -> Iterator[tuple[tuple[str, str], str, str]]:
+        with run_file.open("r") as f:
+            for line in f:
+                kind, key, signature = line.rstrip("\n").split("\t", 2)
+
+                yield (kind, key), name, signature
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Validate entry params
+        # ? --------------------------------------------------------------------
+
+        if run_size < 1:
+            return exc.UseCaseError(
+                f"Invalid run size: {run_size}",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        for output_file in [previous_output_file, current_output_file]:
+            if find_output_data_file(output_file) is None:
+                return exc.UseCaseError(
+                    (
+                        f"No JSON or JSON Lines output found for: {output_file}."
+                        + " Please inform the output files without extension."
+                    ),
+                    logger=LOGGER,
+                    exp=True,
+                )()
+
+        with TemporaryDirectory(
+            dir=temporary_dir,
+            prefix=f"{current_output_file.name}-diff-",
+        ) as runs_dir:
+            # ? ----------------------------------------------------------------
+            # ? Spill both runs to sorted runs
+            # ? ----------------------------------------------------------------
+
+            run_files: dict[str, list[Path]] = {}
+
+            def spill(name: str, records: list[tuple[str, str, str]]) -> None:
+                # The sort is stable, thus records sharing a key keep the run
+                # order
+                records.sort(key=lambda record: (record[0], record[1]))
+
+                run_file = Path(runs_dir).joinpath(
+                    f"{name}-{len(run_files[name]):06d}.tsv"
+                )
+
+                with run_file.open("w") as f:
+                    f.writelines("\t".join(record) + "\n" for record in records)
+
+                run_files[name].append(run_file)
+                records.clear()
+
+            for name, output_file in [
+                ("previous", previous_output_file),
+                ("current", current_output_file),
+            ]:
+                LOGGER.info(f"Splitting into sorted runs: {output_file}")
+
+                run_files[name] = []
+                records: list[tuple[str, str, str]] = []
+
+                for record_either in iter_output_records(output_file):
+                    if record_either.is_left:
+                        return record_either
+
+                    record = record_either.value
+
+                    records.append(
+                        (
+                            "connection",
+                            str(record.get("id")),
+                            str(record.get("signature")),
+                        )
+                    )
+
+                    records.extend(
+                        (
+                            "node",
+                            build_node_key(node),
+                            str(node.get("signature")),
+                        )
+                        for node in record.get("nodes") or []
+                    )
+
+                    if len(records) >= run_size:
+                        spill(name, records)
+
+                if records:
+                    spill(name, records)
+
+            # ? ----------------------------------------------------------------
+            # ? Merge both runs by key
+            # ? ----------------------------------------------------------------
+
+            tsv_writer = writer(
+                report,
+                delimiter="\t",
+                quoting=QUOTE_MINIMAL,
+                lineterminator="\n",
+            )
+
+            tsv_writer.writerow(DIFF_REPORT_COLUMNS)
+
+            counts: dict[str, Counter[str]] = {
+                "connection": Counter(),
+                "node": Counter(),
+            }
+
+            # Runs are merged in the spilling order, previous runs first, and
+            # the merge is stable, thus the first occurrence of a record in
+            # each execution is compared
+            for (kind, key), records_group in groupby(
+                merge(
+                    *(
+                        iter_run(run_file, name)
+                        for name, files in run_files.items()
+                        for run_file in files
+                    ),
+                    key=lambda record: record[0],
+                ),
+                key=lambda record: record[0],
+            ):
+                signatures: dict[str, str] = {}
+
+                for _, name, signature in records_group:
+                    signatures.setdefault(name, signature)
+
+                previous_signature = signatures.get("previous")
+                current_signature = signatures.get("current")
+
+                if previous_signature is None:
+                    change = "added"
+                elif current_signature is None:
+                    change = "removed"
+                elif previous_signature != current_signature:
+                    change = "changed"
+                else:
+                    counts[kind]["unchanged"] += 1
+                    continue
+
+                counts[kind][change] += 1
+                tsv_writer.writerow(
+                    [change, kind, key, previous_signature, current_signature]
+                )
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(
+            ResultsDiff(
+                connections=ChangeCounts(**counts["connection"]),
+                nodes=ChangeCounts(**counts["node"]),
+            )
+        )
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
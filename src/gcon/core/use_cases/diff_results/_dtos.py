@@ -0,0 +1,39 @@
+from typing import Any
+
+from attrs import asdict, field, frozen
+
+
+@frozen(kw_only=True)
+class ChangeCounts:
+    """The number of records by kind of change between two runs.
+
+    Attributes:
+        added (int): Records only found in the current run.
+        removed (int): Records only found in the previous run.
+        changed (int): Records found in both runs with different signatures.
+        unchanged (int): Records found in both runs with the same signature.
+
+    """
+
+    added: int = field(default=0)
+    removed: int = field(default=0)
+    changed: int = field(default=0)
+    unchanged: int = field(default=0)
+
+
+@frozen(kw_only=True)
+class ResultsDiff:
+    """The summary of the differences between two runs.
+
+    Attributes:
+        connections (ChangeCounts): The changes of connections, matched by id.
+        nodes (ChangeCounts): The changes of nodes, matched by marker and
+            accession.
+
+    """
+
+    connections: ChangeCounts = field()
+    nodes: ChangeCounts = field()
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
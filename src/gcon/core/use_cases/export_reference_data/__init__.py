@@ -0,0 +1,194 @@
+from pathlib import Path
+from typing import Literal
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.settings import LOGGER
+
+from ._dtos import ColumnarFormat, OutputFormat, TableLayout
+from ._export_shards import (
+    GENUS_SHARD_KEY,
+    SHARDS_MANIFEST_SUFFIX,
+    build_shard_output_file,
+    export_reference_data_shards,
+    refresh_shard_manifest,
+)
+from ._iter_output_records import (
+    find_output_data_file,
+    iter_output_records,
+    read_output_fields,
+)
+from ._validate_export_options import validate_export_options
+from ._score_columns import (
+    SCORE_COLUMNS,
+    build_score_values,
+    format_score_values,
+)
+from ._write_columnar_tables import (
+    NODES_DIRECTORY_SUFFIX,
+    write_columnar_tables,
+)
+from ._write_connections_table import write_connections_table
+from ._write_json_output import (
+    GZIP_COMPRESS_LEVEL,
+    open_jsonl_output,
+    write_json,
+    write_jsonl,
+    write_jsonl_header,
+    write_jsonl_record,
+)
+from ._write_long_table import (
+    LONG_TABLE_COLUMNS,
+    LONG_TABLE_SCORES_GROUP,
+    LONG_TABLE_SUFFIX,
+    build_long_table_score_rows,
+    write_long_table,
+)
+from ._write_results_database import (
+    RESULTS_DATABASE_FORMAT_NAME,
+    RESULTS_DATABASE_SUFFIX,
+    RESULTS_DATABASE_VERSION,
+    write_results_database,
+)
+
+
+def export_reference_data(
+    reference_data: ReferenceData,
+    output_file: Path,
+    output_format: OutputFormat = OutputFormat.JSON,
+    profile_names: list[str] | None = None,
+    columnar_format: ColumnarFormat | None = None,
+    table_layout: TableLayout = TableLayout.WIDE,
+    results_database: bool = False,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Persist the resolved reference data
+
+    The whole reference data is written to `<output_file>.json`, or to
+    `<output_file>.jsonl` (`.jsonl.gz` if compressed) in the JSON Lines
+    format, and the connections table is written to `<output_file>.tsv`, or
+    to `<output_file>.long.tsv` in the long layout. If a
+    columnar format is informed, the typed connections table and the nodes
+    table partitioned by marker are also written (see
+    `write_columnar_tables`). If requested, the connections, nodes and
+    qualifiers are also written to the SQLite database `<output_file>.sqlite`
+    (see `write_results_database`).
+
+    Args:
+        reference_data (ReferenceData): The reference data containing scored
+            connections.
+        output_file (Path): The system path of the outputs, without file
+            extension.
+        output_format (OutputFormat): The format of the reference data file.
+        profile_names (list[str] | None): The names of the additional scoring
+            profiles, whose scores are written after the main ones in the TSV
+            table.
+        columnar_format (ColumnarFormat | None): The format of the typed
+            tables. Not written if not informed.
+        table_layout (TableLayout): The layout of the connections TSV table.
+        results_database (bool): Whether to write the SQLite results
+            database.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            outputs were written or a negative response with the errors.
+
+    """
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Persist the reference data
+        # ? --------------------------------------------------------------------
+
+        data_file = output_file.with_suffix(output_format.suffix)
+
+        LOGGER.info(f"Persisting JSON results to file: {data_file}")
+
+        if output_format == OutputFormat.JSON:
+            writing_either = write_json(
+                reference_data=reference_data,
+                output_file=data_file,
+            )
+        else:
+            writing_either = write_jsonl(
+                reference_data=reference_data,
+                output_file=data_file,
+                compress=output_format == OutputFormat.JSONL_GZ,
+            )
+
+        if writing_either.is_left:
+            return writing_either
+
+        # ? --------------------------------------------------------------------
+        # ? Persist the connections table
+        # ? --------------------------------------------------------------------
+
+        if table_layout == TableLayout.LONG:
+            table_file = output_file.with_suffix(LONG_TABLE_SUFFIX)
+
+            LOGGER.info(f"Persisting TSV results to file: {table_file}")
+
+            writing_either = write_long_table(
+                reference_data=reference_data,
+                output_file=table_file,
+            )
+        else:
+            table_file = output_file.with_suffix(".tsv")
+
+            LOGGER.info(f"Persisting TSV results to file: {table_file}")
+
+            writing_either = write_connections_table(
+                reference_data=reference_data,
+                output_file=table_file,
+                profile_names=profile_names,
+            )
+
+        if writing_either.is_left:
+            return writing_either
+
+        # ? --------------------------------------------------------------------
+        # ? Persist the columnar tables
+        # ? --------------------------------------------------------------------
+
+        if columnar_format is not None:
+            LOGGER.info(
+                f"Persisting {columnar_format.value} results to file: "
+                + f"{output_file}.{columnar_format.value}"
+            )
+
+            if (
+                writing_either := write_columnar_tables(
+                    reference_data=reference_data,
+                    output_file=output_file,
+                    columnar_format=columnar_format,
+                    profile_names=profile_names,
+                )
+            ).is_left:
+                return writing_either
+
+        # ? --------------------------------------------------------------------
+        # ? Persist the results database
+        # ? --------------------------------------------------------------------
+
+        if results_database is True:
+            database_file = output_file.with_suffix(RESULTS_DATABASE_SUFFIX)
+
+            LOGGER.info(f"Persisting SQLite results to file: {database_file}")
+
+            if (
+                writing_either := write_results_database(
+                    reference_data=reference_data,
+                    output_file=database_file,
+                )
+            ).is_left:
+                return writing_either
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
@@ -0,0 +1,40 @@
+from gcon.core.domain.dtos.metadata import MetadataKey
+from gcon.core.domain.dtos.reference_data import ReferenceData
+
+
+def build_metadata_string_key(key: MetadataKey) -> str:
+    """Build the column name of a metadata key, e.g. `SPECIMEN.strain`"""
+
+    return f"{key.group.name}.{key.key}"
+
+
+def collect_table_keys(
+    reference_data: ReferenceData,
+) -> tuple[list[str], list[str]]:
+    """Collect the markers and the metadata keys of all connections
+
+    Only names are collected, thus the pass is cheap even for large outputs.
+
+    Args:
+        reference_data (ReferenceData): The reference data containing the
+            connections.
+
+    Returns:
+        tuple[list[str], list[str]]: The sorted markers and the sorted
+            metadata column names.
+
+    """
+
+    unique_marker_keys: set[str] = set()
+    unique_metadata_keys: set[str] = set()
+
+    for connection in reference_data.connections:
+        for node in connection.nodes:
+            unique_marker_keys.add(node.marker)
+
+            unique_metadata_keys.update(
+                build_metadata_string_key(key=qualifier_key)
+                for qualifier_key in node.metadata.qualifiers.keys()
+            )
+
+    return sorted(unique_marker_keys), sorted(unique_metadata_keys)
@@ -0,0 +1,37 @@
+from enum import Enum
+
+
+class OutputFormat(Enum):
+    """The formats of the connections output.
+
+    The TSV table is always written. The format selects the file containing
+    the whole reference data.
+
+    """
+
+    JSON = "json"
+    JSONL = "jsonl"
+    JSONL_GZ = "jsonl.gz"
+
+    @property
+    def suffix(self) -> str:
+        return f".{self.value}"
+
+
+class ColumnarFormat(Enum):
+    """The formats of the typed connections and nodes tables."""
+
+    PARQUET = "parquet"
+    FEATHER = "feather"
+
+
+class TableLayout(Enum):
+    """The layouts of the connections TSV table.
+
+    The wide table has one row by connection and one column by marker and by
+    metadata key. The long table has one row by metadata value of each node.
+
+    """
+
+    WIDE = "wide"
+    LONG = "long"
@@ -0,0 +1,492 @@
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from json import dump, load
+from os import cpu_count
+from pathlib import Path
+from re import fullmatch
+from typing import Any, Literal
+from uuid import uuid4
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+from pandas import isna
+
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.domain.dtos.reference_data.schemas import StandardFieldsSchema
+from gcon.core.use_cases._file_digest import build_file_digest
+from gcon.settings import LOGGER
+
+from ._dtos import ColumnarFormat, OutputFormat, TableLayout
+from ._iter_connection_rows import iter_connection_rows
+from ._write_columnar_tables import NODES_DIRECTORY_SUFFIX
+from ._write_long_table import LONG_TABLE_SUFFIX
+from ._write_results_database import RESULTS_DATABASE_SUFFIX
+
+# ? ----------------------------------------------------------------------------
+# ? Shards manifest format
+#
+# The manifest lists each shard with its number of source rows and connections
+# and the path, size and SHA-256 digest of each file written for the shard.
+# Paths are relative to the manifest directory.
+#
+# ? ----------------------------------------------------------------------------
+
+
+SHARDS_MANIFEST_FORMAT_NAME = "gcon-shards"
+
+
+SHARDS_MANIFEST_FORMAT_VERSION = 1
+
+
+SHARDS_MANIFEST_SUFFIX = ".manifest.json"
+
+
+# The pseudo grouping column grouping rows by the first word of the scientific
+# name
+GENUS_SHARD_KEY = "genus"
+
+
+def build_shard_output_file(output_file: Path, index: int) -> Path:
+    """Build the system path of the outputs of a shard, without extension"""
+
+    return output_file.with_name(f"{output_file.stem}-shard-{index:04d}")
+
+
+def export_reference_data_shards(
+    reference_data: ReferenceData,
+    output_file: Path,
+    shard_count: int,
+    shard_by: str | None = None,
+    max_workers: int | None = None,
+    output_format: OutputFormat = OutputFormat.JSON,
+    profile_names: list[str] | None = None,
+    columnar_format: ColumnarFormat | None = None,
+    table_layout: TableLayout = TableLayout.WIDE,
+    results_database: bool = False,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Persist the resolved reference data in shards
+
+    Rows are split into contiguous row ranges, or, if a grouping column is
+    informed, whole groups of rows are assigned to the least loaded shard,
+    from the largest group to the smallest one. Empty shards are not written.
+
+    Each shard is written by `export_reference_data`, with the same options,
+    to `<output_file>-shard-<index>.<extension>`, and shards are written in
+    parallel worker processes. The rows of a shard are copied only when a
+    worker becomes available, thus at most one shard by worker is held in
+    memory along with the reference data. The manifest, written to
+    `<output_file>.manifest.json`, lists the files of each shard with its row
+    counts and checksums, thus shards could be consumed independently.
+
+    Args:
+        reference_data (ReferenceData): The reference data containing scored
+            connections.
+        output_file (Path): The system path of the outputs, without file
+            extension.
+        shard_count (int): The maximum number of shards.
+        shard_by (str | None): The grouping column, or `genus` to group rows
+            by the first word of the scientific name. Rows are split by row
+            ranges if not informed.
+        max_workers (int | None): The maximum number of worker processes.
+            Defaults to the number of CPUs.
+        output_format (OutputFormat): The format of the reference data file
+            of each shard.
+        profile_names (list[str] | None): The names of the additional scoring
+            profiles.
+        columnar_format (ColumnarFormat | None): The format of the typed
+            tables of each shard. Not written if not informed.
+        table_layout (TableLayout): The layout of the TSV table of each shard.
+        results_database (bool): Whether to write the SQLite results database
+            of each shard.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            outputs were written or a negative response with the errors.
+
+    """
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Validate entry params
+        # ? --------------------------------------------------------------------
+
+        if shard_count < 1:
+            return exc.UseCaseError(
+                f"Invalid shard count: {shard_count}",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        data = reference_data.data
+
+        if shard_by not in [None, GENUS_SHARD_KEY, *data.columns]:
+            return exc.UseCaseError(
+                (
+                    f"Invalid shard grouping column: `{shard_by}`. Use a "
+                    + f"source table column or `{GENUS_SHARD_KEY}`."
+                ),
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        # ? --------------------------------------------------------------------
+        # ? Assign rows and connections to shards
+        # ? --------------------------------------------------------------------
+
+        row_shards = __assign_row_shards(
+            reference_data=reference_data,
+            shard_count=shard_count,
+            shard_by=shard_by,
+        )
+
+        shard_positions: list[list[int]] = [[] for _ in range(shard_count)]
+
+        for position, shard in enumerate(row_shards):
+            shard_positions[shard].append(position)
+
+        # Connections without source rows are placed at the first shard
+        shard_connections: list[list[Connection]] = [
+            [] for _ in range(shard_count)
+        ]
+
+        for connection, row_position in iter_connection_rows(reference_data):
+            shard_connections[
+                0 if row_position is None else row_shards[row_position]
+            ].append(connection)
+
+        shards = [
+            (index, positions, connections)
+            for index, (positions, connections) in enumerate(
+                zip(shard_positions, shard_connections)
+            )
+            if positions or connections
+        ]
+
+        # ? --------------------------------------------------------------------
+        # ? Write shards in parallel
+        # ? --------------------------------------------------------------------
+
+        workers = min(max_workers or cpu_count() or 1, len(shards))
+
+        LOGGER.info(
+            f"Persisting {len(shards)} shards of {output_file} using "
+            + f"{workers} workers"
+        )
+
+        # Arguments are built lazily, thus the reference data of a shard, a
+        # copy of its rows, is only built when the shard is submitted
+        shard_arguments = (
+            dict(
+                index=index,
+                reference_data=__build_shard_reference_data(
+                    reference_data=reference_data,
+                    positions=positions,
+                    connections=connections,
+                ),
+                output_file=build_shard_output_file(output_file, index),
+                export_options=dict(
+                    output_format=output_format,
+                    profile_names=profile_names,
+                    columnar_format=columnar_format,
+                    table_layout=table_layout,
+                    results_database=results_database,
+                ),
+            )
+            for index, positions, connections in shards
+        )
+
+        manifest_entries: list[dict[str, Any]]
+
+        if workers > 1:
+            manifest_entries = []
+
+            # Shards are submitted as workers become available, instead of by
+            # `executor.map`, which submits all of them at once, thus at most
+            # one shard by worker is held in memory
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending: set[Future[dict[str, Any]]] = set()
+
+                for arguments in shard_arguments:
+                    if len(pending) >= workers:
+                        done, pending = wait(
+                            pending,
+                            return_when=FIRST_COMPLETED,
+                        )
+
+                        manifest_entries.extend(
+                            future.result() for future in done
+                        )
+
+                    pending.add(
+                        executor.submit(_write_shard_from_kwargs, arguments)
+                    )
+
+                manifest_entries.extend(
+                    future.result() for future in wait(pending).done
+                )
+
+            manifest_entries.sort(key=lambda entry: entry["index"])
+        else:
+            manifest_entries = [
+                _write_shard_from_kwargs(arguments)
+                for arguments in shard_arguments
+            ]
+
+        # ? --------------------------------------------------------------------
+        # ? Write manifest
+        # ? --------------------------------------------------------------------
+
+        manifest_file = output_file.with_suffix(SHARDS_MANIFEST_SUFFIX)
+
+        LOGGER.info(f"Persisting shards manifest to file: {manifest_file}")
+
+        with manifest_file.open("w") as f:
+            dump(
+                {
+                    "format": SHARDS_MANIFEST_FORMAT_NAME,
+                    "version": SHARDS_MANIFEST_FORMAT_VERSION,
+                    "shard_by": shard_by,
+                    "rows": len(data),
+                    "connections": len(reference_data.connections),
+                    "shards": manifest_entries,
+                },
+                f,
+                indent=4,
+            )
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
+
+
+def __assign_row_shards(
+    reference_data: ReferenceData,
+    shard_count: int,
+    shard_by: str | None,
+) -> list[int]:
+    """Get the shard index of each row of the reference data"""
+
+    rows_count = len(reference_data.data)
+
+    if shard_by is None:
+        return [
+            position * shard_count // max(rows_count, 1)
+            for position in range(rows_count)
+        ]
+
+    if shard_by == GENUS_SHARD_KEY and shard_by not in (
+        reference_data.data.columns
+    ):
+        keys = [
+            "" if isna(name) else str(name).split(" ", 1)[0]
+            for name in reference_data.data[StandardFieldsSchema.sci_name]
+        ]
+    else:
+        keys = [
+            "" if isna(value) else str(value)
+            for value in reference_data.data[shard_by]
+        ]
+
+    group_sizes: dict[str, int] = {}
+
+    for key in keys:
+        group_sizes[key] = group_sizes.get(key, 0) + 1
+
+    # Groups are sorted by name within the same size, thus the assignment does
+    # not depend on the rows order
+    shard_sizes = [0] * shard_count
+    group_shards: dict[str, int] = {}
+
+    for key, size in sorted(
+        group_sizes.items(),
+        key=lambda item: (-item[1], item[0]),
+    ):
+        shard = shard_sizes.index(min(shard_sizes))
+        shard_sizes[shard] += size
+        group_shards[key] = shard
+
+    return [group_shards[key] for key in keys]
+
+
+def __build_shard_reference_data(
+    reference_data: ReferenceData,
+    positions: list[int],
+    connections: list[Connection],
+) -> ReferenceData:
+    """Build the reference data of a shard"""
+
+    shard_reference_data = ReferenceData(
+        data=reference_data.data.iloc[positions].reset_index(drop=True),
+        optional_fields=reference_data.optional_fields,
+        gene_fields=reference_data.gene_fields,
+    )
+
+    shard_reference_data.with_connections(connections)
+
+    return shard_reference_data
+
+
+def _write_shard_from_kwargs(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Write a shard and build its manifest entry
+
+    It is called by worker processes, thus errors are raised instead of
+    returned to be propagated to the parent process.
+
+    """
+
+    from . import export_reference_data
+
+    index: int = arguments["index"]
+    reference_data: ReferenceData = arguments["reference_data"]
+    output_file: Path = arguments["output_file"]
+    export_options: dict[str, Any] = arguments["export_options"]
+
+    if (
+        export_either := export_reference_data(
+            reference_data=reference_data,
+            output_file=output_file,
+            **export_options,
+        )
+    ).is_left:
+        raise Exception(
+            f"Unable to write shard {index}: {export_either.value.msg}"
+        )
+
+    output_format: OutputFormat = export_options["output_format"]
+    columnar_format: ColumnarFormat | None = export_options["columnar_format"]
+
+    paths = [
+        output_file.with_suffix(output_format.suffix),
+        output_file.with_suffix(
+            LONG_TABLE_SUFFIX
+            if export_options["table_layout"] == TableLayout.LONG
+            else ".tsv"
+        ),
+    ]
+
+    if columnar_format is not None:
+        paths.append(output_file.with_suffix(f".{columnar_format.value}"))
+        paths.extend(
+            sorted(
+                path
+                for path in output_file.with_suffix(
+                    NODES_DIRECTORY_SUFFIX
+                ).rglob(f"*.{columnar_format.value}")
+                if path.is_file()
+            )
+        )
+
+    if export_options["results_database"] is True:
+        paths.append(output_file.with_suffix(RESULTS_DATABASE_SUFFIX))
+
+    return {
+        "index": index,
+        "rows": len(reference_data.data),
+        "connections": len(reference_data.connections),
+        "files": [
+            {
+                "path": path.relative_to(output_file.parent).as_posix(),
+                **__build_file_checksums(path),
+            }
+            for path in paths
+        ],
+    }
+
+
+def refresh_shard_manifest(output_file: Path) -> Either[exc.UseCaseError, bool]:
+    """Refresh the sizes and checksums of the files of a shard in its manifest
+
+    Should be called whenever the files of a shard are rewritten, e.g. by
+    `rescore_connections`, thus downstream jobs verifying the manifest accept
+    the rewritten files. Outputs which are not shards are ignored.
+
+    Args:
+        output_file (Path): The system path of the outputs of a shard, as
+            built by `build_shard_output_file`, without file extension.
+
+    Returns:
+        Either[exc.UseCaseError, bool]: A positive response with True if the
+            manifest was refreshed, or False if the output is not a shard with
+            a manifest, or a negative response with the errors.
+
+    """
+
+    try:
+        if (
+            shard_match := fullmatch(r"(.+)-shard-(\d{4,})", output_file.name)
+        ) is None:
+            return right(False)
+
+        manifest_file = output_file.with_name(
+            f"{shard_match[1]}{SHARDS_MANIFEST_SUFFIX}"
+        )
+
+        if not manifest_file.is_file():
+            return right(False)
+
+        with manifest_file.open("r") as f:
+            manifest: dict[str, Any] = load(f)
+
+        index = int(shard_match[2])
+
+        if (
+            shard := next(
+                (
+                    shard
+                    for shard in manifest.get("shards", [])
+                    if shard.get("index") == index
+                ),
+                None,
+            )
+        ) is None:
+            return exc.UseCaseError(
+                f"Shard {index} not found in manifest: {manifest_file}",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        LOGGER.info(f"Refreshing shard {index} of manifest: {manifest_file}")
+
+        for file in shard["files"]:
+            file.update(
+                __build_file_checksums(
+                    manifest_file.parent.joinpath(file["path"])
+                )
+            )
+
+        temporary_manifest = manifest_file.with_name(
+            f".{manifest_file.name}.{uuid4()}"
+        )
+
+        try:
+            with temporary_manifest.open("w") as f:
+                dump(manifest, f, indent=4)
+
+            temporary_manifest.replace(manifest_file)
+
+        finally:
+            temporary_manifest.unlink(missing_ok=True)
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
+
+
+def __build_file_checksums(path: Path) -> dict[str, Any]:
+    """Build the size and the SHA-256 digest of a manifest file entry"""
+
+    return {
+        "bytes": path.stat().st_size,
+        "sha256": build_file_digest(path),
+    }
@@ -0,0 +1,54 @@
+from typing import Iterator
+
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.reference_data import ReferenceData
+
+
+def iter_connection_rows(
+    reference_data: ReferenceData,
+) -> Iterator[tuple[Connection, int | None]]:
+    """Pair each connection with the position of its source row
+
+    Connections ids are the row ids of the reference data. Connections are
+    built in the order of the data rows, thus rows are matched sequentially,
+    and rows are indexed by id only if the order differs.
+
+    Args:
+        reference_data (ReferenceData): The reference data containing the
+            connections.
+
+    Yields:
+        tuple[Connection, int | None]: The connection and the position of its
+            row in the reference data, or None if the row is not found.
+
+    """
+
+    row_ids = (
+        reference_data.data["uuid"].array
+        if "uuid" in reference_data.data.columns
+        else []
+    )
+
+    next_position = 0
+    positions: dict[str, int] | None = None
+
+    for connection in reference_data.connections:
+        connection_id = str(connection.id)
+
+        if (
+            next_position < len(row_ids)
+            and row_ids[next_position] == connection_id
+        ):
+            position: int | None = next_position
+        else:
+            if positions is None:
+                positions = {
+                    row_id: index for index, row_id in enumerate(row_ids)
+                }
+
+            position = positions.get(connection_id)
+
+        if position is not None:
+            next_position = position + 1
+
+        yield connection, position
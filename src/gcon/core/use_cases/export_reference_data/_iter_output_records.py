@@ -0,0 +1,157 @@
+from json import load
+from pathlib import Path
+from typing import Any, Iterator
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.settings import LOGGER
+
+from ._dtos import OutputFormat
+
+# The reference data files looked up for the outputs of a run, in the lookup
+# order. JSON Lines files are preferred since they are read incrementally.
+OUTPUT_RECORDS_FORMATS = [
+    OutputFormat.JSONL,
+    OutputFormat.JSONL_GZ,
+    OutputFormat.JSON,
+]
+
+
+def find_output_data_file(output_file: Path) -> Path | None:
+    """Find the reference data file of the outputs of a run
+
+    Args:
+        output_file (Path): The system path of the outputs, without file
+            extension.
+
+    Returns:
+        Path | None: The first file found in the `OUTPUT_RECORDS_FORMATS`
+            order, or None if the outputs contain no reference data file.
+
+    """
+
+    for output_format in OUTPUT_RECORDS_FORMATS:
+        if (
+            data_file := output_file.with_suffix(output_format.suffix)
+        ).is_file():
+            return data_file
+
+    return None
+
+
+def read_output_fields(
+    output_file: Path,
+) -> Either[exc.MappedErrors, tuple[list[str], list[str]]]:
+    """Read the optional and gene fields of the outputs of a run
+
+    Only the header of JSON Lines files is read. The JSON document is loaded
+    as a whole.
+
+    Args:
+        output_file (Path): The system path of the outputs, without file
+            extension.
+
+    Returns:
+        Either[exc.MappedErrors, tuple[list[str], list[str]]]: The optional
+            and gene fields or a negative response with the errors.
+
+    """
+
+    try:
+        if (data_file := find_output_data_file(output_file)) is None:
+            return exc.UseCaseError(
+                (
+                    f"No JSON or JSON Lines output found for: {output_file}. "
+                    + "Please inform the output file without extension."
+                ),
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        if data_file.suffix != OutputFormat.JSON.suffix:
+            return ReferenceData.read_jsonl_header(data_file)
+
+        with data_file.open("r") as f:
+            content: dict[str, Any] = load(f)
+
+        fields: list[list[str]] = []
+
+        for key in ["optional_fields", "gene_fields"]:
+            if not isinstance(value := content.get(key), list):
+                return exc.UseCaseError(
+                    f"Unable to read {data_file}. Invalid `{key}`.",
+                    logger=LOGGER,
+                )()
+
+            fields.append([str(item) for item in value])
+
+        optional_fields, gene_fields = fields
+
+        return right((optional_fields, gene_fields))
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
+
+
+def iter_output_records(
+    output_file: Path,
+) -> Iterator[Either[exc.MappedErrors, dict[str, Any]]]:
+    """Iterate over the connection records of the outputs of a run
+
+    JSON Lines files are read one line at a time. The JSON document is loaded
+    as a whole, thus memory usage grows with the file size, and its connection
+    records are joined to the source table rows by id. In both cases records
+    are yielded as produced by `Connection.to_dict`, with the source table row
+    in the `data` key. The iteration stops after the first error.
+
+    Args:
+        output_file (Path): The system path of the outputs, without file
+            extension.
+
+    Yields:
+        Either[exc.MappedErrors, dict[str, Any]]: The connection records, or
+            an error.
+
+    """
+
+    try:
+        if (data_file := find_output_data_file(output_file)) is None:
+            yield exc.UseCaseError(
+                (
+                    f"No JSON or JSON Lines output found for: {output_file}. "
+                    + "Please inform the output file without extension."
+                ),
+                logger=LOGGER,
+                exp=True,
+            )()
+
+            return
+
+        if data_file.suffix != OutputFormat.JSON.suffix:
+            yield from ReferenceData.iter_jsonl_records(data_file)
+            return
+
+        with data_file.open("r") as f:
+            content: dict[str, Any] = load(f)
+
+        if not isinstance(connections := content.get("connections"), list):
+            yield exc.UseCaseError(
+                f"Unable to read {data_file}. Connections must be a list.",
+                logger=LOGGER,
+            )()
+
+            return
+
+        rows = {
+            row.get("uuid"): row
+            for row in content.get("data") or []
+            if isinstance(row, dict)
+        }
+
+        for connection in connections:
+            yield right({**connection, "data": rows.get(connection.get("id"))})
+
+    except Exception as e:
+        yield exc.UseCaseError(e, logger=LOGGER)()
@@ -0,0 +1,59 @@
+from gcon.core.domain.dtos.score import ConnectionScores
+
+# The score columns of the connections tables, in the output order. Columns of
+# additional scoring profiles follow the same order, prefixed by the profile
+# name (see `ConnectionScores.build_profile_field_name`).
+SCORE_COLUMNS = [
+    "observed_completeness_score",
+    "reachable_completeness_score",
+    "information_gain",
+]
+
+
+def build_score_values(
+    scores: ConnectionScores | None,
+) -> list[float | None]:
+    """Build the values of the score columns of a connection
+
+    The information gain is missing for connections without reachable scores.
+
+    Args:
+        scores (ConnectionScores | None): The connection scores.
+
+    Returns:
+        list[float | None]: The values in the `SCORE_COLUMNS` order, all
+            missing if the connection is not scored.
+
+    """
+
+    if scores is None:
+        return [None, None, None]
+
+    observed = float(scores.observed_completeness_score)
+    reachable = float(scores.reachable_completeness_score)
+
+    return [
+        observed,
+        reachable,
+        None if reachable == 0 else 100 - (observed * 100 / reachable),
+    ]
+
+
+def format_score_values(scores: ConnectionScores | None) -> list[str]:
+    """Format the values of the score columns of a connection as text
+
+    Values are formatted as pandas does on writing floats, and missing values
+    are written as empty strings.
+
+    Args:
+        scores (ConnectionScores | None): The connection scores.
+
+    Returns:
+        list[str]: The formatted values in the `SCORE_COLUMNS` order.
+
+    """
+
+    return [
+        "" if value is None else repr(value)
+        for value in build_score_values(scores)
+    ]
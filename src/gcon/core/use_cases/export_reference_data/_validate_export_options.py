@@ -0,0 +1,59 @@
+from importlib.util import find_spec
+from typing import Literal
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.settings import LOGGER
+
+from ._dtos import ColumnarFormat
+
+
+def validate_export_options(
+    columnar_format: ColumnarFormat | None = None,
+    shard_count: int | None = None,
+    shard_by: str | None = None,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Validate the export options before resolving the reference data
+
+    Options are validated apart from the export itself, thus invalid options
+    are reported before the slower steps run.
+
+    Args:
+        columnar_format (ColumnarFormat | None): The format of the typed
+            tables.
+        shard_count (int | None): The maximum number of shards.
+        shard_by (str | None): The column grouping rows of the same shard.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            options are valid or a negative response with the errors.
+
+    """
+
+    if shard_by is not None and shard_count is None:
+        return exc.UseCaseError(
+            "The shard grouping column requires a shard count",
+            logger=LOGGER,
+            exp=True,
+        )()
+
+    if shard_count is not None and shard_count < 1:
+        return exc.UseCaseError(
+            f"Invalid shard count: {shard_count}",
+            logger=LOGGER,
+            exp=True,
+        )()
+
+    if columnar_format is not None and find_spec("pyarrow") is None:
+        return exc.UseCaseError(
+            (
+                f"Writing {columnar_format.value} outputs requires the "
+                + "optional `pyarrow` package. Install it with `pip "
+                + "install gene-connector-cli[arrow]`."
+            ),
+            logger=LOGGER,
+            exp=True,
+        )()
+
+    return right(True)
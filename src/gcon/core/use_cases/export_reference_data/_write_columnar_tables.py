@@ -0,0 +1,307 @@
+from math import isnan
+from pathlib import Path
+from typing import Any, Literal
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.domain.dtos.reference_data.schemas import StandardFieldsSchema
+from gcon.core.domain.dtos.score import ConnectionScores
+from gcon.settings import LOGGER, OUTPUT_BATCH_SIZE
+
+from ._collect_table_keys import build_metadata_string_key, collect_table_keys
+from ._dtos import ColumnarFormat
+from ._iter_connection_rows import iter_connection_rows
+from ._score_columns import SCORE_COLUMNS, build_score_values
+
+# ? ----------------------------------------------------------------------------
+# ? Columnar outputs layout
+#
+# The connections table is written to `<output_file>.<format>` with one row by
+# connection. The nodes table is written to `<output_file>.nodes/`, with one
+# row by node, partitioned by marker as `marker=<marker>/part-0.<format>`, thus
+# readers supporting hive partitioning (e.g. `pyarrow.dataset`, `arrow` in R)
+# restore the `marker` column and load only the required markers.
+#
+# ? ----------------------------------------------------------------------------
+
+
+NODES_DIRECTORY_SUFFIX = ".nodes"
+
+
+def write_columnar_tables(
+    reference_data: ReferenceData,
+    output_file: Path,
+    columnar_format: ColumnarFormat,
+    profile_names: list[str] | None = None,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Write the connections and the nodes tables as Parquet or Feather files
+
+    Unlike the TSV table, columns are typed: scores are floats, and
+    identifiers, accessions, signatures, and metadata values are list columns.
+    Connections are converted in batches of `OUTPUT_BATCH_SIZE`, thus the
+    memory used does not depend on the number of connections.
+
+    Args:
+        reference_data (ReferenceData): The reference data containing scored
+            connections.
+        output_file (Path): The system path of the outputs, without file
+            extension.
+        columnar_format (ColumnarFormat): The format of the tables.
+        profile_names (list[str] | None): The names of the additional scoring
+            profiles, whose scores are written after the main ones.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            tables were written or a negative response with the errors.
+
+    """
+
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        import pyarrow.parquet as pq
+
+    except ImportError:
+        return exc.UseCaseError(
+            (
+                f"Writing {columnar_format.value} outputs requires the "
+                + "optional `pyarrow` package. Install it with `pip install "
+                + "gene-connector-cli[arrow]`."
+            ),
+            logger=LOGGER,
+            exp=True,
+        )()
+
+    def to_string(value: Any) -> str | None:
+        if value is None or (isinstance(value, float) and isnan(value)):
+            return None
+
+        return str(value)
+
+    def to_strings(value: Any) -> list[str]:
+        if isinstance(value, str):
+            return [value]
+
+        return [str(item) for item in value]
+
+    def open_writer(path: Path, schema: Any) -> Any:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if columnar_format == ColumnarFormat.PARQUET:
+            return pq.ParquetWriter(path, schema)
+
+        return ipc.new_file(path, schema)
+
+    def write_batch(
+        writer: Any, schema: Any, columns: dict[str, list[Any]]
+    ) -> None:
+        batch = pa.RecordBatch.from_pydict(columns, schema=schema)
+
+        if columnar_format == ColumnarFormat.PARQUET:
+            writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            writer.write_batch(batch)
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Build the tables schemas
+        # ? --------------------------------------------------------------------
+
+        markers, metadata_keys = collect_table_keys(reference_data)
+
+        data_columns = [
+            c
+            for c in [
+                StandardFieldsSchema.sci_name,
+                *reference_data.optional_fields,
+            ]
+            if c in reference_data.data.columns
+        ]
+
+        data_values = [reference_data.data[c].array for c in data_columns]
+
+        score_columns = [
+            *SCORE_COLUMNS,
+            *(
+                ConnectionScores.build_profile_field_name(name, column)
+                for name in profile_names or []
+                for column in SCORE_COLUMNS
+            ),
+        ]
+
+        strings = pa.list_(pa.string())
+
+        connections_schema = pa.schema(
+            [
+                ("signature", pa.string()),
+                (StandardFieldsSchema.identifier, strings),
+                *((column, pa.string()) for column in data_columns),
+                *((column, pa.float64()) for column in score_columns),
+                *((marker, strings) for marker in markers),
+                *((f"signature-{marker}", strings) for marker in markers),
+                *((key, strings) for key in metadata_keys),
+            ]
+        )
+
+        nodes_schema = pa.schema(
+            [
+                ("connection_signature", pa.string()),
+                ("accession", pa.string()),
+                ("signature", pa.string()),
+                *((key, strings) for key in metadata_keys),
+            ]
+        )
+
+        # ? --------------------------------------------------------------------
+        # ? Open writers
+        # ? --------------------------------------------------------------------
+
+        extension = f".{columnar_format.value}"
+        nodes_directory = output_file.with_suffix(NODES_DIRECTORY_SUFFIX)
+
+        connections_writer = open_writer(
+            output_file.with_suffix(extension),
+            connections_schema,
+        )
+
+        nodes_writers = {
+            marker: open_writer(
+                nodes_directory.joinpath(
+                    f"marker={marker}", f"part-0{extension}"
+                ),
+                nodes_schema,
+            )
+            for marker in markers
+        }
+
+        # ? --------------------------------------------------------------------
+        # ? Write batches
+        # ? --------------------------------------------------------------------
+
+        def new_batch(schema: Any) -> dict[str, list[Any]]:
+            return {name: [] for name in schema.names}
+
+        def flush(
+            connections_batch: dict[str, list[Any]],
+            nodes_batches: dict[str, dict[str, list[Any]]],
+        ) -> None:
+            write_batch(
+                connections_writer,
+                connections_schema,
+                connections_batch,
+            )
+
+            for marker, nodes_batch in nodes_batches.items():
+                if nodes_batch["accession"]:
+                    write_batch(
+                        nodes_writers[marker],
+                        nodes_schema,
+                        nodes_batch,
+                    )
+
+        def append_connection(
+            connection: Connection,
+            position: int | None,
+            connections_batch: dict[str, list[Any]],
+            nodes_batches: dict[str, dict[str, list[Any]]],
+        ) -> None:
+            signature = str(connection.signature)
+
+            record: dict[str, Any] = {
+                "signature": signature,
+                StandardFieldsSchema.identifier: list(connection.identifiers),
+            }
+
+            if position is not None:
+                record.update(
+                    {
+                        column: to_string(values[position])
+                        for column, values in zip(data_columns, data_values)
+                    }
+                )
+
+            record.update(
+                zip(SCORE_COLUMNS, build_score_values(connection.scores))
+            )
+
+            for name, scores in connection.profile_scores.items():
+                record.update(
+                    {
+                        ConnectionScores.build_profile_field_name(
+                            name, column
+                        ): value
+                        for column, value in zip(
+                            SCORE_COLUMNS, build_score_values(scores)
+                        )
+                    }
+                )
+
+            for node in connection.nodes:
+                record.setdefault(node.marker, []).append(node.accession)
+                record.setdefault(f"signature-{node.marker}", []).append(
+                    str(node.signature)
+                )
+
+                nodes_batch = nodes_batches[node.marker]
+                nodes_batch["connection_signature"].append(signature)
+                nodes_batch["accession"].append(node.accession)
+                nodes_batch["signature"].append(str(node.signature))
+
+                node_values = {
+                    build_metadata_string_key(key=key): to_strings(value)
+                    for key, value in node.metadata.qualifiers.items()
+                }
+
+                for key in metadata_keys:
+                    nodes_batch[key].append(node_values.get(key))
+
+                for key, values in node_values.items():
+                    record.setdefault(key, []).extend(values)
+
+            for name, column_values in connections_batch.items():
+                column_values.append(record.get(name))
+
+        try:
+            connections_batch = new_batch(connections_schema)
+            nodes_batches = {
+                marker: new_batch(nodes_schema) for marker in markers
+            }
+            batch_size = 0
+
+            for connection, position in iter_connection_rows(reference_data):
+                append_connection(
+                    connection=connection,
+                    position=position,
+                    connections_batch=connections_batch,
+                    nodes_batches=nodes_batches,
+                )
+
+                if (batch_size := batch_size + 1) >= OUTPUT_BATCH_SIZE:
+                    flush(connections_batch, nodes_batches)
+
+                    connections_batch = new_batch(connections_schema)
+                    nodes_batches = {
+                        marker: new_batch(nodes_schema) for marker in markers
+                    }
+                    batch_size = 0
+
+            if batch_size > 0:
+                flush(connections_batch, nodes_batches)
+
+        finally:
+            connections_writer.close()
+
+            for writer in nodes_writers.values():
+                writer.close()
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
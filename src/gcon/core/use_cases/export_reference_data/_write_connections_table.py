@@ -0,0 +1,198 @@
+from csv import QUOTE_MINIMAL, writer
+from math import isnan
+from pathlib import Path
+from typing import Any, Literal
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.domain.dtos.reference_data.schemas import StandardFieldsSchema
+from gcon.core.domain.dtos.score import ConnectionScores
+from gcon.settings import LOGGER
+
+from ._collect_table_keys import build_metadata_string_key, collect_table_keys
+from ._iter_connection_rows import iter_connection_rows
+from ._score_columns import SCORE_COLUMNS, format_score_values
+
+
+def write_connections_table(
+    reference_data: ReferenceData,
+    output_file: Path,
+    profile_names: list[str] | None = None,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Write the connections table of the reference data to a TSV file
+
+    The table is written in two passes over the connections. The first one
+    only collects the marker and the metadata columns, and the second one
+    builds and writes one row at a time, thus no table of the whole output is
+    held in memory. Values are formatted as pandas does, thus the output is
+    the same of writing the table through a DataFrame.
+
+    Args:
+        reference_data (ReferenceData): The reference data containing scored
+            connections.
+        output_file (Path): The TSV file path.
+        profile_names (list[str] | None): The names of the additional scoring
+            profiles, whose scores are written after the main ones.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            table was written or a negative response with the errors.
+
+    """
+
+    JOIN_SEPARATOR = " / "
+
+    def build_connection_record(connection: Connection) -> dict[str, Any]:
+        connection_record: dict[str, Any] = {}
+
+        connection_record.update(
+            {
+                "signature": connection.signature,
+                StandardFieldsSchema.identifier: f"{JOIN_SEPARATOR}".join(
+                    set(connection.identifiers)
+                ),
+            }
+        )
+
+        for name, scores in [
+            (None, connection.scores),
+            *connection.profile_scores.items(),
+        ]:
+            connection_record.update(
+                {
+                    (
+                        field_name
+                        if name is None
+                        else ConnectionScores.build_profile_field_name(
+                            name, field_name
+                        )
+                    ): value
+                    for field_name, value in zip(
+                        SCORE_COLUMNS, format_score_values(scores)
+                    )
+                }
+            )
+
+        for node in connection.nodes:
+            accession = node.accession
+            if node.marker in connection_record:
+                accession = f"{JOIN_SEPARATOR}".join(
+                    [accession, node.accession]
+                )
+
+            connection_record.update({node.marker: accession})
+            connection_record.update(
+                {f"signature-{node.marker}": node.signature}
+            )
+
+            for key, value in node.metadata.qualifiers.items():
+                composed_key = build_metadata_string_key(key=key)
+                stringified_value = (
+                    value
+                    if isinstance(value, str)
+                    else f"{JOIN_SEPARATOR}".join(value)
+                )
+
+                if composed_key in connection_record:
+                    stringified_value = f"{JOIN_SEPARATOR}".join(
+                        [
+                            *connection_record[composed_key],
+                            stringified_value,
+                        ]
+                    )
+
+                connection_record.update(
+                    {
+                        build_metadata_string_key(key=key): stringified_value
+                        if isinstance(value, str)
+                        else ",".join(value)
+                    }
+                )
+
+        return connection_record
+
+    def format_value(value: Any) -> str:
+        if value is None or (isinstance(value, float) and isnan(value)):
+            return ""
+
+        return str(value)
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Collect all unique keys
+        # ? --------------------------------------------------------------------
+
+        markers, metadata_keys = collect_table_keys(reference_data)
+
+        # ? --------------------------------------------------------------------
+        # ? Build the output layout
+        # ? --------------------------------------------------------------------
+
+        data_columns = [
+            c
+            for c in [
+                StandardFieldsSchema.sci_name,
+                *reference_data.optional_fields,
+            ]
+            if c in reference_data.data.columns
+        ]
+
+        data_values = [reference_data.data[c].array for c in data_columns]
+
+        header = [
+            "signature",
+            StandardFieldsSchema.identifier,
+            StandardFieldsSchema.sci_name,
+            *reference_data.optional_fields,
+            *SCORE_COLUMNS,
+            *(
+                ConnectionScores.build_profile_field_name(name, column)
+                for name in profile_names or []
+                for column in SCORE_COLUMNS
+            ),
+            *markers,
+            *(f"signature-{marker}" for marker in markers),
+            *metadata_keys,
+        ]
+
+        # ? --------------------------------------------------------------------
+        # ? Write rows
+        # ? --------------------------------------------------------------------
+
+        with output_file.with_suffix(".tsv").open("w", newline="") as f:
+            tsv_writer = writer(
+                f,
+                delimiter="\t",
+                quoting=QUOTE_MINIMAL,
+                lineterminator="\n",
+            )
+
+            tsv_writer.writerow(header)
+
+            for connection, position in iter_connection_rows(reference_data):
+                connection_record = build_connection_record(connection)
+
+                if position is not None:
+                    connection_record.update(
+                        {
+                            column: values[position]
+                            for column, values in zip(data_columns, data_values)
+                        }
+                    )
+
+                tsv_writer.writerow(
+                    format_value(connection_record.get(column))
+                    for column in header
+                )
+
+        # ? --------------------------------------------------------------------
+        # ? Return success
+        # ? --------------------------------------------------------------------
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
@@ -0,0 +1,172 @@
+import gzip
+from json import dumps
+from pathlib import Path
+from typing import Any, Literal, TextIO
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.reference_data import (
+    JSONL_FORMAT_NAME,
+    JSONL_FORMAT_VERSION,
+    ReferenceData,
+)
+from gcon.settings import LOGGER
+
+from ._iter_connection_rows import iter_connection_rows
+
+# The zlib default level. The gzip module default (9) is several times slower
+# and results in files only slightly smaller.
+GZIP_COMPRESS_LEVEL = 6
+
+
+def write_json(
+    reference_data: ReferenceData,
+    output_file: Path,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Write the whole reference data to a single JSON document
+
+    Args:
+        reference_data (ReferenceData): The reference data containing scored
+            connections.
+        output_file (Path): The JSON file path.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            file was written or a negative response with the errors.
+
+    """
+
+    try:
+        with output_file.open("w") as f:
+            f.write(
+                dumps(
+                    reference_data.to_dict(),
+                    indent=4,
+                    sort_keys=True,
+                    default=str,
+                )
+            )
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
+
+
+def write_jsonl(
+    reference_data: ReferenceData,
+    output_file: Path,
+    compress: bool = False,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Write the reference data as JSON Lines, one connection by line
+
+    The first line contains the format header and the optional and gene
+    fields. Each following line contains a connection, as produced by
+    `Connection.to_dict`, with its source table row in the `data` key.
+    Connections are serialized one at a time, thus the whole document is
+    never held in memory. See `ReferenceData.iter_jsonl` for the reader.
+
+    Args:
+        reference_data (ReferenceData): The reference data containing scored
+            connections.
+        output_file (Path): The JSON Lines file path.
+        compress (bool): Compress the output with gzip if True.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            file was written or a negative response with the errors.
+
+    """
+
+    try:
+        data_columns = list(reference_data.data.columns)
+        data_values = [reference_data.data[c].array for c in data_columns]
+
+        with open_jsonl_output(output_file, compress=compress) as f:
+            write_jsonl_header(
+                f,
+                optional_fields=reference_data.optional_fields,
+                gene_fields=reference_data.gene_fields,
+            )
+
+            for connection, position in iter_connection_rows(reference_data):
+                write_jsonl_record(
+                    f,
+                    {
+                        **connection.to_dict(),
+                        "data": None
+                        if position is None
+                        else {
+                            column: values[position]
+                            for column, values in zip(data_columns, data_values)
+                        },
+                    },
+                )
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
+
+
+def open_jsonl_output(output_file: Path, compress: bool = False) -> TextIO:
+    """Open a JSON Lines file for writing
+
+    Args:
+        output_file (Path): The JSON Lines file path.
+        compress (bool): Compress the output with gzip if True.
+
+    Returns:
+        TextIO: The text stream of the file.
+
+    """
+
+    if compress:
+        return gzip.open(
+            output_file,
+            "wt",
+            compresslevel=GZIP_COMPRESS_LEVEL,
+        )
+
+    return output_file.open("w")
+
+
+def write_jsonl_header(
+    f: TextIO,
+    optional_fields: list[str],
+    gene_fields: list[str],
+) -> None:
+    """Write the format header line of a JSON Lines file
+
+    Args:
+        f (TextIO): The text stream of the file.
+        optional_fields (list[str]): The optional fields of the source table.
+        gene_fields (list[str]): The gene fields of the source table.
+
+    """
+
+    write_jsonl_record(
+        f,
+        {
+            "format": JSONL_FORMAT_NAME,
+            "version": JSONL_FORMAT_VERSION,
+            "optional_fields": optional_fields,
+            "gene_fields": gene_fields,
+        },
+    )
+
+
+def write_jsonl_record(f: TextIO, content: dict[str, Any]) -> None:
+    """Write a record as a single line of a JSON Lines file
+
+    Args:
+        f (TextIO): The text stream of the file.
+        content (dict[str, Any]): The record, e.g. a connection as produced
+            by `Connection.to_dict` with its source table row in the `data`
+            key.
+
+    """
+
+    f.write(dumps(content, sort_keys=True, default=str))
+    f.write("\n")
@@ -0,0 +1,148 @@
+from csv import QUOTE_MINIMAL, writer
+from pathlib import Path
+from typing import Iterable, Literal
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.domain.dtos.score import ConnectionScores
+from gcon.settings import LOGGER
+
+from ._score_columns import SCORE_COLUMNS, format_score_values
+
+# The columns of the long table, in the output order. Nodes without metadata
+# are written as a single row with empty `group`, `key`, and `value` columns,
+# thus all nodes are listed.
+LONG_TABLE_COLUMNS = [
+    "connection_id",
+    "marker",
+    "accession",
+    "group",
+    "key",
+    "value",
+]
+
+
+LONG_TABLE_SUFFIX = ".long.tsv"
+
+
+# The group of the score rows. The rows of each connection start with a row by
+# score column of the wide table, with empty `marker` and `accession` columns,
+# the score column name in the `key` column, and the score formatted as in the
+# wide table in the `value` column.
+LONG_TABLE_SCORES_GROUP = "SCORES"
+
+
+def write_long_table(
+    reference_data: ReferenceData,
+    output_file: Path,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Write the nodes metadata of the connections as a long TSV table
+
+    Each row contains a single metadata value of a node, and multi-valued
+    qualifiers span many rows. Unlike the wide table, columns do not depend on
+    the metadata keys found, thus rows are written in a single pass over the
+    connections and rare qualifiers do not cost empty cells in all rows. Rows
+    of the same connection are contiguous. See `pivot_long_table` to build the
+    wide layout of a subset of keys. The rows of each connection start with
+    its score rows (see `build_long_table_score_rows`).
+
+    Args:
+        reference_data (ReferenceData): The reference data containing the
+            connections.
+        output_file (Path): The TSV file path.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            table was written or a negative response with the errors.
+
+    """
+
+    try:
+        with output_file.open("w", newline="") as f:
+            tsv_writer = writer(
+                f,
+                delimiter="\t",
+                quoting=QUOTE_MINIMAL,
+                lineterminator="\n",
+            )
+
+            tsv_writer.writerow(LONG_TABLE_COLUMNS)
+
+            for connection in reference_data.connections:
+                connection_id = str(connection.id)
+
+                tsv_writer.writerows(
+                    build_long_table_score_rows(
+                        connection_id=connection_id,
+                        scores=connection.scores,
+                        profile_scores=connection.profile_scores.items(),
+                    )
+                )
+
+                for node in connection.nodes:
+                    if not node.metadata.qualifiers:
+                        tsv_writer.writerow(
+                            [connection_id, node.marker, node.accession]
+                            + [""] * 3
+                        )
+
+                        continue
+
+                    for key, value in node.metadata.qualifiers.items():
+                        tsv_writer.writerows(
+                            [
+                                connection_id,
+                                node.marker,
+                                node.accession,
+                                key.group.name,
+                                key.key,
+                                item,
+                            ]
+                            for item in (
+                                [value] if isinstance(value, str) else value
+                            )
+                        )
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
+
+
+def build_long_table_score_rows(
+    connection_id: str,
+    scores: ConnectionScores | None,
+    profile_scores: Iterable[tuple[str, ConnectionScores]],
+) -> list[list[str]]:
+    """Build the score rows of a connection of the long table
+
+    Args:
+        connection_id (str): The connection id.
+        scores (ConnectionScores | None): The main scores of the connection.
+        profile_scores (Iterable[tuple[str, ConnectionScores]]): The name and
+            the scores of each additional scoring profile.
+
+    Returns:
+        list[list[str]]: The rows, in the score columns order of the wide
+            table.
+
+    """
+
+    return [
+        [
+            connection_id,
+            "",
+            "",
+            LONG_TABLE_SCORES_GROUP,
+            column
+            if name is None
+            else ConnectionScores.build_profile_field_name(name, column),
+            value,
+        ]
+        for name, connection_scores in [(None, scores), *profile_scores]
+        for column, value in zip(
+            SCORE_COLUMNS, format_score_values(connection_scores)
+        )
+    ]
@@ -0,0 +1,281 @@
+import sqlite3
+from json import dumps
+from math import isnan
+from pathlib import Path
+from typing import Any, Literal
+from uuid import uuid4
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.domain.dtos.reference_data.schemas import StandardFieldsSchema
+from gcon.settings import LOGGER, OUTPUT_BATCH_SIZE
+
+from ._iter_connection_rows import iter_connection_rows
+from ._score_columns import build_score_values
+
+# ? ----------------------------------------------------------------------------
+# ? Results database schema
+#
+# Connections, their identifiers, nodes, and nodes qualifiers are stored in
+# separate tables, linked by integer keys. Each qualifier value is a row of
+# the `qualifiers` table, which is indexed for exact lookups by `group`, `key`
+# and `value`, and by the `qualifiers_fts` full-text index. The format and the
+# version of the schema are stored in the `meta` table.
+#
+# Indexes are created after all rows are inserted, which is faster than
+# updating them on each insertion.
+#
+# ? ----------------------------------------------------------------------------
+
+
+RESULTS_DATABASE_FORMAT_NAME = "gcon-results"
+
+
+RESULTS_DATABASE_VERSION = 1
+
+
+RESULTS_DATABASE_SUFFIX = ".sqlite"
+
+
+RESULTS_DATABASE_TABLES = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE connections (
+    id INTEGER PRIMARY KEY,
+    connection_id TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    scientific_name TEXT,
+    observed_completeness_score REAL,
+    reachable_completeness_score REAL,
+    information_gain REAL,
+    data TEXT
+);
+
+CREATE TABLE identifiers (
+    connection INTEGER NOT NULL REFERENCES connections (id),
+    identifier TEXT NOT NULL
+);
+
+CREATE TABLE profile_scores (
+    connection INTEGER NOT NULL REFERENCES connections (id),
+    profile TEXT NOT NULL,
+    observed_completeness_score REAL,
+    reachable_completeness_score REAL,
+    information_gain REAL
+);
+
+CREATE TABLE nodes (
+    id INTEGER PRIMARY KEY,
+    connection INTEGER NOT NULL REFERENCES connections (id),
+    marker TEXT NOT NULL,
+    accession TEXT NOT NULL,
+    signature TEXT NOT NULL
+);
+
+CREATE TABLE qualifiers (
+    id INTEGER PRIMARY KEY,
+    node INTEGER NOT NULL REFERENCES nodes (id),
+    "group" TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+"""
+
+
+RESULTS_DATABASE_INDEXES = """
+CREATE UNIQUE INDEX connections_connection_id ON connections (connection_id);
+CREATE INDEX connections_signature ON connections (signature);
+CREATE INDEX connections_observed_completeness_score
+    ON connections (observed_completeness_score);
+CREATE INDEX connections_reachable_completeness_score
+    ON connections (reachable_completeness_score);
+CREATE INDEX connections_information_gain ON connections (information_gain);
+CREATE INDEX identifiers_identifier ON identifiers (identifier);
+CREATE INDEX identifiers_connection ON identifiers (connection);
+CREATE INDEX profile_scores_connection ON profile_scores (connection);
+CREATE INDEX nodes_accession ON nodes (accession);
+CREATE INDEX nodes_connection ON nodes (connection);
+CREATE INDEX qualifiers_group_key_value ON qualifiers ("group", key, value);
+CREATE INDEX qualifiers_node ON qualifiers (node);
+
+CREATE VIRTUAL TABLE qualifiers_fts USING fts5 (
+    value,
+    content = 'qualifiers',
+    content_rowid = 'id'
+);
+
+INSERT INTO qualifiers_fts (qualifiers_fts) VALUES ('rebuild');
+"""
+
+
+def write_results_database(
+    reference_data: ReferenceData,
+    output_file: Path,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Write the connections, nodes and qualifiers to a SQLite database
+
+    Rows are inserted in batches of `OUTPUT_BATCH_SIZE` connections within a
+    single transaction. The database is built at a temporary path and moved
+    into place, thus an existing database is replaced only if the writing
+    succeeds. See `query_results_database` for the lookups supported.
+
+    Args:
+        reference_data (ReferenceData): The reference data containing scored
+            connections.
+        output_file (Path): The database file path.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            database was written or a negative response with the errors.
+
+    """
+
+    def to_value(value: Any) -> Any:
+        if value is None or (isinstance(value, float) and isnan(value)):
+            return None
+
+        return value
+
+    temporary_file = output_file.with_name(f".{output_file.name}.{uuid4()}")
+
+    try:
+        data_columns = list(reference_data.data.columns)
+        data_values = [reference_data.data[c].array for c in data_columns]
+
+        connection = sqlite3.connect(temporary_file)
+
+        try:
+            # The database is discarded if the writing fails, thus the journal
+            # is not required
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+
+            connection.executescript(RESULTS_DATABASE_TABLES)
+
+            connection.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("format", RESULTS_DATABASE_FORMAT_NAME),
+                    ("version", str(RESULTS_DATABASE_VERSION)),
+                    ("optional_fields", dumps(reference_data.optional_fields)),
+                    ("gene_fields", dumps(reference_data.gene_fields)),
+                ],
+            )
+
+            # ? ----------------------------------------------------------------
+            # ? Insert rows in batches
+            # ? ----------------------------------------------------------------
+
+            connections_rows: list[tuple[Any, ...]] = []
+            identifiers_rows: list[tuple[Any, ...]] = []
+            profile_scores_rows: list[tuple[Any, ...]] = []
+            nodes_rows: list[tuple[Any, ...]] = []
+            qualifiers_rows: list[tuple[Any, ...]] = []
+
+            def flush() -> None:
+                for table, rows in [
+                    ("connections", connections_rows),
+                    ("identifiers", identifiers_rows),
+                    ("profile_scores", profile_scores_rows),
+                    ("nodes", nodes_rows),
+                    ("qualifiers", qualifiers_rows),
+                ]:
+                    if rows:
+                        connection.executemany(
+                            f"INSERT INTO {table} VALUES "
+                            + f"({', '.join('?' * len(rows[0]))})",
+                            rows,
+                        )
+
+                        rows.clear()
+
+            node_id = 0
+
+            for connection_key, (scored_connection, position) in enumerate(
+                iter_connection_rows(reference_data),
+                start=1,
+            ):
+                row = (
+                    None
+                    if position is None
+                    else {
+                        column: to_value(values[position])
+                        for column, values in zip(data_columns, data_values)
+                    }
+                )
+
+                connections_rows.append(
+                    (
+                        connection_key,
+                        str(scored_connection.id),
+                        str(scored_connection.signature),
+                        None
+                        if row is None
+                        else row.get(StandardFieldsSchema.sci_name),
+                        *build_score_values(scored_connection.scores),
+                        None if row is None else dumps(row, default=str),
+                    )
+                )
+
+                identifiers_rows.extend(
+                    (connection_key, identifier)
+                    for identifier in sorted(scored_connection.identifiers)
+                )
+
+                profile_scores_rows.extend(
+                    (connection_key, name, *build_score_values(scores))
+                    for name, scores in (
+                        scored_connection.profile_scores.items()
+                    )
+                )
+
+                for node in scored_connection.nodes:
+                    node_id += 1
+
+                    nodes_rows.append(
+                        (
+                            node_id,
+                            connection_key,
+                            node.marker,
+                            node.accession,
+                            str(node.signature),
+                        )
+                    )
+
+                    qualifiers_rows.extend(
+                        (None, node_id, key.group.name, str(key.key), str(item))
+                        for key, value in node.metadata.qualifiers.items()
+                        for item in (
+                            [value] if isinstance(value, str) else value
+                        )
+                    )
+
+                if connection_key % OUTPUT_BATCH_SIZE == 0:
+                    flush()
+
+            flush()
+
+            # ? ----------------------------------------------------------------
+            # ? Build indexes
+            # ? ----------------------------------------------------------------
+
+            connection.executescript(RESULTS_DATABASE_INDEXES)
+            connection.commit()
+
+        finally:
+            connection.close()
+
+        temporary_file.replace(output_file)
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
+
+    finally:
+        temporary_file.unlink(missing_ok=True)
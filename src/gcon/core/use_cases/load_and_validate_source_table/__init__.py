@@ -1,30 +1,70 @@
 from pathlib import Path
-from uuid import uuid4
 
 import clean_base.exceptions as exc
 from clean_base.either import Either, right
-from numpy import nan
-from pandas import read_csv
+from numpy import bool_
+from numpy.typing import NDArray
+from pandas import DataFrame
 
 from gcon.core.domain.dtos.reference_data import (
     ReferenceData,
     StandardFieldsSchema,
 )
+from gcon.core.use_cases._file_digest import build_file_digest
 from gcon.settings import LOGGER
 
+from ._build_row_ids import build_row_ids
+from ._read_source_table import read_source_table
+from ._split_genes_fields import split_genes_fields
 from ._validate_genes_fields import validate_genes_fields
 from ._validate_optional_fields import validate_optional_fields
 from ._validate_required_fields import validate_required_fields
+from ._validation_cache import (
+    ValidationCache,
+    build_layout_digest,
+    build_row_digests,
+)
+from ._validation_report import (
+    ValidationIssue,
+    log_validation_summary,
+    write_validation_report,
+)
+
+# ? ----------------------------------------------------------------------------
+# ? The maximum ratio of unique values by rows of categorical text fields
+# ? ----------------------------------------------------------------------------
+
+
+COMPACT_TEXT_RATIO = 0.5
 
 
 def load_and_validate_source_table(
     source_table_path: Path,
     ignore_duplicates: bool = False,
+    literature_cache_file: Path | None = None,
+    validation_cache_dir: Path | None = None,
+    report_file: Path | None = None,
 ) -> Either[exc.UseCaseError, ReferenceData]:
     """Load and validate source table
 
     Args:
         source_table_path (Path): Path to source table file.
+        ignore_duplicates (bool): Ignore duplicated accessions if True.
+        literature_cache_file (Path | None): A JSON file persisting the
+            literature validation results. Unchanged BibTeX entries are not
+            parsed again if informed.
+        validation_cache_dir (Path | None): A directory to persist the results
+            of successful validations. If informed, an unchanged table is not
+            validated again, and only rows changed or appended since the last
+            validation are checked by rules involving a single row. Rules
+            involving multiple rows, like duplicated identifiers and
+            accessions, always check all rows.
+        report_file (Path | None): If informed, all checks run over all rows
+            instead of stopping at the first failing one, and every failure is
+            written to this file (JSON if the extension is `.json`, TSV
+            otherwise). Only a summary is printed. Failures of the table
+            layout, like missing columns or invalid gene names, still stop
+            the validation.
 
     Returns:
         Either[exc.UseCaseError, ReferenceData]: Either a UseCaseError or a
@@ -35,12 +75,6 @@ def load_and_validate_source_table(
 
     """
 
-    def format_gene_field_as_list(value: str) -> list[str]:
-        if value is nan:
-            return []
-
-        return [i.strip() for i in value.split(",")] if value else []
-
     try:
         # ? --------------------------------------------------------------------
         # ? Validate entry params
@@ -56,62 +90,112 @@ def load_and_validate_source_table(
         # ? Load source data
         # ? --------------------------------------------------------------------
 
-        definition_row = read_csv(source_table_path, sep="\t", nrows=1)
-        content_rows = read_csv(source_table_path, sep="\t", skiprows=1)
-        content_rows.columns = definition_row.columns
+        validation_cache: ValidationCache | None = None
 
-        # ? --------------------------------------------------------------------
-        # ? Pre-load definition-rows
-        #
-        # Required fields
-        #
-        # ? --------------------------------------------------------------------
+        if validation_cache_dir is not None:
+            table_digest = build_file_digest(source_table_path)
+            validation_cache = ValidationCache.load(validation_cache_dir)
 
         if (
-            validation_response := validate_required_fields(
-                definition_row=definition_row,
-                content_rows=content_rows,
+            reading_response := read_source_table(
+                source_table_path=source_table_path,
             )
         ).is_left:
-            return validation_response
-        del validation_response
+            return reading_response
+
+        definition_row, content_rows = reading_response.value
+        del reading_response
 
         # ? --------------------------------------------------------------------
-        # ? Pre-load definition-rows
-        #
-        # Optional fields
-        #
+        # ? Validate rows not validated by previous executions
         # ? --------------------------------------------------------------------
 
-        if (
-            validation_response := validate_optional_fields(
-                definition_row=definition_row,
-                content_rows=content_rows,
-            )
-        ).is_left:
-            return validation_response
+        if validation_cache is not None and validation_cache.covers_table(
+            table_digest=table_digest,
+            ignore_duplicates=ignore_duplicates,
+        ):
+            LOGGER.info("Source table unchanged since its last validation")
 
-        optional_fields: list[str] = validation_response.value
-        del validation_response
+            optional_fields = validation_cache.optional_fields
+            gene_fields = validation_cache.gene_fields
 
-        # ? --------------------------------------------------------------------
-        # ? Pre-load definition-rows
-        #
-        # Gene fields
-        #
-        # ? --------------------------------------------------------------------
+            if report_file is not None:
+                write_validation_report(issues=[], report_file=report_file)
 
-        if (
-            validation_response := validate_genes_fields(
-                definition_row=definition_row,
-                content_rows=content_rows,
-                ignore_duplicates=ignore_duplicates,
+        else:
+            pending_rows: NDArray[bool_] | None = None
+            issues: list[ValidationIssue] | None = (
+                None if report_file is None else list()
             )
-        ).is_left:
-            return validation_response
 
-        gene_fields: list[str] = validation_response.value
-        del validation_response
+            if validation_cache_dir is not None:
+                row_digests = build_row_digests(content_rows)
+                layout_digest = build_layout_digest(definition_row)
+
+                if (
+                    validation_cache is not None
+                    and (
+                        pending_rows := validation_cache.find_pending_rows(
+                            layout_digest=layout_digest,
+                            row_digests=row_digests,
+                        )
+                    )
+                    is not None
+                ):
+                    LOGGER.info(
+                        f"{pending_rows.sum()} of {len(pending_rows)} rows "
+                        + "changed since the last validation"
+                    )
+
+            if (
+                validation_response := __validate_source_table(
+                    definition_row=definition_row,
+                    content_rows=content_rows,
+                    ignore_duplicates=ignore_duplicates,
+                    literature_cache_file=literature_cache_file,
+                    pending_rows=pending_rows,
+                    issues=issues,
+                )
+            ).is_left:
+                return validation_response
+
+            optional_fields, gene_fields = validation_response.value
+            del validation_response
+
+            if issues is not None and report_file is not None:
+                issues = sorted(
+                    set(issues),
+                    key=lambda issue: (
+                        issue.row_index is None,
+                        issue.row_index or 0,
+                        str(issue.column),
+                        issue.rule,
+                        str(issue.value),
+                    ),
+                )
+
+                write_validation_report(issues=issues, report_file=report_file)
+                log_validation_summary(issues)
+
+                if len(issues) > 0:
+                    return exc.UseCaseError(
+                        (
+                            f"{len(issues)} validation issues found. Please "
+                            + f"check the report file: {report_file}"
+                        ),
+                        logger=LOGGER,
+                        exp=True,
+                    )()
+
+            if validation_cache_dir is not None:
+                ValidationCache(
+                    table_digest=table_digest,
+                    layout_digest=layout_digest,
+                    ignore_duplicates=ignore_duplicates,
+                    optional_fields=optional_fields,
+                    gene_fields=gene_fields,
+                    row_digests=row_digests,
+                ).dump(validation_cache_dir)
 
         # ? --------------------------------------------------------------------
         # ? Return a positive response
@@ -124,14 +208,20 @@ def load_and_validate_source_table(
                 *optional_fields,
                 *gene_fields,
             ]
-        ]
+        ].copy()
 
-        for gene in gene_fields:
-            data[gene] = data[gene].apply(
-                lambda x: format_gene_field_as_list(x)
-            )
+        del content_rows
+
+        split_genes_fields(data=data, gene_fields=gene_fields)
+
+        # Ids are stored as their 36 characters representation instead of as
+        # `UUID` objects, which cost an object and a 128 bits integer each
+        data["uuid"] = [str(row_id) for row_id in build_row_ids(data)]
 
-        data["uuid"] = [uuid4() for _ in range(len(data.index))]
+        __compact_text_fields(
+            data=data,
+            fields=[StandardFieldsSchema.sci_name, *optional_fields],
+        )
 
         return right(
             ReferenceData(
@@ -143,3 +233,109 @@ def load_and_validate_source_table(
 
     except Exception as e:
         return exc.UseCaseError(e, logger=LOGGER)()
+
+
+def __compact_text_fields(data: DataFrame, fields: list[str]) -> None:
+    """Store repeated text fields as categorical columns
+
+    Scientific names and optional fields (e.g. the literature and the type
+    status) usually repeat along the table. Fields with up to half as many
+    unique values as rows are converted in place, thus each row costs a small
+    integer code instead of an object reference. Null values are kept.
+
+    """
+
+    for column in fields:
+        if column not in data.columns or data[column].dtype != object:
+            continue
+
+        if data[column].nunique() <= data.shape[0] * COMPACT_TEXT_RATIO:
+            data[column] = data[column].astype("category")
+
+
+def __validate_source_table(
+    definition_row: DataFrame,
+    content_rows: DataFrame,
+    ignore_duplicates: bool,
+    literature_cache_file: Path | None,
+    pending_rows: NDArray[bool_] | None,
+    issues: list[ValidationIssue] | None,
+) -> Either[exc.UseCaseError, tuple[list[str], list[str]]]:
+    """Validate the source table fields
+
+    Args:
+        definition_row (DataFrame): The definition row of the source table.
+        content_rows (DataFrame): The content rows of the source table.
+        ignore_duplicates (bool): Ignore duplicated accessions if True.
+        literature_cache_file (Path | None): A JSON file persisting the
+            literature validation results.
+        pending_rows (NDArray[bool_] | None): A boolean mask of the rows
+            checked by rules involving a single row. All rows are checked if
+            None.
+        issues (list[ValidationIssue] | None): If informed, failures of the
+            content rows are collected into the list instead of returned.
+
+    Returns:
+        Either[exc.UseCaseError, tuple[list[str], list[str]]]: The optional
+            and gene fields or a UseCaseError.
+
+    """
+
+    # ? ------------------------------------------------------------------------
+    # ? Pre-load definition-rows
+    #
+    # Required fields
+    #
+    # ? ------------------------------------------------------------------------
+
+    if (
+        validation_response := validate_required_fields(
+            definition_row=definition_row,
+            content_rows=content_rows,
+            pending_rows=pending_rows,
+            issues=issues,
+        )
+    ).is_left:
+        return validation_response
+    del validation_response
+
+    # ? ------------------------------------------------------------------------
+    # ? Pre-load definition-rows
+    #
+    # Optional fields
+    #
+    # ? ------------------------------------------------------------------------
+
+    if (
+        validation_response := validate_optional_fields(
+            definition_row=definition_row,
+            content_rows=content_rows,
+            literature_cache_file=literature_cache_file,
+            pending_rows=pending_rows,
+            issues=issues,
+        )
+    ).is_left:
+        return validation_response
+
+    optional_fields: list[str] = validation_response.value
+    del validation_response
+
+    # ? ------------------------------------------------------------------------
+    # ? Pre-load definition-rows
+    #
+    # Gene fields
+    #
+    # ? ------------------------------------------------------------------------
+
+    if (
+        validation_response := validate_genes_fields(
+            definition_row=definition_row,
+            content_rows=content_rows,
+            ignore_duplicates=ignore_duplicates,
+            pending_rows=pending_rows,
+            issues=issues,
+        )
+    ).is_left:
+        return validation_response
+
+    return right((optional_fields, validation_response.value))
@@ -0,0 +1,48 @@
+from json import dumps
+from uuid import UUID, uuid3
+
+from pandas import DataFrame, isna
+
+from gcon.settings import GCON_NAMESPACE_HASH
+
+
+def build_row_ids(data: DataFrame) -> list[UUID]:
+    """Build deterministic ids from the content of each row
+
+    The id of a row only changes if any of its values (or the set of columns
+    of the table) changes. It allows results produced from unchanged rows to
+    be reused between executions.
+
+    Args:
+        data (DataFrame): A pandas dataframe containing the content rows of the
+            source table. Gene columns should already be formatted as lists.
+
+    Returns:
+        list[UUID]: The row ids in the same order of the data rows.
+
+    """
+
+    def serialize_cell(value: object) -> object:
+        if isinstance(value, list):
+            return value
+
+        if isna(value):  # type: ignore
+            return None
+
+        return str(value)
+
+    columns = sorted(data.columns)
+
+    return [
+        uuid3(
+            namespace=GCON_NAMESPACE_HASH,
+            name=dumps(
+                [[column, serialize_cell(value)] for column, value in row],
+                ensure_ascii=False,
+            ),
+        )
+        for row in (
+            zip(columns, values)
+            for values in data[columns].itertuples(index=False, name=None)
+        )
+    ]
@@ -0,0 +1,342 @@
+import gc
+import gzip
+from csv import reader
+from json import JSONDecodeError, loads
+from pathlib import Path
+from typing import Any, Callable
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+from numpy import nan
+from pandas import DataFrame, Series, read_csv
+from pandas.errors import EmptyDataError
+
+from gcon.core.domain.dtos.reference_data import StandardFieldsSchema
+from gcon.settings import LOGGER
+
+from ._dtos import ReferenceRowOptions
+
+# ? ----------------------------------------------------------------------------
+# ? Columnar inputs configuration
+#
+# Columnar tables do not contain the definition row. Definitions are read from
+# the `gcon:defs` key of the file metadata or from a JSON sidecar file named
+# after the table (e.g. `table.defs.json` for `table.parquet`). Both contain a
+# JSON object mapping column names to definitions. The sidecar file has
+# precedence over the file metadata.
+#
+# ? ----------------------------------------------------------------------------
+
+
+COLUMNAR_FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+}
+
+
+DEFINITIONS_METADATA_KEY = b"gcon:defs"
+
+
+DEFINITIONS_SIDECAR_SUFFIX = ".defs.json"
+
+
+def read_source_table(
+    source_table_path: Path,
+) -> Either[exc.UseCaseError, tuple[DataFrame, DataFrame]]:
+    """Read the definition row and the content rows of a source table
+
+    The format is selected by the file extension. Parquet (`.parquet`, `.pq`)
+    and Feather (`.feather`, `.arrow`) tables require the optional `pyarrow`
+    package. Gzip compressed tables (`.gz`) and any other extension are read
+    as TSV.
+
+    TSV files are read in a single pass. The header and the definition row are
+    parsed once from the file head, and the content rows are read from the
+    same file handle. Columnar files have only the used columns read from
+    disk, and list columns are kept as lists.
+
+    In all formats only the standard fields and the columns classified as
+    optional or gene fields are kept, and scalar values are read as strings,
+    thus unused columns and type inference do not cost memory.
+
+    Note that the used columns of all rows are held in memory, since rules
+    like the duplicated identifiers and accessions validate the whole table.
+    Reading the rows in chunks would not bound the memory used, thus the
+    memory grows with the number of rows and unique values of the table.
+
+    Args:
+        source_table_path (Path): Path to source table file.
+
+    Returns:
+        Either[exc.UseCaseError, tuple[DataFrame, DataFrame]]: The definition
+            row, including all columns of the source table, and the content
+            rows of the used columns.
+
+    """
+
+    if (
+        columnar_format := COLUMNAR_FORMATS.get(
+            source_table_path.suffix.lower()
+        )
+    ) is not None:
+        return __read_columnar_source_table(
+            source_table_path=source_table_path,
+            columnar_format=columnar_format,
+        )
+
+    opener: Callable[..., Any] = (
+        gzip.open if source_table_path.suffix.lower() == ".gz" else open
+    )
+
+    with opener(source_table_path, "rt", newline="") as source:
+        # ? --------------------------------------------------------------------
+        # ? Parse header and definition row
+        # ? --------------------------------------------------------------------
+
+        header = next(reader([source.readline()], delimiter="\t"), [])
+        definitions = next(reader([source.readline()], delimiter="\t"), [])
+
+        if len(set(header)) != len(header):
+            return exc.UseCaseError(
+                "Duplicated column names found in source table header",
+                logger=LOGGER,
+            )()
+
+        definition_row = __build_definition_row(header, definitions)
+
+        # ? --------------------------------------------------------------------
+        # ? Read used columns
+        # ? --------------------------------------------------------------------
+
+        used_columns = __get_used_columns(header, definitions)
+
+        try:
+            content_rows = read_csv(
+                source,
+                sep="\t",
+                header=None,
+                names=header,
+                usecols=used_columns,
+                dtype=str,
+            )
+
+        except EmptyDataError:
+            content_rows = DataFrame(columns=used_columns, dtype=str)
+
+    return right((definition_row, content_rows))
+
+
+def __read_columnar_source_table(
+    source_table_path: Path,
+    columnar_format: str,
+) -> Either[exc.UseCaseError, tuple[DataFrame, DataFrame]]:
+    """Read a Parquet or Feather source table
+
+    Only the schema is read before the used columns are known, thus unused
+    columns are never loaded.
+
+    """
+
+    try:
+        import pyarrow as pa
+
+        if columnar_format == "parquet":
+            from pyarrow.parquet import read_schema
+            from pyarrow.parquet import read_table as read_parquet_table
+
+            schema = read_schema(source_table_path)
+
+            def read_table(columns: list[str]) -> Any:
+                return read_parquet_table(source_table_path, columns=columns)
+
+        else:
+            from pyarrow.feather import read_table as read_feather_table
+            from pyarrow.ipc import open_file
+
+            with pa.memory_map(str(source_table_path), "r") as source:
+                schema = open_file(source).schema
+
+            def read_table(columns: list[str]) -> Any:
+                return read_feather_table(source_table_path, columns=columns)
+
+    except ImportError:
+        return exc.UseCaseError(
+            (
+                f"Reading {columnar_format} source tables requires the "
+                + "optional `pyarrow` package. Install it with `pip install "
+                + "gene-connector-cli[arrow]` or convert the table to TSV."
+            ),
+            logger=LOGGER,
+            exp=True,
+        )()
+
+    # ? ------------------------------------------------------------------------
+    # ? Collect definitions from sidecar file or file metadata
+    # ? ------------------------------------------------------------------------
+
+    header: list[str] = list(schema.names)
+
+    if len(set(header)) != len(header):
+        return exc.UseCaseError(
+            "Duplicated column names found in source table header",
+            logger=LOGGER,
+        )()
+
+    sidecar_path = source_table_path.with_suffix(DEFINITIONS_SIDECAR_SUFFIX)
+    raw_definitions: str | bytes | None = None
+
+    if sidecar_path.is_file():
+        raw_definitions = sidecar_path.read_text()
+    elif schema.metadata is not None:
+        raw_definitions = schema.metadata.get(DEFINITIONS_METADATA_KEY)
+
+    definitions: list[str] = []
+
+    if raw_definitions is not None:
+        try:
+            definitions_map = loads(raw_definitions)
+        except JSONDecodeError as e:
+            return exc.UseCaseError(
+                f"Invalid source table definitions: {e}",
+                logger=LOGGER,
+            )()
+
+        if not isinstance(definitions_map, dict) or not all(
+            isinstance(value, str) for value in definitions_map.values()
+        ):
+            return exc.UseCaseError(
+                (
+                    "Source table definitions should be a JSON object "
+                    + "mapping column names to definitions"
+                ),
+                logger=LOGGER,
+            )()
+
+        if unknown_columns := set(definitions_map).difference(header):
+            return exc.UseCaseError(
+                (
+                    "Definitions informed for columns not found in source "
+                    + f"table: {', '.join(sorted(unknown_columns))}"
+                ),
+                logger=LOGGER,
+            )()
+
+        definitions = [
+            definitions_map.get(
+                column,
+                ReferenceRowOptions.IDENTIFIER.value
+                if column == StandardFieldsSchema.identifier
+                else "",
+            )
+            for column in header
+        ]
+
+    definition_row = __build_definition_row(header, definitions)
+
+    # ? ------------------------------------------------------------------------
+    # ? Read used columns
+    # ? ------------------------------------------------------------------------
+
+    used_columns = __get_used_columns(header, definitions)
+
+    table = read_table(used_columns)
+
+    content_rows = DataFrame(
+        {
+            column: __convert_column(table.column(column), pa)
+            for column in used_columns
+        },
+        columns=used_columns,
+    )
+
+    return right((definition_row, content_rows))
+
+
+def __convert_column(column: Any, pa: Any) -> Series:
+    """Convert an Arrow column into a pandas column of strings or lists
+
+    List columns are converted from their flat values and offsets, thus each
+    cell costs a single list slice instead of boxing each item as an Arrow
+    scalar. Null cells result in nan values, as read from TSV tables.
+
+    """
+
+    column = column.combine_chunks()
+
+    if not (
+        pa.types.is_list(column.type) or pa.types.is_large_list(column.type)
+    ):
+        if not pa.types.is_string(column.type):
+            column = column.cast(pa.string())
+
+        values = Series(column.to_numpy(zero_copy_only=False), dtype=object)
+        return values.where(values.notna(), nan)
+
+    items = column.flatten()
+
+    if not pa.types.is_string(items.type):
+        items = items.cast(pa.string())
+
+    flat_items = items.to_numpy(zero_copy_only=False).tolist()
+    offsets = (column.offsets.to_numpy() - column.offsets[0].as_py()).tolist()
+    validity = column.is_valid().to_numpy(zero_copy_only=False).tolist()
+
+    # The lists created can not form reference cycles. See `split_genes_fields`.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        return Series(
+            [
+                flat_items[start:end] if is_valid else nan
+                for start, end, is_valid in zip(offsets, offsets[1:], validity)
+            ],
+            dtype=object,
+        )
+
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def __build_definition_row(
+    header: list[str],
+    definitions: list[str],
+) -> DataFrame:
+    """Build the one row definitions dataframe
+
+    The dataframe has no rows if the table has no definitions.
+
+    """
+
+    return DataFrame(
+        [
+            [
+                value if value else nan
+                for value in (
+                    definitions + [""] * (len(header) - len(definitions))
+                )[: len(header)]
+            ]
+        ]
+        if definitions
+        else [],
+        columns=header,
+    )
+
+
+def __get_used_columns(header: list[str], definitions: list[str]) -> list[str]:
+    """Get the standard fields and the optional and gene fields of a table"""
+
+    return [
+        column
+        for column, definition in zip(header, definitions)
+        if column
+        in [StandardFieldsSchema.identifier, StandardFieldsSchema.sci_name]
+        or definition
+        in [
+            ReferenceRowOptions.OPTIONAL.value,
+            ReferenceRowOptions.GENE.value,
+        ]
+    ]
@@ -1,21 +1,29 @@
-from collections import defaultdict
-
 import clean_base.exceptions as exc
 from clean_base.either import Either, right
-from pandas import DataFrame, Series
+from numpy import bool_
+from numpy.typing import NDArray
+from pandas import DataFrame
+from pandera.errors import SchemaErrors
 from rich.console import Console
 from rich.table import Table
 
 from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.domain.dtos.reference_data.accessions import (
+    find_duplicated_accessions,
+    find_invalid_accessions,
+)
 from gcon.settings import LOGGER
 
 from ._dtos import ReferenceRowOptions
+from ._validation_report import ValidationIssue, build_issues_from_schema_errors
 
 
 def validate_genes_fields(
     definition_row: DataFrame,
     content_rows: DataFrame,
     ignore_duplicates: bool = False,
+    pending_rows: NDArray[bool_] | None = None,
+    issues: list[ValidationIssue] | None = None,
 ) -> Either[exc.UseCaseError, list[str]]:
     """Validates the gene fields in the source table
 
@@ -24,6 +32,13 @@ def validate_genes_fields(
             row of the source table
         content_rows (DataFrame): A pandas dataframe containing the content rows
             of the source table
+        ignore_duplicates (bool): Ignore duplicated accessions if True
+        pending_rows (NDArray[bool_] | None): A boolean mask of the rows whose
+            accessions are validated. Duplicated accessions are searched in
+            all rows. All rows are validated if None.
+        issues (list[ValidationIssue] | None): If informed, failures of the
+            content rows are appended to the list instead of returned as
+            errors, and no table is printed.
 
     Returns:
         Either[exc.UseCaseError, list[str]]: A list of gene fields or an error
@@ -34,27 +49,6 @@ def validate_genes_fields(
 
     """
 
-    def get_single_gene_duplications(
-        col_data: Series,
-    ) -> tuple[list[str], list[str]]:
-        """Returns a list of duplicated gene names
-
-        Args:
-            col_data (Series): A pandas series containing the gene names
-
-        Returns:
-            tuple[list[str], list[str]]: A tuple containing a list of duplicated
-                gene names and a list of unique accession numbers
-
-        """
-
-        unique_accessions = col_data.value_counts().index.tolist()
-        duplicated_accessions = col_data.value_counts()[
-            col_data.value_counts() > 1
-        ].index.tolist()
-
-        return (unique_accessions, duplicated_accessions)
-
     # ? ------------------------------------------------------------------------
     # ? Collect and validate all gene fields
     # ? ------------------------------------------------------------------------
@@ -71,12 +65,6 @@ def validate_genes_fields(
         ].columns
     )
 
-    inter_genic_unique_accessions: list[str] = list()
-    inter_genic_duplicate_accessions: list[tuple[str, str]] = list()
-    within_genic_unique_accessions: defaultdict[str, list[str]] = defaultdict(
-        list
-    )
-
     for gene in gene_fields:
         gene_parts = gene.split("-")
 
@@ -102,77 +90,143 @@ def validate_genes_fields(
                 logger=LOGGER,
             )()
 
-        (uniques, duplicates) = get_single_gene_duplications(
-            col_data=content_rows[gene]
-        )
-
-        if len(duplicates) > 0:
-            within_genic_unique_accessions[gene].extend(duplicates)
-
-        for unique in uniques:
-            if (
-                unique in inter_genic_unique_accessions
-                and ignore_duplicates is False
-            ):
-                inter_genic_duplicate_accessions.append((gene, unique))
-
-        inter_genic_unique_accessions.extend(uniques)
-
     # ? ------------------------------------------------------------------------
     # ? Notify user of any duplicated accessions
     # ? ------------------------------------------------------------------------
 
-    err = 0
+    if ignore_duplicates is False and issues is not None:
+        duplicates = find_duplicated_accessions(
+            data=content_rows,
+            gene_fields=gene_fields,
+        )
 
-    if (
-        within_genic_unique_accessions.__len__() > 0
-        and ignore_duplicates is False
+        issues.extend(
+            ValidationIssue(
+                row_index=row,
+                column=column,
+                rule=rule,
+                value=duplicate.accession,
+                message=(
+                    "Also found at row indices "
+                    + ", ".join(
+                        str(other_row)
+                        for other_row in duplicate.rows
+                        if other_row != row
+                    )
+                    if len(duplicate.rows) > 1
+                    else "Repeated in the same cell"
+                ),
+            )
+            for rule, duplicated_accessions in [
+                ("duplicated_within_gene", duplicates.within_genes),
+                ("duplicated_between_genes", duplicates.between_genes),
+            ]
+            for duplicate in duplicated_accessions
+            for row, column in duplicate.occurrences
+        )
+
+    elif (
+        ignore_duplicates is False
+        and not (
+            duplicates := find_duplicated_accessions(
+                data=content_rows,
+                gene_fields=gene_fields,
+            )
+        ).is_empty
     ):
-        for gene, accessions in within_genic_unique_accessions.items():
+        console = Console()
+
+        for title, duplicated_accessions in [
+            (
+                "One or more accessions duplicated within genes",
+                duplicates.within_genes,
+            ),
+            (
+                "Inter genic duplications found",
+                duplicates.between_genes,
+            ),
+        ]:
+            if len(duplicated_accessions) == 0:
+                continue
+
             LOGGER.error("-" * 40)
-            LOGGER.error(
-                "\033[93mOne or more duplicated accession found in "
-                + f"`{gene}` gene:\033[0m"
-            )
+            LOGGER.error(f"\033[93m{title}:\033[0m")
 
             table = Table(highlight=False)
             table.add_column("Accession", style="green", min_width=15)
+            table.add_column("Gene", style="magenta")
+            table.add_column("Row indices", style="cyan")
+
+            for duplicate in duplicated_accessions:
+                table.add_row(
+                    duplicate.accession,
+                    ", ".join(duplicate.columns),
+                    ", ".join(str(row) for row in duplicate.rows),
+                )
 
-            for accession in accessions:
-                table.add_row(accession)
+            console.print(table)
 
-        console = Console()
-        console.print(table)
+        return exc.UseCaseError(
+            (
+                f"{len(duplicates.within_genes)} accessions duplicated within "
+                + f"genes and {len(duplicates.between_genes)} accessions "
+                + "shared between genes. Please check the log for more "
+                + "details. Case it is an intentional duplication, please "
+                + "re-run the command with the --skip-duplicates flag."
+            ),
+            logger=LOGGER,
+            exp=True,
+        )()
 
-        err += 1
+    # ? ------------------------------------------------------------------------
+    # ? Validate accessions format
+    # ? ------------------------------------------------------------------------
 
-    if (
-        inter_genic_duplicate_accessions.__len__() > 0
-        and ignore_duplicates is False
-    ):
+    if pending_rows is not None:
+        content_rows = content_rows.loc[pending_rows]
+
+    invalid_accessions = find_invalid_accessions(
+        data=content_rows,
+        gene_fields=gene_fields,
+    )
+
+    if issues is not None:
+        issues.extend(
+            ValidationIssue(
+                row_index=issue.row,
+                column=issue.column,
+                rule="valid_accessions",
+                value=issue.accession,
+                message=issue.reason,
+            )
+            for issue in invalid_accessions
+        )
+
+    elif invalid_accessions:
         LOGGER.error("-" * 40)
-        LOGGER.error("\033[93mInter genic duplications found:\033[0m")
+        LOGGER.error("\033[93mInvalid accessions found:\033[0m")
 
         table = Table(highlight=False)
+        table.add_column("Row index", style="cyan", justify="right")
         table.add_column("Gene", style="magenta")
         table.add_column("Accession", style="green", min_width=15)
-
-        for gene, accession in sorted(
-            inter_genic_duplicate_accessions, key=lambda x: (x[0], x[1])
-        ):
-            table.add_row(gene, accession)
+        table.add_column("Reason")
+
+        for issue in invalid_accessions:
+            table.add_row(
+                str(issue.row),
+                issue.column,
+                issue.accession,
+                issue.reason,
+            )
 
         console = Console()
         console.print(table)
 
-        err += 1
-
-    if err > 0:
         return exc.UseCaseError(
             (
-                "Duplicate accessions found. Please check the log for more "
-                + "details. Case it is an intentional duplication, please "
-                + "re-run the command with the --skip-duplicates flag."
+                f"{len(invalid_accessions)} invalid accessions found. Please "
+                + "check the log for more details."
             ),
             logger=LOGGER,
             exp=True,
@@ -182,9 +236,13 @@ def validate_genes_fields(
     # ? Build out the genes schema
     # ? ------------------------------------------------------------------------
 
-    ReferenceData.build_genes_schema_from_list(
-        genes=gene_fields,
-    ).validate(content_rows[gene_fields])
+    try:
+        ReferenceData.build_genes_schema_from_list(
+            genes=gene_fields,
+            check_accessions=False,
+        ).validate(content_rows[gene_fields], lazy=issues is not None)
+    except SchemaErrors as e:
+        issues.extend(build_issues_from_schema_errors(e))  # type: ignore
 
     # ? ------------------------------------------------------------------------
     # ? Notify user of any duplicated accessions
@@ -1,17 +1,29 @@
+from pathlib import Path
+
 import clean_base.exceptions as exc
 from clean_base.either import Either, right
+from numpy import bool_
+from numpy.typing import NDArray
 from pandas import DataFrame
-from pandera.errors import SchemaError
+from pandera.errors import SchemaError, SchemaErrors
 
 from gcon.core.domain.dtos.reference_data import OptionalColumnsSchema
+from gcon.core.domain.dtos.reference_data.literature import (
+    dump_bib_validation_results,
+    load_bib_validation_results,
+)
 from gcon.settings import LOGGER
 
 from ._dtos import ReferenceRowOptions
+from ._validation_report import ValidationIssue, build_issues_from_schema_errors
 
 
 def validate_optional_fields(
     definition_row: DataFrame,
     content_rows: DataFrame,
+    literature_cache_file: Path | None = None,
+    pending_rows: NDArray[bool_] | None = None,
+    issues: list[ValidationIssue] | None = None,
 ) -> Either[exc.UseCaseError, list[str]]:
     """Validates the optional fields in the source table
 
@@ -20,6 +32,13 @@ def validate_optional_fields(
             row of the source table
         content_rows (DataFrame): A pandas dataframe containing the content rows
             of the source table
+        literature_cache_file (Path | None): A JSON file persisting the
+            literature validation results. Results are loaded before and saved
+            after the validation if informed.
+        pending_rows (NDArray[bool_] | None): A boolean mask of the rows to
+            validate. All rows are validated if None.
+        issues (list[ValidationIssue] | None): If informed, failures are
+            appended to the list instead of returned as errors.
 
     Returns:
         Either[exc.UseCaseError, list[str]]: A list of optional fields or an
@@ -45,9 +64,23 @@ def validate_optional_fields(
     if len(optional_fields) == 0:
         return right(optional_fields)
 
+    if literature_cache_file is not None:
+        if (loaded := load_bib_validation_results(literature_cache_file)) > 0:
+            LOGGER.info(f"{loaded} literature validation results loaded")
+
     try:
-        OptionalColumnsSchema.validate(content_rows[optional_fields])
+        OptionalColumnsSchema.validate(
+            content_rows[optional_fields]
+            if pending_rows is None
+            else content_rows.loc[pending_rows, optional_fields],
+            lazy=issues is not None,
+        )
+    except SchemaErrors as e:
+        issues.extend(build_issues_from_schema_errors(e))  # type: ignore
     except SchemaError as e:
         return exc.UseCaseError(e, logger=LOGGER)()
+    finally:
+        if literature_cache_file is not None:
+            dump_bib_validation_results(literature_cache_file)
 
     return right(optional_fields)
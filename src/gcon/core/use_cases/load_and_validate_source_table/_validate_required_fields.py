@@ -1,20 +1,33 @@
 import clean_base.exceptions as exc
 from clean_base.either import Either, right
+from numpy import bool_
+from numpy.typing import NDArray
 from pandas import DataFrame
-from pandera.errors import SchemaError
+from pandera.errors import SchemaError, SchemaErrors
 
 from gcon.core.domain.dtos.reference_data import StandardFieldsSchema
 from gcon.settings import LOGGER
 
+from ._validation_report import ValidationIssue, build_issues_from_schema_errors
+
 
 def validate_required_fields(
     definition_row: DataFrame,
     content_rows: DataFrame,
+    pending_rows: NDArray[bool_] | None = None,
+    issues: list[ValidationIssue] | None = None,
 ) -> Either[exc.UseCaseError, None]:
     """Validate required fields in source table
 
     Args:
         definition_row (DataFrame): The definition row of the source table
+        content_rows (DataFrame): The content rows of the source table
+        pending_rows (NDArray[bool_] | None): A boolean mask of the rows to
+            validate. Identifiers uniqueness is checked against all rows. All
+            rows are validated if None.
+        issues (list[ValidationIssue] | None): If informed, failures of the
+            content rows are appended to the list instead of returned as
+            errors.
 
     Returns:
         Either[exc.UseCaseError, None]: Either a UseCaseError or None
@@ -42,13 +55,56 @@ def validate_required_fields(
             logger=LOGGER,
         )()
 
+    required_fields = [
+        StandardFieldsSchema.identifier,
+        StandardFieldsSchema.sci_name,
+    ]
+
     try:
         StandardFieldsSchema.validate(
-            content_rows[
-                [StandardFieldsSchema.identifier, StandardFieldsSchema.sci_name]
-            ]
+            content_rows[required_fields]
+            if pending_rows is None
+            else content_rows.loc[pending_rows, required_fields],
+            lazy=issues is not None,
         )
+    except SchemaErrors as e:
+        issues.extend(build_issues_from_schema_errors(e))  # type: ignore
     except SchemaError as e:
         return exc.UseCaseError(e, logger=LOGGER)()
 
+    if (
+        pending_rows is not None
+        and (
+            duplicated := content_rows[
+                StandardFieldsSchema.identifier
+            ].duplicated(keep=False)
+        ).any()
+    ):
+        if issues is not None:
+            issues.extend(
+                ValidationIssue(
+                    row_index=row,
+                    column=StandardFieldsSchema.identifier,
+                    rule="field_uniqueness",
+                    value=identifier,
+                )
+                for row, identifier in content_rows.loc[
+                    duplicated, StandardFieldsSchema.identifier
+                ].items()
+            )
+
+            return right(None)
+
+        return exc.UseCaseError(
+            (
+                "Duplicated identifiers found in source table: "
+                + ", ".join(
+                    content_rows.loc[
+                        duplicated, StandardFieldsSchema.identifier
+                    ].unique()
+                )
+            ),
+            logger=LOGGER,
+        )()
+
     return right(None)
@@ -0,0 +1,235 @@
+from hashlib import sha256
+from json import dump, dumps, load
+from pathlib import Path
+from typing import Self
+
+from attrs import field, frozen
+from numpy import bool_, isin, uint64
+from numpy import load as np_load
+from numpy import save as np_save
+from numpy.typing import NDArray
+from pandas import DataFrame, Series, isna
+from pandas.util import hash_pandas_object
+
+from gcon.settings import LOGGER
+
+# ? ----------------------------------------------------------------------------
+# ? Validation cache version
+#
+# Should be increased whenever validation rules change, thus tables validated
+# by previous rules are validated again.
+#
+# ? ----------------------------------------------------------------------------
+
+
+VALIDATOR_VERSION = 1
+
+
+VALIDATION_CACHE_FILE_NAME = "validation-cache.json"
+
+
+VALIDATION_CACHE_ROWS_FILE_NAME = "validation-cache.npy"
+
+
+def build_layout_digest(definition_row: DataFrame) -> str:
+    """Build the digest of the source table header and definition row.
+
+    Args:
+        definition_row (DataFrame): The definition row of the source table.
+
+    Returns:
+        str: The hex digest.
+
+    """
+
+    return sha256(
+        dumps(
+            [
+                list(definition_row.columns),
+                [
+                    None if isna(value) else str(value)
+                    for value in definition_row.iloc[0].tolist()
+                ]
+                if definition_row.shape[0] > 0
+                else [],
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def build_row_digests(content_rows: DataFrame) -> NDArray[uint64]:
+    """Build a 64 bits digest of each content row.
+
+    List cells, as read from columnar inputs, are hashed as comma separated
+    strings.
+
+    Args:
+        content_rows (DataFrame): The content rows of the source table.
+
+    Returns:
+        NDArray[uint64]: The digests in the same order of the rows.
+
+    """
+
+    def has_lists(column: Series) -> bool:
+        first_valid = column.first_valid_index()
+
+        return first_valid is not None and isinstance(
+            column.at[first_valid], list
+        )
+
+    if list_columns := [
+        column
+        for column in content_rows.columns
+        if content_rows[column].dtype == object
+        and has_lists(content_rows[column])
+    ]:
+        content_rows = content_rows.assign(
+            **{
+                column: content_rows[column].map(
+                    ", ".join,
+                    na_action="ignore",
+                )
+                for column in list_columns
+            }
+        )
+
+    return hash_pandas_object(content_rows, index=False).to_numpy(dtype=uint64)
+
+
+@frozen(kw_only=True)
+class ValidationCache:
+    """Results of the last successful validation of a source table.
+
+    Attributes:
+        table_digest (str): The digest of the validated table bytes.
+        layout_digest (str): The digest of the table header and definition
+            row.
+        ignore_duplicates (bool): If duplicated accessions were allowed.
+        optional_fields (list[str]): The validated optional fields.
+        gene_fields (list[str]): The validated gene fields.
+        row_digests (NDArray[uint64]): The digests of the validated rows.
+
+    """
+
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    table_digest: str = field()
+    layout_digest: str = field()
+    ignore_duplicates: bool = field()
+    optional_fields: list[str] = field()
+    gene_fields: list[str] = field()
+    row_digests: NDArray[uint64] = field(eq=False)
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC INSTANCE METHODS
+    # ? ------------------------------------------------------------------------
+
+    def covers_table(self, table_digest: str, ignore_duplicates: bool) -> bool:
+        """Check if the whole table was validated with the same rules.
+
+        A table validated without duplicated accessions is valid whatever the
+        duplicates policy, but a table validated allowing duplicates should be
+        checked again if they are not allowed anymore.
+
+        """
+
+        return self.table_digest == table_digest and (
+            ignore_duplicates or not self.ignore_duplicates
+        )
+
+    def find_pending_rows(
+        self,
+        layout_digest: str,
+        row_digests: NDArray[uint64],
+    ) -> NDArray[bool_] | None:
+        """Find rows not validated yet.
+
+        Returns:
+            NDArray[bool_] | None: A boolean mask of the rows to validate, or
+                None if the table layout changed and all rows should be
+                validated.
+
+        """
+
+        if self.layout_digest != layout_digest:
+            return None
+
+        return ~isin(row_digests, self.row_digests)
+
+    def dump(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+
+        np_save(
+            directory.joinpath(VALIDATION_CACHE_ROWS_FILE_NAME),
+            self.row_digests,
+            allow_pickle=False,
+        )
+
+        with directory.joinpath(VALIDATION_CACHE_FILE_NAME).open("w") as f:
+            dump(
+                {
+                    "version": VALIDATOR_VERSION,
+                    "table_digest": self.table_digest,
+                    "layout_digest": self.layout_digest,
+                    "ignore_duplicates": self.ignore_duplicates,
+                    "optional_fields": self.optional_fields,
+                    "gene_fields": self.gene_fields,
+                    "rows_count": len(self.row_digests),
+                },
+                f,
+                indent=4,
+            )
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC CLASS METHODS
+    # ? ------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, directory: Path) -> Self | None:
+        """Load the validation cache of a workspace.
+
+        Missing, invalid, or outdated caches are ignored.
+
+        Args:
+            directory (Path): The workspace directory.
+
+        Returns:
+            Self | None: The validation cache or None.
+
+        """
+
+        manifest_path = directory.joinpath(VALIDATION_CACHE_FILE_NAME)
+        rows_path = directory.joinpath(VALIDATION_CACHE_ROWS_FILE_NAME)
+
+        if not manifest_path.is_file() or not rows_path.is_file():
+            return None
+
+        try:
+            with manifest_path.open("r") as f:
+                content = load(f)
+
+            if content.get("version") != VALIDATOR_VERSION:
+                return None
+
+            row_digests = np_load(rows_path, allow_pickle=False)
+
+            # Rows and manifest are written separately. Both should come from
+            # the same validation.
+            if len(row_digests) != content.get("rows_count"):
+                return None
+
+            return cls(
+                table_digest=str(content["table_digest"]),
+                layout_digest=str(content["layout_digest"]),
+                ignore_duplicates=bool(content["ignore_duplicates"]),
+                optional_fields=list(content["optional_fields"]),
+                gene_fields=list(content["gene_fields"]),
+                row_digests=row_digests,
+            )
+
+        except Exception as e:
+            LOGGER.warning(f"Ignoring invalid validation cache: {e}")
+            return None
@@ -0,0 +1,148 @@
+from collections import Counter
+from csv import QUOTE_MINIMAL, writer
+from json import dump
+from pathlib import Path
+from typing import Any
+
+from attrs import asdict, field, frozen
+from pandas import isna
+from pandera.errors import SchemaErrors
+
+from gcon.settings import LOGGER
+
+
+@frozen(kw_only=True)
+class ValidationIssue:
+    """A failure found while validating the source table.
+
+    Attributes:
+        row_index (int | None): The 0-based index of the content row, or None
+            if the failure is not related to a single row. Indices do not
+            count the header and the definition rows, thus the row of index
+            `i` is found at the line `i + 3` of TSV tables.
+        column (str | None): The column containing the failure, or None if the
+            failure is not related to a single column.
+        rule (str): The name of the failing rule.
+        value (str | None): The failing value.
+        message (str | None): A human readable explanation of the failure.
+
+    """
+
+    # ? ------------------------------------------------------------------------
+    # ? CLASS ATTRIBUTES
+    # ? ------------------------------------------------------------------------
+
+    row_index: int | None = field()
+    column: str | None = field()
+    rule: str = field()
+    value: str | None = field(default=None)
+    message: str | None = field(default=None)
+
+    # ? ------------------------------------------------------------------------
+    # ? PUBLIC INSTANCE METHODS
+    # ? ------------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+REPORT_FIELDS = ["row_index", "column", "rule", "value", "message"]
+
+
+def build_issues_from_schema_errors(
+    errors: SchemaErrors,
+) -> list[ValidationIssue]:
+    """Convert the failure cases of a lazy pandera validation into issues.
+
+    Args:
+        errors (SchemaErrors): The errors raised by a lazy validation.
+
+    Returns:
+        list[ValidationIssue]: One issue by failure case.
+
+    """
+
+    def to_optional(value: Any) -> Any:
+        return None if isna(value) else value
+
+    return [
+        ValidationIssue(
+            row_index=(
+                None if (row := to_optional(index)) is None else int(row)
+            ),
+            column=to_optional(column),
+            rule=str(check),
+            value=None if (value := to_optional(case)) is None else str(value),
+        )
+        for column, check, case, index in errors.failure_cases[
+            ["column", "check", "failure_case", "index"]
+        ].itertuples(index=False, name=None)
+    ]
+
+
+def write_validation_report(
+    issues: list[ValidationIssue],
+    report_file: Path,
+) -> None:
+    """Write the validation issues to a JSON or TSV report file.
+
+    The format is chosen by the file extension: `.json` files receive a list
+    of objects and any other extension receives a tab separated table.
+
+    Args:
+        issues (list[ValidationIssue]): The validation issues.
+        report_file (Path): The report file path.
+
+    """
+
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with report_file.open("w", newline="") as f:
+        if report_file.suffix.lower() == ".json":
+            dump([issue.to_dict() for issue in issues], f, indent=4)
+            return
+
+        tsv_writer = writer(
+            f,
+            delimiter="\t",
+            quoting=QUOTE_MINIMAL,
+            lineterminator="\n",
+        )
+
+        tsv_writer.writerow(REPORT_FIELDS)
+
+        tsv_writer.writerows(
+            [
+                "" if value is None else value
+                for value in (
+                    issue.row_index,
+                    issue.column,
+                    issue.rule,
+                    issue.value,
+                    issue.message,
+                )
+            ]
+            for issue in issues
+        )
+
+
+def log_validation_summary(issues: list[ValidationIssue]) -> None:
+    """Log the number of issues by rule and column.
+
+    Args:
+        issues (list[ValidationIssue]): The validation issues.
+
+    """
+
+    if len(issues) == 0:
+        LOGGER.info("No validation issues found")
+        return
+
+    LOGGER.error("-" * 40)
+    LOGGER.error(f"\033[93m{len(issues)} validation issues found:\033[0m")
+
+    for (rule, column), count in sorted(
+        Counter((issue.rule, issue.column) for issue in issues).items(),
+        key=lambda item: (-item[1], item[0][0], str(item[0][1])),
+    ):
+        LOGGER.error(f"\t{count}\t{rule}" + (f" ({column})" if column else ""))
@@ -0,0 +1,334 @@
+import gzip
+from heapq import merge
+from json import dumps, loads
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterator, TextIO
+from uuid import uuid4
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.reference_data import (
+    JSONL_FORMAT_NAME,
+    JSONL_FORMAT_VERSION,
+)
+from gcon.core.use_cases.export_reference_data import (
+    GZIP_COMPRESS_LEVEL,
+    OutputFormat,
+    find_output_data_file,
+    iter_output_records,
+    read_output_fields,
+)
+from gcon.settings import LOGGER, OUTPUT_BATCH_SIZE
+
+from ._dtos import MergeSummary
+
+# ? ----------------------------------------------------------------------------
+# ? Sorted runs format
+#
+# Inputs are split into runs of up to `run_size` connection records, sorted by
+# signature and spilled to temporary files. Each line of a run contains the
+# connection signature, the connection id, and the serialized record,
+# separated by tabs. Signatures and ids never contain tabs, and serialized
+# records never contain line breaks, thus records are merged and written
+# without being parsed again.
+#
+# ? ----------------------------------------------------------------------------
+
+
+def merge_results(
+    input_files: list[Path],
+    output_file: Path,
+    output_format: OutputFormat = OutputFormat.JSON,
+    run_size: int = OUTPUT_BATCH_SIZE,
+) -> Either[exc.UseCaseError, MergeSummary]:
+    """Merge the outputs of many runs into a single reference data file.
+
+    Each input is read once and spilled to sorted runs (see above), which are
+    then streamed through a k-way merge keyed by connection signature, thus
+    at most `run_size` records, and the ids of the written connections, are
+    held in memory, whatever the inputs size. Connections are written in the
+    signature order, and records with the same signature are written once,
+    keeping the record of the first input. Identical nodes are embedded in
+    identical connections, thus they are deduplicated along with their
+    connections.
+
+    Ids of written connections are kept to skip records sharing the id of a
+    connection with a different signature, i.e. the same source table row
+    resolved differently by distinct runs, which would produce ambiguous
+    outputs. The record with the lowest signature is kept.
+
+    Only the reference data file of the chosen format is written. The tables
+    of `export_reference_data` depend on the whole reference data, thus they
+    are not written.
+
+    Args:
+        input_files (list[Path]): The system paths of the outputs of each run,
+            without file extension. JSON Lines outputs are read one line at a
+            time. JSON outputs are loaded as a whole, one at a time.
+        output_file (Path): The system path of the merged output, without file
+            extension.
+        output_format (OutputFormat): The format of the merged output.
+        run_size (int): The maximum number of records of each sorted run.
+
+    Returns:
+        Either[exc.UseCaseError, MergeSummary]: The number of connections
+            read and written, or a negative response with the errors.
+
+    """
+
+    def iter_run(run_file: Path) -> Iterator[tuple[str, str, str]]:
+        with run_file.open("r") as f:
+            for line in f:
+                signature, connection_id, content = line.rstrip("\n").split(
+                    "\t", 2
+                )
+
+                yield signature, connection_id, content
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Validate entry params
+        # ? --------------------------------------------------------------------
+
+        if not input_files:
+            return exc.UseCaseError(
+                "At least one input should be informed",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        if run_size < 1:
+            return exc.UseCaseError(
+                f"Invalid run size: {run_size}",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        merged_file = output_file.with_suffix(output_format.suffix)
+        input_data_files: list[Path] = []
+
+        for input_file in input_files:
+            if (data_file := find_output_data_file(input_file)) is None:
+                return exc.UseCaseError(
+                    (
+                        f"No JSON or JSON Lines output found for: {input_file}."
+                        + " Please inform the output files without extension."
+                    ),
+                    logger=LOGGER,
+                    exp=True,
+                )()
+
+            if data_file.resolve() == merged_file.resolve():
+                return exc.UseCaseError(
+                    f"The merged output would overwrite an input: {data_file}",
+                    logger=LOGGER,
+                    exp=True,
+                )()
+
+            input_data_files.append(data_file)
+
+        # ? --------------------------------------------------------------------
+        # ? Collect the fields of all inputs
+        # ? --------------------------------------------------------------------
+
+        optional_fields: dict[str, None] = dict()
+        gene_fields: dict[str, None] = dict()
+
+        for input_file in input_files:
+            if (fields_either := read_output_fields(input_file)).is_left:
+                return fields_either
+
+            input_optional_fields, input_gene_fields = fields_either.value
+
+            optional_fields.update(dict.fromkeys(input_optional_fields))
+            gene_fields.update(dict.fromkeys(input_gene_fields))
+
+        with TemporaryDirectory(
+            dir=output_file.parent,
+            prefix=f".{output_file.name}-merge-",
+        ) as temporary_dir:
+            # ? ----------------------------------------------------------------
+            # ? Spill inputs to sorted runs
+            # ? ----------------------------------------------------------------
+
+            run_files: list[Path] = []
+            records_count = 0
+
+            def spill(records: list[tuple[str, str, str]]) -> None:
+                # The sort is stable, thus records sharing a signature keep
+                # the inputs order
+                records.sort(key=lambda record: record[0])
+
+                run_file = Path(temporary_dir).joinpath(
+                    f"run-{len(run_files):06d}.tsv"
+                )
+
+                with run_file.open("w") as f:
+                    f.writelines("\t".join(record) + "\n" for record in records)
+
+                run_files.append(run_file)
+                records.clear()
+
+            for data_file, input_file in zip(input_data_files, input_files):
+                LOGGER.info(f"Splitting into sorted runs: {data_file}")
+
+                records: list[tuple[str, str, str]] = []
+
+                for record_either in iter_output_records(input_file):
+                    if record_either.is_left:
+                        return record_either
+
+                    record = record_either.value
+
+                    if "signature" not in record or "id" not in record:
+                        return exc.UseCaseError(
+                            (
+                                f"Unable to merge {data_file}. Connection "
+                                + "records should contain `id` and "
+                                + "`signature`."
+                            ),
+                            logger=LOGGER,
+                        )()
+
+                    records_count += 1
+                    records.append(
+                        (
+                            str(record["signature"]),
+                            str(record["id"]),
+                            dumps(record, sort_keys=True, default=str),
+                        )
+                    )
+
+                    if len(records) >= run_size:
+                        spill(records)
+
+                if records:
+                    spill(records)
+
+            # ? ----------------------------------------------------------------
+            # ? Merge sorted runs
+            # ? ----------------------------------------------------------------
+
+            LOGGER.info(
+                f"Merging {len(run_files)} sorted runs to file: {merged_file}"
+            )
+
+            temporary_file = merged_file.with_name(
+                f".{merged_file.name}.{uuid4()}"
+            )
+
+            written_ids: set[str] = set()
+            connections_count = 0
+            duplicates_count = 0
+            conflicts_count = 0
+            previous_signature: str | None = None
+
+            try:
+                f: TextIO
+
+                with (
+                    gzip.open(
+                        temporary_file,
+                        "wt",
+                        compresslevel=GZIP_COMPRESS_LEVEL,
+                    )
+                    if output_format == OutputFormat.JSONL_GZ
+                    else temporary_file.open("w")
+                ) as f, Path(temporary_dir).joinpath("rows.jsonl").open(
+                    "w+"
+                ) as rows_f:
+                    if output_format == OutputFormat.JSON:
+                        f.write('{"connections": [')
+                    else:
+                        f.write(
+                            dumps(
+                                {
+                                    "format": JSONL_FORMAT_NAME,
+                                    "version": JSONL_FORMAT_VERSION,
+                                    "optional_fields": list(optional_fields),
+                                    "gene_fields": list(gene_fields),
+                                },
+                                sort_keys=True,
+                            )
+                            + "\n"
+                        )
+
+                    for signature, connection_id, content in merge(
+                        *(iter_run(run_file) for run_file in run_files),
+                        key=lambda record: record[0],
+                    ):
+                        if signature == previous_signature:
+                            duplicates_count += 1
+                            continue
+
+                        previous_signature = signature
+
+                        if connection_id in written_ids:
+                            conflicts_count += 1
+                            continue
+
+                        written_ids.add(connection_id)
+
+                        if output_format == OutputFormat.JSON:
+                            # The JSON document keeps the source table rows
+                            # apart from the connections
+                            record = loads(content)
+                            row = record.pop("data", None)
+
+                            f.write(", " if connections_count else "")
+                            f.write(dumps(record, sort_keys=True))
+
+                            if row is not None:
+                                rows_f.write(dumps(row, sort_keys=True) + "\n")
+                        else:
+                            f.write(content + "\n")
+
+                        connections_count += 1
+
+                    if output_format == OutputFormat.JSON:
+                        f.write('], "data": [')
+
+                        rows_f.seek(0)
+
+                        for index, line in enumerate(rows_f):
+                            f.write(", " if index else "")
+                            f.write(line.rstrip("\n"))
+
+                        f.write(
+                            '], "gene_fields": '
+                            + dumps(list(gene_fields))
+                            + ', "optional_fields": '
+                            + dumps(list(optional_fields))
+                            + "}"
+                        )
+
+                temporary_file.replace(merged_file)
+
+            finally:
+                temporary_file.unlink(missing_ok=True)
+
+        if conflicts_count:
+            LOGGER.warning(
+                f"{conflicts_count} connections skipped since other "
+                + "connections with the same id but different signatures were "
+                + "merged. The same source rows were resolved differently by "
+                + "the merged runs."
+            )
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(
+            MergeSummary(
+                records=records_count,
+                connections=connections_count,
+                duplicates=duplicates_count,
+                conflicts=conflicts_count,
+            )
+        )
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
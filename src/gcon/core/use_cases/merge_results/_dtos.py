@@ -0,0 +1,27 @@
+from typing import Any
+
+from attrs import asdict, field, frozen
+
+
+@frozen(kw_only=True)
+class MergeSummary:
+    """The summary of a merge of the outputs of many runs.
+
+    Attributes:
+        records (int): The connection records read from all inputs.
+        connections (int): The connections written to the merged output.
+        duplicates (int): The records skipped as duplicates of a written
+            connection with the same signature.
+        conflicts (int): The records skipped since a written connection with
+            a different signature has the same id, i.e. the same source table
+            row resolved differently by distinct runs.
+
+    """
+
+    records: int = field()
+    connections: int = field()
+    duplicates: int = field()
+    conflicts: int = field()
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
@@ -0,0 +1,12 @@
+from ._dtos import SourcesHeader, SourcesStage
+from ._run_assemble_stage import run_assemble_stage
+from ._run_export_stage import run_export_stage
+from ._run_fetch_stage import run_fetch_stage
+from ._run_load_stage import run_load_stage
+from ._run_score_stage import run_score_stage
+from ._sources_stream import (
+    SOURCES_FORMAT_NAME,
+    SOURCES_FORMAT_VERSION,
+    iter_sources_records,
+    read_sources_header,
+)
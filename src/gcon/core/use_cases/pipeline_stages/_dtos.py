@@ -0,0 +1,31 @@
+from enum import Enum
+
+from attrs import field, frozen
+
+
+class SourcesStage(Enum):
+    """The stages writing sources streams.
+
+    Streams of the load stage contain the source table rows only, and streams
+    of the fetch stage contain the nodes of the rows accessions too.
+
+    """
+
+    LOAD = "load"
+    FETCH = "fetch"
+
+
+@frozen(kw_only=True)
+class SourcesHeader:
+    """The header of a sources stream.
+
+    Attributes:
+        stage (SourcesStage): The stage which wrote the stream.
+        optional_fields (list[str]): The optional fields of the rows.
+        gene_fields (list[str]): The gene fields of the rows.
+
+    """
+
+    stage: SourcesStage = field()
+    optional_fields: list[str] = field()
+    gene_fields: list[str] = field()
@@ -0,0 +1,150 @@
+from typing import TextIO
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.node import Node
+from gcon.core.domain.dtos.node_store import NodeStore, NodeView
+from gcon.core.domain.dtos.reference_data import (
+    JSONL_FORMAT_NAME,
+    JSONL_FORMAT_VERSION,
+)
+from gcon.core.use_cases.collect_metadata._assemble_row_connection import (
+    build_row_connection,
+    collect_row_nodes,
+    index_markers_nodes,
+)
+from gcon.settings import LOGGER
+
+from ._dtos import SourcesHeader, SourcesStage
+from ._sources_stream import (
+    iter_sources_records,
+    read_sources_header,
+    write_line,
+)
+
+
+def run_assemble_stage(
+    input: TextIO,
+    output: TextIO,
+) -> Either[exc.UseCaseError, int]:
+    """Assemble the connections of the rows of a fetched sources stream.
+
+    Nodes are indexed as read, and each row is assembled and written as soon
+    as it is read, thus only the nodes are held in memory. Connections are
+    written unscored, in the JSON Lines format of the reference data outputs
+    (see `ReferenceData.iter_jsonl`).
+
+    Args:
+        input (TextIO): The sources stream written by the fetch stage.
+        output (TextIO): The text stream the connections are written to.
+
+    Returns:
+        Either[exc.UseCaseError, int]: The number of connections written or a
+            negative response with the errors.
+
+    """
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Validate the input stream
+        # ? --------------------------------------------------------------------
+
+        if (header_either := read_sources_header(input)).is_left:
+            return header_either
+
+        header: SourcesHeader = header_either.value
+
+        if header.stage != SourcesStage.FETCH:
+            return exc.UseCaseError(
+                (
+                    "Unable to assemble connections. The sources stream does "
+                    + "not contain nodes. Please run `gcon fetch` before."
+                ),
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        write_line(
+            output,
+            {
+                "format": JSONL_FORMAT_NAME,
+                "version": JSONL_FORMAT_VERSION,
+                "optional_fields": header.optional_fields,
+                "gene_fields": header.gene_fields,
+            },
+        )
+
+        # ? --------------------------------------------------------------------
+        # ? Assemble connections as rows are read
+        # ? --------------------------------------------------------------------
+
+        # Nodes are kept in a compact store instead of as `Node` objects to
+        # reduce the memory footprint of large tables
+        node_store = NodeStore()
+        by_marker_nodes: dict[str, list[NodeView]] = {
+            gene: [] for gene in header.gene_fields
+        }
+        by_marker_positions: dict[str, dict[str, list[int]]] | None = None
+        connections_count = 0
+
+        for record_either in iter_sources_records(input):
+            if record_either.is_left:
+                return record_either
+
+            record = record_either.value
+
+            if (row := record.get("row")) is None:
+                if by_marker_positions is not None:
+                    return exc.UseCaseError(
+                        (
+                            "Unable to assemble connections. Nodes should "
+                            + "precede rows in the sources stream."
+                        ),
+                        logger=LOGGER,
+                        exp=True,
+                    )()
+
+                if (node_either := Node.from_dict(record["node"])).is_left:
+                    return node_either
+
+                by_marker_nodes.setdefault(record["gene"], []).append(
+                    node_store.add(node_either.value)
+                )
+
+                continue
+
+            if by_marker_positions is None:
+                by_marker_positions = index_markers_nodes(by_marker_nodes)
+
+            if (
+                row_nodes_either := collect_row_nodes(
+                    row=row,
+                    gene_fields=header.gene_fields,
+                    by_marker_nodes=by_marker_nodes,
+                    by_marker_positions=by_marker_positions,
+                )
+            ).is_left:
+                return row_nodes_either
+
+            if (
+                connection_either := build_row_connection(
+                    row=row,
+                    row_nodes=row_nodes_either.value,
+                )
+            ).is_left:
+                return connection_either
+
+            write_line(
+                output, {**connection_either.value.to_dict(), "data": row}
+            )
+            connections_count += 1
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(connections_count)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
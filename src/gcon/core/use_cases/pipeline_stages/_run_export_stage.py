@@ -0,0 +1,159 @@
+from itertools import chain
+from pathlib import Path
+from typing import Any, Literal, TextIO
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.use_cases.export_reference_data import (
+    ColumnarFormat,
+    OutputFormat,
+    TableLayout,
+    export_reference_data,
+    export_reference_data_shards,
+    validate_export_options,
+)
+from gcon.settings import LOGGER
+
+
+def run_export_stage(
+    input: TextIO,
+    output_file: Path,
+    output_format: OutputFormat = OutputFormat.JSON,
+    columnar_format: ColumnarFormat | None = None,
+    table_layout: TableLayout = TableLayout.WIDE,
+    shard_count: int | None = None,
+    shard_by: str | None = None,
+    results_database: bool = False,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Write the outputs of the scored connections of a connections stream.
+
+    The outputs are the same written by `run_gcon_pipeline`. The tables
+    depend on the whole reference data, thus the connections are loaded
+    before being written.
+
+    Args:
+        input (TextIO): The connections written by the score stage.
+        output_file (Path): The system path of the outputs, without file
+            extension.
+        output_format (OutputFormat): The format of the reference data file.
+        columnar_format (ColumnarFormat | None): The format of the typed
+            tables. Not written if not informed.
+        table_layout (TableLayout): The layout of the connections TSV table.
+        shard_count (int | None): Split the outputs in up to this number of
+            shards. See `export_reference_data_shards`.
+        shard_by (str | None): The column grouping rows of the same shard.
+        results_database (bool): Whether to write the SQLite results
+            database.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            outputs were written or a negative response with the errors.
+
+    """
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Validate entry params
+        # ? --------------------------------------------------------------------
+
+        if (
+            options_either := validate_export_options(
+                columnar_format=columnar_format,
+                shard_count=shard_count,
+                shard_by=shard_by,
+            )
+        ).is_left:
+            return options_either
+
+        header_line = input.readline()
+
+        if (
+            fields_either := ReferenceData.parse_jsonl_header(header_line)
+        ).is_left:
+            return fields_either
+
+        optional_fields, gene_fields = fields_either.value
+
+        # ? --------------------------------------------------------------------
+        # ? Load scored connections
+        # ? --------------------------------------------------------------------
+
+        rows: list[dict[str, Any]] = []
+        connections: list[Connection] = []
+
+        # Names of the additional profiles, in the order they were scored
+        profile_names: dict[str, None] = dict()
+
+        for record_either in ReferenceData.iter_jsonl(
+            chain([header_line], input)
+        ):
+            if record_either.is_left:
+                return record_either
+
+            row, connection = record_either.value
+
+            if connection.scores is None:
+                return exc.UseCaseError(
+                    (
+                        f"Unable to export connection `{connection.id}`. "
+                        + "Connections should be scored. Please run `gcon "
+                        + "score` before."
+                    ),
+                    logger=LOGGER,
+                    exp=True,
+                )()
+
+            if row is not None:
+                rows.append(row)
+
+            connections.append(connection)
+            profile_names.update(dict.fromkeys(connection.profile_scores))
+
+        if (
+            reference_data_either := ReferenceData.from_records(
+                data=rows,
+                optional_fields=optional_fields,
+                gene_fields=gene_fields,
+                connections=connections,
+            )
+        ).is_left:
+            return reference_data_either
+
+        # ? --------------------------------------------------------------------
+        # ? Persist results
+        # ? --------------------------------------------------------------------
+
+        export_options = dict(
+            reference_data=reference_data_either.value,
+            output_file=output_file,
+            output_format=output_format,
+            columnar_format=columnar_format,
+            table_layout=table_layout,
+            results_database=results_database,
+            profile_names=list(profile_names),
+        )
+
+        if (
+            export_response_either := (
+                export_reference_data(**export_options)
+                if shard_count is None
+                else export_reference_data_shards(
+                    **export_options,
+                    shard_count=shard_count,
+                    shard_by=shard_by,
+                )
+            )
+        ).is_left:
+            return export_response_either
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
@@ -0,0 +1,134 @@
+from typing import Any, TextIO
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.node_store import NodeStore
+from gcon.core.domain.dtos.reference_data import ReferenceData
+from gcon.core.domain.entities.node_fetching import NodeFetching
+from gcon.core.domain.entities.node_registration import NodeRegistration
+from gcon.core.use_cases.collect_metadata._collect_markers_nodes import (
+    collect_markers_nodes,
+)
+from gcon.core.use_cases.collect_metadata._warn_unclassified_keys import (
+    warn_unclassified_keys,
+)
+from gcon.settings import LOGGER
+
+from ._dtos import SourcesHeader, SourcesStage
+from ._sources_stream import (
+    iter_sources_records,
+    read_sources_header,
+    write_line,
+    write_sources_header,
+)
+
+
+def run_fetch_stage(
+    input: TextIO,
+    output: TextIO,
+    local_node_fetching_repo: NodeFetching,
+    local_node_registration_repo: NodeRegistration,
+) -> Either[exc.UseCaseError, int]:
+    """Collect the nodes of the accessions of the rows of a sources stream.
+
+    Nodes are written before the rows, thus the output could be assembled one
+    row at a time. Nodes found in the input, e.g. if the input was already
+    fetched, are collected again, which only reads them from the local
+    repositories.
+
+    Args:
+        input (TextIO): The sources stream written by the load stage.
+        output (TextIO): The text stream the sources stream, with the nodes
+            of the rows accessions, is written to.
+        local_node_fetching_repo (NodeFetching): Local node fetching repository.
+        local_node_registration_repo (NodeRegistration): Local node registration
+            repository.
+
+    Returns:
+        Either[exc.UseCaseError, int]: The number of nodes written or a
+            negative response with the errors.
+
+    """
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Read source rows
+        # ? --------------------------------------------------------------------
+
+        if (header_either := read_sources_header(input)).is_left:
+            return header_either
+
+        header: SourcesHeader = header_either.value
+        rows: list[dict[str, Any]] = []
+
+        for record_either in iter_sources_records(input):
+            if record_either.is_left:
+                return record_either
+
+            if (row := record_either.value.get("row")) is not None:
+                rows.append(row)
+
+        if not rows:
+            return exc.UseCaseError(
+                "Unable to fetch nodes. No rows found in the sources stream.",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        if (
+            reference_data_either := ReferenceData.from_records(
+                data=rows,
+                optional_fields=header.optional_fields,
+                gene_fields=header.gene_fields,
+            )
+        ).is_left:
+            return reference_data_either
+
+        # ? --------------------------------------------------------------------
+        # ? Collect nodes
+        # ? --------------------------------------------------------------------
+
+        if (
+            by_marker_nodes_either := collect_markers_nodes(
+                reference_data=reference_data_either.value,
+                node_store=NodeStore(),
+                local_node_fetching_repo=local_node_fetching_repo,
+                local_node_registration_repo=local_node_registration_repo,
+            )
+        ).is_left:
+            return by_marker_nodes_either
+
+        # ? --------------------------------------------------------------------
+        # ? Write nodes and source rows
+        # ? --------------------------------------------------------------------
+
+        write_sources_header(
+            output,
+            SourcesHeader(
+                stage=SourcesStage.FETCH,
+                optional_fields=header.optional_fields,
+                gene_fields=header.gene_fields,
+            ),
+        )
+
+        nodes_count = 0
+
+        for marker, marker_nodes in by_marker_nodes_either.value.items():
+            for node in marker_nodes:
+                write_line(output, {"gene": marker, "node": node.to_dict()})
+                nodes_count += 1
+
+        for row in rows:
+            write_line(output, {"row": row})
+
+        warn_unclassified_keys()
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(nodes_count)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
@@ -0,0 +1,106 @@
+from pathlib import Path
+from typing import TextIO
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.use_cases.load_and_validate_source_table import (
+    load_and_validate_source_table,
+)
+from gcon.settings import LOGGER
+
+from ._dtos import SourcesHeader, SourcesStage
+from ._sources_stream import write_line, write_sources_header
+
+
+def run_load_stage(
+    source_table_path: Path,
+    output: TextIO,
+    ignore_duplicates: bool = False,
+    literature_cache_file: Path | None = None,
+    validation_cache_dir: Path | None = None,
+    report_file: Path | None = None,
+) -> Either[exc.UseCaseError, int]:
+    """Load and validate a source table and write its rows as a sources stream.
+
+    Args:
+        source_table_path (Path): The source table path.
+        output (TextIO): The text stream the sources stream is written to.
+        ignore_duplicates (bool): Ignore duplicated accessions if True.
+        literature_cache_file (Path | None): A JSON file persisting the
+            literature validation results.
+        validation_cache_dir (Path | None): A directory to persist the results
+            of the table validation.
+        report_file (Path | None): A file to write every validation failure
+            to. See `load_and_validate_source_table`.
+
+    Returns:
+        Either[exc.UseCaseError, int]: The number of rows written or a
+            negative response with the errors.
+
+    """
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Validate entry params
+        # ? --------------------------------------------------------------------
+
+        if not source_table_path.exists():
+            return exc.UseCaseError(
+                f"Source table file not found: {source_table_path}",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        # ? --------------------------------------------------------------------
+        # ? Load source data
+        # ? --------------------------------------------------------------------
+
+        if (
+            reference_data_either := load_and_validate_source_table(
+                source_table_path=source_table_path,
+                ignore_duplicates=ignore_duplicates,
+                literature_cache_file=literature_cache_file,
+                validation_cache_dir=validation_cache_dir,
+                report_file=report_file,
+            )
+        ).is_left:
+            return reference_data_either
+
+        reference_data = reference_data_either.value
+
+        # ? --------------------------------------------------------------------
+        # ? Write source rows
+        # ? --------------------------------------------------------------------
+
+        write_sources_header(
+            output,
+            SourcesHeader(
+                stage=SourcesStage.LOAD,
+                optional_fields=reference_data.optional_fields,
+                gene_fields=reference_data.gene_fields,
+            ),
+        )
+
+        data_columns = list(reference_data.data.columns)
+        data_values = [reference_data.data[c].array for c in data_columns]
+
+        for position in range(reference_data.data.shape[0]):
+            write_line(
+                output,
+                {
+                    "row": {
+                        column: values[position]
+                        for column, values in zip(data_columns, data_values)
+                    }
+                },
+            )
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(reference_data.data.shape[0])
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
@@ -0,0 +1,115 @@
+from itertools import chain
+from typing import TextIO
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.reference_data import (
+    JSONL_FORMAT_NAME,
+    JSONL_FORMAT_VERSION,
+    ReferenceData,
+)
+from gcon.core.domain.dtos.scoring_profile import ScoringProfile
+from gcon.core.use_cases.build_metadata_match_scores._calculate_connection_match_score import (
+    calculate_connection_match_score,
+)
+from gcon.settings import LOGGER
+
+from ._sources_stream import write_line
+
+
+def run_score_stage(
+    input: TextIO,
+    output: TextIO,
+    profiles: list[ScoringProfile] | None = None,
+) -> Either[exc.UseCaseError, int]:
+    """Score the connections of a connections stream.
+
+    Connections are read, scored and written one at a time. The coverage of
+    connections already scored is reused, thus the outputs of previous
+    executions could be scored again with other profiles.
+
+    Args:
+        input (TextIO): The connections written by the assemble stage, or any
+            reference data written as JSON Lines.
+        output (TextIO): The text stream the scored connections are written
+            to, as JSON Lines.
+        profiles (list[ScoringProfile] | None): The scoring profiles. The
+            first profile sets the main connection scores and the remaining
+            ones set additional scores indexed by the profile name. The
+            default profile is used if not informed.
+
+    Returns:
+        Either[exc.UseCaseError, int]: The number of connections written or a
+            negative response with the errors.
+
+    """
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Validate entry params
+        # ? --------------------------------------------------------------------
+
+        if not profiles:
+            profiles = [ScoringProfile.default()]
+
+        if len({profile.name for profile in profiles}) != len(profiles):
+            return exc.UseCaseError(
+                "Scoring profiles names should be unique",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        header_line = input.readline()
+
+        if (
+            fields_either := ReferenceData.parse_jsonl_header(header_line)
+        ).is_left:
+            return fields_either
+
+        optional_fields, gene_fields = fields_either.value
+
+        write_line(
+            output,
+            {
+                "format": JSONL_FORMAT_NAME,
+                "version": JSONL_FORMAT_VERSION,
+                "optional_fields": optional_fields,
+                "gene_fields": gene_fields,
+            },
+        )
+
+        # ? --------------------------------------------------------------------
+        # ? Score connections as they are read
+        # ? --------------------------------------------------------------------
+
+        connections_count = 0
+
+        for record_either in ReferenceData.iter_jsonl(
+            chain([header_line], input)
+        ):
+            if record_either.is_left:
+                return record_either
+
+            row, connection = record_either.value
+
+            if (
+                calculation_response_either := calculate_connection_match_score(
+                    connection=connection,
+                    profiles=profiles,
+                    reuse_coverage=True,
+                )
+            ).is_left:
+                return calculation_response_either
+
+            write_line(output, {**connection.to_dict(), "data": row})
+            connections_count += 1
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(connections_count)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
@@ -0,0 +1,202 @@
+from json import JSONDecodeError, dumps, loads
+from typing import Any, Iterator, TextIO
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.settings import LOGGER
+
+from ._dtos import SourcesHeader, SourcesStage
+
+# ? ----------------------------------------------------------------------------
+# ? Sources stream format
+#
+# Sources streams are written by the load and fetch stages as JSON Lines. The
+# first line contains the format header, the stage which wrote the stream, and
+# the optional and gene fields:
+#
+#   {"format": "gcon-sources", "version": 1, "stage": "fetch",
+#    "optional_fields": [...], "gene_fields": [...]}
+#
+# Each following line contains a node, as produced by `Node.to_dict`, with the
+# gene field it was fetched for, or a source table row:
+#
+#   {"gene": "nuc-its", "node": {"accession": ..., "metadata": ...}}
+#   {"row": {"uuid": ..., "identifier": ..., "nuc-its": [...]}}
+#
+# Streams of the fetch stage contain all nodes before the first row, thus rows
+# are assembled into connections one at a time, as they are read.
+#
+# ? ----------------------------------------------------------------------------
+
+
+SOURCES_FORMAT_NAME = "gcon-sources"
+
+
+SOURCES_FORMAT_VERSION = 1
+
+
+def write_line(output: TextIO, content: dict[str, Any]) -> None:
+    """Write a JSON Lines record, as the JSON Lines outputs are written.
+
+    Args:
+        output (TextIO): The text stream the record is written to.
+        content (dict[str, Any]): The record content.
+
+    """
+
+    output.write(dumps(content, sort_keys=True, default=str))
+    output.write("\n")
+
+
+def write_sources_header(output: TextIO, header: SourcesHeader) -> None:
+    """Write the header line of a sources stream.
+
+    Args:
+        output (TextIO): The text stream the header is written to.
+        header (SourcesHeader): The header content.
+
+    """
+
+    write_line(
+        output,
+        {
+            "format": SOURCES_FORMAT_NAME,
+            "version": SOURCES_FORMAT_VERSION,
+            "stage": header.stage.value,
+            "optional_fields": header.optional_fields,
+            "gene_fields": header.gene_fields,
+        },
+    )
+
+
+def read_sources_header(
+    input: TextIO,
+) -> Either[exc.MappedErrors, SourcesHeader]:
+    """Read the header line of a sources stream.
+
+    Args:
+        input (TextIO): The text stream, read from the current position.
+
+    Returns:
+        Either[exc.MappedErrors, SourcesHeader]: The header content or a
+            negative response with the errors.
+
+    """
+
+    try:
+        header = loads(input.readline())
+    except JSONDecodeError as e:
+        return exc.UseCaseError(
+            f"Unable to read sources stream. Invalid header: {e}",
+            logger=LOGGER,
+            exp=True,
+        )()
+
+    if not isinstance(header, dict) or header.get("format") != (
+        SOURCES_FORMAT_NAME
+    ):
+        return exc.UseCaseError(
+            (
+                "Unable to read sources stream. Unknown format. Sources "
+                + "streams are written by `gcon load` and `gcon fetch`."
+            ),
+            logger=LOGGER,
+            exp=True,
+        )()
+
+    if (version := header.get("version")) != SOURCES_FORMAT_VERSION:
+        return exc.UseCaseError(
+            f"Unable to read sources stream. Unsupported version: {version}",
+            logger=LOGGER,
+            exp=True,
+        )()
+
+    if (stage := header.get("stage")) not in [
+        stage.value for stage in SourcesStage
+    ]:
+        return exc.UseCaseError(
+            f"Unable to read sources stream. Unknown stage: {stage}",
+            logger=LOGGER,
+            exp=True,
+        )()
+
+    fields: list[list[str]] = []
+
+    for key in ["optional_fields", "gene_fields"]:
+        if not isinstance(value := header.get(key), list) or not all(
+            isinstance(item, str) for item in value
+        ):
+            return exc.UseCaseError(
+                f"Unable to read sources stream. `{key}` must be a list.",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        fields.append(value)
+
+    return right(
+        SourcesHeader(
+            stage=SourcesStage(stage),
+            optional_fields=fields[0],
+            gene_fields=fields[1],
+        )
+    )
+
+
+def iter_sources_records(
+    input: TextIO,
+) -> Iterator[Either[exc.MappedErrors, dict[str, Any]]]:
+    """Iterate over the node and row records of a sources stream.
+
+    The header should be read before (see `read_sources_header`). The
+    iteration stops after the first error.
+
+    Args:
+        input (TextIO): The text stream, read from the current position.
+
+    Yields:
+        Either[exc.MappedErrors, dict[str, Any]]: The record of each line,
+            containing either the `gene` and `node` keys or the `row` key, or
+            an error.
+
+    """
+
+    for line_number, line in enumerate(input, start=2):
+        if not line.strip():
+            continue
+
+        try:
+            record = loads(line)
+        except JSONDecodeError as e:
+            yield exc.UseCaseError(
+                (
+                    "Unable to read sources stream. Invalid line "
+                    + f"{line_number}: {e}"
+                ),
+                logger=LOGGER,
+                exp=True,
+            )()
+
+            return
+
+        if not isinstance(record, dict) or not (
+            isinstance(record.get("row"), dict)
+            or (
+                isinstance(record.get("gene"), str)
+                and isinstance(record.get("node"), dict)
+            )
+        ):
+            yield exc.UseCaseError(
+                (
+                    f"Unable to read sources stream. Line {line_number} "
+                    + "should contain a `row` object or a `gene` and a `node` "
+                    + "object."
+                ),
+                logger=LOGGER,
+                exp=True,
+            )()
+
+            return
+
+        yield right(record)
@@ -0,0 +1,202 @@
+from csv import QUOTE_MINIMAL, DictReader, writer
+from pathlib import Path
+from typing import Literal
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.use_cases.export_reference_data import (
+    LONG_TABLE_COLUMNS,
+    LONG_TABLE_SCORES_GROUP,
+)
+from gcon.settings import LOGGER
+
+
+def pivot_long_table(
+    long_table_path: Path,
+    output_file: Path,
+    keys: list[str] | None = None,
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Pivot a long connections table to the wide layout.
+
+    The wide table has one row by connection, with the score columns of the
+    connections, a column by marker containing the node accessions, and a
+    column by metadata key, named as `GROUP.key`, containing the values of
+    all nodes. Multiple values are joined by ` / `. Scores are written as
+    found in the score rows, thus as in the wide table written by the
+    pipeline.
+
+    The long table is read twice. The first pass collects the score columns,
+    the markers, and the metadata keys if not informed, and the second one writes each connection
+    as soon as its rows end, thus rows of the same connection should be
+    contiguous, as written by the pipeline.
+
+    Args:
+        long_table_path (Path): The system path of the long table.
+        output_file (Path): The system path of the wide table.
+        keys (list[str] | None): The metadata keys to include, as
+            `GROUP.key`. All keys found are included if not informed.
+
+    Returns:
+        Either[exc.UseCaseError, Literal[True]]: A positive response if the
+            table was written or a negative response with the errors.
+
+    """
+
+    JOIN_SEPARATOR = " / "
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Validate entry params
+        # ? --------------------------------------------------------------------
+
+        if not long_table_path.is_file():
+            return exc.UseCaseError(
+                f"Long table file not found: {long_table_path}",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        if keys is not None:
+            if invalid_keys := [key for key in keys if "." not in key]:
+                return exc.UseCaseError(
+                    (
+                        "Metadata keys should be informed as `GROUP.key`: "
+                        + ", ".join(invalid_keys)
+                    ),
+                    logger=LOGGER,
+                    exp=True,
+                )()
+
+            keys = list(dict.fromkeys(keys))
+
+        # ? --------------------------------------------------------------------
+        # ? Collect markers and metadata keys
+        # ? --------------------------------------------------------------------
+
+        score_columns: dict[str, None] = {}
+        markers: set[str] = set()
+        found_keys: set[str] = set()
+
+        with long_table_path.open("r", newline="") as f:
+            long_reader = DictReader(f, delimiter="\t")
+
+            if missing_columns := set(LONG_TABLE_COLUMNS).difference(
+                long_reader.fieldnames or []
+            ):
+                return exc.UseCaseError(
+                    (
+                        "Invalid long table. Missing columns: "
+                        + ", ".join(sorted(missing_columns))
+                    ),
+                    logger=LOGGER,
+                    exp=True,
+                )()
+
+            for row in long_reader:
+                if row["group"] == LONG_TABLE_SCORES_GROUP:
+                    score_columns.setdefault(row["key"])
+                    continue
+
+                markers.add(row["marker"])
+
+                if row["key"]:
+                    found_keys.add(f"{row['group']}.{row['key']}")
+
+        if keys is None:
+            keys = sorted(found_keys)
+        elif unknown_keys := [key for key in keys if key not in found_keys]:
+            LOGGER.warning(
+                "Metadata keys not found in long table: "
+                + ", ".join(unknown_keys)
+            )
+
+        sorted_markers = sorted(markers)
+        selected_keys = set(keys)
+
+        # ? --------------------------------------------------------------------
+        # ? Write one row by connection
+        # ? --------------------------------------------------------------------
+
+        written_ids: set[str] = set()
+
+        with long_table_path.open("r", newline="") as source, output_file.open(
+            "w", newline=""
+        ) as target:
+            tsv_writer = writer(
+                target,
+                delimiter="\t",
+                quoting=QUOTE_MINIMAL,
+                lineterminator="\n",
+            )
+
+            tsv_writer.writerow(
+                ["connection_id", *score_columns, *sorted_markers, *keys]
+            )
+
+            current_id: str | None = None
+            scores: dict[str, str] = {}
+            accessions: dict[str, list[str]] = {}
+            values: dict[str, list[str]] = {}
+            seen_nodes: set[tuple[str, str]] = set()
+
+            def write_connection() -> None:
+                tsv_writer.writerow(
+                    [
+                        current_id,
+                        *(scores.get(column, "") for column in score_columns),
+                        *(
+                            JOIN_SEPARATOR.join(accessions.get(marker, []))
+                            for marker in sorted_markers
+                        ),
+                        *(
+                            JOIN_SEPARATOR.join(values.get(key, []))
+                            for key in keys or []
+                        ),
+                    ]
+                )
+
+            for row in DictReader(source, delimiter="\t"):
+                if row["connection_id"] != current_id:
+                    if current_id is not None:
+                        write_connection()
+                        written_ids.add(current_id)
+
+                    if (current_id := row["connection_id"]) in written_ids:
+                        return exc.UseCaseError(
+                            (
+                                "Rows of the same connection should be "
+                                + f"contiguous: {current_id}"
+                            ),
+                            logger=LOGGER,
+                            exp=True,
+                        )()
+
+                    scores, accessions, values, seen_nodes = {}, {}, {}, set()
+
+                if row["group"] == LONG_TABLE_SCORES_GROUP:
+                    scores[row["key"]] = row["value"]
+                    continue
+
+                if (node := (row["marker"], row["accession"])) not in (
+                    seen_nodes
+                ):
+                    seen_nodes.add(node)
+                    accessions.setdefault(row["marker"], []).append(
+                        row["accession"]
+                    )
+
+                if (key := f"{row['group']}.{row['key']}") in selected_keys:
+                    values.setdefault(key, []).append(row["value"])
+
+            if current_id is not None:
+                write_connection()
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
@@ -0,0 +1,237 @@
+import sqlite3
+from csv import QUOTE_MINIMAL, writer
+from pathlib import Path
+from typing import Any, TextIO
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.use_cases.export_reference_data import (
+    RESULTS_DATABASE_FORMAT_NAME,
+    RESULTS_DATABASE_VERSION,
+    SCORE_COLUMNS,
+)
+from gcon.settings import LOGGER
+
+# The columns of the query results, in the output order. Identifiers and node
+# accessions, as `marker:accession`, are joined by ` / `.
+QUERY_RESULT_COLUMNS = [
+    "connection_id",
+    "signature",
+    "identifier",
+    "scientificName",
+    *SCORE_COLUMNS,
+    "accessions",
+]
+
+
+def query_results_database(
+    database_path: Path,
+    output: TextIO,
+    accession: str | None = None,
+    identifier: str | None = None,
+    signature: str | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    score_field: str = SCORE_COLUMNS[0],
+    qualifier: str | None = None,
+    search: str | None = None,
+    limit: int | None = None,
+) -> Either[exc.UseCaseError, int]:
+    """Write the connections of a results database matching the filters.
+
+    All informed filters should match. Each filter is resolved by an index of
+    the database, thus lookups do not scan the whole database. Matching
+    connections are written as TSV rows, in the order of the results, with
+    the `QUERY_RESULT_COLUMNS` columns.
+
+    Args:
+        database_path (Path): The system path of the results database, written
+            by `gcon resolve --results-database`.
+        output (TextIO): The text stream the TSV rows are written to.
+        accession (str | None): An accession of any connection node.
+        identifier (str | None): A connection identifier.
+        signature (str | None): The connection signature.
+        min_score (float | None): The minimum value of the score field.
+        max_score (float | None): The maximum value of the score field.
+        score_field (str): The score the range filter applies to. One of
+            `SCORE_COLUMNS`.
+        qualifier (str | None): A qualifier value of any connection node, as
+            `GROUP.key=value` (e.g. `SPECIMEN.strain=CBS 123`).
+        search (str | None): A FTS5 full-text query over the qualifier values
+            of the connection nodes (e.g. `holotype OR "type material"`).
+        limit (int | None): The maximum number of connections written.
+
+    Returns:
+        Either[exc.UseCaseError, int]: The number of connections written or a
+            negative response with the errors.
+
+    """
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Validate entry params
+        # ? --------------------------------------------------------------------
+
+        if not database_path.is_file():
+            return exc.UseCaseError(
+                f"Results database file not found: {database_path}",
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        if score_field not in SCORE_COLUMNS:
+            return exc.UseCaseError(
+                (
+                    f"Invalid score field: `{score_field}`. Use one of: "
+                    + ", ".join(SCORE_COLUMNS)
+                ),
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        if qualifier is not None:
+            qualifier_key, separator, qualifier_value = qualifier.partition("=")
+
+            qualifier_group, _, qualifier_name = qualifier_key.partition(".")
+
+            if not (separator and qualifier_group and qualifier_name):
+                return exc.UseCaseError(
+                    (
+                        "Qualifiers should be informed as `GROUP.key=value`: "
+                        + qualifier
+                    ),
+                    logger=LOGGER,
+                    exp=True,
+                )()
+
+        # ? --------------------------------------------------------------------
+        # ? Build the query
+        # ? --------------------------------------------------------------------
+
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        if accession is not None:
+            conditions.append(
+                "c.id IN (SELECT connection FROM nodes WHERE accession = ?)"
+            )
+            params.append(accession)
+
+        if identifier is not None:
+            conditions.append(
+                "c.id IN "
+                + "(SELECT connection FROM identifiers WHERE identifier = ?)"
+            )
+            params.append(identifier)
+
+        if signature is not None:
+            conditions.append("c.signature = ?")
+            params.append(signature)
+
+        if min_score is not None:
+            conditions.append(f"c.{score_field} >= ?")
+            params.append(min_score)
+
+        if max_score is not None:
+            conditions.append(f"c.{score_field} <= ?")
+            params.append(max_score)
+
+        if qualifier is not None:
+            conditions.append(
+                "c.id IN (SELECT n.connection FROM qualifiers AS q "
+                + "JOIN nodes AS n ON n.id = q.node "
+                + 'WHERE q."group" = ? AND q.key = ? AND q.value = ?)'
+            )
+            params.extend([qualifier_group, qualifier_name, qualifier_value])
+
+        if search is not None:
+            conditions.append(
+                "c.id IN (SELECT n.connection FROM qualifiers_fts AS f "
+                + "JOIN qualifiers AS q ON q.id = f.rowid "
+                + "JOIN nodes AS n ON n.id = q.node "
+                + "WHERE qualifiers_fts MATCH ?)"
+            )
+            params.append(search)
+
+        query = (
+            "SELECT c.connection_id, c.signature, "
+            + "(SELECT group_concat(identifier, ' / ') FROM identifiers "
+            + "WHERE connection = c.id), "
+            + "c.scientific_name, "
+            + ", ".join(f"c.{column}" for column in SCORE_COLUMNS)
+            + ", (SELECT group_concat(marker || ':' || accession, ' / ') "
+            + "FROM nodes WHERE connection = c.id) "
+            + "FROM connections AS c"
+            + (f" WHERE {' AND '.join(conditions)}" if conditions else "")
+            + " ORDER BY c.id"
+        )
+
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        # ? --------------------------------------------------------------------
+        # ? Run the query
+        # ? --------------------------------------------------------------------
+
+        connection = sqlite3.connect(
+            f"{database_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+        )
+
+        try:
+            meta = dict(connection.execute("SELECT key, value FROM meta"))
+            database_format = (meta.get("format"), meta.get("version"))
+
+            if database_format != (
+                RESULTS_DATABASE_FORMAT_NAME,
+                str(RESULTS_DATABASE_VERSION),
+            ):
+                return exc.UseCaseError(
+                    (
+                        "Unsupported results database: "
+                        + "{} v{}".format(*database_format)
+                    ),
+                    logger=LOGGER,
+                    exp=True,
+                )()
+
+            try:
+                cursor = connection.execute(query, params)
+            except sqlite3.OperationalError as e:
+                if search is None:
+                    raise
+
+                return exc.UseCaseError(
+                    f"Invalid search expression: `{search}` ({e})",
+                    logger=LOGGER,
+                    exp=True,
+                )()
+
+            tsv_writer = writer(
+                output,
+                delimiter="\t",
+                quoting=QUOTE_MINIMAL,
+                lineterminator="\n",
+            )
+
+            tsv_writer.writerow(QUERY_RESULT_COLUMNS)
+
+            written_count = 0
+
+            for row in cursor:
+                tsv_writer.writerow(row)
+                written_count += 1
+
+        finally:
+            connection.close()
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(written_count)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
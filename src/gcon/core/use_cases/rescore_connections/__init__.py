@@ -0,0 +1,922 @@
+import sqlite3
+from csv import QUOTE_MINIMAL, reader, writer
+from importlib.util import find_spec
+from json import dump, load
+from pathlib import Path
+from typing import Any, Iterable, Literal
+from uuid import uuid4
+
+import clean_base.exceptions as exc
+from clean_base.either import Either, right
+
+from gcon.core.domain.dtos.score import ConnectionScores
+from gcon.core.domain.dtos.scoring_profile import ScoringProfile
+from gcon.core.use_cases.build_metadata_match_scores import (
+    calculate_key_coverage,
+    calculate_scores_from_coverage,
+)
+from gcon.core.use_cases.export_reference_data import (
+    LONG_TABLE_COLUMNS,
+    LONG_TABLE_SCORES_GROUP,
+    LONG_TABLE_SUFFIX,
+    RESULTS_DATABASE_SUFFIX,
+    SCORE_COLUMNS,
+    ColumnarFormat,
+    OutputFormat,
+    build_long_table_score_rows,
+    build_score_values,
+    find_output_data_file,
+    format_score_values,
+    iter_output_records,
+    open_jsonl_output,
+    read_output_fields,
+    refresh_shard_manifest,
+    write_jsonl_header,
+    write_jsonl_record,
+)
+from gcon.settings import LOGGER, OUTPUT_BATCH_SIZE
+
+
+def rescore_connections(
+    output_file: Path,
+    profiles: list[ScoringProfile],
+) -> Either[exc.MappedErrors, Literal[True]]:
+    """Recalculate the scores of a previous execution given scoring profiles.
+
+    Scores depend only on the metadata keys coverage of each connection and on
+    the scoring profile. The coverage persisted in the reference data file is
+    reused, thus nodes metadata is not parsed again. Connections produced by
+    versions which did not persist the coverage have it calculated from the
+    raw nodes metadata, and persisted for later executions.
+
+    The reference data file is looked up as done by `find_output_data_file`.
+    JSON Lines files are rescored one record at a time and rewritten with the
+    same compression, while the JSON document is loaded as a whole, thus its
+    memory usage grows with the file size. In both cases the scores of each
+    connection are kept by signature to rewrite the tables.
+
+    Only the score fields of the reference data file, the score columns of the
+    wide TSV table and of the Parquet or Feather connections table, the score
+    rows of the long TSV table, and the scores of the SQLite results database
+    are rewritten. Remaining contents are kept as is. Scores of additional
+    profiles of the previous execution are replaced by the scores of the
+    additional profiles informed here.
+
+    Files are rewritten to temporary files, which replace the original ones
+    only after all of them were written and the results database was updated
+    in a single transaction. Thus outputs are left untouched if any of them
+    could not be rewritten, e.g. due to an unexpected table layout, or if a
+    columnar table exists but `pyarrow` is not installed, and the data file
+    and tables never disagree on scores. If the outputs are a shard written
+    by `export_reference_data_shards`, the sizes and checksums of its files
+    are refreshed in the shards manifest.
+
+    Args:
+        output_file (Path): The system path of the outputs of a previous
+            execution, without file extension.
+        profiles (list[ScoringProfile]): The scoring profiles. The first
+            profile sets the main scores and the remaining ones set additional
+            scores indexed by the profile name.
+
+    Returns:
+        Either[exc.MappedErrors, Literal[True]]: A positive response if the
+            outputs were rescored or a negative response with the errors.
+
+    """
+
+    try:
+        # ? --------------------------------------------------------------------
+        # ? Validate entry params
+        # ? --------------------------------------------------------------------
+
+        tsv_output = output_file.with_suffix(".tsv")
+        long_output = output_file.with_suffix(LONG_TABLE_SUFFIX)
+        database_output = output_file.with_suffix(RESULTS_DATABASE_SUFFIX)
+
+        if (data_file := find_output_data_file(output_file)) is None:
+            return exc.UseCaseError(
+                (
+                    f"No JSON or JSON Lines output found for: {output_file}. "
+                    + "Please inform the output file without extension."
+                ),
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        if not profiles:
+            return exc.UseCaseError(
+                "At least one scoring profile should be informed",
+                logger=LOGGER,
+            )()
+
+        for profile in profiles:
+            if not isinstance(profile, ScoringProfile):
+                return exc.UseCaseError(
+                    f"`{profile}` is not a valid instance of `{ScoringProfile}`",
+                    logger=LOGGER,
+                )()
+
+        if len({profile.name for profile in profiles}) != len(profiles):
+            return exc.UseCaseError(
+                "Scoring profiles names should be unique",
+                logger=LOGGER,
+            )()
+
+        columnar_outputs = [
+            (columnar_format, columnar_output)
+            for columnar_format in ColumnarFormat
+            if (
+                columnar_output := output_file.with_suffix(
+                    f".{columnar_format.value}"
+                )
+            ).is_file()
+        ]
+
+        # Checked before rewriting any output, thus columnar tables are never
+        # left with stale scores
+        if columnar_outputs and find_spec("pyarrow") is None:
+            return exc.UseCaseError(
+                (
+                    "Rescoring columnar outputs requires the optional "
+                    + "`pyarrow` package. Install it with `pip install "
+                    + "gene-connector-cli[arrow]`."
+                ),
+                logger=LOGGER,
+                exp=True,
+            )()
+
+        # Outputs are rewritten to temporary files, which replace the original
+        # ones only after all outputs were rewritten
+        temporary_outputs: dict[Path, Path] = dict()
+
+        try:
+            # ? ----------------------------------------------------------------
+            # ? Rescore connections of the reference data file
+            # ? ----------------------------------------------------------------
+
+            LOGGER.info(f"Rescoring connections of file: {data_file}")
+
+            temporary_outputs[data_file] = __build_temporary_path(data_file)
+
+            if data_file.suffix == OutputFormat.JSON.suffix:
+                rescoring_either = __rescore_json_output(
+                    data_file=data_file,
+                    temporary_output=temporary_outputs[data_file],
+                    profiles=profiles,
+                    index_ids=long_output.is_file(),
+                )
+            else:
+                rescoring_either = __rescore_jsonl_output(
+                    output_file=output_file,
+                    data_file=data_file,
+                    temporary_output=temporary_outputs[data_file],
+                    profiles=profiles,
+                    index_ids=long_output.is_file(),
+                )
+
+            if rescoring_either.is_left:
+                return rescoring_either
+
+            (
+                scores_by_signature,
+                signatures_by_id,
+                previous_profile_names,
+            ) = rescoring_either.value
+            profile_names = [profile.name for profile in profiles[1:]]
+
+            # ? ----------------------------------------------------------------
+            # ? Rewrite score columns of the TSV tables
+            # ? ----------------------------------------------------------------
+
+            if not tsv_output.is_file() and not long_output.is_file():
+                LOGGER.warning(
+                    f"TSV output file not found: {tsv_output} or {long_output}"
+                )
+
+            if tsv_output.is_file():
+                LOGGER.info(f"Rewriting score columns of file: {tsv_output}")
+
+                temporary_outputs[tsv_output] = __build_temporary_path(
+                    tsv_output
+                )
+
+                if (
+                    rewriting_either := __rewrite_score_columns(
+                        tsv_output=tsv_output,
+                        temporary_output=temporary_outputs[tsv_output],
+                        scores_by_signature=scores_by_signature,
+                        profile_names=profile_names,
+                        previous_profile_names=previous_profile_names,
+                    )
+                ).is_left:
+                    return rewriting_either
+
+            if long_output.is_file():
+                LOGGER.info(f"Rewriting score rows of file: {long_output}")
+
+                temporary_outputs[long_output] = __build_temporary_path(
+                    long_output
+                )
+
+                if (
+                    rewriting_either := __rewrite_long_score_rows(
+                        long_output=long_output,
+                        temporary_output=temporary_outputs[long_output],
+                        scores_by_signature=scores_by_signature,
+                        signatures_by_id=signatures_by_id,
+                        profile_names=profile_names,
+                    )
+                ).is_left:
+                    return rewriting_either
+
+            # ? ----------------------------------------------------------------
+            # ? Rewrite score columns of the columnar outputs
+            # ? ----------------------------------------------------------------
+
+            for columnar_format, columnar_output in columnar_outputs:
+                LOGGER.info(
+                    f"Rewriting score columns of file: {columnar_output}"
+                )
+
+                temporary_outputs[columnar_output] = __build_temporary_path(
+                    columnar_output
+                )
+
+                if (
+                    rewriting_either := __rewrite_columnar_score_columns(
+                        columnar_output=columnar_output,
+                        temporary_output=temporary_outputs[columnar_output],
+                        columnar_format=columnar_format,
+                        scores_by_signature=scores_by_signature,
+                        profile_names=profile_names,
+                        previous_profile_names=previous_profile_names,
+                    )
+                ).is_left:
+                    return rewriting_either
+
+            # ? ----------------------------------------------------------------
+            # ? Rewrite scores of the results database
+            #
+            # The database is rewritten in a single transaction, after all
+            # temporary files were written, thus it is kept untouched if any
+            # output could not be rewritten.
+            #
+            # ? ----------------------------------------------------------------
+
+            if database_output.is_file():
+                LOGGER.info(f"Rewriting scores of database: {database_output}")
+
+                if (
+                    rewriting_either := __rewrite_database_scores(
+                        database_output=database_output,
+                        scores_by_signature=scores_by_signature,
+                        profile_names=profile_names,
+                    )
+                ).is_left:
+                    return rewriting_either
+
+            # ? ----------------------------------------------------------------
+            # ? Replace the original outputs
+            # ? ----------------------------------------------------------------
+
+            for output, temporary_output in temporary_outputs.items():
+                temporary_output.replace(output)
+
+        finally:
+            for temporary_output in temporary_outputs.values():
+                temporary_output.unlink(missing_ok=True)
+
+        # ? --------------------------------------------------------------------
+        # ? Refresh the shards manifest
+        # ? --------------------------------------------------------------------
+
+        if (refreshing_either := refresh_shard_manifest(output_file)).is_left:
+            return refreshing_either
+
+        # ? --------------------------------------------------------------------
+        # ? Return a positive response
+        # ? --------------------------------------------------------------------
+
+        return right(True)
+
+    except Exception as e:
+        return exc.UseCaseError(e, logger=LOGGER)()
+
+
+def __rescore_json_output(
+    data_file: Path,
+    temporary_output: Path,
+    profiles: list[ScoringProfile],
+    index_ids: bool = False,
+) -> Either[
+    exc.MappedErrors,
+    tuple[
+        dict[str, tuple[ConnectionScores, list[ConnectionScores]]],
+        dict[str, str],
+        set[str],
+    ],
+]:
+    """Rescore the connections of a JSON output, loaded as a whole.
+
+    The rescored document is written to `temporary_output`. Returns the scores by connection signature, the signatures by connection
+    id if `index_ids` is True, and the names of the additional profiles of the
+    previous execution.
+
+    """
+
+    with data_file.open("r") as f:
+        content: dict[str, Any] = load(f)
+
+    if not isinstance(connections := content.get("connections"), list):
+        return exc.UseCaseError(
+            "Unable to rescore. Connections must be a list.",
+            logger=LOGGER,
+        )()
+
+    scores_by_signature: dict[
+        str, tuple[ConnectionScores, list[ConnectionScores]]
+    ] = dict()
+    signatures_by_id: dict[str, str] = dict()
+    previous_profile_names: set[str] = set()
+    calculated_coverages = 0
+
+    for connection in connections:
+        previous_profile_names.update(connection.get("profile_scores") or {})
+
+        if connection.get("coverage") is None:
+            calculated_coverages += 1
+
+        signature = str(connection.get("signature"))
+
+        scores_by_signature[signature] = __rescore_record(
+            record=connection,
+            profiles=profiles,
+        )
+
+        if index_ids:
+            signatures_by_id[str(connection.get("id"))] = signature
+
+    __log_calculated_coverages(calculated_coverages, len(connections))
+
+    with temporary_output.open("w") as f:
+        dump(content, f, indent=4, sort_keys=True, default=str)
+
+    return right(
+        (scores_by_signature, signatures_by_id, previous_profile_names)
+    )
+
+
+def __rescore_jsonl_output(
+    output_file: Path,
+    data_file: Path,
+    temporary_output: Path,
+    profiles: list[ScoringProfile],
+    index_ids: bool = False,
+) -> Either[
+    exc.MappedErrors,
+    tuple[
+        dict[str, tuple[ConnectionScores, list[ConnectionScores]]],
+        dict[str, str],
+        set[str],
+    ],
+]:
+    """Rescore the connections of a JSON Lines output, one record at a time.
+
+    Records are read through `iter_output_records` and written with the JSON
+    Lines writer to `temporary_output`, with the compression of the original
+    file. Returns the scores by connection signature, the
+    signatures by connection id if `index_ids` is True, and the names of the
+    additional profiles of the previous execution.
+
+    """
+
+    if (fields_either := read_output_fields(output_file)).is_left:
+        return fields_either
+
+    optional_fields, gene_fields = fields_either.value
+
+    scores_by_signature: dict[
+        str, tuple[ConnectionScores, list[ConnectionScores]]
+    ] = dict()
+    signatures_by_id: dict[str, str] = dict()
+    previous_profile_names: set[str] = set()
+    connections_count = 0
+    calculated_coverages = 0
+
+    with open_jsonl_output(
+        temporary_output,
+        compress=data_file.name.endswith(OutputFormat.JSONL_GZ.suffix),
+    ) as f:
+        write_jsonl_header(
+            f,
+            optional_fields=optional_fields,
+            gene_fields=gene_fields,
+        )
+
+        for record_either in iter_output_records(output_file):
+            if record_either.is_left:
+                return record_either
+
+            record = record_either.value
+            connections_count += 1
+
+            previous_profile_names.update(record.get("profile_scores") or {})
+
+            if record.get("coverage") is None:
+                calculated_coverages += 1
+
+            signature = str(record.get("signature"))
+
+            scores_by_signature[signature] = __rescore_record(
+                record=record,
+                profiles=profiles,
+            )
+
+            if index_ids:
+                signatures_by_id[str(record.get("id"))] = signature
+
+            write_jsonl_record(f, record)
+
+    __log_calculated_coverages(calculated_coverages, connections_count)
+
+    return right(
+        (scores_by_signature, signatures_by_id, previous_profile_names)
+    )
+
+
+def __rescore_record(
+    record: dict[str, Any],
+    profiles: list[ScoringProfile],
+) -> tuple[ConnectionScores, list[ConnectionScores]]:
+    """Replace the scores of a connection record, in place.
+
+    The coverage is calculated from the raw nodes metadata, and persisted in
+    the record, if missing. Returns the main and the additional profiles
+    scores.
+
+    """
+
+    nodes: list[dict[str, Any]] = record.get("nodes", [])
+
+    if (coverage := record.get("coverage")) is None:
+        coverage = calculate_key_coverage(
+            (
+                node.get("accession"),
+                (
+                    (grouped_key.split(".", 1)[-1], values)
+                    for grouped_key, values in node.get("metadata", {}).items()
+                ),
+            )
+            for node in nodes
+        )
+
+        record["coverage"] = coverage
+
+    scores, *profile_scores = (
+        calculate_scores_from_coverage(
+            coverage=coverage,
+            nodes_count=len(nodes),
+            profile=profile,
+        )
+        for profile in profiles
+    )
+
+    record["scores"] = scores.to_dict()
+    record["profile_scores"] = {
+        profile.name: profile_score.to_dict()
+        for profile, profile_score in zip(profiles[1:], profile_scores)
+    }
+
+    return scores, profile_scores
+
+
+def __log_calculated_coverages(
+    calculated_coverages: int,
+    connections_count: int,
+) -> None:
+    if calculated_coverages > 0:
+        LOGGER.info(
+            f"Coverage calculated for {calculated_coverages} of "
+            + f"{connections_count} connections"
+        )
+
+
+def __rewrite_score_columns(
+    tsv_output: Path,
+    temporary_output: Path,
+    scores_by_signature: dict[
+        str, tuple[ConnectionScores, list[ConnectionScores]]
+    ],
+    profile_names: list[str],
+    previous_profile_names: set[str],
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Rewrite the score columns of a TSV output.
+
+    Values are formatted as pandas does on writing the original output, thus
+    rescoring with the same profiles results in an identical file. Columns of
+    previous additional profiles are dropped and the columns of the current
+    additional profiles are placed after the main score columns, as done by
+    the pipeline. The rewritten table is written to `temporary_output`.
+
+    """
+
+    with tsv_output.open("r", newline="") as source, temporary_output.open(
+        "w", newline=""
+    ) as target:
+        tsv_reader = reader(source, delimiter="\t")
+        tsv_writer = writer(
+            target,
+            delimiter="\t",
+            quoting=QUOTE_MINIMAL,
+            lineterminator="\n",
+        )
+
+        header = next(tsv_reader)
+
+        try:
+            signature_index = header.index("signature")
+            scores_index = header.index(SCORE_COLUMNS[0])
+        except ValueError as e:
+            return exc.UseCaseError(
+                f"Unable to rescore. Missing TSV column: {e}",
+                logger=LOGGER,
+            )()
+
+        if header[scores_index : scores_index + len(SCORE_COLUMNS)] != (
+            SCORE_COLUMNS
+        ):
+            return exc.UseCaseError(
+                (
+                    "Unable to rescore. Score columns should be "
+                    + f"contiguous: {', '.join(SCORE_COLUMNS)}"
+                ),
+                logger=LOGGER,
+            )()
+
+        # ? ----------------------------------------------------------------
+        # ? Build the output layout
+        # ? ----------------------------------------------------------------
+
+        dropped_columns = set(__build_profile_columns(previous_profile_names))
+
+        kept_indices = [
+            index
+            for index, column in enumerate(header)
+            if column not in dropped_columns
+        ]
+
+        insertion_index = kept_indices.index(scores_index) + len(SCORE_COLUMNS)
+
+        kept_header = [header[index] for index in kept_indices]
+
+        tsv_writer.writerow(
+            [
+                *kept_header[:insertion_index],
+                *__build_profile_columns(profile_names),
+                *kept_header[insertion_index:],
+            ]
+        )
+
+        # ? ----------------------------------------------------------------
+        # ? Rewrite rows
+        # ? ----------------------------------------------------------------
+
+        for row in tsv_reader:
+            signature = row[signature_index]
+
+            if (
+                connection_scores := scores_by_signature.get(signature)
+            ) is None:
+                return exc.UseCaseError(
+                    (
+                        "Unable to rescore. Connection not found in JSON "
+                        + f"output: {signature}"
+                    ),
+                    logger=LOGGER,
+                )()
+
+            scores, profile_scores = connection_scores
+
+            row[
+                scores_index : scores_index + len(SCORE_COLUMNS)
+            ] = format_score_values(scores)
+
+            kept_row = [row[index] for index in kept_indices]
+
+            tsv_writer.writerow(
+                [
+                    *kept_row[:insertion_index],
+                    *(
+                        value
+                        for profile_score in profile_scores
+                        for value in format_score_values(profile_score)
+                    ),
+                    *kept_row[insertion_index:],
+                ]
+            )
+
+    return right(True)
+
+
+def __rewrite_long_score_rows(
+    long_output: Path,
+    temporary_output: Path,
+    scores_by_signature: dict[
+        str, tuple[ConnectionScores, list[ConnectionScores]]
+    ],
+    signatures_by_id: dict[str, str],
+    profile_names: list[str],
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Rewrite the score rows of a long table.
+
+    Score rows of previous executions are dropped, and the score rows of the
+    current profiles are written before the first row of each connection, as
+    done by `write_long_table`. Remaining rows are copied verbatim. The
+    rewritten table is written to `temporary_output`.
+
+    """
+
+    with long_output.open("r", newline="") as source, temporary_output.open(
+        "w", newline=""
+    ) as target:
+        tsv_reader = reader(source, delimiter="\t")
+        tsv_writer = writer(
+            target,
+            delimiter="\t",
+            quoting=QUOTE_MINIMAL,
+            lineterminator="\n",
+        )
+
+        if (header := next(tsv_reader, [])) != LONG_TABLE_COLUMNS:
+            return exc.UseCaseError(
+                (
+                    "Unable to rescore. Long table columns should be: "
+                    + ", ".join(LONG_TABLE_COLUMNS)
+                ),
+                logger=LOGGER,
+            )()
+
+        tsv_writer.writerow(header)
+
+        id_index = header.index("connection_id")
+        group_index = header.index("group")
+        current_id: str | None = None
+
+        for row in tsv_reader:
+            if row[group_index] == LONG_TABLE_SCORES_GROUP:
+                continue
+
+            if row[id_index] != current_id:
+                current_id = row[id_index]
+
+                if (
+                    connection_scores := scores_by_signature.get(
+                        signatures_by_id.get(current_id, "")
+                    )
+                ) is None:
+                    return exc.UseCaseError(
+                        (
+                            "Unable to rescore. Connection not found in "
+                            + f"reference data: {current_id}"
+                        ),
+                        logger=LOGGER,
+                    )()
+
+                scores, profile_scores = connection_scores
+
+                tsv_writer.writerows(
+                    build_long_table_score_rows(
+                        connection_id=current_id,
+                        scores=scores,
+                        profile_scores=zip(profile_names, profile_scores),
+                    )
+                )
+
+            tsv_writer.writerow(row)
+
+    return right(True)
+
+
+def __rewrite_columnar_score_columns(
+    columnar_output: Path,
+    temporary_output: Path,
+    columnar_format: ColumnarFormat,
+    scores_by_signature: dict[
+        str, tuple[ConnectionScores, list[ConnectionScores]]
+    ],
+    profile_names: list[str],
+    previous_profile_names: set[str],
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Rewrite the score columns of a Parquet or Feather connections table.
+
+    Record batches are read and written one at a time, thus the table is
+    never loaded as a whole. Columns of previous additional profiles are
+    dropped and the columns of the current additional profiles are placed
+    after the main score columns, as done by `write_columnar_tables`. The
+    nodes tables contain no scores, thus they are kept as is. The rewritten
+    table is written to `temporary_output`.
+
+    """
+
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+
+    source: Any = None
+
+    try:
+        if columnar_format == ColumnarFormat.PARQUET:
+            source = parquet_file = pq.ParquetFile(columnar_output)
+            schema = parquet_file.schema_arrow
+            batches = parquet_file.iter_batches(batch_size=OUTPUT_BATCH_SIZE)
+        else:
+            source = pa.memory_map(str(columnar_output))
+            ipc_reader = ipc.open_file(source)
+            schema = ipc_reader.schema
+            batches = (
+                ipc_reader.get_batch(index)
+                for index in range(ipc_reader.num_record_batches)
+            )
+
+        if missing_columns := [
+            column
+            for column in ["signature", *SCORE_COLUMNS]
+            if column not in schema.names
+        ]:
+            return exc.UseCaseError(
+                (
+                    "Unable to rescore. Missing columns in "
+                    + f"{columnar_output}: {', '.join(missing_columns)}"
+                ),
+                logger=LOGGER,
+            )()
+
+        # ? --------------------------------------------------------------------
+        # ? Build the output schema
+        # ? --------------------------------------------------------------------
+
+        profile_columns = __build_profile_columns(profile_names)
+        dropped_columns = set(__build_profile_columns(previous_profile_names))
+
+        fields = [
+            field for field in schema if field.name not in dropped_columns
+        ]
+        insertion_index = [field.name for field in fields].index(
+            SCORE_COLUMNS[-1]
+        ) + 1
+
+        fields[insertion_index:insertion_index] = [
+            pa.field(column, pa.float64()) for column in profile_columns
+        ]
+
+        output_schema = pa.schema(fields, metadata=schema.metadata)
+
+        # ? --------------------------------------------------------------------
+        # ? Rewrite batches
+        # ? --------------------------------------------------------------------
+
+        writer: Any = (
+            pq.ParquetWriter(temporary_output, output_schema)
+            if columnar_format == ColumnarFormat.PARQUET
+            else ipc.new_file(temporary_output, output_schema)
+        )
+
+        try:
+            for batch in batches:
+                score_values: dict[str, list[float | None]] = {
+                    column: [] for column in [*SCORE_COLUMNS, *profile_columns]
+                }
+
+                for signature in batch.column("signature").to_pylist():
+                    if (
+                        connection_scores := scores_by_signature.get(
+                            str(signature)
+                        )
+                    ) is None:
+                        return exc.UseCaseError(
+                            (
+                                "Unable to rescore. Connection not found in "
+                                + f"reference data: {signature}"
+                            ),
+                            logger=LOGGER,
+                        )()
+
+                    scores, profile_scores = connection_scores
+
+                    for column, value in zip(
+                        score_values,
+                        (
+                            value
+                            for connection_score in [scores, *profile_scores]
+                            for value in build_score_values(connection_score)
+                        ),
+                    ):
+                        score_values[column].append(value)
+
+                writer.write_batch(
+                    pa.RecordBatch.from_arrays(
+                        [
+                            pa.array(score_values[field.name], pa.float64())
+                            if field.name in score_values
+                            else batch.column(field.name)
+                            for field in output_schema
+                        ],
+                        schema=output_schema,
+                    )
+                )
+
+        finally:
+            writer.close()
+
+        return right(True)
+
+    finally:
+        if source is not None:
+            source.close()
+
+
+def __rewrite_database_scores(
+    database_output: Path,
+    scores_by_signature: dict[
+        str, tuple[ConnectionScores, list[ConnectionScores]]
+    ],
+    profile_names: list[str],
+) -> Either[exc.UseCaseError, Literal[True]]:
+    """Rewrite the scores of a results database.
+
+    The score columns of the `connections` table are updated in place, and
+    the rows of the `profile_scores` table are replaced by the scores of the
+    current additional profiles, in a single transaction, thus the database
+    is kept untouched if the rewriting fails. Indexes on scores are updated
+    along with the rows.
+
+    """
+
+    connection = sqlite3.connect(database_output)
+
+    try:
+        rows: list[tuple[int, str]] = connection.execute(
+            "SELECT id, signature FROM connections"
+        ).fetchall()
+
+        if missing_signatures := [
+            signature
+            for _, signature in rows
+            if signature not in scores_by_signature
+        ]:
+            return exc.UseCaseError(
+                (
+                    "Unable to rescore. Connection not found in reference "
+                    + f"data: {missing_signatures[0]}"
+                ),
+                logger=LOGGER,
+            )()
+
+        with connection:
+            connection.executemany(
+                "UPDATE connections SET "
+                + ", ".join(f"{column} = ?" for column in SCORE_COLUMNS)
+                + " WHERE id = ?",
+                (
+                    (
+                        *build_score_values(scores_by_signature[signature][0]),
+                        connection_key,
+                    )
+                    for connection_key, signature in rows
+                ),
+            )
+
+            connection.execute("DELETE FROM profile_scores")
+
+            connection.executemany(
+                "INSERT INTO profile_scores VALUES "
+                + f"({', '.join('?' * (len(SCORE_COLUMNS) + 2))})",
+                (
+                    (connection_key, name, *build_score_values(scores))
+                    for connection_key, signature in rows
+                    for name, scores in zip(
+                        profile_names, scores_by_signature[signature][1]
+                    )
+                ),
+            )
+
+        return right(True)
+
+    finally:
+        connection.close()
+
+
+def __build_profile_columns(profile_names: Iterable[str]) -> list[str]:
+    """Build the score columns of additional profiles, in the output order."""
+
+    return [
+        ConnectionScores.build_profile_field_name(name, column)
+        for name in profile_names
+        for column in SCORE_COLUMNS
+    ]
+
+
+def __build_temporary_path(path: Path) -> Path:
+    """Build the path of a hidden temporary file next to an output."""
+
+    return path.with_name(f".{path.name}.{uuid4()}")
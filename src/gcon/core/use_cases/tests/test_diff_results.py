@@ -0,0 +1,182 @@
+from csv import reader
+from io import StringIO
+from json import dump, dumps
+from pathlib import Path
+from subprocess import run
+from sys import executable
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import TestCase
+
+from gcon.core.domain.dtos.reference_data import (
+    JSONL_FORMAT_NAME,
+    JSONL_FORMAT_VERSION,
+)
+from gcon.core.use_cases.diff_results import (
+    DIFF_REPORT_COLUMNS,
+    ChangeCounts,
+    diff_results,
+)
+
+
+class DiffResultsTest(TestCase):
+    def setUp(self) -> None:
+        self.__temporary_dir = TemporaryDirectory()
+        self.__previous_output_file = Path(self.__temporary_dir.name).joinpath(
+            "previous"
+        )
+        self.__current_output_file = Path(self.__temporary_dir.name).joinpath(
+            "current"
+        )
+
+        # The previous run is written as a JSON document and the current one
+        # as JSON Lines
+        with self.__previous_output_file.with_suffix(".json").open("w") as f:
+            dump(
+                {
+                    "data": [],
+                    "optional_fields": [],
+                    "gene_fields": ["nuc-its", "mit-gapdh"],
+                    "connections": [
+                        self.__build_connection("c1", "s1", ["n1", "n2"]),
+                        self.__build_connection("c2", "s2", ["n3"]),
+                        self.__build_connection("c3", "s3", ["n4"]),
+                    ],
+                },
+                f,
+            )
+
+        self.__current_output_file.with_suffix(".jsonl").write_text(
+            "\n".join(
+                dumps(line)
+                for line in [
+                    {
+                        "format": JSONL_FORMAT_NAME,
+                        "version": JSONL_FORMAT_VERSION,
+                        "optional_fields": [],
+                        "gene_fields": ["nuc-its", "mit-gapdh"],
+                    },
+                    self.__build_connection("c1", "s1", ["n1", "n2"]),
+                    self.__build_connection("c2", "s2-new", ["n3-new", "n1"]),
+                    self.__build_connection("c4", "s4", ["n5"]),
+                ]
+            )
+        )
+
+    def tearDown(self) -> None:
+        self.__temporary_dir.cleanup()
+
+    @staticmethod
+    def __build_connection(
+        id: str,
+        signature: str,
+        nodes_signatures: list[str],
+    ) -> dict[str, Any]:
+        return {
+            "id": id,
+            "signature": signature,
+            "identifiers": [id.upper()],
+            "nodes": [
+                {
+                    "signature": node_signature,
+                    "accession": f"MN{node_signature[1]}",
+                    "marker": "nuc-its",
+                    "metadata": {},
+                }
+                for node_signature in nodes_signatures
+            ],
+        }
+
+    def test_diff_results(self) -> None:
+        self.__assert_diff_results(run_size=10)
+
+    def test_diff_results_with_several_runs(self) -> None:
+        self.__assert_diff_results(run_size=1)
+
+    def __assert_diff_results(self, run_size: int) -> None:
+        report = StringIO()
+
+        response = diff_results(
+            previous_output_file=self.__previous_output_file,
+            current_output_file=self.__current_output_file,
+            report=report,
+            run_size=run_size,
+            temporary_dir=Path(self.__temporary_dir.name),
+        )
+
+        self.assertTrue(response.is_right)
+        self.assertEqual(
+            response.value.connections,
+            ChangeCounts(added=1, removed=1, changed=1, unchanged=1),
+        )
+        self.assertEqual(
+            response.value.nodes,
+            ChangeCounts(added=1, removed=1, changed=1, unchanged=2),
+        )
+        self.assertEqual(
+            [line.split("\t") for line in report.getvalue().splitlines()],
+            [
+                DIFF_REPORT_COLUMNS,
+                ["changed", "connection", "c2", "s2", "s2-new"],
+                ["removed", "connection", "c3", "s3", ""],
+                ["added", "connection", "c4", "", "s4"],
+                ["changed", "node", "nuc-its:MN3", "n3", "n3-new"],
+                ["removed", "node", "nuc-its:MN4", "n4", ""],
+                ["added", "node", "nuc-its:MN5", "", "n5"],
+            ],
+        )
+
+    def test_diff_results_with_missing_outputs(self) -> None:
+        response = diff_results(
+            previous_output_file=self.__previous_output_file,
+            current_output_file=self.__current_output_file.with_name("none"),
+            report=StringIO(),
+        )
+
+        self.assertTrue(response.is_left)
+
+    def test_diff_cmd_writes_only_the_report_to_stdout(self) -> None:
+        # Logs should be written to the standard error, thus the report
+        # written to the standard output is a parseable TSV table
+        process = run(
+            [
+                executable,
+                "-c",
+                "from gcon.ports.cli.main import gcon_cmd; gcon_cmd()",
+                "diff",
+                "--previous",
+                str(self.__previous_output_file),
+                "--current",
+                str(self.__current_output_file),
+            ],
+            cwd=Path(__file__).parents[4],
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+
+        rows = list(reader(StringIO(process.stdout), delimiter="\t"))
+
+        self.assertEqual(rows[0], DIFF_REPORT_COLUMNS)
+        self.assertEqual(len(rows), 7)
+        self.assertTrue(
+            all(len(row) == len(DIFF_REPORT_COLUMNS) for row in rows)
+        )
+        self.assertIn("Splitting into sorted runs", process.stderr)
+
+    def test_diff_results_with_invalid_run_size(self) -> None:
+        response = diff_results(
+            previous_output_file=self.__previous_output_file,
+            current_output_file=self.__current_output_file,
+            report=StringIO(),
+            run_size=0,
+        )
+
+        self.assertTrue(response.is_left)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
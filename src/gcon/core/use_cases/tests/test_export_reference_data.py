@@ -0,0 +1,505 @@
+from importlib.util import find_spec
+from hashlib import sha256
+from json import load
+from os import getenv
+from pathlib import Path
+from sqlite3 import connect
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
+from uuid import UUID
+
+from pandas import DataFrame
+
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.metadata import Metadata
+from gcon.core.domain.dtos.node import Node
+from gcon.core.domain.dtos.reference_data import (
+    ReferenceData,
+    StandardFieldsSchema,
+)
+from gcon.core.domain.dtos.score import ConnectionScores
+from gcon.core.use_cases.export_reference_data import (
+    LONG_TABLE_COLUMNS,
+    RESULTS_DATABASE_SUFFIX,
+    ColumnarFormat,
+    OutputFormat,
+    TableLayout,
+    export_reference_data,
+    export_reference_data_shards,
+)
+from gcon.core.use_cases.load_and_validate_source_table import (
+    load_and_validate_source_table,
+)
+
+
+class ExportReferenceDataTest(TestCase):
+    def setUp(self) -> None:
+        valid_source_table_env_path = getenv("VALID_REFERENCE_TABLE")
+        valid_source_table_path = Path(str(valid_source_table_env_path))
+        self.assertTrue(valid_source_table_path.is_file())
+
+        response = load_and_validate_source_table(
+            source_table_path=valid_source_table_path
+        )
+
+        self.assertTrue(response.is_right)
+
+        self.__reference_data: ReferenceData = response.value
+
+        for position, row in self.__reference_data.data.iterrows():
+            nodes = [
+                Node(
+                    accession=accession,
+                    marker=gene,
+                    metadata=Metadata().add_feature(
+                        key="strain",
+                        value=[f"CBS {position}"],
+                    ),
+                )
+                for gene in self.__reference_data.gene_fields
+                for accession in row[gene]
+            ]
+
+            connection = Connection(
+                identifiers=[row["identifier"]],
+                nodes=nodes,
+            ).with_id(UUID(row["uuid"]))
+
+            connection.with_scores(
+                ConnectionScores(
+                    observed_completeness_score=0.5,
+                    reachable_completeness_score=0.75,
+                )
+            )
+
+            self.__reference_data.with_connections([connection])
+
+        self.__temporary_dir = TemporaryDirectory()
+        self.__output_file = Path(self.__temporary_dir.name).joinpath("out")
+
+    def tearDown(self) -> None:
+        self.__temporary_dir.cleanup()
+
+    def test_export_reference_data_as_json_lines(self) -> None:
+        for output_format in [OutputFormat.JSONL, OutputFormat.JSONL_GZ]:
+            response = export_reference_data(
+                reference_data=self.__reference_data,
+                output_file=self.__output_file,
+                output_format=output_format,
+            )
+
+            self.assertTrue(response.is_right)
+
+            jsonl_path = self.__output_file.with_suffix(output_format.suffix)
+
+            header = ReferenceData.read_jsonl_header(jsonl_path)
+
+            self.assertTrue(header.is_right)
+            self.assertEqual(
+                header.value,
+                (
+                    self.__reference_data.optional_fields,
+                    self.__reference_data.gene_fields,
+                ),
+            )
+
+            records = list(ReferenceData.iter_jsonl(jsonl_path))
+
+            self.assertEqual(
+                len(records),
+                len(self.__reference_data.connections),
+            )
+
+            for record, connection in zip(
+                records, self.__reference_data.connections
+            ):
+                self.assertTrue(record.is_right)
+
+                row, parsed_connection = record.value
+
+                self.assertEqual(row["uuid"], str(connection.id))
+                self.assertEqual(
+                    parsed_connection.signature,
+                    connection.signature,
+                )
+                self.assertEqual(
+                    parsed_connection.scores,
+                    connection.scores,
+                )
+
+    def test_export_reference_data_as_json(self) -> None:
+        response = export_reference_data(
+            reference_data=self.__reference_data,
+            output_file=self.__output_file,
+        )
+
+        self.assertTrue(response.is_right)
+        self.assertTrue(self.__output_file.with_suffix(".tsv").is_file())
+
+        with self.__output_file.with_suffix(".json").open() as f:
+            content = load(f)
+
+        self.assertEqual(
+            len(content["connections"]),
+            len(self.__reference_data.connections),
+        )
+
+    def test_export_reference_data_tsv_matches_dataframe_table(self) -> None:
+        connections = self.__reference_data.connections
+
+        # Nodes with qualifiers missing in other nodes and multi-valued
+        # qualifiers, and connections not following the data rows order
+        connections[0].nodes[0].metadata.add_feature(
+            key="country",
+            value=["Australia"],
+        )
+        connections[1].nodes[-1].metadata.add_feature(
+            key="host",
+            value=["Austrostipa", "Triticum"],
+        )
+        connections.reverse()
+
+        response = export_reference_data(
+            reference_data=self.__reference_data,
+            output_file=self.__output_file,
+        )
+
+        self.assertTrue(response.is_right)
+
+        expected_file = self.__output_file.with_name("expected.tsv")
+        self.__write_table_through_dataframe(expected_file)
+
+        streamed_lines = (
+            self.__output_file.with_suffix(".tsv").read_text().splitlines()
+        )
+        expected_lines = expected_file.read_text().splitlines()
+
+        self.assertEqual(streamed_lines[0], expected_lines[0])
+        self.assertEqual(
+            streamed_lines[0].split("\t")[-3:],
+            [
+                "GEO_REFERENCES.country",
+                "HOST_SUBSTRATE.host",
+                "SPECIMEN.strain",
+            ],
+        )
+        self.assertEqual(streamed_lines, expected_lines)
+
+    def __write_table_through_dataframe(self, output_file: Path) -> None:
+        """Write the connections table as written before it was streamed."""
+
+        reference_data = self.__reference_data
+        records: list[dict[str, object]] = []
+
+        for connection in reference_data.connections:
+            record: dict[str, object] = {
+                # Row ids are stored as strings
+                "id": str(connection.id),
+                "signature": connection.signature,
+                StandardFieldsSchema.identifier: " / ".join(
+                    set(connection.identifiers)
+                ),
+                "observed_completeness_score": (
+                    connection.scores.observed_completeness_score
+                ),
+                "reachable_completeness_score": (
+                    connection.scores.reachable_completeness_score
+                ),
+            }
+
+            for node in connection.nodes:
+                accession = node.accession
+
+                if node.marker in record:
+                    accession = " / ".join([accession, node.accession])
+
+                record[node.marker] = accession
+                record[f"signature-{node.marker}"] = node.signature
+
+                for key, value in node.metadata.qualifiers.items():
+                    record[f"{key.group.name}.{key.key}"] = (
+                        value if isinstance(value, str) else ",".join(value)
+                    )
+
+            records.append(record)
+
+        table = DataFrame.from_records(records)
+
+        table["information_gain"] = 100 - (
+            table["observed_completeness_score"]
+            * 100
+            / table["reachable_completeness_score"]
+        )
+
+        markers = sorted(
+            {
+                node.marker
+                for connection in reference_data.connections
+                for node in connection.nodes
+            }
+        )
+
+        table.merge(
+            right=reference_data.data[
+                [
+                    "uuid",
+                    StandardFieldsSchema.sci_name,
+                    *reference_data.optional_fields,
+                ]
+            ],
+            how="left",
+            left_on="id",
+            right_on="uuid",
+        ).reindex(
+            [
+                "signature",
+                StandardFieldsSchema.identifier,
+                StandardFieldsSchema.sci_name,
+                *reference_data.optional_fields,
+                "observed_completeness_score",
+                "reachable_completeness_score",
+                "information_gain",
+                *markers,
+                *(f"signature-{marker}" for marker in markers),
+                *sorted(
+                    column
+                    for column in table.columns
+                    if "." in column and column[0].isupper()
+                ),
+            ],
+            axis=1,
+        ).to_csv(
+            path_or_buf=output_file,
+            sep="\t",
+            index=False,
+        )
+
+    @skipUnless(find_spec("pyarrow"), "pyarrow is not installed")
+    def test_export_reference_data_as_columnar_tables(self) -> None:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        connections = self.__reference_data.connections
+
+        for columnar_format in ColumnarFormat:
+            output_file = self.__output_file.with_name(
+                f"out-{columnar_format.value}"
+            )
+
+            response = export_reference_data(
+                reference_data=self.__reference_data,
+                output_file=output_file,
+                columnar_format=columnar_format,
+            )
+
+            self.assertTrue(response.is_right)
+
+            table = ds.dataset(
+                output_file.with_suffix(f".{columnar_format.value}"),
+                format=columnar_format.value,
+            ).to_table()
+
+            self.assertEqual(table.num_rows, len(connections))
+            self.assertEqual(
+                table.schema.field("information_gain").type,
+                pa.float64(),
+            )
+            self.assertEqual(
+                table.column("signature").to_pylist(),
+                [str(connection.signature) for connection in connections],
+            )
+            self.assertEqual(
+                table.column("SPECIMEN.strain").to_pylist()[0],
+                ["CBS 0"] * len(connections[0].nodes),
+            )
+
+            nodes = ds.dataset(
+                output_file.with_suffix(".nodes"),
+                format=columnar_format.value,
+                partitioning="hive",
+            ).to_table()
+
+            self.assertEqual(
+                nodes.num_rows,
+                sum(len(connection.nodes) for connection in connections),
+            )
+            self.assertEqual(
+                set(nodes.column("marker").to_pylist()),
+                {
+                    node.marker
+                    for connection in connections
+                    for node in connection.nodes
+                },
+            )
+
+    def test_export_reference_data_as_long_table(self) -> None:
+        response = export_reference_data(
+            reference_data=self.__reference_data,
+            output_file=self.__output_file,
+            table_layout=TableLayout.LONG,
+        )
+
+        self.assertTrue(response.is_right)
+        self.assertFalse(self.__output_file.with_suffix(".tsv").is_file())
+
+        rows = [
+            line.split("\t")
+            for line in self.__output_file.with_suffix(".long.tsv")
+            .read_text()
+            .splitlines()
+        ]
+
+        self.assertEqual(rows[0], LONG_TABLE_COLUMNS)
+
+        connection = self.__reference_data.connections[0]
+
+        # Rows of each connection start with its score rows
+        self.assertEqual(
+            rows[1:4],
+            [
+                [str(connection.id), "", "", "SCORES", column, value]
+                for column, value in [
+                    ("observed_completeness_score", "0.5"),
+                    ("reachable_completeness_score", "0.75"),
+                    ("information_gain", "33.33333333333333"),
+                ]
+            ],
+        )
+
+        self.assertEqual(
+            rows[4 : len(connection.nodes) + 4],
+            [
+                [
+                    str(connection.id),
+                    node.marker,
+                    node.accession,
+                    "SPECIMEN",
+                    "strain",
+                    "CBS 0",
+                ]
+                for node in connection.nodes
+            ],
+        )
+
+        self.assertEqual(
+            len(rows) - 1,
+            sum(
+                len(connection.nodes) + 3
+                for connection in self.__reference_data.connections
+            ),
+        )
+
+    def test_export_reference_data_as_results_database(self) -> None:
+        response = export_reference_data(
+            reference_data=self.__reference_data,
+            output_file=self.__output_file,
+            results_database=True,
+        )
+
+        self.assertTrue(response.is_right)
+
+        connections = self.__reference_data.connections
+        database = connect(
+            self.__output_file.with_suffix(RESULTS_DATABASE_SUFFIX)
+        )
+
+        try:
+            self.assertEqual(
+                database.execute(
+                    "SELECT connection_id, observed_completeness_score, "
+                    + "reachable_completeness_score FROM connections "
+                    + "ORDER BY id"
+                ).fetchall(),
+                [(str(connection.id), 0.5, 0.75) for connection in connections],
+            )
+
+            self.assertEqual(
+                database.execute("SELECT count(*) FROM nodes").fetchone(),
+                (sum(len(connection.nodes) for connection in connections),),
+            )
+
+            self.assertEqual(
+                database.execute(
+                    "SELECT q.value FROM qualifiers_fts AS f "
+                    + "JOIN qualifiers AS q ON q.id = f.rowid "
+                    + "WHERE qualifiers_fts MATCH ? GROUP BY q.value",
+                    ['"CBS 0"'],
+                ).fetchall(),
+                [("CBS 0",)],
+            )
+
+        finally:
+            database.close()
+
+    def test_export_reference_data_shards(self) -> None:
+        for shard_by in [None, "genus"]:
+            response = export_reference_data_shards(
+                reference_data=self.__reference_data,
+                output_file=self.__output_file,
+                shard_count=2,
+                shard_by=shard_by,
+                max_workers=2,
+            )
+
+            self.assertTrue(response.is_right)
+
+            with self.__output_file.with_suffix(".manifest.json").open() as f:
+                manifest = load(f)
+
+            self.assertEqual(manifest["shard_by"], shard_by)
+            self.assertEqual(
+                sum(shard["rows"] for shard in manifest["shards"]),
+                len(self.__reference_data.data),
+            )
+
+            signatures: list[str] = []
+
+            for shard in manifest["shards"]:
+                for file in shard["files"]:
+                    path = self.__output_file.parent.joinpath(file["path"])
+
+                    self.assertEqual(
+                        sha256(path.read_bytes()).hexdigest(),
+                        file["sha256"],
+                    )
+
+                    if path.suffix == ".json":
+                        with path.open() as f:
+                            connections = load(f)["connections"]
+
+                        self.assertEqual(len(connections), shard["connections"])
+
+                        signatures.extend(c["signature"] for c in connections)
+
+            self.assertEqual(
+                sorted(signatures),
+                sorted(
+                    str(connection.signature)
+                    for connection in self.__reference_data.connections
+                ),
+            )
+
+    def test_export_reference_data_shards_with_invalid_column(self) -> None:
+        response = export_reference_data_shards(
+            reference_data=self.__reference_data,
+            output_file=self.__output_file,
+            shard_count=2,
+            shard_by="unknown",
+        )
+
+        self.assertTrue(response.is_left)
+
+    def test_iter_jsonl_with_invalid_file(self) -> None:
+        jsonl_path = self.__output_file.with_suffix(".jsonl")
+        jsonl_path.write_text('{"format": "other"}\n')
+
+        records = list(ReferenceData.iter_jsonl(jsonl_path))
+
+        self.assertEqual(len(records), 1)
+        self.assertTrue(records[0].is_left)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -1,6 +1,11 @@
+import gzip
+from importlib.util import find_spec
+from json import dumps, load
 from os import getenv
 from pathlib import Path
-from unittest import TestCase
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
 
 from clean_base.either import Either
 from clean_base.exceptions import UseCaseError
@@ -34,6 +39,96 @@ class LoadAndValidateSourceTableTest(TestCase):
         self.assertFalse(response.is_left)
         self.assertIsInstance(response.value, ReferenceData)
 
+    def test_load_and_validate_source_table_row_ids_are_deterministic(
+        self,
+    ) -> None:
+        first: Either = load_and_validate_source_table(
+            source_table_path=self.__valid_source_table_path
+        )
+
+        second: Either = load_and_validate_source_table(
+            source_table_path=self.__valid_source_table_path
+        )
+
+        self.assertTrue(first.is_right)
+        self.assertTrue(second.is_right)
+        self.assertEqual(
+            first.value.data["uuid"].tolist(),
+            second.value.data["uuid"].tolist(),
+        )
+        self.assertTrue(first.value.data["uuid"].is_unique)
+
+    def test_load_and_validate_source_table_splits_gene_fields(self) -> None:
+        response: Either = load_and_validate_source_table(
+            source_table_path=self.__valid_source_table_path
+        )
+
+        self.assertTrue(response.is_right)
+
+        for gene in response.value.gene_fields:
+            for accessions in response.value.data[gene]:
+                self.assertIsInstance(accessions, list)
+
+    def test_load_and_validate_source_table_with_validation_cache(
+        self,
+    ) -> None:
+        with TemporaryDirectory() as directory:
+            workspace = Path(directory)
+            table = workspace.joinpath("table.tsv")
+            table.write_bytes(self.__valid_source_table_path.read_bytes())
+
+            first: Either = load_and_validate_source_table(
+                source_table_path=table,
+                validation_cache_dir=workspace,
+            )
+
+            self.assertTrue(first.is_right)
+
+            # ? Unchanged tables are not validated again
+            with patch(
+                "gcon.core.use_cases.load_and_validate_source_table."
+                + "validate_required_fields"
+            ) as validate_required_fields:
+                second: Either = load_and_validate_source_table(
+                    source_table_path=table,
+                    validation_cache_dir=workspace,
+                )
+
+            validate_required_fields.assert_not_called()
+            self.assertTrue(second.is_right)
+            self.assertTrue(first.value.data.equals(second.value.data))
+
+            # ? Appended rows are validated
+            rows = table.read_text().splitlines()
+            columns = rows[0].split("\t")
+            genes = [
+                column
+                for column, definition in zip(columns, rows[1].split("\t"))
+                if definition == "gene"
+            ]
+
+            appended_row = {
+                "identifier": "APPENDED 1",
+                "scientificName": "Bipolaris appended",
+                genes[0]: "ABC12345",
+            }
+
+            with table.open("a") as f:
+                f.write(
+                    "\t".join(
+                        appended_row.get(column, "") for column in columns
+                    )
+                    + "\n"
+                )
+
+            appended: Either = load_and_validate_source_table(
+                source_table_path=table,
+                validation_cache_dir=workspace,
+            )
+
+            self.assertTrue(appended.is_left)
+            self.assertIn("invalid accessions", str(appended.value.msg))
+
     def test_load_and_validate_source_table_with_invalid_data(self) -> None:
         response: Either = load_and_validate_source_table(
             source_table_path=self.__invalid_source_table_path
@@ -43,6 +138,117 @@ class LoadAndValidateSourceTableTest(TestCase):
         self.assertTrue(response.is_left)
         self.assertIsInstance(response.value, UseCaseError)
 
+    def test_load_and_validate_source_table_with_report_file(self) -> None:
+        with TemporaryDirectory() as directory:
+            report_file = Path(directory).joinpath("report.json")
+
+            response: Either = load_and_validate_source_table(
+                source_table_path=self.__invalid_source_table_path,
+                report_file=report_file,
+            )
+
+            self.assertTrue(response.is_left)
+
+            with report_file.open() as f:
+                issues = load(f)
+
+            self.assertGreater(len(issues), 1)
+
+            for issue in issues:
+                self.assertEqual(
+                    set(issue),
+                    {"row_index", "column", "rule", "value", "message"},
+                )
+
+            self.assertIn(
+                "valid_literature",
+                {issue["rule"] for issue in issues},
+            )
+
+            valid_report_file = Path(directory).joinpath("valid.tsv")
+
+            response = load_and_validate_source_table(
+                source_table_path=self.__valid_source_table_path,
+                report_file=valid_report_file,
+            )
+
+            self.assertTrue(response.is_right)
+            self.assertEqual(
+                valid_report_file.read_text(),
+                "row_index\tcolumn\trule\tvalue\tmessage\n",
+            )
+
+    def test_load_and_validate_gzip_source_table(self) -> None:
+        with TemporaryDirectory() as directory:
+            table = Path(directory).joinpath("table.tsv.gz")
+
+            with gzip.open(table, "wb") as f:
+                f.write(self.__valid_source_table_path.read_bytes())
+
+            plain: Either = load_and_validate_source_table(
+                source_table_path=self.__valid_source_table_path
+            )
+
+            compressed: Either = load_and_validate_source_table(
+                source_table_path=table
+            )
+
+            self.assertTrue(compressed.is_right)
+            self.assertTrue(plain.value.data.equals(compressed.value.data))
+
+    @skipUnless(find_spec("pyarrow"), "pyarrow is not installed")
+    def test_load_and_validate_columnar_source_tables(self) -> None:
+        import pyarrow as pa
+        from pyarrow.feather import write_feather
+        from pyarrow.parquet import write_table
+
+        plain: Either = load_and_validate_source_table(
+            source_table_path=self.__valid_source_table_path
+        )
+
+        self.assertTrue(plain.is_right)
+
+        reference_data: ReferenceData = plain.value
+        data = reference_data.data.drop(columns=["uuid"])
+
+        definitions = {
+            **{column: "opt" for column in reference_data.optional_fields},
+            **{column: "gene" for column in reference_data.gene_fields},
+        }
+
+        table = pa.Table.from_pandas(data, preserve_index=False)
+
+        with TemporaryDirectory() as directory:
+            # ? Definitions from file metadata
+            parquet_path = Path(directory).joinpath("table.parquet")
+
+            write_table(
+                table.replace_schema_metadata(
+                    {"gcon:defs": dumps(definitions)}
+                ),
+                parquet_path,
+            )
+
+            # ? Definitions from sidecar file
+            feather_path = Path(directory).joinpath("table.feather")
+            write_feather(table, feather_path)
+
+            Path(directory).joinpath("table.defs.json").write_text(
+                dumps(definitions)
+            )
+
+            for path in [parquet_path, feather_path]:
+                columnar: Either = load_and_validate_source_table(
+                    source_table_path=path
+                )
+
+                self.assertTrue(columnar.is_right)
+                self.assertEqual(
+                    columnar.value.gene_fields,
+                    reference_data.gene_fields,
+                )
+                self.assertTrue(reference_data.data.equals(columnar.value.data))
+
 
 if __name__ == "__main__":
     from unittest import main
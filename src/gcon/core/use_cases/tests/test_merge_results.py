@@ -0,0 +1,169 @@
+from json import dump, dumps, load
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import TestCase
+
+from gcon.core.domain.dtos.reference_data import (
+    JSONL_FORMAT_NAME,
+    JSONL_FORMAT_VERSION,
+    ReferenceData,
+)
+from gcon.core.use_cases.export_reference_data import OutputFormat
+from gcon.core.use_cases.merge_results import MergeSummary, merge_results
+
+
+class MergeResultsTest(TestCase):
+    def setUp(self) -> None:
+        self.__temporary_dir = TemporaryDirectory()
+        temporary_path = Path(self.__temporary_dir.name)
+
+        self.__first_output_file = temporary_path.joinpath("first")
+        self.__second_output_file = temporary_path.joinpath("second")
+        self.__merged_output_file = temporary_path.joinpath("merged")
+
+        # The first run is written as a JSON document and the second one as
+        # JSON Lines
+        with self.__first_output_file.with_suffix(".json").open("w") as f:
+            first_connections = [
+                self.__build_connection("c1", "s3", "MN1"),
+                self.__build_connection("c2", "s1", "MN2"),
+            ]
+
+            dump(
+                {
+                    "data": [
+                        {"uuid": "c1", "nuc-its": ["MN1"]},
+                        {"uuid": "c2", "nuc-its": ["MN2"]},
+                    ],
+                    "optional_fields": [],
+                    "gene_fields": ["nuc-its"],
+                    "connections": first_connections,
+                },
+                f,
+            )
+
+        self.__second_output_file.with_suffix(".jsonl").write_text(
+            "\n".join(
+                dumps(line)
+                for line in [
+                    {
+                        "format": JSONL_FORMAT_NAME,
+                        "version": JSONL_FORMAT_VERSION,
+                        "optional_fields": ["country"],
+                        "gene_fields": ["mit-gapdh"],
+                    },
+                    {
+                        **self.__build_connection("c3", "s2", "MN3"),
+                        "data": {"uuid": "c3", "mit-gapdh": ["MN3"]},
+                    },
+                    {
+                        **first_connections[1],
+                        "data": {"uuid": "c2", "nuc-its": ["MN2"]},
+                    },
+                    {
+                        **self.__build_connection("c1", "s0", "MN1"),
+                        "data": {"uuid": "c1", "nuc-its": ["MN1"]},
+                    },
+                ]
+            )
+        )
+
+    def tearDown(self) -> None:
+        self.__temporary_dir.cleanup()
+
+    @staticmethod
+    def __build_connection(
+        id: str,
+        signature: str,
+        accession: str,
+    ) -> dict[str, Any]:
+        return {
+            "id": id,
+            "signature": signature,
+            "identifiers": [id.upper()],
+            "nodes": [
+                {
+                    "signature": f"n-{accession}",
+                    "accession": accession,
+                    "marker": "nuc-its",
+                    "metadata": {},
+                }
+            ],
+            "scores": None,
+        }
+
+    def test_merge_results(self) -> None:
+        for output_format in OutputFormat:
+            response = merge_results(
+                input_files=[
+                    self.__first_output_file,
+                    self.__second_output_file,
+                ],
+                output_file=self.__merged_output_file,
+                output_format=output_format,
+                run_size=2,
+            )
+
+            self.assertTrue(response.is_right)
+
+            # The connection `c2` is found in both runs, and the connection
+            # `c1` of the first run conflicts with the one of the second run,
+            # with a lower signature
+            self.assertEqual(
+                response.value,
+                MergeSummary(
+                    records=5, connections=3, duplicates=1, conflicts=1
+                ),
+            )
+
+            merged_file = self.__merged_output_file.with_suffix(
+                output_format.suffix
+            )
+
+            if output_format == OutputFormat.JSON:
+                with merged_file.open("r") as f:
+                    content = load(f)
+
+                connections = content["connections"]
+
+                self.assertEqual(
+                    [row["uuid"] for row in content["data"]],
+                    ["c1", "c2", "c3"],
+                )
+                self.assertEqual(
+                    (content["optional_fields"], content["gene_fields"]),
+                    (["country"], ["nuc-its", "mit-gapdh"]),
+                )
+            else:
+                connections = [
+                    record_either.value
+                    for record_either in ReferenceData.iter_jsonl_records(
+                        merged_file
+                    )
+                ]
+
+            self.assertEqual(
+                [
+                    (connection["id"], connection["signature"])
+                    for connection in connections
+                ],
+                [("c1", "s0"), ("c2", "s1"), ("c3", "s2")],
+            )
+
+    def test_merge_results_with_missing_outputs(self) -> None:
+        response = merge_results(
+            input_files=[
+                self.__first_output_file,
+                self.__first_output_file.with_name("none"),
+            ],
+            output_file=self.__merged_output_file,
+        )
+
+        self.assertTrue(response.is_left)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,183 @@
+from io import StringIO
+from json import load
+from os import getenv
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import TestCase
+
+from clean_base.either import Either, right
+from clean_base.entities import CreateManyResponse, FetchResponse
+
+from gcon.core.domain.dtos.metadata import Metadata
+from gcon.core.domain.dtos.node import Node
+from gcon.core.domain.entities.node_fetching import NodeFetching
+from gcon.core.domain.entities.node_registration import NodeRegistration
+from gcon.core.use_cases import run_gcon_pipeline
+from gcon.core.use_cases.load_and_validate_source_table import (
+    load_and_validate_source_table,
+)
+from gcon.core.use_cases.pipeline_stages import (
+    run_assemble_stage,
+    run_export_stage,
+    run_fetch_stage,
+    run_load_stage,
+    run_score_stage,
+)
+
+
+class CachedNodeRepository(NodeFetching, NodeRegistration):
+    """Keep nodes in memory, as the local repositories cache them."""
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, Node] = dict()
+
+    def get(self, **kwargs: Any) -> Either[Any, FetchResponse[Node]]:
+        node = self.nodes.get(kwargs["accession"])
+        return right(FetchResponse(node is not None, node))
+
+    def create_many(self, **kwargs: Any) -> Either[Any, CreateManyResponse]:
+        self.nodes.update({node.accession: node for node in kwargs["nodes"]})
+        return right(CreateManyResponse(True, kwargs["nodes"]))
+
+
+class PipelineStagesTest(TestCase):
+    def setUp(self) -> None:
+        valid_source_table_env_path = getenv("VALID_REFERENCE_TABLE")
+        self.__source_table_path = Path(str(valid_source_table_env_path))
+        self.assertTrue(self.__source_table_path.is_file())
+
+        self.__temporary_dir = TemporaryDirectory()
+        self.__temporary_path = Path(self.__temporary_dir.name)
+
+        response = load_and_validate_source_table(
+            source_table_path=self.__source_table_path,
+        )
+
+        self.assertTrue(response.is_right)
+
+        # All accessions are cached, thus nodes are not fetched from GenBank
+        self.__node_repo = CachedNodeRepository()
+
+        self.__node_repo.create_many(
+            nodes=[
+                Node(
+                    accession=accession,
+                    marker=gene,
+                    metadata=Metadata()
+                    .add_feature(key="strain", value=[f"CBS {accession}"])
+                    .add_feature(key="country", value=["Brazil"]),
+                )
+                for gene in response.value.gene_fields
+                for accessions in response.value.data[gene]
+                for accession in accessions or []
+            ]
+        )
+
+    def tearDown(self) -> None:
+        self.__temporary_dir.cleanup()
+
+    def __run_load_stage(self) -> StringIO:
+        stream = StringIO()
+
+        response = run_load_stage(
+            source_table_path=self.__source_table_path,
+            output=stream,
+        )
+
+        self.assertTrue(response.is_right)
+        self.assertEqual(response.value, 4)
+
+        stream.seek(0)
+
+        return stream
+
+    def test_run_pipeline_stages(self) -> None:
+        fetched_stream = StringIO()
+
+        response = run_fetch_stage(
+            input=self.__run_load_stage(),
+            output=fetched_stream,
+            local_node_fetching_repo=self.__node_repo,
+            local_node_registration_repo=self.__node_repo,
+        )
+
+        self.assertTrue(response.is_right)
+        self.assertEqual(response.value, 12)
+
+        fetched_stream.seek(0)
+        assembled_stream = StringIO()
+
+        response = run_assemble_stage(
+            input=fetched_stream,
+            output=assembled_stream,
+        )
+
+        self.assertTrue(response.is_right)
+        self.assertEqual(response.value, 4)
+
+        assembled_stream.seek(0)
+        scored_stream = StringIO()
+
+        response = run_score_stage(
+            input=assembled_stream,
+            output=scored_stream,
+        )
+
+        self.assertTrue(response.is_right)
+
+        scored_stream.seek(0)
+
+        self.assertTrue(
+            run_export_stage(
+                input=scored_stream,
+                output_file=self.__temporary_path.joinpath("stages"),
+            ).is_right
+        )
+
+        # The stages write the same outputs of the whole pipeline
+        self.assertTrue(
+            run_gcon_pipeline(
+                source_table_path=self.__source_table_path,
+                output_dir_path=self.__temporary_path,
+                output_file=self.__temporary_path.joinpath("pipeline"),
+                local_node_fetching_repo=self.__node_repo,
+                local_node_registration_repo=self.__node_repo,
+            ).is_right
+        )
+
+        for suffix in [".json", ".tsv"]:
+            stages_file = self.__temporary_path.joinpath(f"stages{suffix}")
+            pipeline_file = self.__temporary_path.joinpath(f"pipeline{suffix}")
+
+            with stages_file.open() as stages_f, pipeline_file.open() as f:
+                if suffix == ".json":
+                    self.assertEqual(
+                        [
+                            (connection["id"], connection["signature"])
+                            for connection in load(stages_f)["connections"]
+                        ],
+                        [
+                            (connection["id"], connection["signature"])
+                            for connection in load(f)["connections"]
+                        ],
+                    )
+                else:
+                    self.assertEqual(
+                        stages_f.readline().split("\t"),
+                        f.readline().split("\t"),
+                    )
+
+    def test_run_assemble_stage_without_nodes(self) -> None:
+        response = run_assemble_stage(
+            input=self.__run_load_stage(),
+            output=StringIO(),
+        )
+
+        self.assertTrue(response.is_left)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,84 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from gcon.core.use_cases.pivot_long_table import pivot_long_table
+
+
+class PivotLongTableTest(TestCase):
+    def setUp(self) -> None:
+        self.__temporary_dir = TemporaryDirectory()
+        self.__long_table = Path(self.__temporary_dir.name).joinpath(
+            "out.long.tsv"
+        )
+        self.__output_file = Path(self.__temporary_dir.name).joinpath(
+            "wide.tsv"
+        )
+
+        self.__long_table.write_text(
+            "connection_id\tmarker\taccession\tgroup\tkey\tvalue\n"
+            + "c1\t\t\tSCORES\tobserved_completeness_score\t0.86\n"
+            + "c1\t\t\tSCORES\tinformation_gain\t14.0\n"
+            + "c1\tnuc-its\tMN000001\tSPECIMEN\tstrain\tCBS 101\n"
+            + "c1\tnuc-its\tMN000001\tHOST_SUBSTRATE\thost\tZea mays\n"
+            + "c1\tmit-gapdh\tMN000002\tSPECIMEN\tstrain\tCBS-101\n"
+            + "c2\tnuc-its\tMN000003\t\t\t\n"
+            + "c3\tmit-gapdh\tMN000004\tOTHER\tnote\trare\n"
+        )
+
+    def tearDown(self) -> None:
+        self.__temporary_dir.cleanup()
+
+    def test_pivot_long_table(self) -> None:
+        response = pivot_long_table(
+            long_table_path=self.__long_table,
+            output_file=self.__output_file,
+        )
+
+        self.assertTrue(response.is_right)
+        self.assertEqual(
+            self.__output_file.read_text(),
+            "connection_id\tobserved_completeness_score\tinformation_gain\t"
+            + "mit-gapdh\tnuc-its\tHOST_SUBSTRATE.host\tOTHER.note\t"
+            + "SPECIMEN.strain\n"
+            + "c1\t0.86\t14.0\tMN000002\tMN000001\tZea mays\t\t"
+            + "CBS 101 / CBS-101\n"
+            + "c2\t\t\t\tMN000003\t\t\t\n"
+            + "c3\t\t\tMN000004\t\t\trare\t\n",
+        )
+
+    def test_pivot_long_table_with_selected_keys(self) -> None:
+        response = pivot_long_table(
+            long_table_path=self.__long_table,
+            output_file=self.__output_file,
+            keys=["SPECIMEN.strain"],
+        )
+
+        self.assertTrue(response.is_right)
+        self.assertEqual(
+            self.__output_file.read_text().splitlines(),
+            [
+                "connection_id\tobserved_completeness_score\t"
+                + "information_gain\tmit-gapdh\tnuc-its\tSPECIMEN.strain",
+                "c1\t0.86\t14.0\tMN000002\tMN000001\tCBS 101 / CBS-101",
+                "c2\t\t\t\tMN000003\t",
+                "c3\t\t\tMN000004\t\t",
+            ],
+        )
+
+    def test_pivot_long_table_with_interleaved_connections(self) -> None:
+        with self.__long_table.open("a") as f:
+            f.write("c1\tnuc-tef1\tMN000005\t\t\t\n")
+
+        response = pivot_long_table(
+            long_table_path=self.__long_table,
+            output_file=self.__output_file,
+        )
+
+        self.assertTrue(response.is_left)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
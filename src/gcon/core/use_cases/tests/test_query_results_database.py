@@ -0,0 +1,151 @@
+from io import StringIO
+from os import getenv
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from uuid import UUID
+
+from gcon.core.domain.dtos.connection import Connection
+from gcon.core.domain.dtos.metadata import Metadata
+from gcon.core.domain.dtos.node import Node
+from gcon.core.domain.dtos.score import ConnectionScores
+from gcon.core.use_cases.export_reference_data import (
+    RESULTS_DATABASE_SUFFIX,
+    export_reference_data,
+)
+from gcon.core.use_cases.load_and_validate_source_table import (
+    load_and_validate_source_table,
+)
+from gcon.core.use_cases.query_results_database import (
+    QUERY_RESULT_COLUMNS,
+    query_results_database,
+)
+
+
+class QueryResultsDatabaseTest(TestCase):
+    def setUp(self) -> None:
+        valid_source_table_env_path = getenv("VALID_REFERENCE_TABLE")
+        valid_source_table_path = Path(str(valid_source_table_env_path))
+        self.assertTrue(valid_source_table_path.is_file())
+
+        response = load_and_validate_source_table(
+            source_table_path=valid_source_table_path
+        )
+
+        self.assertTrue(response.is_right)
+
+        reference_data = response.value
+
+        for position, row in reference_data.data.iterrows():
+            nodes = [
+                Node(
+                    accession=accession,
+                    marker=gene,
+                    metadata=Metadata()
+                    .add_feature(key="strain", value=[f"CBS {position}"])
+                    .add_feature(
+                        key="type_material",
+                        value=["holotype" if position == 1 else "ex-type"],
+                    ),
+                )
+                for gene in reference_data.gene_fields
+                for accession in row[gene]
+            ]
+
+            connection = Connection(
+                identifiers=[row["identifier"]],
+                nodes=nodes,
+            ).with_id(UUID(row["uuid"]))
+
+            connection.with_scores(
+                ConnectionScores(
+                    observed_completeness_score=position / 10,
+                    reachable_completeness_score=1,
+                )
+            )
+
+            reference_data.with_connections([connection])
+
+        self.__connections = reference_data.connections
+
+        self.__temporary_dir = TemporaryDirectory()
+        output_file = Path(self.__temporary_dir.name).joinpath("out")
+
+        self.assertTrue(
+            export_reference_data(
+                reference_data=reference_data,
+                output_file=output_file,
+                results_database=True,
+            ).is_right
+        )
+
+        self.__database_path = output_file.with_suffix(RESULTS_DATABASE_SUFFIX)
+
+    def tearDown(self) -> None:
+        self.__temporary_dir.cleanup()
+
+    def __query(self, **kwargs: object) -> list[list[str]]:
+        output = StringIO()
+
+        response = query_results_database(
+            database_path=self.__database_path,
+            output=output,
+            **kwargs,  # type: ignore
+        )
+
+        self.assertTrue(response.is_right)
+
+        rows = [line.split("\t") for line in output.getvalue().splitlines()]
+
+        self.assertEqual(rows[0], QUERY_RESULT_COLUMNS)
+        self.assertEqual(response.value, len(rows) - 1)
+
+        return rows[1:]
+
+    def test_query_results_database(self) -> None:
+        connection = self.__connections[2]
+        node = connection.nodes[0]
+
+        for filters in [
+            dict(accession=node.accession),
+            dict(identifier=list(connection.identifiers)[0]),
+            dict(signature=str(connection.signature)),
+            dict(qualifier="SPECIMEN.strain=CBS 2"),
+            dict(search='"CBS 2"'),
+        ]:
+            self.assertIn(
+                str(connection.id),
+                [row[0] for row in self.__query(**filters)],
+            )
+
+        self.assertEqual(
+            [row[0] for row in self.__query(search="holotype")],
+            [str(self.__connections[1].id)],
+        )
+
+        self.assertEqual(
+            [row[0] for row in self.__query(min_score=0.1, max_score=0.2)],
+            [str(connection.id) for connection in self.__connections[1:3]],
+        )
+
+        self.assertEqual(len(self.__query(limit=1)), 1)
+
+    def test_query_results_database_with_invalid_filters(self) -> None:
+        for filters in [
+            dict(qualifier="strain=CBS 2"),
+            dict(score_field="unknown"),
+            dict(search="AND ("),
+        ]:
+            self.assertTrue(
+                query_results_database(
+                    database_path=self.__database_path,
+                    output=StringIO(),
+                    **filters,  # type: ignore
+                ).is_left
+            )
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
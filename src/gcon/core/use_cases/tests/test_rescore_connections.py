@@ -0,0 +1,488 @@
+import gzip
+from importlib.util import find_spec
+from json import dump, dumps, load, loads
+from pathlib import Path
+from sqlite3 import connect
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
+
+from gcon.core.domain.dtos.reference_data import (
+    JSONL_FORMAT_NAME,
+    JSONL_FORMAT_VERSION,
+)
+from gcon.core.domain.dtos.scoring_profile import ScoringProfile
+from gcon.core.use_cases._file_digest import build_file_digest
+from gcon.core.use_cases.export_reference_data import (
+    SHARDS_MANIFEST_SUFFIX,
+    build_shard_output_file,
+)
+from gcon.core.use_cases.export_reference_data._write_results_database import (
+    RESULTS_DATABASE_TABLES,
+)
+from gcon.core.use_cases.pivot_long_table import pivot_long_table
+from gcon.core.use_cases.rescore_connections import rescore_connections
+
+
+class RescoreConnectionsTest(TestCase):
+    def setUp(self) -> None:
+        self.__temporary_dir = TemporaryDirectory()
+        self.__output_file = Path(self.__temporary_dir.name).joinpath("out")
+
+        self.__connection = {
+            "id": "a1b1f9e4-6ae7-4c24-8a6b-2f3f0f4f0a61",
+            "signature": "signature-1",
+            "identifiers": ["CBS 101"],
+            "nodes": [
+                {
+                    "accession": "MN000001",
+                    "marker": "nuc-its",
+                    "metadata": {
+                        "SPECIMEN.strain": ["CBS 101"],
+                        "HOST_SUBSTRATE.host": ["Zea mays"],
+                    },
+                },
+                {
+                    "accession": "MN000002",
+                    "marker": "mit-gapdh",
+                    "metadata": {
+                        "SPECIMEN.strain": ["CBS-101"],
+                        "HOST_SUBSTRATE.host": ["Oryza"],
+                    },
+                },
+            ],
+            "scores": None,
+        }
+
+        with self.__output_file.with_suffix(".json").open("w") as f:
+            dump({"connections": [self.__connection]}, f)
+
+        with self.__output_file.with_suffix(".tsv").open("w") as f:
+            f.write(
+                "signature\tidentifier\tobserved_completeness_score\t"
+                + "reachable_completeness_score\tinformation_gain\tnuc-its\n"
+                + "signature-1\tCBS 101\t\t\t\tMN000001\n"
+            )
+
+    def tearDown(self) -> None:
+        self.__temporary_dir.cleanup()
+
+    def test_rescore_connections(self) -> None:
+        profile = ScoringProfile.from_dict(
+            {
+                "name": "specimen-only",
+                "groups": {
+                    group: {"score": 0}
+                    for group in [
+                        "TAXONOMY",
+                        "TIME_REFERENCES",
+                        "GEO_REFERENCES",
+                    ]
+                },
+            }
+        )
+
+        self.assertTrue(profile.is_right)
+
+        response = rescore_connections(
+            output_file=self.__output_file,
+            profiles=[profile.value],
+        )
+
+        self.assertTrue(response.is_right)
+
+        with self.__output_file.with_suffix(".json").open("r") as f:
+            connection = load(f)["connections"][0]
+
+        # Strain values are equal after normalization, host values are not
+        self.assertEqual(connection["coverage"], {"strain": 2, "host": 1})
+
+        # observed: (8 * 2 + 3 * 1) / (8 * 2 + 3 * 2); reachable: 1.0
+        self.assertEqual(
+            connection["scores"],
+            {
+                "observed_completeness_score": 0.86,
+                "reachable_completeness_score": 1.0,
+            },
+        )
+
+        with self.__output_file.with_suffix(".tsv").open("r") as f:
+            lines = f.read().splitlines()
+
+        self.assertEqual(
+            lines[1].split("\t"),
+            ["signature-1", "CBS 101", "0.86", "1.0", "14.0", "MN000001"],
+        )
+
+    def test_rescore_connections_with_multiple_profiles(self) -> None:
+        host_profile = ScoringProfile.from_dict(
+            {"name": "host", "groups": {"SPECIMEN": {"score": 0}}}
+        )
+
+        self.assertTrue(host_profile.is_right)
+
+        response = rescore_connections(
+            output_file=self.__output_file,
+            profiles=[ScoringProfile.default(), host_profile.value],
+        )
+
+        self.assertTrue(response.is_right)
+
+        with self.__output_file.with_suffix(".json").open("r") as f:
+            connection = load(f)["connections"][0]
+
+        self.assertEqual(list(connection["profile_scores"]), ["host"])
+
+        with self.__output_file.with_suffix(".tsv").open("r") as f:
+            header, row = (line.split("\t") for line in f.read().splitlines())
+
+        self.assertEqual(
+            header[2:8],
+            [
+                "observed_completeness_score",
+                "reachable_completeness_score",
+                "information_gain",
+                "host.observed_completeness_score",
+                "host.reachable_completeness_score",
+                "host.information_gain",
+            ],
+        )
+
+        self.assertEqual(row[-1], "MN000001")
+
+        # Additional profiles of previous executions are replaced
+        response = rescore_connections(
+            output_file=self.__output_file,
+            profiles=[ScoringProfile.default()],
+        )
+
+        self.assertTrue(response.is_right)
+
+        with self.__output_file.with_suffix(".tsv").open("r") as f:
+            header = f.readline().rstrip("\n").split("\t")
+
+        self.assertFalse(any(i.startswith("host.") for i in header))
+
+    def test_rescore_connections_of_json_lines_output(self) -> None:
+        self.__output_file.with_suffix(".json").unlink()
+
+        jsonl_output = self.__output_file.with_suffix(".jsonl.gz")
+        row = {"identifier": "CBS 101", "uuid": self.__connection["id"]}
+
+        with gzip.open(jsonl_output, "wt") as f:
+            f.write(
+                dumps(
+                    {
+                        "format": JSONL_FORMAT_NAME,
+                        "version": JSONL_FORMAT_VERSION,
+                        "optional_fields": [],
+                        "gene_fields": ["nuc-its", "mit-gapdh"],
+                    }
+                )
+                + "\n"
+            )
+
+            f.write(dumps({**self.__connection, "data": row}) + "\n")
+
+        response = rescore_connections(
+            output_file=self.__output_file,
+            profiles=[ScoringProfile.default()],
+        )
+
+        self.assertTrue(response.is_right)
+
+        # The output is rewritten with the same compression
+        with gzip.open(jsonl_output, "rt") as f:
+            header, record = (loads(line) for line in f)
+
+        self.assertEqual(header["gene_fields"], ["nuc-its", "mit-gapdh"])
+        self.assertEqual(record["data"], row)
+        self.assertEqual(record["coverage"], {"strain": 2, "host": 1})
+        self.assertIsNotNone(record["scores"])
+
+        with self.__output_file.with_suffix(".tsv").open("r") as f:
+            lines = f.read().splitlines()
+
+        self.assertNotEqual(lines[1].split("\t")[2], "")
+
+    def test_rescore_connections_of_long_table(self) -> None:
+        long_output = self.__output_file.with_suffix(".long.tsv")
+        connection_id = self.__connection["id"]
+
+        long_output.write_text(
+            "connection_id\tmarker\taccession\tgroup\tkey\tvalue\n"
+            + f"{connection_id}\t\t\tSCORES\tobserved_completeness_score\t\n"
+            + f"{connection_id}\t\t\tSCORES\treachable_completeness_score\t\n"
+            + f"{connection_id}\t\t\tSCORES\tinformation_gain\t\n"
+            + f"{connection_id}\tnuc-its\tMN000001\tSPECIMEN\tstrain\tCBS 101\n"
+        )
+
+        host_profile = ScoringProfile.from_dict(
+            {"name": "host", "groups": {"SPECIMEN": {"score": 0}}}
+        )
+
+        self.assertTrue(host_profile.is_right)
+
+        response = rescore_connections(
+            output_file=self.__output_file,
+            profiles=[ScoringProfile.default(), host_profile.value],
+        )
+
+        self.assertTrue(response.is_right)
+
+        pivoted_output = self.__output_file.with_suffix(".pivoted.tsv")
+
+        self.assertTrue(
+            pivot_long_table(
+                long_table_path=long_output,
+                output_file=pivoted_output,
+            ).is_right
+        )
+
+        with self.__output_file.with_suffix(".tsv").open("r") as f:
+            wide_header, wide_row = (
+                line.split("\t") for line in f.read().splitlines()
+            )
+
+        with pivoted_output.open("r") as f:
+            pivoted_header, pivoted_row = (
+                line.split("\t") for line in f.read().splitlines()
+            )
+
+        # The pivoted scores match the rescored wide table
+        self.assertEqual(pivoted_header[1:7], wide_header[2:8])
+        self.assertEqual(pivoted_row[1:7], wide_row[2:8])
+        self.assertEqual(pivoted_row[-1], "CBS 101")
+
+    def test_rescore_connections_of_results_database(self) -> None:
+        database = connect(self.__output_file.with_suffix(".sqlite"))
+
+        with database:
+            database.executescript(RESULTS_DATABASE_TABLES)
+            database.execute(
+                "INSERT INTO connections (id, connection_id, signature) "
+                + "VALUES (1, ?, 'signature-1')",
+                (self.__connection["id"],),
+            )
+            database.execute(
+                "INSERT INTO profile_scores VALUES (1, 'stale', 0.1, 0.2, 50.0)"
+            )
+
+        database.close()
+
+        host_profile = ScoringProfile.from_dict(
+            {"name": "host", "groups": {"SPECIMEN": {"score": 0}}}
+        )
+
+        self.assertTrue(host_profile.is_right)
+
+        response = rescore_connections(
+            output_file=self.__output_file,
+            profiles=[ScoringProfile.default(), host_profile.value],
+        )
+
+        self.assertTrue(response.is_right)
+
+        with self.__output_file.with_suffix(".tsv").open("r") as f:
+            tsv_scores = f.read().splitlines()[1].split("\t")[2:8]
+
+        database = connect(self.__output_file.with_suffix(".sqlite"))
+
+        try:
+            scores = database.execute(
+                "SELECT observed_completeness_score, "
+                + "reachable_completeness_score, information_gain "
+                + "FROM connections"
+            ).fetchone()
+
+            profile_scores = database.execute(
+                "SELECT profile, observed_completeness_score, "
+                + "reachable_completeness_score, information_gain "
+                + "FROM profile_scores"
+            ).fetchall()
+
+        finally:
+            database.close()
+
+        # Database scores match the rescored TSV table
+        self.assertEqual([repr(score) for score in scores], tsv_scores[:3])
+        self.assertEqual([name for name, *_ in profile_scores], ["host"])
+        self.assertEqual(
+            [repr(score) for score in profile_scores[0][1:]],
+            tsv_scores[3:],
+        )
+
+    @skipUnless(find_spec("pyarrow"), "pyarrow is not installed")
+    def test_rescore_connections_of_columnar_tables(self) -> None:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+
+        # The previous execution scored an additional profile
+        with self.__output_file.with_suffix(".json").open("w") as f:
+            dump(
+                {
+                    "connections": [
+                        {
+                            **self.__connection,
+                            "profile_scores": {
+                                "host": {
+                                    "observed_completeness_score": 0.5,
+                                    "reachable_completeness_score": 1.0,
+                                }
+                            },
+                        }
+                    ]
+                },
+                f,
+            )
+
+        table = pa.table(
+            {
+                "signature": ["signature-1"],
+                "observed_completeness_score": pa.array([None], pa.float64()),
+                "reachable_completeness_score": pa.array([None], pa.float64()),
+                "information_gain": pa.array([None], pa.float64()),
+                "host.observed_completeness_score": [0.5],
+                "host.reachable_completeness_score": [1.0],
+                "host.information_gain": [50.0],
+                "nuc-its": [["MN000001"]],
+            }
+        )
+
+        pq.write_table(table, self.__output_file.with_suffix(".parquet"))
+        feather.write_feather(table, self.__output_file.with_suffix(".feather"))
+
+        response = rescore_connections(
+            output_file=self.__output_file,
+            profiles=[ScoringProfile.default()],
+        )
+
+        self.assertTrue(response.is_right)
+
+        with self.__output_file.with_suffix(".tsv").open("r") as f:
+            tsv_scores = f.read().splitlines()[1].split("\t")[2:5]
+
+        for rescored_table in [
+            pq.read_table(self.__output_file.with_suffix(".parquet")),
+            feather.read_table(self.__output_file.with_suffix(".feather")),
+        ]:
+            self.assertEqual(
+                rescored_table.column_names,
+                [
+                    "signature",
+                    "observed_completeness_score",
+                    "reachable_completeness_score",
+                    "information_gain",
+                    "nuc-its",
+                ],
+            )
+
+            row = rescored_table.to_pylist()[0]
+
+            # Columnar scores match the rescored TSV table
+            self.assertEqual(
+                [
+                    repr(row["observed_completeness_score"]),
+                    repr(row["reachable_completeness_score"]),
+                    repr(row["information_gain"]),
+                ],
+                tsv_scores,
+            )
+
+            self.assertEqual(row["nuc-its"], ["MN000001"])
+
+    def test_rescore_connections_with_unexpected_table_layout(self) -> None:
+        tsv_output = self.__output_file.with_suffix(".tsv")
+        tsv_output.write_text(
+            tsv_output.read_text().replace(
+                "reachable_completeness_score", "reachable_score"
+            )
+        )
+
+        contents = {
+            path: path.read_bytes()
+            for path in Path(self.__temporary_dir.name).iterdir()
+        }
+
+        response = rescore_connections(
+            output_file=self.__output_file,
+            profiles=[ScoringProfile.default()],
+        )
+
+        self.assertTrue(response.is_left)
+
+        # The reference data file is rescored before the TSV table, but none
+        # of the outputs is replaced, and no temporary file is left behind
+        self.assertEqual(
+            {
+                path: path.read_bytes()
+                for path in Path(self.__temporary_dir.name).iterdir()
+            },
+            contents,
+        )
+
+    def test_rescore_connections_of_shard(self) -> None:
+        shard_output_file = build_shard_output_file(self.__output_file, 0)
+        paths = [
+            self.__output_file.with_suffix(suffix).rename(
+                shard_output_file.with_suffix(suffix)
+            )
+            for suffix in [".json", ".tsv"]
+        ]
+
+        manifest_file = self.__output_file.with_suffix(SHARDS_MANIFEST_SUFFIX)
+
+        with manifest_file.open("w") as f:
+            dump(
+                {
+                    "shards": [
+                        {
+                            "index": 0,
+                            "files": [
+                                {"path": path.name, "bytes": 0, "sha256": ""}
+                                for path in paths
+                            ],
+                        }
+                    ]
+                },
+                f,
+            )
+
+        response = rescore_connections(
+            output_file=shard_output_file,
+            profiles=[ScoringProfile.default()],
+        )
+
+        self.assertTrue(response.is_right)
+
+        # Downstream jobs verify shards by the manifest checksums
+        with manifest_file.open("r") as f:
+            files = load(f)["shards"][0]["files"]
+
+        self.assertEqual(
+            files,
+            [
+                {
+                    "path": path.name,
+                    "bytes": path.stat().st_size,
+                    "sha256": build_file_digest(path),
+                }
+                for path in paths
+            ],
+        )
+
+    def test_rescore_connections_without_reference_data_file(self) -> None:
+        self.__output_file.with_suffix(".json").unlink()
+
+        response = rescore_connections(
+            output_file=self.__output_file,
+            profiles=[ScoringProfile.default()],
+        )
+
+        self.assertTrue(response.is_left)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
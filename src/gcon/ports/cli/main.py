@@ -1,9 +1,19 @@
+import gzip
+from contextlib import contextmanager
 from pathlib import Path
+from sys import stderr, stdin, stdout
+from typing import Iterator, Literal, TextIO
 
 # import click
 import rich_click as click
 
 from gcon.__version__ import version
+from gcon.adapters.pickledb.repositories.connection_fetching import (
+    ConnectionFetchingPickleDbRepository,
+)
+from gcon.adapters.pickledb.repositories.connection_registration import (
+    ConnectionRegistrationPickleDbRepository,
+)
 from gcon.adapters.pickledb.repositories.connector import PickleDbConnector
 from gcon.adapters.pickledb.repositories.node_fetching import (
     NodeFetchingPickleDbRepository,
@@ -11,11 +21,36 @@ from gcon.adapters.pickledb.repositories.node_fetching import (
 from gcon.adapters.pickledb.repositories.node_registration import (
     NodeRegistrationPickleDbRepository,
 )
+from gcon.core.domain.dtos.metadata import MetadataKeyGroup
+from gcon.core.domain.dtos.reference_data.literature import (
+    BIB_VALIDATION_FILE_NAME,
+)
+from gcon.core.domain.dtos.scoring_profile import ScoringProfile
 from gcon.core.use_cases import (
     load_and_validate_source_table,
     run_gcon_pipeline,
 )
-from gcon.settings import LOGGER
+from gcon.core.use_cases.diff_results import diff_results
+from gcon.core.use_cases.export_reference_data import (
+    GENUS_SHARD_KEY,
+    GZIP_COMPRESS_LEVEL,
+    SCORE_COLUMNS,
+    ColumnarFormat,
+    OutputFormat,
+    TableLayout,
+)
+from gcon.core.use_cases.merge_results import merge_results
+from gcon.core.use_cases.pipeline_stages import (
+    run_assemble_stage,
+    run_export_stage,
+    run_fetch_stage,
+    run_load_stage,
+    run_score_stage,
+)
+from gcon.core.use_cases.pivot_long_table import pivot_long_table
+from gcon.core.use_cases.query_results_database import query_results_database
+from gcon.core.use_cases.rescore_connections import rescore_connections
+from gcon.settings import LOGGER, stdout_handler
 from gcon.core.use_cases.load_and_validate_source_table._dtos import (
     SourceGenomeEnum,
 )
@@ -74,6 +109,274 @@ __IGNORE_DUPLICATES = click.option(
 )
 
 
+__TEMPORARY_DIRECTORY = click.option(
+    "-t",
+    "--temporary-directory",
+    required=False,
+    default=Path("tmp"),
+    type=click.Path(
+        readable=True,
+        exists=False,
+        dir_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "A directory path to store temporary files. Validation results are "
+        + "stored here too, thus unchanged tables are not validated again and "
+        + "only changed or appended rows of a table are."
+    ),
+)
+
+
+__REPORT_FILE = click.option(
+    "-r",
+    "--report-file",
+    required=False,
+    default=None,
+    type=click.Path(
+        resolve_path=True,
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,
+    ),
+    help=(
+        "Run all validation checks over all rows and write every failure "
+        + "(row, column, rule, value) to this file, instead of stopping at the "
+        + "first failing check. The report is a JSON file if the extension is "
+        + "`.json` and a TSV file otherwise. Only a summary is printed."
+    ),
+)
+
+
+__SCORING_PROFILE = click.option(
+    "-p",
+    "--scoring-profile",
+    "scoring_profiles",
+    required=False,
+    multiple=True,
+    type=click.Path(
+        resolve_path=True,
+        readable=True,
+        exists=True,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "A JSON file containing the weight and the keys of each metadata key "
+        + "group used to score connections. Groups not included in the file "
+        + "keep the default weight and keys. The option can be repeated to "
+        + "compare profiles: the first profile sets the main scores and each "
+        + "remaining one adds score columns prefixed by the profile name. The "
+        + "keys of the first profile also define the groups assigned to "
+        + "the collected metadata."
+    ),
+)
+
+
+__KEY_GROUPS_PROFILE = click.option(
+    "-p",
+    "--scoring-profile",
+    required=False,
+    default=None,
+    type=click.Path(
+        resolve_path=True,
+        readable=True,
+        exists=True,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "A JSON file of a scoring profile whose keys define the groups "
+        + "assigned to the metadata. Should be the first profile informed to "
+        + "`gcon score`. The default groups are used if not informed."
+    ),
+)
+
+
+__OUTPUT_FORMAT = click.option(
+    "-f",
+    "--output-format",
+    required=False,
+    default=OutputFormat.JSON.value,
+    show_default=True,
+    type=click.Choice([output_format.value for output_format in OutputFormat]),
+    help=(
+        "The format of the file containing the whole results. `json` writes "
+        + "a single JSON document. `jsonl` writes one connection by line, with "
+        + "its source table row, and `jsonl.gz` compresses it with gzip. The "
+        + "TSV table is written in all cases."
+    ),
+)
+
+
+__COLUMNAR_FORMAT = click.option(
+    "--columnar-format",
+    required=False,
+    default=None,
+    type=click.Choice(
+        [columnar_format.value for columnar_format in ColumnarFormat]
+    ),
+    help=(
+        "Also write the connections table with typed columns, and a nodes "
+        + "table partitioned by marker, as Parquet or Feather files. Requires "
+        + "the optional `pyarrow` package."
+    ),
+)
+
+
+__TABLE_LAYOUT = click.option(
+    "-l",
+    "--table-layout",
+    required=False,
+    default=TableLayout.WIDE.value,
+    show_default=True,
+    type=click.Choice([table_layout.value for table_layout in TableLayout]),
+    help=(
+        "The layout of the TSV table. `wide` writes one row by connection and "
+        + "one column by metadata key. `long` writes one row by metadata value "
+        + "of each node, as (connection_id, marker, accession, group, key, "
+        + "value), to the `.long.tsv` file. Use `gcon pivot` to build the wide "
+        + "layout of a long table for selected keys."
+    ),
+)
+
+
+__SHARD_COUNT = click.option(
+    "--shards",
+    "shard_count",
+    required=False,
+    default=None,
+    type=click.IntRange(min=1),
+    help=(
+        "Split the outputs in up to this number of shards, written in "
+        + "parallel to `<output-file>-shard-<index>.*` files. A manifest "
+        + "listing the files, row counts and checksums of each shard is "
+        + "written to `<output-file>.manifest.json`."
+    ),
+)
+
+
+__SHARD_BY = click.option(
+    "--shard-by",
+    required=False,
+    default=None,
+    help=(
+        "A source table column grouping rows of the same shard, or "
+        + f"`{GENUS_SHARD_KEY}` to group rows by the genus of the scientific "
+        + "name. Rows are split by row ranges if not informed. Requires "
+        + "`--shards`."
+    ),
+)
+
+
+__RESULTS_DATABASE = click.option(
+    "--results-database",
+    required=False,
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help=(
+        "Also write the connections, nodes and qualifiers to an indexed "
+        + "SQLite database, `<output-file>.sqlite`. Use `gcon query` to "
+        + "lookup connections in the database."
+    ),
+)
+
+
+__STREAM_INPUT = click.option(
+    "-i",
+    "--input-file",
+    required=False,
+    default=None,
+    type=click.Path(
+        resolve_path=True,
+        readable=True,
+        exists=True,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "The stream written by the previous stage. Files ending with `.gz` "
+        + "are read as gzip compressed. Read from the standard input if not "
+        + "informed."
+    ),
+)
+
+
+__STREAM_OUTPUT = click.option(
+    "-o",
+    "--output-file",
+    required=False,
+    default=None,
+    type=click.Path(
+        resolve_path=True,
+        exists=False,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "The system path of the stream read by the next stage. Files ending "
+        + "with `.gz` are compressed with gzip. Written to the standard output "
+        + "if not informed."
+    ),
+)
+
+
+def __load_scoring_profiles(
+    scoring_profiles: tuple[Path, ...],
+) -> list[ScoringProfile]:
+    if not scoring_profiles:
+        return [ScoringProfile.default()]
+
+    profiles: list[ScoringProfile] = []
+
+    for scoring_profile in scoring_profiles:
+        if (
+            profile_either := ScoringProfile.from_json(scoring_profile)
+        ).is_left:
+            raise Exception(profile_either.value.msg)
+
+        profiles.append(profile_either.value)
+
+    return profiles
+
+
+def __configure_key_groups(scoring_profile: Path | None) -> None:
+    # Metadata keys are classified again as nodes are read, thus each stage
+    # should classify them as the previous ones did
+    MetadataKeyGroup.configure_key_groups(
+        __load_scoring_profiles(
+            () if scoring_profile is None else (scoring_profile,)
+        )[0].key_groups
+    )
+
+
+def __log_to_stderr() -> None:
+    # Logs are written to the standard output by default, thus they are
+    # redirected to the standard error, which is kept apart from the streams
+    # piped between stages
+    stdout_handler.setStream(stderr)
+
+
+@contextmanager
+def __open_stream(
+    path: Path | None, mode: Literal["r", "w"]
+) -> Iterator[TextIO]:
+    if path is None:
+        yield stdin if mode == "r" else stdout
+    elif path.suffix.lower() == ".gz":
+        # The literal text modes select the `TextIO` overload of `gzip.open`
+        with (
+            gzip.open(path, "rt")
+            if mode == "r"
+            else gzip.open(path, "wt", compresslevel=GZIP_COMPRESS_LEVEL)
+        ) as f:
+            yield f
+    else:
+        with path.open(mode) as f:
+            yield f
+
+
 # ? ----------------------------------------------------------------------------
 # ? Create CLI commands
 # ? ----------------------------------------------------------------------------
@@ -122,14 +425,64 @@ def source_genomes_cmd() -> None:
 )
 @__INPUT_TABLE
 @__IGNORE_DUPLICATES
+@click.option(
+    "-t",
+    "--temporary-directory",
+    required=False,
+    default=None,
+    type=click.Path(
+        readable=True,
+        exists=False,
+        dir_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "A directory path to store validation results, thus unchanged tables "
+        + "are not validated again and only changed or appended rows of a "
+        + "table are. Nothing is written if not informed."
+    ),
+)
+@__REPORT_FILE
+@click.option(
+    "--literature-cache",
+    required=False,
+    default=None,
+    type=click.Path(
+        resolve_path=True,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "A path to the JSON file used to persist literature validation "
+        + "results. BibTeX entries validated by previous executions are not "
+        + "parsed again. Defaults to a file in the temporary directory, if "
+        + "informed."
+    ),
+)
 def validate_cmd(
     input_table: Path,
     skip_duplicates: bool,
+    temporary_directory: Path | None,
+    report_file: Path | None,
+    literature_cache: Path | None,
 ) -> None:
+    if temporary_directory is not None and not temporary_directory.is_dir():
+        temporary_directory.mkdir(parents=True)
+
     if (
         left_response := load_and_validate_source_table(
             source_table_path=input_table,
             ignore_duplicates=skip_duplicates,
+            literature_cache_file=(
+                literature_cache
+                or (
+                    None
+                    if temporary_directory is None
+                    else temporary_directory.joinpath(BIB_VALIDATION_FILE_NAME)
+                )
+            ),
+            validation_cache_dir=temporary_directory,
+            report_file=report_file,
         )
     ).is_left:
         raise Exception(left_response.value)
@@ -154,19 +507,7 @@ def validate_cmd(
     help="The system path of the output file. Please ignore file extension.",
 )
 @__IGNORE_DUPLICATES
-@click.option(
-    "-t",
-    "--temporary-directory",
-    required=False,
-    default=Path("tmp"),
-    type=click.Path(
-        readable=True,
-        exists=False,
-        dir_okay=True,
-        path_type=Path,
-    ),
-    help="A directory path to store temporary files.",
-)
+@__TEMPORARY_DIRECTORY
 @click.option(
     "--cache-file",
     required=False,
@@ -180,15 +521,33 @@ def validate_cmd(
     help=(
         "A path to the JSON cache file used to persist intermediary records "
         + "from the pipeline. This is useful to avoid reprocessing the same "
-        + "data when the pipeline is interrupted."
+        + "data when the pipeline is interrupted. Resolved connections are "
+        + "cached too, thus rows unchanged since a previous execution are not "
+        + "assembled and scored again."
     ),
 )
+@__SCORING_PROFILE
+@__REPORT_FILE
+@__OUTPUT_FORMAT
+@__COLUMNAR_FORMAT
+@__TABLE_LAYOUT
+@__SHARD_COUNT
+@__SHARD_BY
+@__RESULTS_DATABASE
 def resolve_cmd(
     input_table: Path,
     temporary_directory: Path,
     output_file: Path,
     skip_duplicates: bool,
     cache_file: Path,
+    scoring_profiles: tuple[Path, ...],
+    report_file: Path | None,
+    output_format: str,
+    columnar_format: str | None,
+    table_layout: str,
+    shard_count: int | None,
+    shard_by: str | None,
+    results_database: bool,
 ) -> None:
     if not temporary_directory.is_dir():
         temporary_directory.mkdir(parents=True)
@@ -201,6 +560,14 @@ def resolve_cmd(
         LOGGER.exception(e)
         raise Exception("Could not initialize PickleDbConnector.")
 
+    profiles = __load_scoring_profiles(scoring_profiles)
+
+    # ? ------------------------------------------------------------------------
+    # ? Compile the qualifiers classification of the main profile
+    # ? ------------------------------------------------------------------------
+
+    MetadataKeyGroup.configure_key_groups(profiles[0].key_groups)
+
     if (
         response_either := run_gcon_pipeline(
             source_table_path=input_table,
@@ -213,6 +580,705 @@ def resolve_cmd(
             local_node_registration_repo=NodeRegistrationPickleDbRepository(
                 db=connector,
             ),
+            local_connection_fetching_repo=ConnectionFetchingPickleDbRepository(
+                db=connector,
+            ),
+            local_connection_registration_repo=(
+                ConnectionRegistrationPickleDbRepository(db=connector)
+            ),
+            scoring_profiles=profiles,
+            validation_report_file=report_file,
+            output_format=OutputFormat(output_format),
+            columnar_format=(
+                None
+                if columnar_format is None
+                else ColumnarFormat(columnar_format)
+            ),
+            table_layout=TableLayout(table_layout),
+            shard_count=shard_count,
+            shard_by=shard_by,
+            results_database=results_database,
+        )
+    ).is_left:
+        raise Exception(response_either.value.msg)
+
+
+@gcon_cmd.command(
+    "rescore",
+    help=(
+        "Rescore the outputs of a previous execution given scoring profiles. "
+        + "Only the score fields of the outputs are rewritten."
+    ),
+)
+@click.option(
+    "-o",
+    "--output-file",
+    required=True,
+    prompt=True,
+    type=click.Path(
+        resolve_path=True,
+        exists=False,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "The system path of the output file of a previous execution. Please "
+        + "ignore file extension."
+    ),
+)
+@__SCORING_PROFILE
+def rescore_cmd(
+    output_file: Path,
+    scoring_profiles: tuple[Path, ...],
+) -> None:
+    if (
+        response_either := rescore_connections(
+            output_file=output_file,
+            profiles=__load_scoring_profiles(scoring_profiles),
+        )
+    ).is_left:
+        raise Exception(response_either.value.msg)
+
+
+@gcon_cmd.command(
+    "pivot",
+    help=(
+        "Pivot a long table, written by `gcon resolve --table-layout long`, "
+        + "to the wide layout, with one row by connection and one column by "
+        + "score, by marker and by selected metadata key."
+    ),
+)
+@click.option(
+    "-i",
+    "--long-table",
+    required=True,
+    prompt=True,
+    type=click.Path(
+        resolve_path=True,
+        readable=True,
+        exists=True,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help="The long table to pivot.",
+)
+@click.option(
+    "-o",
+    "--output-file",
+    required=True,
+    prompt=True,
+    type=click.Path(
+        resolve_path=True,
+        exists=False,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help="The system path of the wide TSV table.",
+)
+@click.option(
+    "-k",
+    "--key",
+    "keys",
+    required=False,
+    multiple=True,
+    help=(
+        "A metadata key to include, as `GROUP.key` (e.g. `SPECIMEN.strain`). "
+        + "Could be informed multiple times. All keys are included if not "
+        + "informed."
+    ),
+)
+def pivot_cmd(
+    long_table: Path,
+    output_file: Path,
+    keys: tuple[str, ...],
+) -> None:
+    if (
+        response_either := pivot_long_table(
+            long_table_path=long_table,
+            output_file=output_file,
+            keys=list(keys) or None,
         )
     ).is_left:
         raise Exception(response_either.value.msg)
+
+
+@gcon_cmd.command(
+    "query",
+    help=(
+        "Lookup connections in a results database, written by `gcon resolve "
+        + "--results-database`. Matching connections are written as TSV rows. "
+        + "All informed filters should match."
+    ),
+)
+@click.option(
+    "-d",
+    "--database",
+    required=True,
+    prompt=True,
+    type=click.Path(
+        resolve_path=True,
+        readable=True,
+        exists=True,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help="The results database to query.",
+)
+@click.option(
+    "-o",
+    "--output-file",
+    required=False,
+    default=None,
+    type=click.Path(
+        resolve_path=True,
+        exists=False,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "The system path of the TSV results. Results are written to the "
+        + "standard output if not informed."
+    ),
+)
+@click.option(
+    "-a",
+    "--accession",
+    required=False,
+    default=None,
+    help="An accession of any connection node.",
+)
+@click.option(
+    "--identifier",
+    required=False,
+    default=None,
+    help="A connection identifier.",
+)
+@click.option(
+    "--signature",
+    required=False,
+    default=None,
+    help="A connection signature.",
+)
+@click.option(
+    "--min-score",
+    required=False,
+    default=None,
+    type=float,
+    help="The minimum value of the score selected by `--score-field`.",
+)
+@click.option(
+    "--max-score",
+    required=False,
+    default=None,
+    type=float,
+    help="The maximum value of the score selected by `--score-field`.",
+)
+@click.option(
+    "--score-field",
+    required=False,
+    default=SCORE_COLUMNS[0],
+    show_default=True,
+    type=click.Choice(SCORE_COLUMNS),
+    help="The score filtered by `--min-score` and `--max-score`.",
+)
+@click.option(
+    "-q",
+    "--qualifier",
+    required=False,
+    default=None,
+    help=(
+        "A qualifier value of any connection node, as `GROUP.key=value` "
+        + "(e.g. `SPECIMEN.strain=CBS 123`)."
+    ),
+)
+@click.option(
+    "-s",
+    "--search",
+    required=False,
+    default=None,
+    help=(
+        "A full-text query over the qualifier values of the connection nodes, "
+        + 'in the SQLite FTS5 syntax (e.g. `holotype OR "type material"`).'
+    ),
+)
+@click.option(
+    "--limit",
+    required=False,
+    default=None,
+    type=click.IntRange(min=1),
+    help="The maximum number of connections returned.",
+)
+def query_cmd(
+    database: Path,
+    output_file: Path | None,
+    accession: str | None,
+    identifier: str | None,
+    signature: str | None,
+    min_score: float | None,
+    max_score: float | None,
+    score_field: str,
+    qualifier: str | None,
+    search: str | None,
+    limit: int | None,
+) -> None:
+    __log_to_stderr()
+
+    query_options = dict(
+        database_path=database,
+        accession=accession,
+        identifier=identifier,
+        signature=signature,
+        min_score=min_score,
+        max_score=max_score,
+        score_field=score_field,
+        qualifier=qualifier,
+        search=search,
+        limit=limit,
+    )
+
+    if output_file is None:
+        response_either = query_results_database(output=stdout, **query_options)
+    else:
+        with output_file.open("w", newline="") as f:
+            response_either = query_results_database(output=f, **query_options)
+
+    if response_either.is_left:
+        raise Exception(response_either.value.msg)
+
+
+@gcon_cmd.command(
+    "diff",
+    help=(
+        "Compare the outputs of two executions by signature. Connections "
+        + "matched by id and nodes matched by marker and accession are "
+        + "reported as added, removed or changed, as TSV rows. A summary is "
+        + "written to the standard error. Connection ids are derived from the "
+        + "source table rows, thus an edited row is reported as a removed and "
+        + "an added connection. JSON outputs are loaded as a whole, prefer "
+        + "JSON Lines outputs to bound the memory usage."
+    ),
+)
+@click.option(
+    "-p",
+    "--previous",
+    "previous_output_file",
+    required=True,
+    prompt=True,
+    type=click.Path(
+        resolve_path=True,
+        exists=False,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "The system path of the output file of the previous execution. "
+        + "Please ignore file extension."
+    ),
+)
+@click.option(
+    "-c",
+    "--current",
+    "current_output_file",
+    required=True,
+    prompt=True,
+    type=click.Path(
+        resolve_path=True,
+        exists=False,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "The system path of the output file of the current execution. Please "
+        + "ignore file extension."
+    ),
+)
+@click.option(
+    "-o",
+    "--output-file",
+    required=False,
+    default=None,
+    type=click.Path(
+        resolve_path=True,
+        exists=False,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "The system path of the TSV report. The report is written to the "
+        + "standard output if not informed."
+    ),
+)
+@click.option(
+    "-t",
+    "--temporary-directory",
+    required=False,
+    default=None,
+    type=click.Path(
+        resolve_path=True,
+        exists=True,
+        file_okay=False,
+        writable=True,
+        path_type=Path,
+    ),
+    help=(
+        "A directory path to store the sorted runs of both executions while "
+        + "comparing them. The system temporary directory is used if not "
+        + "informed."
+    ),
+)
+def diff_cmd(
+    previous_output_file: Path,
+    current_output_file: Path,
+    output_file: Path | None,
+    temporary_directory: Path | None,
+) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    __log_to_stderr()
+
+    diff_options = dict(
+        previous_output_file=previous_output_file,
+        current_output_file=current_output_file,
+        temporary_dir=temporary_directory,
+    )
+
+    if output_file is None:
+        response_either = diff_results(report=stdout, **diff_options)
+    else:
+        with output_file.open("w", newline="") as f:
+            response_either = diff_results(report=f, **diff_options)
+
+    if response_either.is_left:
+        raise Exception(response_either.value.msg)
+
+    table = Table(title="Differences between executions")
+    table.add_column("Kind", style="cyan")
+
+    for change in ["added", "removed", "changed", "unchanged"]:
+        table.add_column(change.capitalize(), style="green", justify="right")
+
+    for kind, counts in response_either.value.to_dict().items():
+        table.add_row(kind, *(str(count) for count in counts.values()))
+
+    Console(stderr=True).print(table)
+
+
+@gcon_cmd.command(
+    "merge",
+    help=(
+        "Merge the outputs of many executions, e.g. of per-clade tables, into "
+        + "a single reference data file. Connections with the same signature "
+        + "are written once."
+    ),
+)
+@click.option(
+    "-i",
+    "--input-file",
+    "input_files",
+    required=True,
+    multiple=True,
+    type=click.Path(
+        resolve_path=True,
+        exists=False,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "The system path of the output file of an execution. Please ignore "
+        + "file extension. Should be informed once by execution. Records of "
+        + "the first informed executions are kept for duplicated connections."
+    ),
+)
+@click.option(
+    "-o",
+    "--output-file",
+    required=True,
+    prompt=True,
+    type=click.Path(
+        resolve_path=True,
+        exists=False,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "The system path of the merged output file. Please ignore file "
+        + "extension."
+    ),
+)
+@click.option(
+    "-f",
+    "--output-format",
+    required=False,
+    default=OutputFormat.JSON.value,
+    show_default=True,
+    type=click.Choice([output_format.value for output_format in OutputFormat]),
+    help="The format of the merged reference data file.",
+)
+def merge_cmd(
+    input_files: tuple[Path, ...],
+    output_file: Path,
+    output_format: str,
+) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    __log_to_stderr()
+
+    if (
+        response_either := merge_results(
+            input_files=list(input_files),
+            output_file=output_file,
+            output_format=OutputFormat(output_format),
+        )
+    ).is_left:
+        raise Exception(response_either.value.msg)
+
+    table = Table(title="Merged connections")
+
+    for name in response_either.value.to_dict():
+        table.add_column(name.capitalize(), style="green", justify="right")
+
+    table.add_row(
+        *(str(count) for count in response_either.value.to_dict().values())
+    )
+
+    Console().print(table)
+
+
+@gcon_cmd.command(
+    "load",
+    help=(
+        "Load and validate a reference table and write its rows as a sources "
+        + "stream, read by `gcon fetch`. First stage of `gcon resolve`, run "
+        + "as `gcon load | gcon fetch | gcon assemble | gcon score | gcon "
+        + "export`."
+    ),
+)
+@__INPUT_TABLE
+@__STREAM_OUTPUT
+@__IGNORE_DUPLICATES
+@__TEMPORARY_DIRECTORY
+@__REPORT_FILE
+def load_cmd(
+    input_table: Path,
+    output_file: Path | None,
+    skip_duplicates: bool,
+    temporary_directory: Path,
+    report_file: Path | None,
+) -> None:
+    __log_to_stderr()
+
+    if not temporary_directory.is_dir():
+        temporary_directory.mkdir(parents=True)
+
+    with __open_stream(output_file, "w") as output:
+        response_either = run_load_stage(
+            source_table_path=input_table,
+            output=output,
+            ignore_duplicates=skip_duplicates,
+            literature_cache_file=temporary_directory.joinpath(
+                BIB_VALIDATION_FILE_NAME
+            ),
+            validation_cache_dir=temporary_directory,
+            report_file=report_file,
+        )
+
+    if response_either.is_left:
+        raise Exception(response_either.value.msg)
+
+    LOGGER.info(f"{response_either.value} rows loaded")
+
+
+@gcon_cmd.command(
+    "fetch",
+    help=(
+        "Collect the GenBank metadata of the accessions of a sources stream, "
+        + "written by `gcon load`. The nodes are written before the rows to a "
+        + "sources stream, read by `gcon assemble`."
+    ),
+)
+@__STREAM_INPUT
+@__STREAM_OUTPUT
+@click.option(
+    "--cache-file",
+    required=False,
+    default=Path("cache.json"),
+    type=click.Path(
+        resolve_path=True,
+        readable=True,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help=(
+        "A path to the JSON cache file used to persist the collected nodes, "
+        + "shared with `gcon resolve`. Cached accessions are not fetched "
+        + "again."
+    ),
+)
+@__KEY_GROUPS_PROFILE
+def fetch_cmd(
+    input_file: Path | None,
+    output_file: Path | None,
+    cache_file: Path,
+    scoring_profile: Path | None,
+) -> None:
+    __log_to_stderr()
+
+    try:
+        connector = PickleDbConnector(
+            db_path=Path(cache_file).with_suffix(".json")
+        )
+    except Exception as e:
+        LOGGER.exception(e)
+        raise Exception("Could not initialize PickleDbConnector.")
+
+    __configure_key_groups(scoring_profile)
+
+    with __open_stream(input_file, "r") as input, __open_stream(
+        output_file, "w"
+    ) as output:
+        response_either = run_fetch_stage(
+            input=input,
+            output=output,
+            local_node_fetching_repo=NodeFetchingPickleDbRepository(
+                db=connector,
+            ),
+            local_node_registration_repo=NodeRegistrationPickleDbRepository(
+                db=connector,
+            ),
+        )
+
+    if response_either.is_left:
+        raise Exception(response_either.value.msg)
+
+    LOGGER.info(f"{response_either.value} nodes collected")
+
+
+@gcon_cmd.command(
+    "assemble",
+    help=(
+        "Assemble the connections of the rows of a sources stream, written by "
+        + "`gcon fetch`. Unscored connections are written as JSON Lines, read "
+        + "by `gcon score`."
+    ),
+)
+@__STREAM_INPUT
+@__STREAM_OUTPUT
+@__KEY_GROUPS_PROFILE
+def assemble_cmd(
+    input_file: Path | None,
+    output_file: Path | None,
+    scoring_profile: Path | None,
+) -> None:
+    __log_to_stderr()
+
+    __configure_key_groups(scoring_profile)
+
+    with __open_stream(input_file, "r") as input, __open_stream(
+        output_file, "w"
+    ) as output:
+        response_either = run_assemble_stage(input=input, output=output)
+
+    if response_either.is_left:
+        raise Exception(response_either.value.msg)
+
+    LOGGER.info(f"{response_either.value} connections assembled")
+
+
+@gcon_cmd.command(
+    "score",
+    help=(
+        "Score the connections written by `gcon assemble`, or by any JSON "
+        + "Lines output, given scoring profiles. Scored connections are "
+        + "written as JSON Lines, read by `gcon export`."
+    ),
+)
+@__STREAM_INPUT
+@__STREAM_OUTPUT
+@__SCORING_PROFILE
+def score_cmd(
+    input_file: Path | None,
+    output_file: Path | None,
+    scoring_profiles: tuple[Path, ...],
+) -> None:
+    __log_to_stderr()
+
+    profiles = __load_scoring_profiles(scoring_profiles)
+
+    MetadataKeyGroup.configure_key_groups(profiles[0].key_groups)
+
+    with __open_stream(input_file, "r") as input, __open_stream(
+        output_file, "w"
+    ) as output:
+        response_either = run_score_stage(
+            input=input,
+            output=output,
+            profiles=profiles,
+        )
+
+    if response_either.is_left:
+        raise Exception(response_either.value.msg)
+
+    LOGGER.info(f"{response_either.value} connections scored")
+
+
+@gcon_cmd.command(
+    "export",
+    help=(
+        "Write the outputs of the connections scored by `gcon score`, as "
+        + "`gcon resolve` does."
+    ),
+)
+@__STREAM_INPUT
+@click.option(
+    "-o",
+    "--output-file",
+    required=True,
+    prompt=True,
+    type=click.Path(
+        resolve_path=True,
+        exists=False,
+        file_okay=True,
+        path_type=Path,
+    ),
+    help="The system path of the output file. Please ignore file extension.",
+)
+@__OUTPUT_FORMAT
+@__COLUMNAR_FORMAT
+@__TABLE_LAYOUT
+@__SHARD_COUNT
+@__SHARD_BY
+@__RESULTS_DATABASE
+@__KEY_GROUPS_PROFILE
+def export_cmd(
+    input_file: Path | None,
+    output_file: Path,
+    output_format: str,
+    columnar_format: str | None,
+    table_layout: str,
+    shard_count: int | None,
+    shard_by: str | None,
+    results_database: bool,
+    scoring_profile: Path | None,
+) -> None:
+    __configure_key_groups(scoring_profile)
+
+    with __open_stream(input_file, "r") as input:
+        response_either = run_export_stage(
+            input=input,
+            output_file=output_file,
+            output_format=OutputFormat(output_format),
+            columnar_format=(
+                None
+                if columnar_format is None
+                else ColumnarFormat(columnar_format)
+            ),
+            table_layout=TableLayout(table_layout),
+            shard_count=shard_count,
+            shard_by=shard_by,
+            results_database=results_database,
+        )
+
+    if response_either.is_left:
+        raise Exception(response_either.value.msg)
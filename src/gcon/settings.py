@@ -56,6 +56,21 @@ CURRENT_USER_EMAIL: str | None = getenv("CURRENT_USER_EMAIL")
 CHUNK_SIZE = int(getenv("CHUNK_SIZE", 15))
 
 
+# ? ----------------------------------------------------------------------------
+# ? Literature validation parallelism configuration
+#
+# The minimum number of unique BibTeX entries not validated yet to spread the
+# parsing over a process pool. Smaller sets are parsed serially, since starting
+# the pool costs more than parsing them.
+#
+# ? ----------------------------------------------------------------------------
+
+
+LITERATURE_PROCESSES_THRESHOLD = int(
+    getenv("LITERATURE_PROCESSES_THRESHOLD", 200)
+)
+
+
 # ? ----------------------------------------------------------------------------
 # ? Application default DNS
 #
@@ -65,3 +80,16 @@ CHUNK_SIZE = int(getenv("CHUNK_SIZE", 15))
 
 
 GCON_NAMESPACE_HASH = UUID("a3e8d8f6-2d0d-11ec-8d3d-0242ac130003")
+
+
+# ? ----------------------------------------------------------------------------
+# ? Columnar outputs batch size configuration
+#
+# The number of connections converted to Arrow record batches at once while
+# writing Parquet and Feather outputs. Larger values are faster but use more
+# memory while writing.
+#
+# ? ----------------------------------------------------------------------------
+
+
+OUTPUT_BATCH_SIZE = int(getenv("OUTPUT_BATCH_SIZE", 10_000))